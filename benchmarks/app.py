@@ -0,0 +1,134 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+
+from flask import Flask
+
+from pydantic import BaseModel
+
+from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.wsgi import JSONRPCWSGIApp
+from flask_jsonrpc.contrib.openrpc import OpenRPC
+
+
+class PydanticUser(BaseModel):
+    id: int
+    name: str
+    email: str
+    tags: list[str]
+
+
+class PydanticNode(BaseModel):
+    name: str
+    value: int
+    children: list[PydanticNode] = []
+
+
+@dataclass
+class DataclassUser:
+    id: int
+    name: str
+    email: str
+    tags: list[str]
+
+
+def build_tree(depth: int, width: int) -> PydanticNode:
+    """Build a tree of pydantic models.
+
+    Args:
+        depth (int): The number of levels.
+        width (int): The number of children of each node but the leaves.
+
+    Returns:
+        PydanticNode: The root node.
+    """
+    node = PydanticNode(name='leaf', value=0)
+    for level in range(1, depth):
+        node = PydanticNode(
+            name=f'level{level}',
+            value=level,
+            children=[node] + [PydanticNode(name='leaf', value=i) for i in range(1, width)],
+        )
+    return node
+
+
+def create_app(*, lean: bool = False) -> Flask:  # noqa: C901
+    """Create the application with the methods used by the benchmark scenarios.
+
+    Args:
+        lean (bool): Whether to serve the JSON-RPC requests with the lean WSGI middleware,
+            :class:`~flask_jsonrpc.wsgi.JSONRPCWSGIApp`, instead of the JSON-RPC view.
+
+    Returns:
+        flask.Flask: The benchmark application, with the JSON-RPC API at ``/api``.
+    """
+    app = Flask('benchmarks')
+    jsonrpc = JSONRPC(app, '/api', enable_web_browsable_api=False)
+    OpenRPC(app, jsonrpc)
+
+    @jsonrpc.method('bench.echo')
+    def echo(s: str) -> str:
+        return s
+
+    @jsonrpc.method('bench.echoNoValidate', validate=False)
+    def echo_no_validate(s: str) -> str:
+        return s
+
+    @jsonrpc.method('bench.add')
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @jsonrpc.method('bench.stdlib')
+    def stdlib(numbers: list[int], weights: dict[str, float], note: str | None = None) -> dict[str, t.Any]:
+        return {'total': sum(numbers), 'weights': weights, 'note': note}
+
+    @jsonrpc.method('bench.pydantic')
+    def pydantic_user(user: PydanticUser) -> PydanticUser:
+        return user
+
+    @jsonrpc.method('bench.dataclass')
+    def dataclass_user(user: DataclassUser) -> DataclassUser:
+        return user
+
+    @jsonrpc.method('bench.list')
+    def list_users(size: int) -> list[dict[str, t.Any]]:
+        return [{'id': i, 'name': f'user{i}', 'email': f'user{i}@example.com', 'tags': ['staff']} for i in range(size)]
+
+    @jsonrpc.method('bench.tree')
+    def tree(depth: int, width: int = 2) -> PydanticNode:
+        return build_tree(depth, width)
+
+    @jsonrpc.method('bench.notify')
+    def notify(s: str) -> None:
+        return None
+
+    if lean:
+        app.wsgi_app = JSONRPCWSGIApp(app, jsonrpc)  # type: ignore[method-assign]
+    return app
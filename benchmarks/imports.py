@@ -0,0 +1,74 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Import-time benchmark.
+
+Imports Flask-JSONRPC in a fresh interpreter with ``python -X importtime``, and
+reports the cumulative import time of each module, in microseconds::
+
+    $ python -m benchmarks --import-time
+"""
+
+from __future__ import annotations
+
+import sys
+import subprocess
+
+#: The modules that ``import flask_jsonrpc`` must not import, they are loaded on first use.
+DEFERRED_MODULES: tuple[str, ...] = (
+    'flask_jsonrpc.asgi',
+    'flask_jsonrpc.wsgi',
+    'flask_jsonrpc.descriptor',
+    'flask_jsonrpc.compression',
+    'flask_jsonrpc.streaming',
+    'flask_jsonrpc.typing',
+    'flask_jsonrpc.types.methods',
+    'flask_jsonrpc.contrib.browse',
+    'flask_jsonrpc.contrib.metrics',
+    'flask_jsonrpc.contrib.openrpc',
+)
+
+
+def measure_import_time(module: str = 'flask_jsonrpc') -> dict[str, int]:
+    """Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module (str): The module to import. Defaults to ``flask_jsonrpc``.
+
+    Returns:
+        dict[str, int]: The cumulative import time of each imported module, in microseconds.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True, check=True
+    )
+    import_times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            import_times[name.strip()] = int(cumulative)
+    return import_times
@@ -0,0 +1,129 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Standalone benchmark runner.
+
+Runs the benchmark scenarios through the WSGI application, without a network
+server, and writes the results in JSON::
+
+    $ python -m benchmarks --rounds 2000 --output results.json
+    $ python -m benchmarks -k batch
+
+With ``--lean``, the requests are served by the lean WSGI middleware,
+:class:`~flask_jsonrpc.wsgi.JSONRPCWSGIApp`, instead of the JSON-RPC view::
+
+    $ python -m benchmarks --lean --output lean.json
+
+With ``--memory``, measures the peak and retained memory of the memory scenarios
+with :mod:`tracemalloc`, and exits with status 1 if one exceeds its limit::
+
+    $ python -m benchmarks --memory --rounds 10
+
+With ``--import-time``, measures the import time of Flask-JSONRPC with
+``python -X importtime``, and exits with status 1 if one of the modules loaded
+on first use (``DEFERRED_MODULES``) is imported by ``import flask_jsonrpc``::
+
+    $ python -m benchmarks --import-time
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import argparse
+
+from benchmarks.app import create_app
+from benchmarks.imports import DEFERRED_MODULES, measure_import_time
+from benchmarks.scenarios import SCENARIOS, MEMORY_LIMITS, MEMORY_SCENARIOS
+from flask_jsonrpc.contrib.bench import run_benchmarks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run the Flask-JSONRPC benchmarks.')
+    parser.add_argument('--rounds', type=int, help='measured calls per scenario (default: 1000, or 10 with --memory)')
+    parser.add_argument('--warmup', type=int, default=100, help='unmeasured calls per scenario (default: 100)')
+    parser.add_argument('--lean', action='store_true', help='serve the requests with the lean WSGI middleware')
+    parser.add_argument('--memory', action='store_true', help='measure the memory of the memory scenarios')
+    parser.add_argument('--import-time', action='store_true', help='measure the import time of flask_jsonrpc')
+    parser.add_argument('-k', dest='keyword', help='only run the scenarios whose name or group contain KEYWORD')
+    parser.add_argument('--output', '-o', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        return import_time(args.output)
+    if args.memory:
+        results = run_benchmarks(
+            create_app(lean=args.lean),
+            MEMORY_SCENARIOS,
+            rounds=args.rounds or 10,
+            warmup=args.warmup,
+            keyword=args.keyword,
+            memory=True,
+        )
+    else:
+        results = run_benchmarks(
+            create_app(lean=args.lean), SCENARIOS, rounds=args.rounds or 1000, warmup=args.warmup, keyword=args.keyword
+        )
+    exceeded = 0
+    for result in results.benchmarks:
+        stats = result['stats']
+        if args.memory:
+            max_peak, max_retained = MEMORY_LIMITS[result['name']]
+            peak, retained = stats['peak'] / 1024, stats['retained'] / 1024
+            over = peak > max_peak or retained > max_retained
+            exceeded += over
+            sys.stderr.write(
+                f'{result["name"]:<28} peak {peak:>10.1f}KiB (max {max_peak})  '
+                f'retained {retained:>8.2f}KiB (max {max_retained}){"  EXCEEDED" if over else ""}\n'
+            )
+            continue
+        sys.stderr.write(
+            f'{result["name"]:<28} median {stats["median"] * 1e6:>10.1f}us  '
+            f'p99 {stats["p99"] * 1e6:>10.1f}us  {stats["ops"]:>10.0f} ops/s\n'
+        )
+    for skipped in results.skipped:
+        sys.stderr.write(f'{skipped["name"]:<28} skipped: {skipped["reason"]}\n')
+    if args.output:
+        results.save(args.output)
+    else:
+        sys.stdout.write(json.dumps(results.to_dict(), indent=2) + '\n')
+    return 1 if results.skipped or exceeded else 0
+
+
+def import_time(output: str | None = None) -> int:
+    import_times = measure_import_time()
+    imported = [module for module in DEFERRED_MODULES if module in import_times]
+    for module, cumulative in sorted(import_times.items(), key=lambda item: item[1], reverse=True)[:20]:
+        sys.stderr.write(f'{module:<40} {cumulative / 1000:>10.1f}ms\n')
+    for module in imported:
+        sys.stderr.write(f'{module:<40} imported, expected to be loaded on first use\n')
+    data = json.dumps({'import_times': import_times, 'imported_deferred_modules': imported}, indent=2)
+    if output:
+        with open(output, 'w') as f:
+            f.write(data + '\n')
+    else:
+        sys.stdout.write(data + '\n')
+    return 1 if imported else 0
@@ -0,0 +1,111 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import typing as t
+
+from flask_jsonrpc.contrib.bench import Scenario
+
+USER: dict[str, t.Any] = {'id': 1, 'name': 'Alice', 'email': 'alice@example.com', 'tags': ['admin', 'staff']}
+
+
+def call(method: str, params: t.Any = None, id: int | None = 1) -> dict[str, t.Any]:  # noqa: ANN401
+    """Build a JSON-RPC request object.
+
+    Args:
+        method (str): The method name.
+        params (typing.Any): The params, omitted if None.
+        id (int | None): The request id, None for notifications.
+
+    Returns:
+        dict[str, typing.Any]: The request object.
+    """
+    req: dict[str, t.Any] = {'jsonrpc': '2.0', 'method': method}
+    if params is not None:
+        req['params'] = params
+    if id is not None:
+        req['id'] = id
+    return req
+
+
+def batch(size: int, *, notification: bool = False) -> list[dict[str, t.Any]]:
+    """Build a batch request.
+
+    Args:
+        size (int): The number of request objects.
+        notification (bool): Whether all request objects are notifications.
+
+    Returns:
+        list[dict[str, typing.Any]]: The batch request.
+    """
+    if notification:
+        return [call('bench.notify', [f'n{i}'], id=None) for i in range(size)]
+    return [call('bench.add', [i, i], id=i) for i in range(size)]
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario('single_validate', call('bench.echo', ['hello']), group='single'),
+    Scenario('single_no_validate', call('bench.echoNoValidate', ['hello']), group='single'),
+    Scenario('params_positional', call('bench.add', [1, 2]), group='params'),
+    Scenario('params_named', call('bench.add', {'a': 1, 'b': 2}), group='params'),
+    Scenario(
+        'params_stdlib',
+        call('bench.stdlib', {'numbers': list(range(20)), 'weights': {'a': 0.5, 'b': 1.5}, 'note': 'x'}),
+        group='params',
+    ),
+    Scenario('params_pydantic', call('bench.pydantic', {'user': USER}), group='params'),
+    Scenario('params_dataclass', call('bench.dataclass', {'user': USER}), group='params'),
+    *(Scenario(f'batch_{size}', batch(size), group='batch') for size in (1, 10, 100, 1000)),
+    Scenario('batch_notifications_100', batch(100, notification=True), group='batch', status_code=204),
+    Scenario('error_method_not_found', call('bench.missing', ['hello']), group='error', status_code=400),
+    Scenario('error_invalid_params', call('bench.add', ['1', 2]), group='error', status_code=400),
+    Scenario('describe', call('rpc.describe'), group='describe'),
+    Scenario('openrpc_discover', call('rpc.discover'), group='describe'),
+]
+
+MEMORY_SCENARIOS: list[Scenario] = [
+    Scenario('memory_single', call('bench.echo', ['hello']), group='single'),
+    Scenario('memory_batch_1000', batch(1000), group='batch'),
+    Scenario('memory_batch_payload_1mb', [call('bench.echo', ['x' * 1024], id=i) for i in range(1024)], group='batch'),
+    Scenario('memory_list_10000', call('bench.list', {'size': 10000}), group='result'),
+    Scenario('memory_pydantic_depth_50', call('bench.tree', {'depth': 50, 'width': 4}), group='result'),
+    Scenario('memory_describe', call('rpc.describe'), group='describe'),
+    Scenario('memory_openrpc_discover', call('rpc.discover'), group='describe'),
+]
+
+#: The maximum peak and retained memory of each memory scenario, in KiB. The peaks
+#: are about twice the measured ones, and the retained memory must stay close to
+#: zero, otherwise the requests leak memory.
+MEMORY_LIMITS: dict[str, tuple[float, float]] = {
+    'memory_single': (150, 1),
+    'memory_batch_1000': (2560, 1),
+    'memory_batch_payload_1mb': (12288, 1),
+    'memory_list_10000': (20480, 1),
+    'memory_pydantic_depth_50': (640, 1),
+    'memory_describe': (256, 1),
+    'memory_openrpc_discover': (150, 1),
+}
@@ -0,0 +1,50 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+from flask import Flask
+
+import pytest
+
+from benchmarks.app import create_app
+from benchmarks.scenarios import MEMORY_LIMITS, MEMORY_SCENARIOS
+from flask_jsonrpc.contrib.bench import Scenario, WSGIRequest, measure_memory
+
+
+@pytest.fixture(scope='module')
+def app() -> Flask:
+    return create_app()
+
+
+@pytest.mark.parametrize('scenario', MEMORY_SCENARIOS, ids=[scenario.name for scenario in MEMORY_SCENARIOS])
+def test_memory(app: Flask, scenario: Scenario) -> None:
+    request = WSGIRequest(app, scenario)
+    request.check()
+    stats = measure_memory(request, rounds=10, warmup=3)
+    max_peak, max_retained = MEMORY_LIMITS[scenario.name]
+    assert stats['peak'] / 1024 <= max_peak, f'peak {stats["peak"] / 1024:.1f}KiB > {max_peak}KiB'
+    assert stats['retained'] / 1024 <= max_retained, f'retained {stats["retained"] / 1024:.2f}KiB > {max_retained}KiB'
@@ -40,12 +40,13 @@ from flask_jsonrpc.conf import settings
 from flask_jsonrpc.globals import default_jsonrpc_site, default_jsonrpc_site_api
 from flask_jsonrpc.helpers import urn
 from flask_jsonrpc.wrappers import JSONRPCDecoratorMixin
-from flask_jsonrpc.contrib.browse import JSONRPCBrowse
 
 if t.TYPE_CHECKING:
     from flask_jsonrpc.site import JSONRPCSite
     from flask_jsonrpc.views import JSONRPCView
     from flask_jsonrpc.blueprints import JSONRPCBlueprint
+    from flask_jsonrpc.contrib.browse import JSONRPCBrowse
+    from flask_jsonrpc.contrib.metrics import JSONRPCMetrics
 
 
 class JSONRPC(JSONRPCDecoratorMixin):
@@ -64,6 +65,9 @@ class JSONRPC(JSONRPCDecoratorMixin):
             default JSON-RPC site API.
         enable_web_browsable_api (bool | None): Whether to enable the web browsable API. If None,
             it will be enabled in debug mode. Defaults to None.
+        enable_metrics (bool): Whether to expose the JSON-RPC metrics in the Prometheus text format.
+            Defaults to False.
+        metrics_path (str): The URL path of the metrics endpoint. Defaults to '/metrics'.
 
     Attributes:
         path (str): The URL path where the JSON-RPC application is accessible.
@@ -76,6 +80,10 @@ class JSONRPC(JSONRPCDecoratorMixin):
         jsonrpc_browse (flask_jsonrpc.contrib.browse.JSONRPCBrowse | None): The JSON-RPC browse application instance.
         enable_web_browsable_api (bool | None): Whether to enable the web browsable API. If None,
             it will be enabled in debug mode. Defaults to None.
+        jsonrpc_metrics (flask_jsonrpc.contrib.metrics.JSONRPCMetrics | None): The JSON-RPC metrics
+            application instance.
+        enable_metrics (bool): Whether to expose the JSON-RPC metrics.
+        metrics_path (str): The URL path of the metrics endpoint.
 
     Examples:
         >>> from flask import Flask
@@ -102,6 +110,8 @@ class JSONRPC(JSONRPCDecoratorMixin):
         jsonrpc_site: type[JSONRPCSite] = default_jsonrpc_site,
         jsonrpc_site_api: type[JSONRPCView] = default_jsonrpc_site_api,
         enable_web_browsable_api: bool | None = None,
+        enable_metrics: bool = False,
+        metrics_path: str = '/metrics',
     ) -> None:
         self.path = path
         self.base_url: str | None = None
@@ -111,6 +121,9 @@ class JSONRPC(JSONRPCDecoratorMixin):
         self.jsonrpc_apps: set[JSONRPC | JSONRPCBlueprint] = set()
         self.jsonrpc_browse: JSONRPCBrowse | None = None
         self.enable_web_browsable_api = enable_web_browsable_api
+        self.jsonrpc_metrics: JSONRPCMetrics | None = None
+        self.enable_metrics = enable_metrics
+        self.metrics_path = metrics_path
         if app:
             self.init_app(app)
 
@@ -148,7 +161,11 @@ class JSONRPC(JSONRPCDecoratorMixin):
         application instance. This includes setting up the URL rules, logging, and
         web browsable API if enabled.
 
-        If the web browsable API is enabled, it will also initialize the browse interface.
+        If the web browsable API is enabled, it will also initialize the browse interface,
+        and if the metrics are enabled, the metrics endpoint.
+
+        The JSON-RPC application is added to the ``app.extensions['jsonrpc']`` list, so that
+        the sites of an application can be found, e.g. by the ``flask jsonrpc`` commands.
 
         Args:
             app (flask.Flask): The Flask application instance.
@@ -185,6 +202,8 @@ class JSONRPC(JSONRPCDecoratorMixin):
         self.get_jsonrpc_site().set_path(self.path)
         self.get_jsonrpc_site().set_base_url(self.base_url)
 
+        app.extensions.setdefault('jsonrpc', []).append(self)
+
         app.add_url_rule(
             self.path,
             view_func=self.get_jsonrpc_site_api().as_view(
@@ -195,6 +214,9 @@ class JSONRPC(JSONRPCDecoratorMixin):
         if self.enable_web_browsable_api is True or (self.enable_web_browsable_api is None and app.config['DEBUG']):
             self.init_browse_app(app)
 
+        if self.enable_metrics:
+            self.init_metrics_app(app)
+
     def register(
         self: Self,
         view_func: t.Callable[..., t.Any],
@@ -235,7 +257,9 @@ class JSONRPC(JSONRPCDecoratorMixin):
         """Register a JSON-RPC blueprint with the given Flask app.
 
         If the web browsable API is enabled, it will also register the browse interface
-        for the blueprint.
+        for the blueprint, and if the metrics are enabled, its calls are recorded too. The
+        blueprint uses the codecs registered to the JSON-RPC application, unless it has its
+        own codec for the same mimetype.
 
         Args:
             app (flask.Flask): The Flask application instance.
@@ -270,6 +294,8 @@ class JSONRPC(JSONRPCDecoratorMixin):
 
         jsonrpc_app.get_jsonrpc_site().set_path(path_url.path)
         jsonrpc_app.get_jsonrpc_site().set_base_url(base_url)
+        for mimetype, codec in self.get_jsonrpc_site().codecs.items():
+            jsonrpc_app.get_jsonrpc_site().codecs.setdefault(mimetype, codec)
 
         app.add_url_rule(
             path,
@@ -283,6 +309,9 @@ class JSONRPC(JSONRPCDecoratorMixin):
         if enable_web_browsable_api is True or (enable_web_browsable_api is None and app.config['DEBUG']):
             self.register_browse(jsonrpc_app)
 
+        if self.jsonrpc_metrics:
+            self.jsonrpc_metrics.register_jsonrpc_site(jsonrpc_app.get_jsonrpc_site())
+
     def init_browse_app(self: Self, app: Flask, path: str | None = None, base_url: str | None = None) -> None:
         """Initialize the JSON-RPC browse application.
 
@@ -303,9 +332,13 @@ class JSONRPC(JSONRPCDecoratorMixin):
             ...     app, path='/api/browse', base_url='http://localhost/api'
             ... )
         """
+        from flask_jsonrpc.contrib.browse import JSONRPCBrowse
+
         browse_url = self._make_jsonrpc_browse_url(path or self.path)
         self.jsonrpc_browse = JSONRPCBrowse(app, url_prefix=browse_url, base_url=base_url or self.base_url)
         self.jsonrpc_browse.register_jsonrpc_site(self.get_jsonrpc_site())
+        if self.jsonrpc_metrics:
+            self.jsonrpc_browse.register_jsonrpc_metrics(self.jsonrpc_metrics)
 
     def register_browse(self: Self, jsonrpc_app: JSONRPC | JSONRPCBlueprint) -> None:
         """Register the JSON-RPC browse application for a given JSON-RPC app.
@@ -340,3 +373,30 @@ class JSONRPC(JSONRPCDecoratorMixin):
                 'you need to init the Browse app before register the Site, see JSONRPC.init_browse_app(...)'
             )
         self.jsonrpc_browse.register_jsonrpc_site(jsonrpc_app.get_jsonrpc_site())
+
+    def init_metrics_app(self: Self, app: Flask, path: str | None = None) -> None:
+        """Initialize the JSON-RPC metrics application.
+
+        Args:
+            app (flask.Flask): The Flask application instance.
+            path (str | None): The URL path for the metrics endpoint. If None, the
+                ``metrics_path`` of the JSON-RPC application will be used.
+
+        Examples:
+            >>> from flask import Flask
+            >>> from flask_jsonrpc import JSONRPC
+            >>>
+            >>> app = Flask(__name__)
+            >>> jsonrpc = JSONRPC(app, path='/api', version='1.0.0')
+            >>> jsonrpc.init_metrics_app(app, path='/api/metrics')
+            >>> jsonrpc.jsonrpc_metrics.path
+            '/api/metrics'
+        """
+        from flask_jsonrpc.contrib.metrics import JSONRPCMetrics
+
+        self.jsonrpc_metrics = JSONRPCMetrics(app, path=path or self.metrics_path)
+        self.jsonrpc_metrics.register_jsonrpc_site(self.get_jsonrpc_site())
+        for jsonrpc_app in self.jsonrpc_apps:
+            self.jsonrpc_metrics.register_jsonrpc_site(jsonrpc_app.get_jsonrpc_site())
+        if self.jsonrpc_browse:
+            self.jsonrpc_browse.register_jsonrpc_metrics(self.jsonrpc_metrics)
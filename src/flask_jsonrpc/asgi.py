@@ -0,0 +1,516 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import io
+import sys
+import time
+from types import AsyncGeneratorType
+import typing as t
+import asyncio
+import inspect
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from typeguard import TypeCheckError
+from werkzeug.datastructures import Headers
+
+from flask_jsonrpc.site import JSONRPC_VERSION_DEFAULT, JSONRPC_DEFAULT_HTTP_HEADERS, JSONRPC_DEFAULT_HTTP_STATUS_CODE
+from flask_jsonrpc.helpers import get
+from flask_jsonrpc.signals import call_started, call_finished, request_started
+from flask_jsonrpc.timings import get_timings, record_timing
+from flask_jsonrpc.encoders import dumps
+from flask_jsonrpc.exceptions import ParseError, JSONRPCError, InvalidRequestError
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+
+Scope = t.MutableMapping[str, t.Any]
+Message = t.MutableMapping[str, t.Any]
+Receive = t.Callable[[], t.Awaitable[Message]]
+Send = t.Callable[[Message], t.Awaitable[None]]
+ResponseReturnValue = tuple[t.Any, int, Headers | dict[str, str] | tuple[str] | list[tuple[str]]]
+
+
+async def call(fn: t.Callable[..., t.Any], *args: t.Any) -> t.Any:  # noqa: ANN401
+    """Call a function, awaiting it if it is a coroutine function.
+
+    Args:
+        fn (typing.Callable[..., typing.Any]): The function.
+        *args (typing.Any): The arguments of the function.
+
+    Returns:
+        typing.Any: The value returned by the function.
+    """
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args)
+    return fn(*args)
+
+
+def make_environ(scope: Scope) -> dict[str, t.Any]:
+    """Make the WSGI environ of an ASGI HTTP connection scope, without the request body.
+
+    It is used to push a Flask request context, so that :data:`~flask.request` gives the
+    method, path, headers and client address of the request.
+
+    Args:
+        scope (typing.MutableMapping[str, typing.Any]): The connection scope.
+
+    Returns:
+        dict[str, typing.Any]: The WSGI environ.
+
+    Examples:
+        >>> environ = make_environ(
+        ...     {
+        ...         'type': 'http',
+        ...         'method': 'POST',
+        ...         'path': '/api',
+        ...         'headers': [
+        ...             (b'content-type', b'application/json'),
+        ...             (b'x-api-key', b'key'),
+        ...         ],
+        ...         'client': ('127.0.0.1', 5000),
+        ...     }
+        ... )
+        >>> (
+        ...     environ['PATH_INFO'],
+        ...     environ['CONTENT_TYPE'],
+        ...     environ['HTTP_X_API_KEY'],
+        ...     environ['REMOTE_ADDR'],
+        ... )
+        ('/api', 'application/json', 'key', '127.0.0.1')
+    """
+    root_path: str = scope.get('root_path', '')
+    path: str = scope['path']
+    server_name, server_port = scope.get('server') or ('localhost', 80)
+    environ: dict[str, t.Any] = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path,
+        'PATH_INFO': path[len(root_path) :] if root_path and path.startswith(root_path) else path,
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server_name,
+        'SERVER_PORT': str(server_port),
+        'SERVER_PROTOCOL': f'HTTP/{scope.get("http_version", "1.1")}',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    if scope.get('client'):
+        environ['REMOTE_ADDR'], environ['REMOTE_PORT'] = scope['client'][0], str(scope['client'][1])
+    for raw_name, raw_value in scope['headers']:
+        name, value = raw_name.decode('latin-1').upper().replace('-', '_'), raw_value.decode('latin-1')
+        if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            name = f'HTTP_{name}'
+        environ[name] = f'{environ[name]},{value}' if name in environ else value
+    return environ
+
+
+class JSONRPCASGIApp:
+    """ASGI application that serves the JSON-RPC sites of a JSON-RPC application.
+
+    The requests are handled without the Flask WSGI request and response objects: the
+    body is read from the ASGI ``receive`` channel and the JSON-RPC requests are dispatched
+    with the method registry, validation and error handling of the
+    :class:`~flask_jsonrpc.site.JSONRPCSite`. The async methods and the async before
+    request, before dispatch, teardown request and error handler functions are awaited on
+    the event loop of the server, so that one worker handles many concurrent calls, the
+    sync methods run in the default thread pool, and the requests of a batch are handled
+    concurrently.
+
+    Each request runs in a request context of the Flask application, made from the ASGI
+    scope (see :func:`make_environ`), so :data:`~flask.current_app`, :data:`~flask.g` and
+    :data:`~flask.request` can be used, e.g. by the rate limiter and the tracing contribs,
+    but the request body is only read by the ASGI application, not through :data:`~flask.request`.
+    The requests of a batch run concurrently in the same request context, and share its
+    :data:`~flask.g`, so the state of each call is kept in a :class:`~contextvars.ContextVar`,
+    as the tracing and the slow call log contribs do.
+    The body is limited by the ``MAX_CONTENT_LENGTH`` config, and decompressed with the
+    ``DECOMPRESSION_*`` settings if it has a ``Content-Encoding`` header. Only JSON is
+    served: the codecs, the response compression, the GET requests, the streamed results
+    and the pipelined requests are features of the WSGI view,
+    :class:`~flask_jsonrpc.views.JSONRPCView`, and the async generator results are collected.
+
+    The blueprints must be registered before the ASGI application is created.
+
+    Args:
+        app (flask.Flask): The Flask application instance.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+
+    Attributes:
+        app (flask.Flask): The Flask application instance.
+        jsonrpc_sites (dict[str, flask_jsonrpc.site.JSONRPCSite]): The JSON-RPC sites by URL path.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.asgi import JSONRPCASGIApp
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>>
+        >>> # Disable automatic validation for typechecking limitations with doctests
+        >>> # We always recommend to use validation in real applications
+        >>> @jsonrpc.method('app.index', validate=False)
+        ... async def index() -> str:
+        ...     return 'Welcome to Flask JSON-RPC'
+        >>>
+        >>> asgi_app = JSONRPCASGIApp(app, jsonrpc)  # uvicorn module:asgi_app
+        >>> list(asgi_app.jsonrpc_sites)
+        ['/api']
+    """
+
+    def __init__(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        self.app = app
+        self.jsonrpc_sites: dict[str, JSONRPCSite] = {
+            jsonrpc_site.path: jsonrpc_site
+            for jsonrpc_site in [jsonrpc_app.get_jsonrpc_site()]
+            + [japp.get_jsonrpc_site() for japp in jsonrpc_app.jsonrpc_apps]
+            if jsonrpc_site.path is not None
+        }
+
+    async def __call__(self: Self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection.
+
+        Args:
+            scope (typing.MutableMapping[str, typing.Any]): The connection scope.
+            receive (typing.Callable[[], typing.Awaitable[typing.MutableMapping[str, typing.Any]]]):
+                The channel of the incoming messages.
+            send (typing.Callable[[typing.MutableMapping[str, typing.Any]], typing.Awaitable[None]]):
+                The channel of the outgoing messages.
+
+        Raises:
+            RuntimeError: If the connection is not an HTTP or lifespan connection.
+        """
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            raise RuntimeError(f'unsupported ASGI scope type: {scope["type"]}')
+
+        jsonrpc_site = self.jsonrpc_sites.get(scope['path'])
+        if jsonrpc_site is None:
+            await self.send_response(send, 404, b'Not Found', [(b'content-type', b'text/plain; charset=utf-8')])
+            return
+        if scope['method'] != 'POST':
+            await self.send_response(
+                send, 405, b'Method Not Allowed', [(b'content-type', b'text/plain; charset=utf-8'), (b'allow', b'POST')]
+            )
+            return
+
+        with self.app.request_context(make_environ(scope)):
+            rv = await self.dispatch_request(jsonrpc_site, scope, receive)
+            if rv is None:
+                return
+            status_code, body, headers = self.make_response(*rv)
+        await self.send_response(send, status_code, body, headers)
+
+    async def lifespan(self: Self, receive: Receive, send: Send) -> None:
+        """Acknowledge the startup and shutdown of the server.
+
+        Args:
+            receive (typing.Callable[[], typing.Awaitable[typing.MutableMapping[str, typing.Any]]]):
+                The channel of the incoming messages.
+            send (typing.Callable[[typing.MutableMapping[str, typing.Any]], typing.Awaitable[None]]):
+                The channel of the outgoing messages.
+        """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def send_response(
+        self: Self, send: Send, status_code: int, body: bytes, headers: list[tuple[bytes, bytes]]
+    ) -> None:
+        """Send an HTTP response.
+
+        Args:
+            send (typing.Callable[[typing.MutableMapping[str, typing.Any]], typing.Awaitable[None]]):
+                The channel of the outgoing messages.
+            status_code (int): The HTTP status code.
+            body (bytes): The response body.
+            headers (list[tuple[bytes, bytes]]): The HTTP headers, without the ``Content-Length`` header.
+        """
+        headers.append((b'content-length', str(len(body)).encode('latin-1')))
+        await send({'type': 'http.response.start', 'status': status_code, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def read_body(self: Self, receive: Receive) -> bytes | None:
+        """Read the request body, up to the ``MAX_CONTENT_LENGTH`` config.
+
+        Args:
+            receive (typing.Callable[[], typing.Awaitable[typing.MutableMapping[str, typing.Any]]]):
+                The channel of the incoming messages.
+
+        Returns:
+            bytes | None: The request body, None if the client disconnected.
+
+        Raises:
+            flask_jsonrpc.exceptions.ParseError: If the request body is too large (413).
+        """
+        max_size: int | None = self.app.config['MAX_CONTENT_LENGTH']
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return None
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise ParseError(data={'message': f'Request data exceeds {max_size} bytes'}, status_code=413)
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    async def dispatch_request(
+        self: Self, jsonrpc_site: JSONRPCSite, scope: Scope, receive: Receive
+    ) -> ResponseReturnValue | None:
+        """Dispatch the JSON-RPC request, see :meth:`~flask_jsonrpc.site.JSONRPCSite.dispatch_request`.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+            scope (typing.MutableMapping[str, typing.Any]): The connection scope.
+            receive (typing.Callable[[], typing.Awaitable[typing.MutableMapping[str, typing.Any]]]):
+                The channel of the incoming messages.
+
+        Returns:
+            tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]
+                | None: The response data, status code, and headers, None if the client disconnected.
+        """
+        exc: BaseException | None = None
+        if request_started.receivers:
+            request_started.send(jsonrpc_site)
+        try:
+            headers = {
+                name: value for name, value in scope['headers'] if name in (b'content-type', b'content-encoding')
+            }
+            mimetype = headers.get(b'content-type', b'').decode('latin-1').partition(';')[0].strip().lower()
+            if not jsonrpc_site.is_json_mimetype(mimetype):
+                jsonrpc_site.logger.info('invalid mimetype')
+                raise ParseError(
+                    data={
+                        'message': f'Invalid mime type for JSON: {mimetype}, use header Content-Type: application/json'
+                    }
+                ) from None
+
+            request_data = await self.read_body(receive)
+            if request_data is None:
+                return None
+            content_encoding = headers.get(b'content-encoding', b'').decode('latin-1')
+            if content_encoding and content_encoding.strip().lower() != 'identity':
+                request_data = jsonrpc_site.decompress_request_data([request_data], content_encoding)
+            json_data = jsonrpc_site.to_json(request_data, mimetype)
+
+            rv = await self.preprocess_request(jsonrpc_site, json_data)
+            if rv is not None:
+                return rv
+            if jsonrpc_site._is_batch_request(json_data):
+                return await self.batch_dispatch(jsonrpc_site, json_data)
+            return await self.handle_dispatch_except(jsonrpc_site, json_data)
+        except JSONRPCError as e:
+            jsonrpc_site.logger.info('jsonrpc error', exc_info=e)
+            response = {'id': None, 'jsonrpc': JSONRPC_VERSION_DEFAULT, 'error': e.jsonrpc_format}
+            return response, e.status_code, JSONRPC_DEFAULT_HTTP_HEADERS
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            for fn in reversed(jsonrpc_site.teardown_request_funcs):
+                await call(fn, exc)
+
+    async def preprocess_request(
+        self: Self,
+        jsonrpc_site: JSONRPCSite,
+        req_json: t.Any,  # noqa: ANN401
+    ) -> ResponseReturnValue | None:
+        """Call the before request functions, see :meth:`~flask_jsonrpc.site.JSONRPCSite.preprocess_request`.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+            req_json (typing.Any): The decoded JSON-RPC request data.
+
+        Returns:
+            tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]
+                | None: The response returned by the first function that returned a non-None value, otherwise None.
+        """
+        for fn in jsonrpc_site.before_request_funcs:
+            rv = await call(fn, req_json)
+            if rv is not None:
+                return jsonrpc_site.unpack_tuple_returns(rv)
+        return None
+
+    async def batch_dispatch(self: Self, jsonrpc_site: JSONRPCSite, reqs_json: list[t.Any]) -> ResponseReturnValue:
+        """Dispatch the requests of a batch concurrently, see :meth:`~flask_jsonrpc.site.JSONRPCSite.batch_dispatch`.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+            reqs_json (list[typing.Any]): The list of JSON-RPC request data.
+
+        Returns:
+            tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
+                The list of response data, status code, and headers.
+
+        Raises:
+            flask_jsonrpc.exceptions.InvalidRequestError: If the batch request is empty.
+        """
+        if not reqs_json:
+            raise InvalidRequestError(data={'message': 'Empty array'}) from None
+
+        rvs = await asyncio.gather(*[self.handle_dispatch_except(jsonrpc_site, rq) for rq in reqs_json])
+        resp_views = []
+        headers = Headers()
+        for rv, _, hdrs in rvs:
+            headers.update([hdrs] if isinstance(hdrs, tuple) else hdrs)  # type: ignore
+            if rv is not None:
+                resp_views.append(rv)
+        return resp_views, JSONRPC_DEFAULT_HTTP_STATUS_CODE if resp_views else 204, headers
+
+    async def handle_dispatch_except(self: Self, jsonrpc_site: JSONRPCSite, req_json: t.Any) -> ResponseReturnValue:  # noqa: ANN401
+        """Dispatch a request and convert the exceptions to JSON-RPC error responses, see
+        :meth:`~flask_jsonrpc.site.JSONRPCSite.handle_dispatch_except`.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+            req_json (typing.Any): The JSON-RPC request data.
+
+        Returns:
+            tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
+                The response data, status code, and headers.
+        """
+        if call_started.receivers:
+            call_started.send(jsonrpc_site, req_json=req_json)
+        started_at = time.perf_counter()
+        try:
+            if not jsonrpc_site.validate(req_json):
+                raise InvalidRequestError(data={'message': f'Invalid JSON: {req_json!r}'}) from None
+            record_timing(get_timings(), 'validate', started_at)
+            for fn in jsonrpc_site.before_dispatch_funcs:
+                await call(fn, req_json)
+            view_func = jsonrpc_site.get_view_func(req_json)
+            resp_view = await self.handle_view_func(jsonrpc_site, view_func, req_json.get('params', {}))
+            rv = jsonrpc_site.make_response(req_json, resp_view)
+        except JSONRPCError as e:
+            jsonrpc_site.logger.info('jsonrpc error', exc_info=e)
+            response = {
+                'id': get(req_json, 'id'),
+                'jsonrpc': get(req_json, 'jsonrpc', JSONRPC_VERSION_DEFAULT),
+                'error': e.jsonrpc_format,
+            }
+            rv = response, e.status_code, JSONRPC_DEFAULT_HTTP_HEADERS
+        except Exception as e:
+            # The error handlers may be async functions, that can not run on the event loop thread
+            rv = await asyncio.to_thread(jsonrpc_site.handle_exception, req_json, e)
+        if call_finished.receivers:
+            call_finished.send(
+                jsonrpc_site,
+                req_json=req_json,
+                response=rv[0],
+                status_code=rv[1],
+                duration=time.perf_counter() - started_at,
+            )
+        return rv
+
+    async def handle_view_func(
+        self: Self,
+        jsonrpc_site: JSONRPCSite,
+        view_func: t.Callable[..., t.Any],
+        params: t.Any,  # noqa: ANN401
+    ) -> t.Any:  # noqa: ANN401
+        """Call a view function, see :meth:`~flask_jsonrpc.site.JSONRPCSite.handle_view_func`.
+
+        The async view functions are awaited on the event loop and the sync view functions
+        run in the default thread pool. The async generator results are collected into a list.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+            view_func (typing.Callable[..., typing.Any]): The view function.
+            params (typing.Any): The parameters of the call.
+
+        Returns:
+            typing.Any: The result of the view function.
+
+        Raises:
+            flask_jsonrpc.exceptions.InvalidParamsError: If the parameters or the result do not type check.
+        """
+        if not inspect.iscoroutinefunction(view_func):
+            resp_view = await asyncio.to_thread(jsonrpc_site.handle_view_func, view_func, params)
+        else:
+            try:
+                binded_params = jsonrpc_site.bind_params(view_func, params)
+                started_at = time.perf_counter()
+                resp_view = await view_func(**binded_params)
+                record_timing(get_timings(), 'view', started_at)
+                resp_view = jsonrpc_site.check_return(view_func, resp_view)
+            except (TypeError, TypeCheckError) as e:
+                raise jsonrpc_site.make_invalid_params_error(view_func, e) from e
+        if isinstance(resp_view, AsyncGeneratorType):
+            return [item async for item in resp_view]
+        return resp_view
+
+    def make_response(
+        self: Self,
+        response: t.Any,  # noqa: ANN401
+        status_code: int,
+        headers: Headers | dict[str, str] | tuple[str] | list[tuple[str]],
+    ) -> tuple[int, bytes, list[tuple[bytes, bytes]]]:
+        """Encode the response data in JSON.
+
+        Args:
+            response (typing.Any): The response data, or a pre-encoded JSON body.
+            status_code (int): The HTTP status code.
+            headers (werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]):
+                The HTTP headers.
+
+        Returns:
+            tuple[int, bytes, list[tuple[bytes, bytes]]]: The status code, body, and ASGI headers of the response.
+        """
+        raw_headers: list[tuple[bytes, bytes]] = []
+        if status_code == 204:
+            body = b''
+        elif isinstance(response, bytes | bytearray):
+            body = bytes(response)
+        else:
+            body = dumps(response, self.app.json).encode('utf-8')
+        if status_code != 204:
+            raw_headers.append((b'content-type', b'application/json'))
+        if headers:
+            hdrs = Headers([headers] if isinstance(headers, tuple) else headers)  # type: ignore
+            raw_headers.extend(
+                (name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in hdrs.items()
+            )
+        return status_code, body, raw_headers
@@ -0,0 +1,362 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import json
+import dataclasses
+
+from flask import current_app
+from flask.cli import AppGroup
+
+import click
+
+from flask_jsonrpc.contrib.bench import (
+    BENCH_STATS,
+    MEMORY_STATS,
+    Scenario,
+    BenchmarkResults,
+    run_benchmarks,
+    compare_results,
+    discover_scenarios,
+)
+from flask_jsonrpc.contrib.bench.load import LOAD_WORKLOADS, run_load_test
+from flask_jsonrpc.contrib.bench.payloads import generate_scenarios
+from flask_jsonrpc.contrib.capture.replay import replay, load_records
+
+jsonrpc_cli = AppGroup('jsonrpc', help='Flask-JSONRPC commands.')
+
+
+def load_scenarios(path: str) -> list[Scenario]:
+    """Load benchmark scenarios from a JSON file.
+
+    The file holds a list of objects with the ``name`` and ``payload`` of each
+    scenario, and optionally its ``path``, ``group`` and expected ``status_code``.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        list[flask_jsonrpc.contrib.bench.Scenario]: The scenarios.
+
+    Raises:
+        click.BadParameter: If the file is not a list of scenarios.
+    """
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise click.BadParameter(f'invalid JSON: {e}', param_hint='--scenarios') from e
+    if not isinstance(data, list):
+        raise click.BadParameter('expected a JSON list of scenarios', param_hint='--scenarios')
+    try:
+        return [Scenario(**item) for item in data]
+    except TypeError as e:
+        raise click.BadParameter(f'invalid scenario: {e}', param_hint='--scenarios') from e
+
+
+def echo_results(results: BenchmarkResults, stat: str) -> None:
+    """Print a line per benchmarked and skipped scenario.
+
+    Args:
+        results (flask_jsonrpc.contrib.bench.BenchmarkResults): The benchmark results.
+        stat (str): The statistic printed with the 99th percentile and the operations per second,
+            or a memory statistic to print the peak and retained memory.
+    """
+    for result in results.benchmarks:
+        stats = result['stats']
+        if stat in MEMORY_STATS:
+            click.echo(
+                f'{result["name"]:<32} peak {stats["peak"] / 1024:>10.1f}KiB  '
+                f'retained {stats["retained"] / 1024:>10.1f}KiB'
+            )
+            continue
+        click.echo(
+            f'{result["name"]:<32} {stat} {stats[stat] * 1e6:>10.1f}us  '
+            f'p99 {stats["p99"] * 1e6:>10.1f}us  {stats["ops"]:>10.0f} ops/s'
+        )
+    for skipped in results.skipped:
+        click.echo(f'{skipped["name"]:<32} skipped: {skipped["reason"]}', err=True)
+
+
+def compare_with_baseline(results: BenchmarkResults, baseline: str, *, tolerance: float, stat: str) -> None:
+    """Print the comparison of the results with a baseline file.
+
+    Args:
+        results (flask_jsonrpc.contrib.bench.BenchmarkResults): The benchmark results.
+        baseline (str): The baseline file path.
+        tolerance (float): The relative change from which a scenario regressed or improved.
+        stat (str): The compared statistic.
+
+    Raises:
+        click.UsageError: If the baseline file does not exist.
+        click.ClickException: If a scenario regressed.
+    """
+    try:
+        baseline_results = BenchmarkResults.load(baseline)
+    except FileNotFoundError as e:
+        raise click.UsageError(f'baseline {baseline} not found, create it with --save-baseline') from e
+
+    comparisons = compare_results(results, baseline_results, tolerance=tolerance, stat=stat)
+    click.echo(f'\nCompared with {baseline} ({stat}, tolerance {tolerance:.0%}):')
+    for comparison in comparisons:
+        change = f'{comparison.change:+.1%}' if comparison.change is not None else ''
+        click.echo(f'{comparison.name:<32} {comparison.status:<10} {change}')
+    regressed = [comparison.name for comparison in comparisons if comparison.status == 'regressed']
+    if regressed:
+        raise click.ClickException(f'{len(regressed)} scenario(s) regressed: {", ".join(regressed)}')
+
+
+@jsonrpc_cli.command('bench')
+@click.option(
+    '--rounds', type=click.IntRange(min=1), help='Measured calls per scenario.  [default: 1000, or 20 with --memory]'
+)
+@click.option(
+    '--warmup', type=click.IntRange(min=0), default=100, show_default=True, help='Unmeasured calls per scenario.'
+)
+@click.option(
+    '--memory', is_flag=True, help='Measure the peak and retained memory of the requests instead of their timings.'
+)
+@click.option('-k', 'keyword', help='Only run the scenarios whose name or group contain KEYWORD.')
+@click.option(
+    '--scenarios',
+    'scenarios_path',
+    type=click.Path(exists=True, dir_okay=False),
+    help='JSON file with the scenarios, instead of one scenario per method built from the method examples.',
+)
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write the JSON results to this file.')
+@click.option(
+    '--baseline',
+    type=click.Path(dir_okay=False),
+    help='Compare the results with this baseline file, exits with status 1 if a scenario regressed.',
+)
+@click.option('--save-baseline', is_flag=True, help='Write the results to the baseline file instead of comparing.')
+@click.option(
+    '--tolerance',
+    type=click.FloatRange(min=0),
+    default=0.1,
+    show_default=True,
+    help='Relative change from which a scenario regressed or improved.',
+)
+@click.option(
+    '--stat',
+    type=click.Choice(BENCH_STATS + MEMORY_STATS),
+    help='The compared statistic.  [default: median, or peak with --memory]',
+)
+def bench_command(
+    rounds: int | None,
+    warmup: int,
+    memory: bool,
+    keyword: str | None,
+    scenarios_path: str | None,
+    output: str | None,
+    baseline: str | None,
+    save_baseline: bool,
+    tolerance: float,
+    stat: str | None,
+) -> None:
+    """Benchmark the JSON-RPC methods of the application.
+
+    The requests are sent through the WSGI application, without a network server.
+    By default a scenario is built for each registered method, from its ``default``
+    or first example; the methods with required params and without examples are
+    skipped.
+    """
+    if save_baseline and not baseline:
+        raise click.UsageError('--save-baseline requires --baseline')
+    if stat is None:
+        stat = 'peak' if memory else 'median'
+    if (stat in MEMORY_STATS) != memory:
+        raise click.UsageError(f'--stat {stat} is {"not " if memory else ""}a memory statistic, check --memory')
+
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    if scenarios_path:
+        scenarios = load_scenarios(scenarios_path)
+        discover_skipped: list[dict[str, str]] = []
+    else:
+        scenarios, discover_skipped = discover_scenarios(app)
+    results = run_benchmarks(
+        app, scenarios, rounds=rounds or (20 if memory else 1000), warmup=warmup, keyword=keyword, memory=memory
+    )
+    results.skipped[:0] = discover_skipped
+
+    echo_results(results, stat)
+
+    if output:
+        results.save(output)
+    if not baseline:
+        return
+    if save_baseline:
+        results.save(baseline)
+        click.echo(f'Saved the baseline to {baseline}')
+        return
+
+    compare_with_baseline(results, baseline, tolerance=tolerance, stat=stat)
+
+
+@jsonrpc_cli.command('load')
+@click.option('--clients', '-c', type=click.IntRange(min=1), default=8, show_default=True, help='Concurrent clients.')
+@click.option(
+    '--requests', '-n', type=click.IntRange(min=1), default=1000, show_default=True, help='Requests per client.'
+)
+@click.option(
+    '--warmup', type=click.IntRange(min=0), default=10, show_default=True, help='Untimed requests per client.'
+)
+@click.option(
+    '--workload',
+    '-w',
+    type=click.Choice(LOAD_WORKLOADS),
+    default='single',
+    show_default=True,
+    help='Single calls, batches of calls, or both.',
+)
+@click.option(
+    '--batch-size', type=click.IntRange(min=1), default=10, show_default=True, help='Calls per batch request.'
+)
+@click.option('-k', 'keyword', help='Only send the scenarios whose name or group contain KEYWORD.')
+@click.option(
+    '--scenarios',
+    'scenarios_path',
+    type=click.Path(exists=True, dir_okay=False),
+    help='JSON file with the scenarios, instead of one scenario per method built from the method examples.',
+)
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write the JSON results to this file.')
+def load_command(
+    clients: int,
+    requests: int,
+    warmup: int,
+    workload: str,
+    batch_size: int,
+    keyword: str | None,
+    scenarios_path: str | None,
+    output: str | None,
+) -> None:
+    """Load test the JSON-RPC methods of the application.
+
+    The application is served in-process by a threaded server on the loopback
+    interface, and each client sends its requests on a keep-alive connection.
+    Exits with status 1 if a request failed.
+    """
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    scenarios = load_scenarios(scenarios_path) if scenarios_path else discover_scenarios(app)[0]
+    if keyword:
+        scenarios = [scenario for scenario in scenarios if keyword in scenario.name or keyword in scenario.group]
+    try:
+        results = run_load_test(
+            app, scenarios, workload=workload, clients=clients, requests=requests, warmup=warmup, batch_size=batch_size
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+
+    click.echo(
+        f'{results.requests} requests ({results.calls} calls) from {results.clients} clients '
+        f'in {results.duration:.2f}s, {results.errors} errors'
+    )
+    click.echo(f'Throughput: {results.throughput:.1f} requests/s, {results.calls_throughput:.1f} calls/s')
+    click.echo('Latency: ' + ', '.join(f'{name} {value * 1e3:.2f}ms' for name, value in results.percentiles().items()))
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results.to_dict(), f, indent=2)
+            f.write('\n')
+    if results.errors:
+        raise click.ClickException(f'{results.errors} request(s) failed')
+
+
+@jsonrpc_cli.command('generate')
+@click.option('--count', '-n', type=click.IntRange(min=1), default=1, show_default=True, help='Requests per method.')
+@click.option(
+    '--invalid-ratio',
+    type=click.FloatRange(min=0, max=1),
+    default=0.0,
+    show_default=True,
+    help='Ratio of invalid requests, expected to be rejected with the HTTP 400 status code.',
+)
+@click.option('--seed', type=int, help='Seed of the random generator, for reproducible requests.')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write the scenarios to this file.')
+def generate_command(count: int, invalid_ratio: float, seed: int | None, output: str | None) -> None:
+    """Generate random requests for the JSON-RPC methods of the application.
+
+    The params are generated from the annotations of the methods and their
+    constraints, or taken from the method examples. The scenarios are written
+    as JSON, to be used with the ``--scenarios`` option of the ``bench`` and
+    ``load`` commands.
+    """
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    scenarios = generate_scenarios(app, count=count, invalid_ratio=invalid_ratio, seed=seed)
+    data = json.dumps([dataclasses.asdict(scenario) for scenario in scenarios], indent=2)
+    if not output:
+        click.echo(data)
+        return
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(data + '\n')
+    click.echo(f'Generated {len(scenarios)} scenarios to {output}')
+
+
+@jsonrpc_cli.command('replay')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    '--speed',
+    type=click.FloatRange(min=0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help='Replay speed, 2 replays twice as fast as recorded.',
+)
+@click.option('--fast', is_flag=True, help='Send the requests as fast as possible, ignoring the recorded pace.')
+@click.option('--no-compare', is_flag=True, help='Do not compare the responses with the recorded ones.')
+@click.option('--output', '-o', type=click.Path(dir_okay=False), help='Write the JSON results to this file.')
+def replay_command(path: str, speed: float, fast: bool, no_compare: bool, output: str | None) -> None:
+    """Replay the requests recorded by the traffic recorder in PATH.
+
+    The requests are sent through the WSGI application, without a network server,
+    and their latencies are compared with the recorded ones. Exits with status 1
+    if a status code or a response differs from the recorded one.
+    """
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    results = replay(app, load_records(path), speed=None if fast else speed, compare=not no_compare)
+
+    for result in results.mismatches:
+        click.echo(
+            f'#{result.index} {result.method}: HTTP {result.status_code} (recorded {result.recorded_status_code})'
+            f'{", different response" if result.equal is False else ""}',
+            err=True,
+        )
+    click.echo(
+        f'{len(results.results)} requests replayed in {results.duration:.2f}s, {len(results.mismatches)} mismatches'
+    )
+    recorded = results.percentiles(recorded=True)
+    click.echo(
+        'Latency: '
+        + ', '.join(
+            f'{name} {value * 1e3:.2f}ms (recorded {recorded[name] * 1e3:.2f}ms)'
+            for name, value in results.percentiles().items()
+        )
+    )
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results.to_dict(), f, indent=2)
+            f.write('\n')
+    if results.mismatches:
+        raise click.ClickException(f'{len(results.mismatches)} request(s) differ from the recording')
@@ -0,0 +1,177 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import typing as t
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask.json.provider import DefaultJSONProvider
+
+from flask_jsonrpc.encoders import RawJSON, serializable
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None  # type: ignore[assignment]
+
+
+class Codec(t.Protocol):  # pragma: no cover
+    """A protocol for the codecs of the JSON-RPC request and response bodies, other than JSON.
+
+    Attributes:
+        mimetypes (tuple[str, ...]): The mimetypes of the codec, the first one is the
+            mimetype of the responses.
+    """
+
+    mimetypes: tuple[str, ...]
+
+    def loads(self: Self, data: bytes) -> t.Any:  # noqa: ANN401
+        """Decode a request body.
+
+        Args:
+            data (bytes): The request body.
+
+        Returns:
+            typing.Any: The decoded JSON-RPC request data.
+
+        Raises:
+            ValueError: If the request body is not valid.
+        """
+        ...
+
+    def dumps(self: Self, obj: t.Any) -> bytes:  # noqa: ANN401
+        """Encode a response body.
+
+        Args:
+            obj (typing.Any): The JSON-RPC response data.
+
+        Returns:
+            bytes: The response body.
+        """
+        ...
+
+
+class MessagePackCodec:
+    """MessagePack codec, it requires the ``msgpack`` package (``pip install flask-jsonrpc[msgpack]``).
+
+    The values that MessagePack can not encode are converted like the JSON responses, and
+    the :class:`~flask_jsonrpc.encoders.RawJSON` values are decoded.
+
+    Args:
+        mimetypes (tuple[str, ...]): The mimetypes of the codec. Defaults to
+            ``application/msgpack``, ``application/x-msgpack`` and ``application/vnd.msgpack``.
+
+    Attributes:
+        mimetypes (tuple[str, ...]): The mimetypes of the codec.
+
+    Examples:
+        >>> codec = MessagePackCodec()
+        >>> codec.loads(codec.dumps({'id': 1, 'jsonrpc': '2.0', 'result': [1.5, 2]}))
+        {'id': 1, 'jsonrpc': '2.0', 'result': [1.5, 2]}
+    """
+
+    def __init__(
+        self: Self,
+        mimetypes: tuple[str, ...] = ('application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack'),
+    ) -> None:
+        if msgpack is None:  # pragma: no cover
+            raise RuntimeError('the MessagePack codec requires msgpack, see https://pypi.org/project/msgpack/')
+        self.mimetypes = mimetypes
+
+    def loads(self: Self, data: bytes) -> t.Any:  # noqa: ANN401
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    def dumps(self: Self, obj: t.Any) -> bytes:  # noqa: ANN401
+        data: bytes = msgpack.packb(serializable(obj), default=self.default, use_bin_type=True)
+        return data
+
+    def default(self: Self, obj: t.Any) -> t.Any:  # noqa: ANN401
+        """Convert the values that MessagePack can not encode.
+
+        Args:
+            obj (typing.Any): The value.
+
+        Returns:
+            typing.Any: The converted value.
+        """
+        if isinstance(obj, RawJSON):
+            return obj.loads()
+        return DefaultJSONProvider.default(obj)
+
+
+class CBORCodec:
+    """CBOR codec, it requires the ``cbor2`` package (``pip install flask-jsonrpc[cbor]``).
+
+    The :class:`~flask_jsonrpc.encoders.RawJSON` values are decoded.
+
+    Args:
+        mimetypes (tuple[str, ...]): The mimetypes of the codec. Defaults to ``application/cbor``.
+
+    Attributes:
+        mimetypes (tuple[str, ...]): The mimetypes of the codec.
+
+    Examples:
+        >>> codec = CBORCodec()
+        >>> codec.loads(codec.dumps({'id': 1, 'jsonrpc': '2.0', 'result': [1.5, 2]}))
+        {'id': 1, 'jsonrpc': '2.0', 'result': [1.5, 2]}
+    """
+
+    def __init__(self: Self, mimetypes: tuple[str, ...] = ('application/cbor',)) -> None:
+        if cbor2 is None:  # pragma: no cover
+            raise RuntimeError('the CBOR codec requires cbor2, see https://pypi.org/project/cbor2/')
+        self.mimetypes = mimetypes
+
+    def loads(self: Self, data: bytes) -> t.Any:  # noqa: ANN401
+        try:
+            return cbor2.loads(data)
+        except cbor2.CBORDecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self: Self, obj: t.Any) -> bytes:  # noqa: ANN401
+        data: bytes = cbor2.dumps(serializable(obj), default=self.default)
+        return data
+
+    def default(self: Self, encoder: t.Any, obj: t.Any) -> None:  # noqa: ANN401
+        """Encode the values that CBOR can not encode.
+
+        Args:
+            encoder (cbor2.CBOREncoder): The CBOR encoder.
+            obj (typing.Any): The value.
+
+        Raises:
+            cbor2.CBOREncodeTypeError: If the value is not a :class:`~flask_jsonrpc.encoders.RawJSON` value.
+        """
+        if not isinstance(obj, RawJSON):
+            raise cbor2.CBOREncodeTypeError(f'cannot serialize type {type(obj).__name__}')
+        encoder.encode(obj.loads())
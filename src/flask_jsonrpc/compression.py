@@ -0,0 +1,337 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import zlib
+import typing as t
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from flask import Response
+
+    from werkzeug.datastructures import Accept
+
+
+class Compressor(t.Protocol):  # pragma: no cover
+    """A protocol for the compressors of the response bodies.
+
+    Attributes:
+        encoding (str): The content coding of the compressor, as in the ``Content-Encoding`` header.
+        level (int): The default compression level.
+    """
+
+    encoding: str
+    level: int
+
+    def compress(self: Self, data: bytes, level: int) -> bytes:
+        """Compress a response body.
+
+        Args:
+            data (bytes): The response body.
+            level (int): The compression level.
+
+        Returns:
+            bytes: The compressed response body.
+        """
+        ...
+
+    def compress_stream(self: Self, chunks: t.Iterable[bytes], level: int) -> t.Iterator[bytes]:
+        """Compress a streamed response body, flushing the compressed data of each chunk.
+
+        Args:
+            chunks (typing.Iterable[bytes]): The chunks of the response body.
+            level (int): The compression level.
+
+        Returns:
+            typing.Iterator[bytes]: The compressed chunks.
+        """
+        ...
+
+
+class DecompressionLimitError(ValueError):
+    """The decompressed body exceeds the maximum size."""
+
+
+class ZlibCompressor:
+    """The ``gzip`` and ``deflate`` compressor, from the standard library.
+
+    Args:
+        encoding (str): The content coding, ``gzip`` or ``deflate``.
+        wbits (int): The ``wbits`` of :func:`zlib.compressobj`, which selects the container format.
+        level (int): The default compression level, from 0 to 9. Defaults to 6.
+
+    Examples:
+        >>> import gzip
+        >>> compressor = ZlibCompressor('gzip', zlib.MAX_WBITS | 16)
+        >>> gzip.decompress(compressor.compress(b'{"result": 1}', compressor.level))
+        b'{"result": 1}'
+    """
+
+    def __init__(self: Self, encoding: str, wbits: int, level: int = 6) -> None:
+        self.encoding = encoding
+        self.wbits = wbits
+        self.level = level
+
+    def compress(self: Self, data: bytes, level: int) -> bytes:
+        compressobj = zlib.compressobj(level, zlib.DEFLATED, self.wbits)
+        return compressobj.compress(data) + compressobj.flush()
+
+    def compress_stream(self: Self, chunks: t.Iterable[bytes], level: int) -> t.Iterator[bytes]:
+        compressobj = zlib.compressobj(level, zlib.DEFLATED, self.wbits)
+        for chunk in chunks:
+            yield compressobj.compress(chunk) + compressobj.flush(zlib.Z_SYNC_FLUSH)
+        yield compressobj.flush()
+
+    def decompress_stream(self: Self, chunks: t.Iterable[bytes], max_size: int) -> bytes:
+        """Decompress a request body chunk by chunk, never inflating more than ``max_size`` bytes.
+
+        Args:
+            chunks (typing.Iterable[bytes]): The chunks of the compressed request body.
+            max_size (int): The maximum size of the decompressed body, in bytes.
+
+        Returns:
+            bytes: The decompressed request body.
+
+        Raises:
+            DecompressionLimitError: If the decompressed body exceeds ``max_size``.
+            ValueError: If the compressed body is invalid or truncated.
+
+        Examples:
+            >>> compressor = ZlibCompressor('deflate', zlib.MAX_WBITS)
+            >>> compressor.decompress_stream([zlib.compress(b'{"id": 1}')], 1024)
+            b'{"id": 1}'
+            >>> compressor.decompress_stream([zlib.compress(b'0' * 2048)], 1024)
+            Traceback (most recent call last):
+              ...
+            flask_jsonrpc.compression.DecompressionLimitError: decompressed body exceeds 1024 bytes
+        """
+        decompressobj = zlib.decompressobj(self.wbits)
+        data = bytearray()
+        try:
+            for chunk in chunks:
+                while chunk:
+                    data += decompressobj.decompress(chunk, max_size + 1 - len(data))
+                    if len(data) > max_size:
+                        raise DecompressionLimitError(f'decompressed body exceeds {max_size} bytes')
+                    chunk = decompressobj.unconsumed_tail
+            data += decompressobj.flush()
+        except zlib.error as e:
+            raise ValueError(f'invalid {self.encoding} body: {e}') from e
+        if not decompressobj.eof:
+            raise ValueError(f'truncated {self.encoding} body')
+        return bytes(data)
+
+
+class BrotliCompressor:
+    """The ``br`` compressor, it requires the ``brotli`` package.
+
+    Args:
+        level (int): The default quality, from 0 to 11. Defaults to 4, as the highest
+            qualities are too slow for dynamic responses.
+    """
+
+    encoding = 'br'
+
+    def __init__(self: Self, level: int = 4) -> None:
+        self.level = level
+
+    def compress(self: Self, data: bytes, level: int) -> bytes:
+        data = brotli.compress(data, quality=level)
+        return data
+
+    def compress_stream(self: Self, chunks: t.Iterable[bytes], level: int) -> t.Iterator[bytes]:
+        compressor = brotli.Compressor(quality=level)
+        for chunk in chunks:
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+
+
+class ZstdCompressor:
+    """The ``zstd`` compressor, it requires the ``zstandard`` package.
+
+    Args:
+        level (int): The default compression level, from 1 to 22. Defaults to 3.
+    """
+
+    encoding = 'zstd'
+
+    def __init__(self: Self, level: int = 3) -> None:
+        self.level = level
+
+    def compress(self: Self, data: bytes, level: int) -> bytes:
+        data = zstandard.ZstdCompressor(level=level).compress(data)
+        return data
+
+    def compress_stream(self: Self, chunks: t.Iterable[bytes], level: int) -> t.Iterator[bytes]:
+        compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+        for chunk in chunks:
+            yield compressobj.compress(chunk) + compressobj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        yield compressobj.flush()
+
+
+COMPRESSORS: dict[str, Compressor] = {
+    'gzip': ZlibCompressor('gzip', zlib.MAX_WBITS | 16),
+    'deflate': ZlibCompressor('deflate', zlib.MAX_WBITS),
+}
+"""dict[str, Compressor]: The available compressors, by content coding. The ``br`` and
+``zstd`` compressors are available when the ``brotli`` and ``zstandard`` packages are installed.
+"""
+if brotli is not None:  # pragma: no branch
+    COMPRESSORS['br'] = BrotliCompressor()
+if zstandard is not None:  # pragma: no branch
+    COMPRESSORS['zstd'] = ZstdCompressor()
+
+DECOMPRESSORS: dict[str, ZlibCompressor] = {
+    'gzip': ZlibCompressor('gzip', zlib.MAX_WBITS | 16),
+    'deflate': ZlibCompressor('deflate', zlib.MAX_WBITS),
+}
+"""dict[str, ZlibCompressor]: The available decompressors of the request bodies, by content coding."""
+
+
+def decompress_request_data(
+    chunks: t.Iterable[bytes], content_encoding: str, *, encodings: t.Sequence[str], max_size: int
+) -> bytes:
+    """Decompress a request body with the content coding of its ``Content-Encoding`` header.
+
+    Args:
+        chunks (typing.Iterable[bytes]): The chunks of the compressed request body.
+        content_encoding (str): The ``Content-Encoding`` header of the request.
+        encodings (typing.Sequence[str]): The content codings accepted by the server.
+        max_size (int): The maximum size of the decompressed body, in bytes.
+
+    Returns:
+        bytes: The decompressed request body.
+
+    Raises:
+        LookupError: If the content coding is not accepted.
+        DecompressionLimitError: If the decompressed body exceeds ``max_size``.
+        ValueError: If the compressed body is invalid or truncated.
+
+    Examples:
+        >>> import gzip
+        >>> decompress_request_data(
+        ...     [gzip.compress(b'[]')], 'GZIP', encodings=['gzip'], max_size=1024
+        ... )
+        b'[]'
+        >>> decompress_request_data([b'[]'], 'br', encodings=['gzip'], max_size=1024)
+        Traceback (most recent call last):
+          ...
+        LookupError: unsupported content coding: br
+    """
+    encoding = content_encoding.strip().lower()
+    if encoding not in encodings or encoding not in DECOMPRESSORS:
+        raise LookupError(f'unsupported content coding: {encoding}')
+    return DECOMPRESSORS[encoding].decompress_stream(chunks, max_size)
+
+
+def negotiate_encoding(accept_encodings: Accept, encodings: t.Sequence[str]) -> str | None:
+    """Select the content coding of a response.
+
+    Args:
+        accept_encodings (werkzeug.datastructures.Accept): The ``Accept-Encoding`` header of the request.
+        encodings (typing.Sequence[str]): The content codings of the server, by preference.
+
+    Returns:
+        str | None: The available content coding that best matches the header, None if
+            the response must not be compressed.
+
+    Examples:
+        >>> from werkzeug.datastructures import Accept
+        >>> from werkzeug.http import parse_accept_header
+        >>>
+        >>> negotiate_encoding(
+        ...     parse_accept_header('deflate, gzip', Accept), ['br', 'gzip', 'deflate']
+        ... )
+        'gzip'
+        >>> negotiate_encoding(
+        ...     parse_accept_header('identity', Accept), ['br', 'gzip', 'deflate']
+        ... )
+    """
+    return accept_encodings.best_match([encoding for encoding in encodings if encoding in COMPRESSORS])
+
+
+def compress_response(
+    response: Response,
+    accept_encodings: Accept,
+    *,
+    encodings: t.Sequence[str],
+    min_size: int = 0,
+    levels: t.Mapping[str, int] | None = None,
+) -> Response:
+    """Compress a response with the content coding negotiated with the ``Accept-Encoding`` header.
+
+    The responses smaller than ``min_size``, already encoded, or without a body are not
+    compressed. Streamed responses are compressed chunk by chunk, whatever their size, and
+    a strong ``ETag`` is made weak, as the compressed body differs. A ``304 Not Modified``
+    response gets the ``Vary`` header and the weak ``ETag`` of the compressed response it
+    validates, without a body.
+
+    Args:
+        response (flask.Response): The response to compress.
+        accept_encodings (werkzeug.datastructures.Accept): The ``Accept-Encoding`` header of the request.
+        encodings (typing.Sequence[str]): The content codings of the server, by preference.
+        min_size (int): The minimum size of the body to compress, in bytes. Defaults to 0.
+        levels (typing.Mapping[str, int] | None): The compression level of each content coding,
+            otherwise the default level of the compressor. Defaults to None.
+
+    Returns:
+        flask.Response: The response, compressed in place.
+    """
+    if response.status_code < 200 or response.status_code == 204 or 'Content-Encoding' in response.headers:
+        return response
+    response.vary.add('Accept-Encoding')
+    if not response.is_streamed and len(response.get_data()) < min_size:
+        return response
+    encoding = negotiate_encoding(accept_encodings, encodings)
+    if encoding is None:
+        return response
+
+    if response.status_code != 304:
+        compressor = COMPRESSORS[encoding]
+        level = (levels or {}).get(encoding, compressor.level)
+        if response.is_streamed:
+            response.response = compressor.compress_stream(response.iter_encoded(), level)
+            response.headers.pop('Content-Length', None)
+        else:
+            response.set_data(compressor.compress(response.get_data(), level))
+        response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
@@ -72,3 +72,15 @@ BROWSE_MIDDLEWARE: list[
         ],
     ]
 ] = []
+
+SERVER_TIMING_HEADER = False
+
+COMPRESSION_ENABLED = False
+COMPRESSION_ENCODINGS: list[str] = ['zstd', 'br', 'gzip', 'deflate']  # by preference, if available
+COMPRESSION_MIN_SIZE = 1024  # bytes
+COMPRESSION_LEVELS: dict[str, int] = {}  # {encoding: level}
+DECOMPRESSION_ENCODINGS: list[str] = ['gzip', 'deflate']  # request bodies, empty to disable
+DECOMPRESSION_MAX_SIZE = 16 * 1024 * 1024  # bytes
+
+NDJSON_PIPELINE_ENABLED = False
+NDJSON_PIPELINE_MAX_LINE_SIZE = 1024 * 1024  # bytes, with the newline
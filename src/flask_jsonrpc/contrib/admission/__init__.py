@@ -0,0 +1,215 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+import functools
+import threading
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask import g
+
+from flask_jsonrpc.site import JSONRPC_VERSION_DEFAULT
+from flask_jsonrpc.helpers import get
+from flask_jsonrpc.exceptions import ServerOverloadedError
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+
+
+class AdmissionControl:
+    """Flask-JSONRPC admission control contrib extension.
+
+    Tracks the number of in-flight requests and an exponentially weighted moving
+    average (EWMA) of their latency, and sheds new requests with a pre-encoded
+    :class:`~flask_jsonrpc.exceptions.ServerOverloadedError` response once one of
+    the thresholds is exceeded. Methods registered with ``critical=True`` are
+    never shed; a batch request is only exempt if all of its methods are critical.
+
+    Args:
+        app (flask.Flask | None): The Flask application instance. Defaults to None.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC | None): The JSON-RPC application instance. Defaults to None.
+        max_in_flight (int | None): Maximum number of concurrent requests. Defaults to None (unlimited).
+        max_latency (float | None): Maximum latency EWMA, in seconds. Defaults to None (unlimited).
+        min_in_flight (int): Minimum number of concurrent requests for the latency threshold to apply,
+            so that the server recovers once the in-flight requests drain. Defaults to 1.
+        ewma_alpha (float): Weight of the most recent sample in the latency EWMA. Defaults to 0.2.
+        retry_after (int): Value of the ``Retry-After`` header of rejected requests, in seconds. Defaults to 1.
+
+    Attributes:
+        max_in_flight (int | None): Maximum number of concurrent requests.
+        max_latency (float | None): Maximum latency EWMA, in seconds.
+        min_in_flight (int): Minimum number of concurrent requests for the latency threshold to apply.
+        ewma_alpha (float): Weight of the most recent sample in the latency EWMA.
+        retry_after (int): Value of the ``Retry-After`` header of rejected requests, in seconds.
+        in_flight (int): Number of requests currently being processed.
+        latency (float): Latency EWMA, in seconds.
+        rejected (int): Number of rejected requests.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.contrib.admission import AdmissionControl
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>> admission = AdmissionControl(app, jsonrpc, max_in_flight=64, max_latency=0.5)
+        >>>
+        >>> # Disable automatic validation for typechecking limitations with doctests
+        >>> # We always recommend to use validation in real applications
+        >>> @jsonrpc.method('app.health', critical=True, validate=False)
+        ... def health() -> str:
+        ...     return 'OK'
+    """
+
+    def __init__(
+        self: Self,
+        app: Flask | None = None,
+        jsonrpc_app: JSONRPC | None = None,
+        *,
+        max_in_flight: int | None = None,
+        max_latency: float | None = None,
+        min_in_flight: int = 1,
+        ewma_alpha: float = 0.2,
+        retry_after: int = 1,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_latency = max_latency
+        self.min_in_flight = min_in_flight
+        self.ewma_alpha = ewma_alpha
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.latency = 0.0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._rejection = self._make_rejection()
+        if app and jsonrpc_app:
+            self.init_app(app, jsonrpc_app)
+
+    def _make_rejection(self: Self) -> tuple[bytes, int, dict[str, str]]:
+        """Pre-encode the response sent to rejected requests.
+
+        Returns:
+            tuple[bytes, int, dict[str, str]]: The encoded response body, status code, and headers.
+        """
+        error = ServerOverloadedError()
+        body = {
+            'id': None,
+            'jsonrpc': JSONRPC_VERSION_DEFAULT,
+            'error': {'name': type(error).__name__, 'code': error.code, 'message': error.message, 'data': None},
+        }
+        return json.dumps(body).encode('utf-8'), error.status_code, {'Retry-After': str(self.retry_after)}
+
+    def init_app(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        """Initialize the admission control with the Flask and JSON-RPC application instances.
+
+        Registers the admission hooks to the JSON-RPC site and to the sites of the
+        registered blueprints, all sharing the same counters.
+
+        Args:
+            app (flask.Flask): The Flask application instance.
+            jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+        """
+        jsonrpc_sites = [jsonrpc_app.get_jsonrpc_site()] + [
+            japp.get_jsonrpc_site() for japp in jsonrpc_app.jsonrpc_apps
+        ]
+        for jsonrpc_site in jsonrpc_sites:
+            jsonrpc_site.register_before_request(functools.partial(self.admit, jsonrpc_site))
+            jsonrpc_site.register_teardown_request(self.release)
+
+    def is_overloaded(self: Self) -> bool:
+        """Check if any of the thresholds is exceeded.
+
+        Returns:
+            bool: True if new requests must be shed, False otherwise.
+        """
+        if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+            return True
+        return self.max_latency is not None and self.in_flight >= self.min_in_flight and self.latency > self.max_latency
+
+    def is_critical(self: Self, jsonrpc_site: JSONRPCSite, req_json: t.Any) -> bool:  # noqa: ANN401
+        """Check if all methods of the request are critical.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the request.
+            req_json (typing.Any): The decoded JSON-RPC request data.
+
+        Returns:
+            bool: True if the request must not be shed, False otherwise.
+        """
+        reqs_json = req_json if isinstance(req_json, list) else [req_json]
+        for rq in reqs_json:
+            method_name = get(rq, 'method')
+            view_func = jsonrpc_site.view_funcs.get(method_name) if isinstance(method_name, str) else None
+            if not getattr(view_func, 'jsonrpc_options', {}).get('critical', False):
+                return False
+        return bool(reqs_json)
+
+    def admit(
+        self: Self,
+        jsonrpc_site: JSONRPCSite,
+        req_json: t.Any,  # noqa: ANN401
+    ) -> tuple[bytes, int, dict[str, str]] | None:
+        """Admit or reject a request, it is registered as a before request function.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the request.
+            req_json (typing.Any): The decoded JSON-RPC request data.
+
+        Returns:
+            tuple[bytes, int, dict[str, str]] | None: The pre-encoded rejection response, or None
+                if the request is admitted.
+        """
+        with self._lock:
+            # Check and count under the same lock, so concurrent requests can not exceed the limits
+            if self.is_overloaded() and not self.is_critical(jsonrpc_site, req_json):
+                self.rejected += 1
+                return self._rejection
+            self.in_flight += 1
+        g._jsonrpc_admission_started_at = time.perf_counter()
+        return None
+
+    def release(self: Self, exc: BaseException | None) -> None:
+        """Release an admitted request and record its latency, it is registered as a teardown request function.
+
+        Args:
+            exc (BaseException | None): The exception raised while dispatching the request, if any.
+        """
+        started_at = g.pop('_jsonrpc_admission_started_at', None)
+        if started_at is None:
+            return
+        elapsed = time.perf_counter() - started_at
+        with self._lock:
+            self.in_flight -= 1
+            self.latency += self.ewma_alpha * (elapsed - self.latency)
@@ -0,0 +1,556 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import gc
+import io
+import json
+import time
+import typing as t
+import platform
+import statistics
+from dataclasses import field, dataclass
+import tracemalloc
+import importlib.metadata
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from werkzeug.test import EnvironBuilder
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_jsonrpc.site import JSONRPCSite
+    import flask_jsonrpc.typing as fjt
+
+BENCH_PACKAGES: tuple[str, ...] = ('Flask-JSONRPC', 'Flask', 'Werkzeug', 'pydantic', 'typeguard')
+BENCH_STATS: tuple[str, ...] = ('min', 'max', 'mean', 'median', 'stddev', 'p95', 'p99')
+MEMORY_STATS: tuple[str, ...] = ('peak', 'retained')
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A benchmark scenario, an HTTP request to a JSON-RPC site.
+
+    Args:
+        name (str): The scenario name.
+        payload (typing.Any): The JSON-RPC request body.
+        path (str): The URL path of the JSON-RPC site. Defaults to ``/api``.
+        group (str): The scenario group, to compare related scenarios. Defaults to ``''``.
+        status_code (int | None): The expected HTTP status code. Defaults to None, any 2xx status code.
+    """
+
+    name: str
+    payload: t.Any
+    path: str = '/api'
+    group: str = ''
+    status_code: int | None = None
+
+
+@dataclass
+class BenchmarkResults:
+    """The results of a benchmark run.
+
+    Args:
+        machine_info (dict[str, str]): The environment of the run, see :func:`machine_info`.
+        datetime (str): The date and time of the run, in ISO 8601.
+        benchmarks (list[dict[str, typing.Any]]): The name, group and statistics of each scenario.
+        skipped (list[dict[str, str]]): The name of the skipped scenarios and the reason.
+    """
+
+    machine_info: dict[str, str] = field(default_factory=dict)
+    datetime: str = ''
+    benchmarks: list[dict[str, t.Any]] = field(default_factory=list)
+    skipped: list[dict[str, str]] = field(default_factory=list)
+
+    def to_dict(self: Self) -> dict[str, t.Any]:
+        """Get the results as a JSON-serializable dict.
+
+        Returns:
+            dict[str, typing.Any]: The results.
+        """
+        return {
+            'machine_info': self.machine_info,
+            'datetime': self.datetime,
+            'benchmarks': self.benchmarks,
+            'skipped': self.skipped,
+        }
+
+    def save(self: Self, path: str) -> None:
+        """Save the results in JSON.
+
+        Args:
+            path (str): The file path.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write('\n')
+
+    @classmethod
+    def load(cls: type[Self], path: str) -> Self:
+        """Load results saved in JSON.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            BenchmarkResults: The results.
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(
+            machine_info=data.get('machine_info', {}),
+            datetime=data.get('datetime', ''),
+            benchmarks=data.get('benchmarks', []),
+            skipped=data.get('skipped', []),
+        )
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """The comparison of a scenario with the baseline.
+
+    Args:
+        name (str): The scenario name.
+        status (str): ``regressed``, ``improved`` or ``unchanged``, ``new`` if the scenario is not in
+            the baseline, ``missing`` if it is only in the baseline.
+        baseline (float | None): The baseline statistic, in seconds or in bytes.
+        current (float | None): The current statistic, in seconds or in bytes.
+        change (float | None): The relative change, ``0.1`` is 10% slower.
+    """
+
+    name: str
+    status: str
+    baseline: float | None = None
+    current: float | None = None
+    change: float | None = None
+
+
+class WSGIRequest:
+    """A request to a WSGI application, sent without a network server.
+
+    The WSGI environ is built once, so that timing the request measures the
+    application and not the request building.
+
+    Args:
+        app (flask.Flask): The Flask application.
+        scenario (Scenario): The benchmark scenario.
+
+    Attributes:
+        app (flask.Flask): The Flask application.
+        scenario (Scenario): The benchmark scenario.
+        body (bytes): The encoded request body.
+        status_code (int): The HTTP status code of the last response.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>>
+        >>> # Disable automatic validation for typechecking limitations with doctests
+        >>> # We always recommend to use validation in real applications
+        >>> @jsonrpc.method('app.index', validate=False)
+        ... def index() -> str:
+        ...     return 'Welcome to Flask JSON-RPC'
+        >>>
+        >>> request = WSGIRequest(
+        ...     app, Scenario('index', {'jsonrpc': '2.0', 'method': 'app.index', 'id': 1})
+        ... )
+        >>> request()
+        b'{"id":1,"jsonrpc":"2.0","result":"Welcome to Flask JSON-RPC"}\\n'
+        >>> request.status_code
+        200
+    """
+
+    def __init__(self: Self, app: Flask, scenario: Scenario) -> None:
+        self.app = app
+        self.scenario = scenario
+        self.body = json.dumps(scenario.payload).encode('utf-8')
+        builder = EnvironBuilder(path=scenario.path, method='POST', data=self.body, content_type='application/json')
+        try:
+            self._environ = builder.get_environ()
+        finally:
+            builder.close()
+        self.status_code = 0
+
+    def _start_response(
+        self: Self,
+        status: str,
+        headers: list[tuple[str, str]],
+        exc_info: t.Any = None,  # noqa: ANN401
+    ) -> t.Callable[[bytes], object]:
+        self.status_code = int(status.split(' ', 1)[0])
+        return lambda data: None
+
+    def __call__(self: Self) -> bytes:
+        """Send the request.
+
+        Returns:
+            bytes: The response body.
+        """
+        environ = dict(self._environ)
+        environ['wsgi.input'] = io.BytesIO(self.body)
+        app_iter = self.app.wsgi_app(environ, self._start_response)
+        try:
+            return b''.join(app_iter)
+        finally:
+            close = getattr(app_iter, 'close', None)
+            if close is not None:
+                close()
+
+    def check(self: Self) -> None:
+        """Send the request once and check the response status code.
+
+        Raises:
+            ValueError: If the status code is not the expected one.
+        """
+        body = self()
+        expected = self.scenario.status_code
+        if self.status_code == expected or (expected is None and 200 <= self.status_code < 300):
+            return
+        raise ValueError(f'unexpected HTTP {self.status_code} response: {body[:200]!r}')
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Get a percentile of sorted samples, with the nearest-rank method.
+
+    Args:
+        samples (list[float]): The sorted samples.
+        q (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile.
+
+    Examples:
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 50)
+        2.0
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 99)
+        4.0
+    """
+    index = max(0, min(len(samples) - 1, round(q / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize the timings of a scenario.
+
+    Args:
+        samples (list[float]): The duration of each round, in seconds.
+
+    Returns:
+        dict[str, float]: The number of rounds, the statistics in :data:`BENCH_STATS`, in seconds,
+            and the operations per second.
+
+    Examples:
+        >>> stats = summarize([0.002, 0.001, 0.003])
+        >>> stats['rounds'], stats['min'], stats['median'], stats['ops']
+        (3, 0.001, 0.002, 500.0)
+    """
+    samples = sorted(samples)
+    mean = statistics.fmean(samples)
+    return {
+        'rounds': len(samples),
+        'min': samples[0],
+        'max': samples[-1],
+        'mean': mean,
+        'median': statistics.median(samples),
+        'stddev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'p95': percentile(samples, 95),
+        'p99': percentile(samples, 99),
+        'ops': 1 / mean if mean else 0.0,
+    }
+
+
+def measure(fn: t.Callable[[], t.Any], *, rounds: int, warmup: int = 0) -> list[float]:
+    """Time a function.
+
+    Args:
+        fn (typing.Callable[[], typing.Any]): The function.
+        rounds (int): The number of timed calls.
+        warmup (int): The number of untimed calls before the timed ones. Defaults to 0.
+
+    Returns:
+        list[float]: The duration of each timed call, in seconds.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(rounds):
+        started_at = perf_counter()
+        fn()
+        samples.append(perf_counter() - started_at)
+    return samples
+
+
+def measure_memory(fn: t.Callable[[], t.Any], *, rounds: int, warmup: int = 0) -> dict[str, float]:
+    """Measure the memory allocated by a function, with :mod:`tracemalloc`.
+
+    The peak is the largest memory allocated during a call, above the memory
+    allocated before it. The retained memory is the memory still allocated after
+    all the calls and a garbage collection, divided by the number of calls; it
+    should be close to zero, otherwise a call leaks memory.
+
+    Args:
+        fn (typing.Callable[[], typing.Any]): The function.
+        rounds (int): The number of measured calls.
+        warmup (int): The number of unmeasured calls before the measured ones, so that
+            the caches filled by the first calls are not measured. Defaults to 0.
+
+    Returns:
+        dict[str, float]: The number of rounds, and the statistics in :data:`MEMORY_STATS`, in bytes.
+
+    Examples:
+        >>> leaks = []
+        >>> stats = measure_memory(lambda: leaks.append(bytearray(10_000)), rounds=5)
+        >>> stats['rounds'], stats['peak'] >= 10_000, stats['retained'] >= 10_000
+        (5, True, True)
+    """
+    for _ in range(warmup):
+        fn()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        peak = 0
+        started_size, _ = tracemalloc.get_traced_memory()
+        for _ in range(rounds):
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn()
+            _, call_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, call_peak - size)
+        gc.collect()
+        finished_size, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return {'rounds': rounds, 'peak': peak, 'retained': max(0, finished_size - started_size) / rounds}
+
+
+def machine_info(packages: t.Iterable[str] = BENCH_PACKAGES) -> dict[str, str]:
+    """Describe the environment of a benchmark run.
+
+    Args:
+        packages (typing.Iterable[str]): The distribution names whose version is recorded.
+            Defaults to :data:`BENCH_PACKAGES`.
+
+    Returns:
+        dict[str, str]: The Python implementation and version, the platform and the package versions.
+    """
+    info = {
+        'python_implementation': platform.python_implementation(),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+    for package in packages:
+        try:
+            info[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            info[package] = 'not installed'
+    return info
+
+
+def get_jsonrpc_sites(app: Flask) -> list[JSONRPCSite]:
+    """Get the JSON-RPC sites of an application, including the sites of the registered blueprints.
+
+    Args:
+        app (flask.Flask): The Flask application.
+
+    Returns:
+        list[flask_jsonrpc.site.JSONRPCSite]: The JSON-RPC sites.
+    """
+    jsonrpc_sites: list[JSONRPCSite] = []
+    for jsonrpc_app in app.extensions.get('jsonrpc', []):
+        jsonrpc_sites.append(jsonrpc_app.get_jsonrpc_site())
+        jsonrpc_sites.extend(japp.get_jsonrpc_site() for japp in jsonrpc_app.jsonrpc_apps)
+    return jsonrpc_sites
+
+
+def method_params(
+    jsonrpc_site: JSONRPCSite, method_name: str, methods: dict[str, fjt.Method] | None = None
+) -> dict[str, t.Any] | None:
+    """Get the params to call a method with, from its examples.
+
+    The example named ``default`` is used if any, otherwise the first one.
+
+    Args:
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+        method_name (str): The method name.
+        methods (dict[str, flask_jsonrpc.typing.Method] | None): The method descriptions of the site,
+            pass them when getting the params of many methods. Defaults to describing the site.
+
+    Returns:
+        dict[str, typing.Any] | None: The named params, an empty dict if the method has no
+            required params, or None if they are unknown.
+    """
+    view_func = jsonrpc_site.view_funcs[method_name]
+    if methods is None:
+        methods = jsonrpc_site.describe().methods
+    method = methods.get(method_name)
+    examples = method.examples if method is not None and method.examples else []
+    if examples:
+        defaults = [example for example in examples if (example.name or '').lower() == 'default']
+        example = defaults[0] if defaults else examples[0]
+        return {param.name: param.value for param in example.params or []}
+    params = getattr(view_func, 'jsonrpc_method_params', {})
+    default_params = getattr(view_func, 'jsonrpc_method_default_params', {})
+    if all(name in default_params for name in params):
+        return {}
+    return None
+
+
+def discover_scenarios(app: Flask, *, include_rpc: bool = False) -> tuple[list[Scenario], list[dict[str, str]]]:
+    """Build a scenario per method registered in the application, from the method examples.
+
+    Args:
+        app (flask.Flask): The Flask application.
+        include_rpc (bool): Whether to include the ``rpc.*`` methods. Defaults to False.
+
+    Returns:
+        tuple[list[Scenario], list[dict[str, str]]]: The scenarios, and the name of the methods that were
+            skipped because the params of a call are unknown, with the reason.
+    """
+    scenarios: list[Scenario] = []
+    skipped: list[dict[str, str]] = []
+    for jsonrpc_site in get_jsonrpc_sites(app):
+        path = jsonrpc_site.path or '/'
+        methods = jsonrpc_site.describe().methods
+        for method_name in jsonrpc_site.view_funcs:
+            if method_name.startswith('rpc.') and not include_rpc:
+                continue
+            params = method_params(jsonrpc_site, method_name, methods)
+            if params is None:
+                skipped.append({'name': method_name, 'reason': 'no example for the required params'})
+                continue
+            payload: dict[str, t.Any] = {'jsonrpc': '2.0', 'method': method_name, 'id': 1}
+            if params:
+                payload['params'] = params
+            scenarios.append(Scenario(method_name, payload, path=path, group=path))
+    return scenarios, skipped
+
+
+def run_benchmarks(
+    app: Flask,
+    scenarios: t.Iterable[Scenario],
+    *,
+    rounds: int = 1000,
+    warmup: int = 100,
+    keyword: str | None = None,
+    memory: bool = False,
+    packages: t.Iterable[str] = BENCH_PACKAGES,
+) -> BenchmarkResults:
+    """Run benchmark scenarios against an application.
+
+    Each scenario is sent once and skipped if the response has an unexpected status code.
+    The scenarios are timed, see :func:`summarize`, or with ``memory``, their memory
+    allocations are measured, see :func:`measure_memory`.
+
+    Args:
+        app (flask.Flask): The Flask application.
+        scenarios (typing.Iterable[Scenario]): The scenarios.
+        rounds (int): The number of timed calls per scenario. Defaults to 1000.
+        warmup (int): The number of untimed calls per scenario. Defaults to 100.
+        keyword (str | None): Only run the scenarios whose name or group contain it. Defaults to None.
+        memory (bool): Whether to measure the memory allocations instead of the timings. Defaults to False.
+        packages (typing.Iterable[str]): The distribution names recorded in the machine info.
+
+    Returns:
+        BenchmarkResults: The results.
+    """
+    results = BenchmarkResults(machine_info=machine_info(packages), datetime=time.strftime('%Y-%m-%dT%H:%M:%S%z'))
+    for scenario in scenarios:
+        if keyword and keyword not in scenario.name and keyword not in scenario.group:
+            continue
+        request = WSGIRequest(app, scenario)
+        try:
+            request.check()
+        except ValueError as e:
+            results.skipped.append({'name': scenario.name, 'reason': str(e)})
+            continue
+        if memory:
+            stats = measure_memory(request, rounds=rounds, warmup=warmup)
+        else:
+            stats = summarize(measure(request, rounds=rounds, warmup=warmup))
+        results.benchmarks.append({'name': scenario.name, 'group': scenario.group, 'stats': stats})
+    return results
+
+
+def compare_results(
+    results: BenchmarkResults, baseline: BenchmarkResults, *, tolerance: float = 0.1, stat: str = 'median'
+) -> list[Comparison]:
+    """Compare benchmark results with a baseline.
+
+    Args:
+        results (BenchmarkResults): The current results.
+        baseline (BenchmarkResults): The baseline results.
+        tolerance (float): The relative change from which a scenario has regressed or improved.
+            Defaults to 0.1 (10%).
+        stat (str): The compared statistic, one of :data:`BENCH_STATS` or :data:`MEMORY_STATS`.
+            Defaults to ``median``. The scenarios without it are not compared.
+
+    Returns:
+        list[Comparison]: The comparison of each scenario.
+
+    Raises:
+        ValueError: If the statistic is unknown.
+
+    Examples:
+        >>> baseline = BenchmarkResults(
+        ...     benchmarks=[{'name': 'a', 'stats': {'median': 0.001}}]
+        ... )
+        >>> results = BenchmarkResults(
+        ...     benchmarks=[{'name': 'a', 'stats': {'median': 0.0012}}]
+        ... )
+        >>> compare_results(results, baseline, tolerance=0.1)[0].status
+        'regressed'
+    """
+    if stat not in BENCH_STATS + MEMORY_STATS:
+        raise ValueError(f'unknown statistic {stat!r}, expected one of {", ".join(BENCH_STATS + MEMORY_STATS)}')
+    baseline_stats = {
+        benchmark['name']: benchmark['stats'][stat] for benchmark in baseline.benchmarks if stat in benchmark['stats']
+    }
+    comparisons = []
+    for benchmark in results.benchmarks:
+        if stat not in benchmark['stats']:
+            continue
+        name = benchmark['name']
+        current = benchmark['stats'][stat]
+        previous = baseline_stats.pop(name, None)
+        if previous is None:
+            comparisons.append(Comparison(name, 'new', current=current))
+            continue
+        change = (current - previous) / previous if previous else 0.0
+        status = 'regressed' if change > tolerance else 'improved' if change < -tolerance else 'unchanged'
+        comparisons.append(Comparison(name, status, baseline=previous, current=current, change=change))
+    comparisons.extend(Comparison(name, 'missing', baseline=previous) for name, previous in baseline_stats.items())
+    return comparisons
@@ -0,0 +1,369 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+import threading
+from dataclasses import field, dataclass
+import http.client
+from http.server import BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIServer, ServerHandler, WSGIRequestHandler
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask_jsonrpc.contrib.bench import Scenario, percentile, machine_info
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+LOAD_WORKLOADS: tuple[str, ...] = ('single', 'batch', 'mixed')
+LOAD_PERCENTILES: tuple[tuple[str, float], ...] = (('p50', 50), ('p90', 90), ('p99', 99), ('p99.9', 99.9))
+
+
+class KeepAliveRequestHandler(WSGIRequestHandler):
+    """A WSGI request handler that keeps the HTTP/1.1 connections alive.
+
+    The request handlers of :mod:`wsgiref` and of the werkzeug development server
+    handle one request per connection, which would measure the TCP handshakes
+    instead of the application. The Nagle algorithm is disabled, so that the
+    responses written in several parts are not delayed. The requests are not logged.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def handle(self: Self) -> None:
+        BaseHTTPRequestHandler.handle(self)
+
+    def handle_one_request(self: Self) -> None:
+        self.raw_requestline = self.rfile.readline(65537)
+        if not self.raw_requestline or len(self.raw_requestline) > 65536:
+            self.close_connection = True
+            return
+        if not self.parse_request():
+            return
+        handler = ServerHandler(
+            self.rfile,
+            self.wfile,  # type: ignore[arg-type]
+            self.get_stderr(),
+            self.get_environ(),
+            multithread=True,
+        )
+        handler.http_version = '1.1'
+        handler.request_handler = self  # type: ignore[attr-defined]
+        handler.run(self.server.get_app())  # type: ignore[attr-defined]
+
+    def get_environ(self: Self) -> dict[str, t.Any]:
+        environ = super().get_environ()
+        environ['REMOTE_PORT'] = str(self.client_address[1])
+        return environ
+
+    def log_message(self: Self, format: str, *args: t.Any) -> None:  # noqa: ANN401
+        pass
+
+
+class ThreadedWSGIServer(ThreadingMixIn, WSGIServer):
+    """A WSGI server handling each connection in a thread."""
+
+    daemon_threads = True
+
+
+@dataclass
+class LoadTestResults:
+    """The results of a load test.
+
+    Args:
+        workload (str): The workload, one of :data:`LOAD_WORKLOADS`.
+        clients (int): The number of concurrent clients.
+        requests (int): The number of HTTP requests sent.
+        calls (int): The number of JSON-RPC calls sent, the requests of the batches included.
+        errors (int): The number of requests that failed or had an unexpected status code.
+        duration (float): The duration of the load test, in seconds.
+        latencies (list[float]): The sorted latency of each request, in seconds.
+        machine_info (dict[str, str]): The environment of the run,
+            see :func:`~flask_jsonrpc.contrib.bench.machine_info`.
+    """
+
+    workload: str
+    clients: int
+    requests: int = 0
+    calls: int = 0
+    errors: int = 0
+    duration: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    machine_info: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def throughput(self: Self) -> float:
+        """float: The number of requests per second."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def calls_throughput(self: Self) -> float:
+        """float: The number of JSON-RPC calls per second."""
+        return self.calls / self.duration if self.duration else 0.0
+
+    def percentiles(self: Self) -> dict[str, float]:
+        """Get the latency percentiles.
+
+        Returns:
+            dict[str, float]: The p50, p90, p99 and p99.9 latencies, in seconds, empty if no request was sent.
+        """
+        if not self.latencies:
+            return {}
+        return {name: percentile(self.latencies, q) for name, q in LOAD_PERCENTILES}
+
+    def to_dict(self: Self) -> dict[str, t.Any]:
+        """Get the results as a JSON-serializable dict, without the latency of each request.
+
+        Returns:
+            dict[str, typing.Any]: The results.
+        """
+        return {
+            'machine_info': self.machine_info,
+            'workload': self.workload,
+            'clients': self.clients,
+            'requests': self.requests,
+            'calls': self.calls,
+            'errors': self.errors,
+            'duration': self.duration,
+            'throughput': self.throughput,
+            'calls_throughput': self.calls_throughput,
+            'latency': self.percentiles(),
+        }
+
+
+def build_workload(
+    scenarios: t.Iterable[Scenario], workload: str = 'single', *, batch_size: int = 10
+) -> list[Scenario]:
+    """Build the requests of a workload from single call scenarios.
+
+    Args:
+        scenarios (typing.Iterable[flask_jsonrpc.contrib.bench.Scenario]): The single call scenarios.
+        workload (str): ``single`` sends each scenario as is, ``batch`` sends batches of ``batch_size``
+            calls of the scenarios of a site, and ``mixed`` alternates both. Defaults to ``single``.
+        batch_size (int): The number of calls of a batch. Defaults to 10.
+
+    Returns:
+        list[flask_jsonrpc.contrib.bench.Scenario]: The requests, sent in turn by each client.
+
+    Raises:
+        ValueError: If the workload is unknown.
+
+    Examples:
+        >>> scenarios = [
+        ...     Scenario('app.index', {'jsonrpc': '2.0', 'method': 'app.index', 'id': 1})
+        ... ]
+        >>> [
+        ...     (scenario.name, len(scenario.payload))
+        ...     for scenario in build_workload(scenarios, 'batch', batch_size=5)
+        ... ]
+        [('batch[/api]', 5)]
+    """
+    if workload not in LOAD_WORKLOADS:
+        raise ValueError(f'unknown workload {workload!r}, expected one of {", ".join(LOAD_WORKLOADS)}')
+    singles = [scenario for scenario in scenarios if isinstance(scenario.payload, dict)]
+    if workload == 'single':
+        return singles
+
+    by_path: dict[str, list[Scenario]] = {}
+    for scenario in singles:
+        by_path.setdefault(scenario.path, []).append(scenario)
+    batches = []
+    for path, path_scenarios in by_path.items():
+        payload = [{**path_scenarios[i % len(path_scenarios)].payload, 'id': i + 1} for i in range(batch_size)]
+        batches.append(Scenario(f'batch[{path}]', payload, path=path, group='batch'))
+    if workload == 'batch':
+        return batches
+    return singles + batches
+
+
+class LoadClient:
+    """A load test client, sending the requests of a workload on a keep-alive connection.
+
+    Args:
+        host (str): The server host.
+        port (int): The server port.
+        workload (list[flask_jsonrpc.contrib.bench.Scenario]): The requests, sent in turn.
+        requests (int): The number of requests to send.
+        timeout (float): The socket timeout, in seconds.
+        offset (int): The index of the first request of the workload, so that the clients
+            do not send the same request at the same time. Defaults to 0.
+
+    Attributes:
+        latencies (list[float]): The latency of each request, in seconds.
+        sent (int): The number of requests sent.
+        calls (int): The number of JSON-RPC calls sent.
+        errors (int): The number of requests that failed or had an unexpected status code.
+    """
+
+    def __init__(
+        self: Self, host: str, port: int, workload: list[Scenario], *, requests: int, timeout: float, offset: int = 0
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.requests = requests
+        self.offset = offset
+        self.bodies = [
+            (scenario.path, json.dumps(scenario.payload).encode('utf-8'), scenario.status_code, _calls(scenario))
+            for scenario in workload
+        ]
+        self.latencies: list[float] = []
+        self.sent = 0
+        self.calls = 0
+        self.errors = 0
+
+    def run(self: Self, barrier: threading.Barrier | None = None) -> None:
+        """Send the requests.
+
+        Args:
+            barrier (threading.Barrier | None): Waited for before sending the first request,
+                so that all clients start together. Defaults to None.
+        """
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        headers = {'Content-Type': 'application/json'}
+        perf_counter = time.perf_counter
+        if barrier is not None:
+            barrier.wait()
+        try:
+            for i in range(self.offset, self.offset + self.requests):
+                path, body, status_code, calls = self.bodies[i % len(self.bodies)]
+                self.sent += 1
+                started_at = perf_counter()
+                try:
+                    conn.request('POST', path, body, headers)
+                    response = conn.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    self.errors += 1
+                    continue
+                self.latencies.append(perf_counter() - started_at)
+                self.calls += calls
+                if not _is_expected(response.status, status_code):
+                    self.errors += 1
+        finally:
+            conn.close()
+
+
+def _calls(scenario: Scenario) -> int:
+    return len(scenario.payload) if isinstance(scenario.payload, list) else 1
+
+
+def _is_expected(status: int, expected: int | None) -> bool:
+    return status == expected if expected is not None else 200 <= status < 300
+
+
+def start_server(app: Flask, host: str = '127.0.0.1', port: int = 0) -> ThreadedWSGIServer:
+    """Start the application in a threaded WSGI server, in a background thread.
+
+    Args:
+        app (flask.Flask): The Flask application.
+        host (str): The host to bind. Defaults to ``127.0.0.1``.
+        port (int): The port to bind, a free port if 0. Defaults to 0.
+
+    Returns:
+        ThreadedWSGIServer: The server, stop it with ``shutdown()`` and ``server_close()``.
+    """
+    server = ThreadedWSGIServer((host, port), KeepAliveRequestHandler)
+    server.set_app(app)
+    threading.Thread(target=server.serve_forever, name='jsonrpc-load-server', daemon=True).start()
+    return server
+
+
+def run_load_test(
+    app: Flask,
+    scenarios: t.Iterable[Scenario],
+    *,
+    workload: str = 'single',
+    clients: int = 8,
+    requests: int = 1000,
+    warmup: int = 10,
+    batch_size: int = 10,
+    timeout: float = 30.0,
+) -> LoadTestResults:
+    """Load test an application with concurrent keep-alive clients.
+
+    Args:
+        app (flask.Flask): The Flask application.
+        scenarios (typing.Iterable[flask_jsonrpc.contrib.bench.Scenario]): The single call scenarios,
+            see :func:`~flask_jsonrpc.contrib.bench.discover_scenarios`.
+        workload (str): The workload, see :func:`build_workload`. Defaults to ``single``.
+        clients (int): The number of concurrent clients. Defaults to 8.
+        requests (int): The number of requests of each client. Defaults to 1000.
+        warmup (int): The number of untimed requests of each client before the load test. Defaults to 10.
+        batch_size (int): The number of calls of the batch requests. Defaults to 10.
+        timeout (float): The socket timeout of the clients, in seconds. Defaults to 30.0.
+
+    Returns:
+        LoadTestResults: The results.
+
+    Raises:
+        ValueError: If the workload is unknown or has no requests.
+    """
+    requests_workload = build_workload(scenarios, workload, batch_size=batch_size)
+    if not requests_workload:
+        raise ValueError('no requests to send')
+
+    results = LoadTestResults(workload=workload, clients=clients, machine_info=machine_info())
+    server = start_server(app)
+    host, port = str(server.server_address[0]), server.server_port
+    try:
+        for i in range(clients):
+            LoadClient(host, port, requests_workload, requests=warmup, timeout=timeout, offset=i).run()
+        load_clients = [
+            LoadClient(host, port, requests_workload, requests=requests, timeout=timeout, offset=i)
+            for i in range(clients)
+        ]
+        barrier = threading.Barrier(clients + 1)
+        threads = [
+            threading.Thread(target=client.run, args=(barrier,), name=f'jsonrpc-load-client-{i}')
+            for i, client in enumerate(load_clients)
+        ]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        started_at = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        results.duration = time.perf_counter() - started_at
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    for client in load_clients:
+        results.requests += client.sent
+        results.calls += client.calls
+        results.errors += client.errors
+        results.latencies.extend(client.latencies)
+    results.latencies.sort()
+    return results
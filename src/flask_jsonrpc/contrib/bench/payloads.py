@@ -0,0 +1,661 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import re
+import enum
+import math
+import types
+import random
+import string
+import typing as t
+import inspect
+import numbers
+import importlib
+import dataclasses
+from dataclasses import dataclass
+import collections.abc
+
+# Added in version 3.11.
+from typing_extensions import Self, is_typeddict
+
+from pydantic.main import BaseModel
+
+from flask_jsonrpc.contrib.bench import Scenario, get_jsonrpc_sites
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_jsonrpc.site import JSONRPCSite
+    import flask_jsonrpc.typing as fjt
+
+try:
+    _sre_parse: t.Any = importlib.import_module('re._parser')
+except ModuleNotFoundError:  # pragma: no cover
+    _sre_parse = importlib.import_module('sre_parse')
+
+ALPHABET = string.ascii_letters + string.digits
+REGEX_CATEGORIES: dict[str, str] = {
+    'CATEGORY_DIGIT': string.digits,
+    'CATEGORY_NOT_DIGIT': string.ascii_letters,
+    'CATEGORY_SPACE': ' ',
+    'CATEGORY_NOT_SPACE': ALPHABET,
+    'CATEGORY_WORD': ALPHABET + '_',
+    'CATEGORY_NOT_WORD': ' -.',
+}
+ARRAY_TYPES: tuple[t.Any, ...] = (
+    list,
+    tuple,
+    set,
+    frozenset,
+    collections.deque,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+    collections.abc.Collection,
+    collections.abc.Iterable,
+)
+OBJECT_TYPES: tuple[t.Any, ...] = (
+    dict,
+    collections.OrderedDict,
+    collections.defaultdict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+)
+CONSTRAINT_ATTRS: tuple[str, ...] = (
+    'multiple_of',
+    'min_length',
+    'max_length',
+    'max_digits',
+    'decimal_places',
+    'required',
+    'nullable',
+)
+
+
+@dataclass
+class Constraints:
+    """The constraints of a generated value.
+
+    Args:
+        minimum (float | None): The minimum of a number.
+        maximum (float | None): The maximum of a number.
+        exclusive_minimum (bool): Whether the minimum is excluded.
+        exclusive_maximum (bool): Whether the maximum is excluded.
+        multiple_of (float | None): The number is a multiple of it.
+        max_digits (int | None): The maximum number of whole digits of a number.
+        decimal_places (int | None): The maximum number of decimal places of a number.
+        min_length (int | None): The minimum length of a string or an array.
+        max_length (int | None): The maximum length of a string or an array.
+        pattern (str | None): The regular expression of a string.
+        required (bool | None): Whether the value must not be empty.
+        nullable (bool | None): Whether the value can be null.
+    """
+
+    minimum: float | None = None
+    maximum: float | None = None
+    exclusive_minimum: bool = False
+    exclusive_maximum: bool = False
+    multiple_of: float | None = None
+    max_digits: int | None = None
+    decimal_places: int | None = None
+    min_length: int | None = None
+    max_length: int | None = None
+    pattern: str | None = None
+    required: bool | None = None
+    nullable: bool | None = None
+
+    @classmethod
+    def from_field(cls: type[Self], field: fjt.Field | None) -> Self:
+        """Get the constraints of a field of the service description.
+
+        Args:
+            field (flask_jsonrpc.typing.Field | None): The field.
+
+        Returns:
+            Constraints: The constraints, empty if there is no field.
+        """
+        if field is None:
+            return cls()
+        pattern = field.pattern.pattern if isinstance(field.pattern, re.Pattern) else field.pattern
+        return cls(
+            minimum=field.minimum,
+            maximum=field.maximum,
+            multiple_of=field.multiple_of,
+            max_digits=field.max_digits,
+            decimal_places=field.decimal_places,
+            min_length=field.min_length,
+            max_length=field.max_length,
+            pattern=pattern,
+            required=field.required,
+            nullable=field.nullable,
+        )
+
+    def update(self: Self, metadata: t.Iterable[t.Any]) -> Self:
+        """Get the constraints updated with the metadata of an annotation.
+
+        The :mod:`flask_jsonrpc.types.params` annotations, the :mod:`annotated_types`
+        constraints and the pydantic field constraints are supported.
+
+        Args:
+            metadata (typing.Iterable[typing.Any]): The metadata of an ``Annotated`` type or of a pydantic field.
+
+        Returns:
+            Constraints: The updated constraints.
+
+        Examples:
+            >>> import annotated_types
+            >>> import flask_jsonrpc.types.params as tp
+            >>> constraints = Constraints().update(
+            ...     [tp.Minimum(1), annotated_types.Lt(10), tp.MaxLength(3)]
+            ... )
+            >>> (
+            ...     constraints.minimum,
+            ...     constraints.maximum,
+            ...     constraints.exclusive_maximum,
+            ...     constraints.max_length,
+            ... )
+            (1, 10, True, 3)
+        """
+        changes: dict[str, t.Any] = {}
+        for item in metadata:
+            for name, attr, exclusive in (
+                ('minimum', 'minimum', False),
+                ('minimum', 'ge', False),
+                ('minimum', 'gt', True),
+                ('maximum', 'maximum', False),
+                ('maximum', 'le', False),
+                ('maximum', 'lt', True),
+            ):
+                value = getattr(item, attr, None)
+                if value is not None:
+                    changes[name] = value
+                    changes[f'exclusive_{name}'] = exclusive
+            for name in CONSTRAINT_ATTRS:
+                value = getattr(item, name, None)
+                if value is not None:
+                    changes[name] = value
+            pattern = getattr(item, 'pattern', None)
+            if pattern is not None:
+                changes['pattern'] = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+        return dataclasses.replace(self, **changes)
+
+
+def is_optional(annotation: t.Any) -> bool:  # noqa: ANN401
+    """Check if a param of a type can be omitted or null.
+
+    Args:
+        annotation (typing.Any): The type annotation.
+
+    Returns:
+        bool: True for ``typing.Any`` and the unions with ``None``, False otherwise.
+    """
+    if t.get_origin(annotation) is t.Annotated:
+        return is_optional(t.get_args(annotation)[0])
+    if annotation is t.Any or annotation is inspect.Parameter.empty or annotation is None:
+        return True
+    if t.get_origin(annotation) in (t.Union, types.UnionType):
+        return type(None) in t.get_args(annotation)
+    return False
+
+
+def get_object_fields(annotation: type[t.Any]) -> dict[str, t.Any] | None:
+    """Get the field types of a class that is sent as a JSON object.
+
+    Args:
+        annotation (type[typing.Any]): The class.
+
+    Returns:
+        dict[str, typing.Any] | None: The field types by name, or None if the class has no typed fields.
+    """
+    if is_typeddict(annotation) or (issubclass(annotation, tuple) and hasattr(annotation, '_fields')):
+        return t.get_type_hints(annotation, include_extras=True)
+    if inspect.isfunction(annotation.__init__):
+        type_hints = t.get_type_hints(annotation.__init__, include_extras=True)
+        type_hints.pop('return', None)
+        return type_hints or None
+    return None
+
+
+class PayloadGenerator:
+    """Generates random requests for the methods of a JSON-RPC site.
+
+    The params are generated from the annotations of the methods, respecting the
+    constraints of the service description (:class:`~flask_jsonrpc.types.params.Minimum`,
+    :class:`~flask_jsonrpc.types.params.MaxLength`, :class:`~flask_jsonrpc.types.params.Pattern`, ...),
+    and of the pydantic models. The params of the method examples are also used.
+
+    Invalid requests have a param of the wrong type, out of its bounds, too long or
+    empty, or miss a required param.
+
+    Args:
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+        seed (int | None): The seed of the random generator, for reproducible requests. Defaults to None.
+        example_ratio (float): The ratio of the valid requests that use the params of a method example,
+            when the method has examples. Defaults to 0.5.
+        max_items (int): The maximum number of items of the generated arrays and objects, when their
+            length is not constrained, and of the repetitions of the patterns. Defaults to 3.
+        max_depth (int): The maximum depth of the generated arrays and objects. Defaults to 5.
+
+    Examples:
+        >>> import typing as t
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> import flask_jsonrpc.types.params as tp
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>>
+        >>> # Disable automatic validation for typechecking limitations with doctests
+        >>> # We always recommend to use validation in real applications
+        >>> @jsonrpc.method('app.hello', validate=False)
+        ... def hello(name: t.Annotated[str, tp.Pattern(r'^[A-Z][a-z]{2,5}$')]) -> str:
+        ...     return f'Hello {name}'
+        >>>
+        >>> generator = PayloadGenerator(jsonrpc.get_jsonrpc_site(), seed=42)
+        >>> params = generator.generate_params('app.hello')
+        >>> bool(re.fullmatch(r'[A-Z][a-z]{2,5}', params['name']))
+        True
+    """
+
+    def __init__(
+        self: Self,
+        jsonrpc_site: JSONRPCSite,
+        *,
+        seed: int | None = None,
+        example_ratio: float = 0.5,
+        max_items: int = 3,
+        max_depth: int = 5,
+    ) -> None:
+        self.jsonrpc_site = jsonrpc_site
+        self.random = random.Random(seed)
+        self.example_ratio = example_ratio
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self._methods = jsonrpc_site.describe().methods
+
+    def generate_string(self: Self, constraints: Constraints) -> str:
+        """Generate a string.
+
+        Args:
+            constraints (Constraints): The length, pattern and required constraints.
+
+        Returns:
+            str: The string, matching the pattern if possible.
+        """
+        min_length = max(constraints.min_length or 0, 1 if constraints.required else 0)
+        max_length = constraints.max_length if constraints.max_length is not None else min_length + 16
+        if constraints.pattern is not None:
+            value = ''
+            for _ in range(10):
+                value = self.generate_from_pattern(constraints.pattern)
+                if min_length <= len(value) <= max_length:
+                    break
+            return value
+        length = self.random.randint(min_length, max(min_length, min(max_length, min_length + 16)))
+        return ''.join(self.random.choice(ALPHABET) for _ in range(length))
+
+    def generate_from_pattern(self: Self, pattern: str) -> str:
+        """Generate a string matching a regular expression.
+
+        The anchors, lookarounds and backreferences are ignored.
+
+        Args:
+            pattern (str): The regular expression.
+
+        Returns:
+            str: The string.
+        """
+        return self._generate_subpattern(_sre_parse.parse(pattern))
+
+    def _generate_subpattern(self: Self, subpattern: t.Any) -> str:  # noqa: ANN401, C901
+        chars = []
+        for op, av in subpattern:
+            name = str(op)
+            if name == 'LITERAL':
+                chars.append(chr(av))
+            elif name == 'NOT_LITERAL':
+                chars.append(self.random.choice([char for char in ALPHABET if char != chr(av)]))
+            elif name == 'ANY':
+                chars.append(self.random.choice(ALPHABET))
+            elif name == 'IN':
+                chars.append(self._generate_in(av))
+            elif name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT'):
+                min_repeat, max_repeat, item = av
+                count = self.random.randint(min_repeat, min(max_repeat, min_repeat + self.max_items))
+                chars.extend(self._generate_subpattern(item) for _ in range(count))
+            elif name == 'BRANCH':
+                chars.append(self._generate_subpattern(self.random.choice(av[1])))
+            elif name == 'SUBPATTERN':
+                chars.append(self._generate_subpattern(av[-1]))
+            elif name == 'ATOMIC_GROUP':
+                chars.append(self._generate_subpattern(av))
+        return ''.join(chars)
+
+    def _generate_in(self: Self, items: t.Any) -> str:  # noqa: ANN401
+        negate = False
+        chars: set[str] = set()
+        for op, av in items:
+            name = str(op)
+            if name == 'NEGATE':
+                negate = True
+            elif name == 'LITERAL':
+                chars.add(chr(av))
+            elif name == 'RANGE':
+                chars.update(chr(code) for code in range(av[0], min(av[1], av[0] + 255) + 1))
+            else:
+                chars.update(REGEX_CATEGORIES.get(str(av), ''))
+        candidates = sorted(set(ALPHABET) - chars if negate else chars)
+        return self.random.choice(candidates) if candidates else ''
+
+    def generate_number(self: Self, constraints: Constraints, *, integer: bool) -> int | float:
+        """Generate a number.
+
+        Args:
+            constraints (Constraints): The bounds, multiple, digits and decimal places constraints.
+            integer (bool): Whether to generate an integer.
+
+        Returns:
+            int | float: The number.
+        """
+        minimum, maximum = constraints.minimum, constraints.maximum
+        if minimum is None:
+            minimum = 0 if maximum is None or maximum >= 1000 else maximum - 1000
+        if maximum is None:
+            maximum = minimum + 1000
+        if constraints.max_digits is not None:
+            maximum = min(maximum, 10**constraints.max_digits - 1)
+        step = constraints.multiple_of or (1 if integer else 10.0 ** -(constraints.decimal_places or 6))
+        low = math.ceil(minimum / step)
+        high = math.floor(maximum / step)
+        low += constraints.exclusive_minimum and low * step == minimum
+        high -= constraints.exclusive_maximum and high * step == maximum
+        value = self.random.randint(low, max(low, high)) * step
+        if integer:
+            return int(value)
+        return round(value, constraints.decimal_places) if constraints.decimal_places is not None else float(value)
+
+    def generate_value(  # noqa: C901
+        self: Self,
+        annotation: t.Any,  # noqa: ANN401
+        constraints: Constraints | None = None,
+        *,
+        depth: int = 0,
+    ) -> t.Any:  # noqa: ANN401
+        """Generate a valid value of a type.
+
+        Args:
+            annotation (typing.Any): The type annotation.
+            constraints (Constraints | None): The constraints of the value. Defaults to None.
+            depth (int): The depth of the value in the generated params. Defaults to 0.
+
+        Returns:
+            typing.Any: The JSON value.
+        """
+        constraints = constraints or Constraints()
+        origin = t.get_origin(annotation)
+        args = t.get_args(annotation)
+        if origin is t.Annotated:
+            return self.generate_value(args[0], constraints.update(annotation.__metadata__), depth=depth)
+        if annotation is None or annotation is type(None):
+            return None
+        if annotation is t.Any or annotation is inspect.Parameter.empty:
+            return self.generate_string(constraints)
+        if origin is t.Literal:
+            return self.random.choice(args)
+        if origin is t.Union or origin is types.UnionType:
+            if constraints.required or constraints.nullable is False:
+                args = tuple(arg for arg in args if arg is not type(None))
+            return self.generate_value(self.random.choice(args), constraints, depth=depth)
+        if origin in ARRAY_TYPES or annotation in ARRAY_TYPES:
+            if origin is tuple and args and args[-1] is not Ellipsis:
+                return [self.generate_value(arg, depth=depth + 1) for arg in args]
+            min_length = max(constraints.min_length or 0, 1 if constraints.required else 0)
+            max_length = constraints.max_length if constraints.max_length is not None else min_length + self.max_items
+            count = min_length if depth >= self.max_depth else self.random.randint(min_length, max_length)
+            return [self.generate_value(args[0] if args else t.Any, depth=depth + 1) for _ in range(count)]
+        if origin in OBJECT_TYPES or annotation in OBJECT_TYPES:
+            key_type, value_type = args if len(args) == 2 else (str, t.Any)
+            min_length = 1 if constraints.required else 0
+            count = min_length if depth >= self.max_depth else self.random.randint(min_length, self.max_items)
+            return {
+                str(self.generate_value(key_type, Constraints(required=True))): self.generate_value(
+                    value_type, depth=depth + 1
+                )
+                for _ in range(count)
+            }
+        if not isinstance(annotation, type):
+            return self.generate_string(constraints)
+        if issubclass(annotation, enum.Enum):
+            return self.random.choice(list(annotation)).value
+        if issubclass(annotation, bool):
+            return self.random.random() < 0.5
+        if issubclass(annotation, int):
+            return self.generate_number(constraints, integer=True)
+        if issubclass(annotation, numbers.Number):
+            return self.generate_number(constraints, integer=False)
+        if issubclass(annotation, BaseModel):
+            return {
+                field_info.alias or name: self.generate_value(
+                    field_info.annotation, Constraints().update(field_info.metadata), depth=depth + 1
+                )
+                for name, field_info in annotation.model_fields.items()
+                if field_info.is_required() or (depth < self.max_depth and self.random.random() < 0.5)
+            }
+        if issubclass(annotation, (str, bytes)):
+            return self.generate_string(constraints)
+        fields = get_object_fields(annotation)
+        if fields is None:
+            return self.generate_string(constraints)
+        return {name: self.generate_value(field_type, depth=depth + 1) for name, field_type in fields.items()}
+
+    def generate_invalid_values(  # noqa: C901
+        self: Self,
+        annotation: t.Any,  # noqa: ANN401
+        constraints: Constraints | None = None,
+    ) -> list[t.Any]:
+        """Generate values of a type that break its type or its constraints.
+
+        Args:
+            annotation (typing.Any): The type annotation.
+            constraints (Constraints | None): The constraints of the value. Defaults to None.
+
+        Returns:
+            list[typing.Any]: The invalid values, empty if all values are valid.
+        """
+        constraints = constraints or Constraints()
+        origin = t.get_origin(annotation)
+        args = t.get_args(annotation)
+        if origin is t.Annotated:
+            return self.generate_invalid_values(args[0], constraints.update(annotation.__metadata__))
+        values: list[t.Any] = [None] if constraints.nullable is False else []
+        if origin is t.Union or origin is types.UnionType:
+            non_null = [arg for arg in args if arg is not type(None)]
+            return values + self.generate_invalid_values(non_null[0], constraints) if len(non_null) == 1 else values
+        if origin is t.Literal or (isinstance(annotation, type) and issubclass(annotation, enum.Enum)):
+            return [*values, '__invalid__']
+        if origin in ARRAY_TYPES or annotation in ARRAY_TYPES:
+            values.append(12345)
+            if constraints.required:
+                values.append([])
+            if constraints.max_length is not None:
+                values.append([self.generate_value(args[0] if args else t.Any)] * (constraints.max_length + 1))
+            return values
+        if origin in OBJECT_TYPES or annotation in OBJECT_TYPES:
+            return [*values, 12345, {}] if constraints.required else [*values, 12345]
+        if not isinstance(annotation, type):
+            return values
+        if issubclass(annotation, bool):
+            return [*values, 'not a boolean']
+        if issubclass(annotation, numbers.Number):
+            values.append('not a number')
+            if constraints.minimum is not None:
+                values.append(constraints.minimum if constraints.exclusive_minimum else constraints.minimum - 1)
+            if constraints.maximum is not None:
+                values.append(constraints.maximum if constraints.exclusive_maximum else constraints.maximum + 1)
+            return values
+        if issubclass(annotation, str):
+            values.append(12345)
+            if constraints.required:
+                values.append('')
+            if constraints.max_length is not None:
+                values.append('x' * (constraints.max_length + 1))
+            if constraints.min_length:
+                values.append('x' * (constraints.min_length - 1))
+            return values
+        if issubclass(annotation, BaseModel) or get_object_fields(annotation) is not None:
+            return [*values, 'not an object']
+        return values
+
+    def generate_params(self: Self, method_name: str, *, valid: bool = True) -> dict[str, t.Any] | None:
+        """Generate the named params of a method.
+
+        Args:
+            method_name (str): The method name.
+            valid (bool): Whether the params must be valid. Defaults to True.
+
+        Returns:
+            dict[str, typing.Any] | None: The params, or None if invalid params were requested and
+                no param can be invalid.
+        """
+        view_func = self.jsonrpc_site.view_funcs[method_name]
+        method = self._methods.get(method_name)
+        annotations: dict[str, t.Any] = getattr(view_func, 'jsonrpc_method_params', {})
+        default_params: dict[str, t.Any] = getattr(view_func, 'jsonrpc_method_default_params', {})
+        fields = {field.name: field for field in method.params} if method is not None else {}
+
+        examples = method.examples if method is not None and method.examples else []
+        if valid and examples and self.random.random() < self.example_ratio:
+            example = self.random.choice(examples)
+            return {param.name: param.value for param in example.params or []}
+
+        constraints = {name: Constraints.from_field(fields.get(name)) for name in annotations}
+        omittable = {
+            name
+            for name in default_params
+            if not constraints[name].required and constraints[name].nullable is not False
+        }
+        params = {
+            name: self.generate_value(annotation, constraints[name])
+            for name, annotation in annotations.items()
+            if name not in omittable or self.random.random() < 0.5
+        }
+        if valid:
+            return params
+
+        invalidations = [
+            (name, value)
+            for name, annotation in annotations.items()
+            for value in self.generate_invalid_values(annotation, constraints[name])
+        ]
+        required = [name for name, annotation in annotations.items() if name not in default_params]
+        required = [name for name in required if not is_optional(annotations[name]) or constraints[name].required]
+        if not invalidations and not required:
+            return None
+        if not invalidations or (required and self.random.random() < 0.2):
+            params.pop(self.random.choice(required))
+            return params
+        name, value = self.random.choice(invalidations)
+        params[name] = value
+        return params
+
+    def generate_scenarios(
+        self: Self, *, count: int = 1, invalid_ratio: float = 0.0, include_rpc: bool = False
+    ) -> list[Scenario]:
+        """Generate requests for the methods of the site.
+
+        Invalid requests are only generated for the methods with validation, and are
+        expected to be rejected with the HTTP 400 status code, any other status is
+        reported as an unexpected response.
+
+        Args:
+            count (int): The number of requests of each method. Defaults to 1.
+            invalid_ratio (float): The ratio of invalid requests, between 0 and 1. Defaults to 0.0.
+            include_rpc (bool): Whether to include the ``rpc.*`` methods. Defaults to False.
+
+        Returns:
+            list[flask_jsonrpc.contrib.bench.Scenario]: The requests, in the ``valid`` or ``invalid`` group.
+        """
+        path = self.jsonrpc_site.path or '/'
+        scenarios = []
+        for method_name, view_func in self.jsonrpc_site.view_funcs.items():
+            if method_name.startswith('rpc.') and not include_rpc:
+                continue
+            validate = getattr(view_func, 'jsonrpc_validate', True)
+            for i in range(count):
+                params = None
+                if validate and self.random.random() < invalid_ratio:
+                    params = self.generate_params(method_name, valid=False)
+                valid = params is None
+                if valid:
+                    params = self.generate_params(method_name)
+                payload: dict[str, t.Any] = {'jsonrpc': '2.0', 'method': method_name, 'id': i + 1}
+                if params:
+                    payload['params'] = params
+                scenarios.append(
+                    Scenario(
+                        f'{method_name}[{i}]',
+                        payload,
+                        path=path,
+                        group='valid' if valid else 'invalid',
+                        status_code=None if valid else 400,
+                    )
+                )
+        return scenarios
+
+
+def generate_scenarios(
+    app: Flask,
+    *,
+    count: int = 1,
+    invalid_ratio: float = 0.0,
+    seed: int | None = None,
+    include_rpc: bool = False,
+    **kwargs: t.Any,  # noqa: ANN401
+) -> list[Scenario]:
+    """Generate requests for the methods of all the JSON-RPC sites of an application.
+
+    Args:
+        app (flask.Flask): The Flask application.
+        count (int): The number of requests of each method. Defaults to 1.
+        invalid_ratio (float): The ratio of invalid requests, between 0 and 1. Defaults to 0.0.
+        seed (int | None): The seed of the random generator, for reproducible requests. Defaults to None.
+        include_rpc (bool): Whether to include the ``rpc.*`` methods. Defaults to False.
+        **kwargs (typing.Any): Other :class:`PayloadGenerator` arguments.
+
+    Returns:
+        list[flask_jsonrpc.contrib.bench.Scenario]: The requests.
+    """
+    rng = random.Random(seed)
+    scenarios = []
+    for jsonrpc_site in get_jsonrpc_sites(app):
+        generator = PayloadGenerator(jsonrpc_site, seed=rng.randrange(2**32), **kwargs)
+        scenarios.extend(
+            generator.generate_scenarios(count=count, invalid_ratio=invalid_ratio, include_rpc=include_rpc)
+        )
+    return scenarios
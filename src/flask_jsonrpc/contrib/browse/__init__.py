@@ -49,6 +49,7 @@ if t.TYPE_CHECKING:
 
     from flask_jsonrpc.site import JSONRPCSite
     from flask_jsonrpc.typing import Method
+    from flask_jsonrpc.contrib.metrics import JSONRPCMetrics
 
 
 def register_middleware(
@@ -325,6 +326,9 @@ class JSONRPCBrowse:
         url_prefix (str): The URL prefix for the browse interface.
         base_url (str | None): The base URL for the browse interface.
         jsonrpc_sites (set[flask_jsonrpc.site.JSONRPCSite]): The set of registered JSON-RPC sites
+        menu_links (dict[str, str]): The extra menu links, by name
+        jsonrpc_metrics (flask_jsonrpc.contrib.metrics.JSONRPCMetrics | None): The metrics shown in the
+            performance dashboard
 
     Examples:
         >>> from flask import Flask
@@ -343,6 +347,8 @@ class JSONRPCBrowse:
         self.url_prefix = url_prefix
         self.base_url = base_url
         self.jsonrpc_sites: set[JSONRPCSite] = set()
+        self.menu_links: dict[str, str] = {}
+        self.jsonrpc_metrics: JSONRPCMetrics | None = None
         if app:
             self.init_app(app)
 
@@ -374,6 +380,7 @@ class JSONRPCBrowse:
             'browse_description': self.get_browse_description(),
             'browse_fork_me_button_enabled': self.get_browse_fork_me_button_enabled(),
             'browse_dashboard_menu_name': self.get_browse_dashboard_menu_name(),
+            'browse_menu_links': self.menu_links,
             'browse_login_template_enabled': self.get_browse_login_template() is not None,
             'browse_logout_template_enabled': self.get_browse_logout_template() is not None,
             'browse_media_css': self.get_browse_media_css(),
@@ -430,6 +437,26 @@ class JSONRPCBrowse:
         """
         self.jsonrpc_sites.add(jsonrpc_site)
 
+    def register_jsonrpc_metrics(self: Self, jsonrpc_metrics: JSONRPCMetrics) -> None:
+        """Register the JSON-RPC metrics shown in the performance dashboard.
+
+        The dashboard is enabled by setting BROWSE_DASHBOARD_PARTIAL_TEMPLATE to
+        ``browse/partials/performance_dashboard.html`` in your settings.
+
+        Args:
+            jsonrpc_metrics (flask_jsonrpc.contrib.metrics.JSONRPCMetrics): The JSON-RPC metrics.
+        """
+        self.jsonrpc_metrics = jsonrpc_metrics
+
+    def register_menu_link(self: Self, name: str, url: str) -> None:
+        """Register an extra link in the menu of the browse interface, after the dashboard.
+
+        Args:
+            name (str): The link name.
+            url (str): The link URL.
+        """
+        self.menu_links[name] = url
+
     def get_browse_title(self: Self) -> str:
         """Get the browse title.
 
@@ -638,7 +665,8 @@ class JSONRPCBrowse:
         Returns:
             str: The rendered dashboard partial template.
         """
-        return render_template(self.get_browse_dashboard_partial_template())
+        metrics_url = f'{request.script_root}{self.jsonrpc_metrics.json_path}' if self.jsonrpc_metrics else None
+        return render_template(self.get_browse_dashboard_partial_template(), browse_metrics_url=metrics_url)
 
     def vf_partials_field_describe(self: Self) -> str:
         """Render the field describe partial template.
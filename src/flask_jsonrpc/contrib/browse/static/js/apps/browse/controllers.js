@@ -148,6 +148,46 @@
         };
     }]);
 
+    App.controller('PerformanceDashboardCtrl', ['$scope', '$attrs', '$http', '$interval',
+                                                function($scope, $attrs, $http, $interval) {
+        var previous = null;
+        $scope.metricsUrl = $attrs.metricsUrl;
+        $scope.pollInterval = parseInt($attrs.pollInterval, 10) || 5000;
+        $scope.methods = [];
+        $scope.error = null;
+
+        $scope.refresh = function() {
+            if (!$scope.metricsUrl) {
+                return;
+            }
+            $http.get($scope.metricsUrl, {ignoreLoadingBar: true}).then(function(response) {
+                var now = Date.now(),
+                    methods = response.data.methods;
+                $scope.methods = Object.keys(methods).map(function(name) {
+                    var metrics = methods[name],
+                        rate = null;
+                    if (previous) {
+                        var previousCalls = previous.methods[name] ? previous.methods[name].calls : 0;
+                        rate = (metrics.calls - previousCalls) * 1000 / Math.max(now - previous.time, 1);
+                    }
+                    return angular.extend({name: name, rate: rate}, metrics);
+                });
+                $scope.batches = response.data.batches;
+                $scope.updatedAt = now;
+                $scope.error = null;
+                previous = {time: now, methods: methods};
+            }, function(response) {
+                $scope.error = 'Unable to load the metrics (HTTP ' + response.status + ')';
+            });
+        };
+
+        var poller = $interval($scope.refresh, $scope.pollInterval);
+        $scope.$on('$destroy', function() {
+            $interval.cancel(poller);
+        });
+        $scope.refresh();
+    }]);
+
     App.controller('ViewerContainerCtrl', ['$scope', function($scope) {
         $scope.play = function() {
             $scope.$broadcast('RPC:play');
@@ -21,6 +21,22 @@
                     return $sce.trustAsHtml(input);
                 }
             };
+        }])
+        .filter('latency', ['numberFilter', function(numberFilter) {
+            return function(input) {
+                if (input === null || input === undefined) {
+                    return '\u2014';
+                }
+                return numberFilter(input * 1000, 1) + ' ms';
+            };
+        }])
+        .filter('ratio', ['numberFilter', function(numberFilter) {
+            return function(input) {
+                if (input === null || input === undefined) {
+                    return '\u2014';
+                }
+                return numberFilter(input * 100, 1) + '%';
+            };
         }]);
 
 })(window.App);
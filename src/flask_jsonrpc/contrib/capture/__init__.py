@@ -0,0 +1,324 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import os
+import json
+import time
+import random
+import typing as t
+import threading
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask import g, request
+
+from flask_jsonrpc.conf import settings
+from flask_jsonrpc.signals import request_finished
+from flask_jsonrpc.compression import decompress_request_data
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+    from flask.wrappers import Response
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+
+CAPTURE_REDACTED_PARAMS: tuple[str, ...] = ('password', 'secret', 'token', 'api_key', 'authorization')
+CAPTURE_REDACTED_VALUE: str = '[REDACTED]'
+
+
+def redact(value: t.Any, names: t.Collection[str]) -> t.Any:  # noqa: ANN401
+    """Replace the values of the object members with one of the names, at any depth.
+
+    Args:
+        value (typing.Any): The JSON value.
+        names (typing.Collection[str]): The redacted member names, in lower case.
+
+    Returns:
+        typing.Any: A copy of the value with the redacted members replaced by ``[REDACTED]``.
+
+    Examples:
+        >>> redact({'user': 'alice', 'auth': {'password': 's3cr3t'}}, {'password'})
+        {'user': 'alice', 'auth': {'password': '[REDACTED]'}}
+    """
+    if isinstance(value, dict):
+        return {
+            key: CAPTURE_REDACTED_VALUE if key.lower() in names else redact(item, names) for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item, names) for item in value]
+    return value
+
+
+class RotatingFileWriter:
+    """Appends lines to a file, rotating it when it reaches a maximum size.
+
+    The rotated files are renamed ``<path>.1``, ``<path>.2``, ..., the higher the
+    older, and the files above ``backup_count`` are removed.
+
+    Args:
+        path (str): The file path.
+        max_bytes (int): The size from which the file is rotated, 0 to never rotate it.
+        backup_count (int): The number of rotated files kept.
+
+    Attributes:
+        path (str): The file path.
+        max_bytes (int): The size from which the file is rotated.
+        backup_count (int): The number of rotated files kept.
+    """
+
+    def __init__(self: Self, path: str, *, max_bytes: int, backup_count: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+
+    def write(self: Self, line: str) -> None:
+        """Append a line to the file.
+
+        Args:
+            line (str): The line, without the line break.
+        """
+        data = f'{line}\n'.encode()
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                size = 0
+            if self.max_bytes and size and size + len(data) > self.max_bytes:
+                self.rotate()
+            with open(self.path, 'ab') as f:
+                f.write(data)
+
+    def rotate(self: Self) -> None:
+        """Rename the file and the rotated files, and remove the oldest one."""
+        for i in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f'{self.path}.{i}'):
+                os.replace(f'{self.path}.{i}', f'{self.path}.{i + 1}')
+        if self.backup_count:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+
+
+class TrafficRecorder:
+    """Flask-JSONRPC traffic recorder contrib extension.
+
+    Records a sample of the requests handled by the JSON-RPC sites, with their
+    response and duration, as JSON lines in a rotating file, to be replayed with
+    :func:`flask_jsonrpc.contrib.capture.replay.replay` or the ``flask jsonrpc replay``
+    command. Each line is an object with the ``time`` of the request (seconds since
+    the epoch), its ``path``, its ``request`` body, the ``status_code`` and ``response``
+    body of the response, and its ``duration`` in seconds.
+
+    The members of the params, and of the responses, named like one of the
+    ``redacted_params`` are replaced by ``[REDACTED]``, at any depth and case
+    insensitively. The positional params are redacted by the name of the method
+    param. The bodies are decoded with the codec of their mimetype, if the site has
+    one, and the compressed responses are decompressed. The requests whose body can
+    not be decoded are not recorded, nor the responses whose body can not be decoded,
+    e.g. compressed with ``br``.
+
+    The requests are recorded from the :data:`~flask_jsonrpc.signals.request_finished`
+    signal, so the recorder adds no overhead to the requests once it is removed.
+
+    Args:
+        app (flask.Flask | None): The Flask application instance. Defaults to None.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC | None): The JSON-RPC application instance. Defaults to None.
+        path (str | None): The file of the records. Defaults to ``jsonrpc-traffic.jsonl`` in the
+            instance folder of the Flask application.
+        sample_rate (float): The ratio of the recorded requests, between 0 and 1. Defaults to 1.0.
+        redacted_params (typing.Iterable[str]): The redacted member names.
+            Defaults to :data:`CAPTURE_REDACTED_PARAMS`.
+        max_bytes (int): The size from which the file is rotated, 0 to never rotate it. Defaults to 10 MiB.
+        backup_count (int): The number of rotated files kept. Defaults to 5.
+
+    Attributes:
+        path (str | None): The file of the records.
+        sample_rate (float): The ratio of the recorded requests.
+        redacted_params (frozenset[str]): The redacted member names, in lower case.
+        writer (RotatingFileWriter | None): The writer of the records.
+        recorded (int): The number of recorded requests.
+
+    Examples:
+        >>> import tempfile
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.contrib.capture import TrafficRecorder
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>> recorder = TrafficRecorder(
+        ...     app,
+        ...     jsonrpc,
+        ...     path=f'{tempfile.mkdtemp()}/traffic.jsonl',
+        ...     sample_rate=0.1,
+        ...     redacted_params=['password'],
+        ... )
+        >>> recorder.redacted_params
+        frozenset({'password'})
+    """
+
+    def __init__(
+        self: Self,
+        app: Flask | None = None,
+        jsonrpc_app: JSONRPC | None = None,
+        *,
+        path: str | None = None,
+        sample_rate: float = 1.0,
+        redacted_params: t.Iterable[str] = CAPTURE_REDACTED_PARAMS,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.redacted_params = frozenset(name.lower() for name in redacted_params)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.writer: RotatingFileWriter | None = None
+        self.recorded = 0
+        if app and jsonrpc_app:
+            self.init_app(app, jsonrpc_app)
+
+    def init_app(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        """Initialize the recorder with the Flask and JSON-RPC application instances.
+
+        Records the requests of the JSON-RPC site and of the sites of the registered
+        blueprints. The extension is kept in ``app.extensions['jsonrpc_capture']``.
+
+        Args:
+            app (flask.Flask): The Flask application instance.
+            jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+        """
+        if self.path is None:
+            self.path = os.path.join(app.instance_path, 'jsonrpc-traffic.jsonl')
+        self.writer = RotatingFileWriter(self.path, max_bytes=self.max_bytes, backup_count=self.backup_count)
+
+        jsonrpc_sites = [jsonrpc_app.get_jsonrpc_site()] + [
+            japp.get_jsonrpc_site() for japp in jsonrpc_app.jsonrpc_apps
+        ]
+        app.extensions['jsonrpc_capture'] = self
+        for jsonrpc_site in jsonrpc_sites:
+            request_finished.connect(self.record, sender=jsonrpc_site)
+
+    def redact_request(self: Self, jsonrpc_site: JSONRPCSite, req_json: t.Any) -> t.Any:  # noqa: ANN401
+        """Redact the params of a JSON-RPC request.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the request.
+            req_json (typing.Any): The decoded JSON-RPC request data.
+
+        Returns:
+            typing.Any: A copy of the request data with the redacted params.
+        """
+        if isinstance(req_json, list):
+            return [self.redact_request(jsonrpc_site, item) for item in req_json]
+        if not isinstance(req_json, dict) or not isinstance(req_json.get('params'), list):
+            return redact(req_json, self.redacted_params)
+        view_func = jsonrpc_site.view_funcs.get(req_json.get('method'))  # type: ignore[arg-type]
+        names = list(getattr(view_func, 'jsonrpc_method_params', {}))
+        params = [
+            CAPTURE_REDACTED_VALUE if i < len(names) and names[i].lower() in self.redacted_params else param
+            for i, param in enumerate(req_json['params'])
+        ]
+        return redact({**req_json, 'params': params}, self.redacted_params)
+
+    def load_body(
+        self: Self, jsonrpc_site: JSONRPCSite, data: bytes, *, mimetype: str, content_encoding: str | None = None
+    ) -> t.Any:  # noqa: ANN401
+        """Decode a request or response body.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the request.
+            data (bytes): The body.
+            mimetype (str): The mimetype of the body, decoded with the codec of the site for it, if any,
+                otherwise as JSON.
+            content_encoding (str | None): The ``Content-Encoding`` header of the body. Defaults to None.
+
+        Returns:
+            typing.Any: The decoded body.
+
+        Raises:
+            LookupError: If the content coding can not be decompressed.
+            ValueError: If the body can not be decoded.
+        """
+        if content_encoding and content_encoding.strip().lower() != 'identity':
+            data = decompress_request_data(
+                [data],
+                content_encoding,
+                encodings=[content_encoding.strip().lower()],
+                max_size=settings.DECOMPRESSION_MAX_SIZE,
+            )
+        codec = jsonrpc_site.codecs.get(mimetype)
+        if codec is not None:
+            return codec.loads(data)
+        return json.loads(data)
+
+    def record(self: Self, jsonrpc_site: JSONRPCSite, *, response: Response, duration: float, **kwargs: t.Any) -> None:  # noqa: ANN401
+        """Record a sampled request, it is connected to the :data:`~flask_jsonrpc.signals.request_finished` signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the request.
+            response (flask.Response): The response.
+            duration (float): The request duration, in seconds.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        if random.random() >= self.sample_rate:
+            return
+        # The recorder must never fail the request, the bodies that can not be decoded are skipped
+        # The compressed requests are decompressed from the request stream by the site, which keeps the data
+        data = g.get('_jsonrpc_request_data')
+        try:
+            req_json = self.load_body(
+                jsonrpc_site, data if data is not None else request.get_data(), mimetype=request.mimetype
+            )
+        except (LookupError, ValueError):
+            return
+        resp_json = None
+        if not response.is_streamed and response.content_length:
+            try:
+                resp_json = self.load_body(
+                    jsonrpc_site,
+                    response.get_data(),
+                    mimetype=response.mimetype or '',
+                    content_encoding=response.headers.get('Content-Encoding'),
+                )
+            except (LookupError, ValueError):
+                resp_json = None
+        record = {
+            'time': time.time() - duration,
+            'path': request.path,
+            'request': self.redact_request(jsonrpc_site, req_json),
+            'status_code': response.status_code,
+            'response': redact(resp_json, self.redacted_params),
+            'duration': duration,
+        }
+        t.cast(RotatingFileWriter, self.writer).write(json.dumps(record, separators=(',', ':'), default=str))
+        self.recorded += 1
@@ -0,0 +1,225 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import os
+import json
+import time
+import typing as t
+from dataclasses import field, asdict, dataclass
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask_jsonrpc.contrib.bench import Scenario, WSGIRequest, percentile
+from flask_jsonrpc.contrib.capture import CAPTURE_REDACTED_VALUE
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+REPLAY_PERCENTILES: dict[str, float] = {'p50': 50.0, 'p90': 90.0, 'p99': 99.0}
+
+
+@dataclass
+class ReplayResult:
+    """The result of a replayed request.
+
+    Args:
+        index (int): The position of the request in the records.
+        method (str | None): The method name, ``batch`` for batch requests.
+        path (str): The URL path of the JSON-RPC site.
+        status_code (int): The HTTP status code of the replayed request.
+        recorded_status_code (int): The recorded HTTP status code.
+        duration (float): The duration of the replayed request, in seconds.
+        recorded_duration (float): The recorded duration, in seconds.
+        equal (bool | None): Whether the response is equal to the recorded one, None if not compared.
+    """
+
+    index: int
+    method: str | None
+    path: str
+    status_code: int
+    recorded_status_code: int
+    duration: float
+    recorded_duration: float
+    equal: bool | None = None
+
+    @property
+    def mismatch(self: Self) -> bool:
+        """bool: Whether the status code or the response differs from the recorded one."""
+        return self.status_code != self.recorded_status_code or self.equal is False
+
+
+@dataclass
+class ReplayResults:
+    """The results of a replay.
+
+    Args:
+        speed (float | None): The replay speed, None if the requests were sent as fast as possible.
+        duration (float): The duration of the replay, in seconds.
+        results (list[ReplayResult]): The result of each request.
+    """
+
+    speed: float | None
+    duration: float
+    results: list[ReplayResult] = field(default_factory=list)
+
+    @property
+    def mismatches(self: Self) -> list[ReplayResult]:
+        """list[ReplayResult]: The requests whose status code or response differs from the recorded one."""
+        return [result for result in self.results if result.mismatch]
+
+    def percentiles(self: Self, *, recorded: bool = False) -> dict[str, float]:
+        """Get the latency percentiles of the requests.
+
+        Args:
+            recorded (bool): Whether to get the recorded latencies instead of the replayed ones. Defaults to False.
+
+        Returns:
+            dict[str, float]: The p50, p90 and p99 latencies, in seconds.
+        """
+        samples = sorted(result.recorded_duration if recorded else result.duration for result in self.results)
+        if not samples:
+            return dict.fromkeys(REPLAY_PERCENTILES, 0.0)
+        return {name: percentile(samples, q) for name, q in REPLAY_PERCENTILES.items()}
+
+    def to_dict(self: Self) -> dict[str, t.Any]:
+        """Get the results as a JSON-serializable dict.
+
+        Returns:
+            dict[str, typing.Any]: The results.
+        """
+        return {
+            'speed': self.speed,
+            'duration': self.duration,
+            'requests': len(self.results),
+            'mismatches': len(self.mismatches),
+            'latency': self.percentiles(),
+            'recorded_latency': self.percentiles(recorded=True),
+            'results': [asdict(result) for result in self.results],
+        }
+
+
+def load_records(path: str) -> list[dict[str, t.Any]]:
+    """Load the records of a traffic capture, including its rotated files, oldest first.
+
+    Args:
+        path (str): The file of the records.
+
+    Returns:
+        list[dict[str, typing.Any]]: The records.
+    """
+    paths = [path]
+    while os.path.exists(f'{path}.{len(paths)}'):
+        paths.append(f'{path}.{len(paths)}')
+    records: list[dict[str, t.Any]] = []
+    for record_path in reversed(paths):
+        with open(record_path, encoding='utf-8') as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+    return records
+
+
+def responses_match(recorded: t.Any, replayed: t.Any) -> bool:  # noqa: ANN401
+    """Check if a replayed response is equal to the recorded one, the redacted values match any value.
+
+    Args:
+        recorded (typing.Any): The recorded response.
+        replayed (typing.Any): The replayed response.
+
+    Returns:
+        bool: True if the responses are equal, False otherwise.
+
+    Examples:
+        >>> responses_match(
+        ...     {'result': {'token': '[REDACTED]', 'n': 1}},
+        ...     {'result': {'token': 'abc', 'n': 1}},
+        ... )
+        True
+        >>> responses_match({'result': [1, 2]}, {'result': [1, 3]})
+        False
+    """
+    if recorded == CAPTURE_REDACTED_VALUE:
+        return True
+    if isinstance(recorded, dict) and isinstance(replayed, dict):
+        return recorded.keys() == replayed.keys() and all(
+            responses_match(value, replayed[key]) for key, value in recorded.items()
+        )
+    if isinstance(recorded, list) and isinstance(replayed, list):
+        return len(recorded) == len(replayed) and all(map(responses_match, recorded, replayed))
+    return bool(recorded == replayed)
+
+
+def replay(
+    app: Flask, records: list[dict[str, t.Any]], *, speed: float | None = 1.0, compare: bool = True
+) -> ReplayResults:
+    """Replay recorded requests against an application, without a network server.
+
+    The requests are sent one after the other at their recorded pace, divided by
+    ``speed``; a request slower than the gap to the next one delays the following
+    requests. The redacted params are sent as ``[REDACTED]``.
+
+    Args:
+        app (flask.Flask): The Flask application.
+        records (list[dict[str, typing.Any]]): The records of a traffic capture, see :func:`load_records`.
+        speed (float | None): The replay speed, 2.0 replays twice as fast as recorded, None sends the
+            requests as fast as possible. Defaults to 1.0.
+        compare (bool): Whether to compare the responses with the recorded ones. Defaults to True.
+
+    Returns:
+        ReplayResults: The results.
+    """
+    results = ReplayResults(speed=speed, duration=0.0)
+    started_at = time.perf_counter()
+    first_time = records[0]['time'] if records else 0.0
+    for index, record in enumerate(records):
+        if speed:
+            delay = (record['time'] - first_time) / speed - (time.perf_counter() - started_at)
+            if delay > 0:
+                time.sleep(delay)
+        req_json = record['request']
+        method = 'batch' if isinstance(req_json, list) else req_json.get('method')
+        request = WSGIRequest(app, Scenario(f'{index}', req_json, path=record['path']))
+        sent_at = time.perf_counter()
+        body = request()
+        duration = time.perf_counter() - sent_at
+        equal = None
+        if compare:
+            equal = responses_match(record['response'], json.loads(body) if body else None)
+        results.results.append(
+            ReplayResult(
+                index=index,
+                method=method,
+                path=record['path'],
+                status_code=request.status_code,
+                recorded_status_code=record['status_code'],
+                duration=duration,
+                recorded_duration=record['duration'],
+                equal=equal,
+            )
+        )
+    results.duration = time.perf_counter() - started_at
+    return results
@@ -0,0 +1,565 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import bisect
+import typing as t
+import weakref
+import itertools
+import threading
+from dataclasses import field, dataclass
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask import Flask, Response, typing as ft
+
+from flask_jsonrpc.helpers import urn
+from flask_jsonrpc.signals import cache_checked, call_finished
+from flask_jsonrpc.encoders import jsonify
+
+if t.TYPE_CHECKING:
+    from flask_jsonrpc.site import JSONRPCSite
+
+METRICS_UNKNOWN_METHOD: str = '__unknown__'
+METRICS_CONTENT_TYPE: str = 'text/plain; version=0.0.4; charset=utf-8'
+METRICS_LATENCY_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_BATCH_SIZE_BUCKETS: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+@dataclass
+class Histogram:
+    """A fixed-bucket histogram.
+
+    Args:
+        buckets (tuple[float, ...]): The upper bounds of the buckets, in ascending order.
+        counts (list[int]): The number of observations per bucket, the last one counts the
+            observations above the last upper bound.
+        sum (float): The sum of all observations.
+
+    Examples:
+        >>> histogram = Histogram(buckets=(1.0, 5.0))
+        >>> histogram.observe(0.5)
+        >>> histogram.observe(3)
+        >>> histogram.observe(10)
+        >>> histogram.counts, histogram.count, histogram.sum
+        ([1, 1, 1], 3, 13.5)
+        >>> histogram.cumulative_counts()
+        [1, 2, 3]
+        >>> histogram.quantile(0.5)
+        3.0
+    """
+
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    sum: float = 0.0
+
+    def __post_init__(self: Self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    @property
+    def count(self: Self) -> int:
+        """int: The number of observations."""
+        return sum(self.counts)
+
+    def observe(self: Self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def merge(self: Self, other: Histogram) -> None:
+        """Add the observations of another histogram with the same buckets.
+
+        Args:
+            other (Histogram): The histogram to merge.
+        """
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.sum += other.sum
+
+    def cumulative_counts(self: Self) -> list[int]:
+        """Get the cumulative number of observations per bucket, as exposed by Prometheus.
+
+        Returns:
+            list[int]: The number of observations less than or equal to each upper bound, the last
+                one is the total number of observations.
+        """
+        total = 0
+        cumulative = []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    def quantile(self: Self, q: float) -> float | None:
+        """Estimate a quantile of the observations, interpolating linearly inside the bucket
+        as Prometheus ``histogram_quantile`` does.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float | None: The estimated quantile, the last upper bound if it falls above it,
+                or None if there are no observations.
+        """
+        cumulative = self.cumulative_counts()
+        if not cumulative[-1]:
+            return None
+        rank = q * cumulative[-1]
+        index = bisect.bisect_left(cumulative, rank)
+        if index == len(self.buckets):
+            return self.buckets[-1]
+        lower = self.buckets[index - 1] if index else 0.0
+        previous = cumulative[index - 1] if index else 0
+        return lower + (self.buckets[index] - lower) * (rank - previous) / max(cumulative[index] - previous, 1)
+
+
+@dataclass
+class MethodMetrics:
+    """Metrics of a JSON-RPC method.
+
+    Args:
+        calls (int): Number of calls.
+        errors (dict[int, int]): Number of errors by JSON-RPC error code.
+        latency (Histogram): Call latency histogram, in seconds.
+        cache_hits (int): Number of calls answered from a cache.
+        cache_misses (int): Number of cacheable calls that were not found in a cache.
+    """
+
+    calls: int = 0
+    errors: dict[int, int] = field(default_factory=dict)
+    latency: Histogram = field(default_factory=lambda: Histogram(buckets=METRICS_LATENCY_BUCKETS))
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def merge(self: Self, other: MethodMetrics) -> None:
+        """Add the metrics of another instance.
+
+        Args:
+            other (MethodMetrics): The metrics to merge.
+        """
+        self.calls += other.calls
+        for code, count in list(other.errors.items()):
+            self.errors[code] = self.errors.get(code, 0) + count
+        self.latency.merge(other.latency)
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+
+
+@dataclass
+class MetricsSnapshot:
+    """Point-in-time metrics, merged from all the threads.
+
+    Args:
+        methods (dict[str, MethodMetrics]): Metrics by method name.
+        batch_size (Histogram): Batch request size histogram.
+    """
+
+    methods: dict[str, MethodMetrics] = field(default_factory=dict)
+    batch_size: Histogram = field(default_factory=lambda: Histogram(buckets=METRICS_BATCH_SIZE_BUCKETS))
+
+    def merge(self: Self, other: MetricsSnapshot) -> None:
+        """Add the metrics of another snapshot.
+
+        Args:
+            other (MetricsSnapshot): The snapshot to merge.
+        """
+        for name, method_metrics in list(other.methods.items()):
+            self.methods.setdefault(name, MethodMetrics()).merge(method_metrics)
+        self.batch_size.merge(other.batch_size)
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value.
+
+    Args:
+        value (str): The label value.
+
+    Returns:
+        str: The escaped label value.
+
+    Examples:
+        >>> _escape_label('say "hi"\\n')
+        'say \\\\"hi\\\\"\\\\n'
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_histogram(name: str, labels: str, histogram: Histogram) -> list[str]:
+    """Format a histogram in the Prometheus text format.
+
+    Args:
+        name (str): The metric name.
+        labels (str): The formatted labels, without the ``le`` label.
+        histogram (Histogram): The histogram.
+
+    Returns:
+        list[str]: The metric lines.
+    """
+    sep = ',' if labels else ''
+    bounds = [f'{bound:g}' for bound in histogram.buckets] + ['+Inf']
+    cumulative = histogram.cumulative_counts()
+    lines = [
+        f'{name}_bucket{{{labels}{sep}le="{bound}"}} {count}' for bound, count in zip(bounds, cumulative, strict=True)
+    ]
+    lines.append(f'{name}_sum{{{labels}}} {histogram.sum!r}' if labels else f'{name}_sum {histogram.sum!r}')
+    lines.append(f'{name}_count{{{labels}}} {cumulative[-1]}' if labels else f'{name}_count {cumulative[-1]}')
+    return lines
+
+
+class _ShardOwner:
+    """Owner of the shard of a thread, it is only referenced by the thread local data."""
+
+
+class MetricsRegistry:
+    """In-process registry of the JSON-RPC metrics.
+
+    Each thread records into its own shard without locking, the shards are
+    merged when the metrics are collected. The shard of a thread is folded into
+    a shared aggregate when the thread ends, so thread-per-request servers do
+    not grow the number of shards.
+
+    Examples:
+        >>> registry = MetricsRegistry()
+        >>> registry.record_call('app.index', None, 0.002)
+        >>> registry.record_call('app.index', -32602, 0.001)
+        >>> registry.record_batch(10)
+        >>> snapshot = registry.collect()
+        >>> snapshot.methods['app.index'].calls, snapshot.methods['app.index'].errors
+        (2, {-32602: 1})
+        >>> snapshot.batch_size.count
+        1
+        >>> registry.record_cache('app.index', hit=True)
+        >>> registry.summary()['methods']['app.index']['cache_hit_ratio']
+        1.0
+    """
+
+    def __init__(self: Self) -> None:
+        self._local = threading.local()
+        self._shards: dict[int, MetricsSnapshot] = {}
+        self._retired = MetricsSnapshot()
+        self._keys = itertools.count()
+        self._lock = threading.Lock()
+
+    def _shard(self: Self) -> MetricsSnapshot:
+        """Get the shard of the current thread.
+
+        Returns:
+            MetricsSnapshot: The shard of the current thread.
+        """
+        shard: MetricsSnapshot | None = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = MetricsSnapshot()
+            owner = self._local.owner = _ShardOwner()
+            key = next(self._keys)
+            with self._lock:
+                self._shards[key] = shard
+            weakref.finalize(owner, self._retire, key)
+        return shard
+
+    def _retire(self: Self, key: int) -> None:
+        """Fold the shard of an ended thread into the aggregate.
+
+        Args:
+            key (int): The shard key.
+        """
+        with self._lock:
+            shard = self._shards.pop(key)
+            self._retired.merge(shard)
+
+    def record_call(self: Self, method_name: str, error_code: int | None, duration: float) -> None:
+        """Record a JSON-RPC call.
+
+        Args:
+            method_name (str): The method name.
+            error_code (int | None): The JSON-RPC error code, or None if the call succeeded.
+            duration (float): The call duration, in seconds.
+        """
+        methods = self._shard().methods
+        method_metrics = methods.get(method_name)
+        if method_metrics is None:
+            method_metrics = methods[method_name] = MethodMetrics()
+        method_metrics.calls += 1
+        if error_code is not None:
+            method_metrics.errors[error_code] = method_metrics.errors.get(error_code, 0) + 1
+        method_metrics.latency.observe(duration)
+
+    def record_cache(self: Self, method_name: str, *, hit: bool) -> None:
+        """Record a cache lookup of a JSON-RPC call.
+
+        Args:
+            method_name (str): The method name.
+            hit (bool): Whether the call was answered from the cache.
+        """
+        methods = self._shard().methods
+        method_metrics = methods.get(method_name)
+        if method_metrics is None:
+            method_metrics = methods[method_name] = MethodMetrics()
+        if hit:
+            method_metrics.cache_hits += 1
+        else:
+            method_metrics.cache_misses += 1
+
+    def record_batch(self: Self, size: int) -> None:
+        """Record the size of a batch request.
+
+        Args:
+            size (int): The number of request objects in the batch.
+        """
+        self._shard().batch_size.observe(size)
+
+    def collect(self: Self) -> MetricsSnapshot:
+        """Merge the shards of all threads.
+
+        Returns:
+            MetricsSnapshot: The merged metrics.
+        """
+        snapshot = MetricsSnapshot()
+        with self._lock:
+            snapshot.merge(self._retired)
+            shards = list(self._shards.values())
+        for shard in shards:
+            snapshot.merge(shard)
+        return snapshot
+
+    def render_prometheus(self: Self) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics.
+        """
+        snapshot = self.collect()
+        methods = sorted(snapshot.methods.items())
+        lines = ['# HELP jsonrpc_calls_total Total number of JSON-RPC calls.', '# TYPE jsonrpc_calls_total counter']
+        lines.extend(f'jsonrpc_calls_total{{method="{_escape_label(name)}"}} {m.calls}' for name, m in methods)
+        lines.extend(
+            [
+                '# HELP jsonrpc_errors_total Total number of JSON-RPC calls that returned an error, by error code.',
+                '# TYPE jsonrpc_errors_total counter',
+            ]
+        )
+        for name, m in methods:
+            lines.extend(
+                f'jsonrpc_errors_total{{method="{_escape_label(name)}",code="{code}"}} {count}'
+                for code, count in sorted(m.errors.items())
+            )
+        lines.extend(
+            [
+                '# HELP jsonrpc_call_duration_seconds Duration of the JSON-RPC calls.',
+                '# TYPE jsonrpc_call_duration_seconds histogram',
+            ]
+        )
+        for name, m in methods:
+            lines.extend(
+                _format_histogram('jsonrpc_call_duration_seconds', f'method="{_escape_label(name)}"', m.latency)
+            )
+        lines.extend(
+            [
+                '# HELP jsonrpc_cache_requests_total Total number of cache lookups of the JSON-RPC calls, by result.',
+                '# TYPE jsonrpc_cache_requests_total counter',
+            ]
+        )
+        for name, m in methods:
+            if m.cache_hits or m.cache_misses:
+                lines.append(
+                    f'jsonrpc_cache_requests_total{{method="{_escape_label(name)}",result="hit"}} {m.cache_hits}'
+                )
+                lines.append(
+                    f'jsonrpc_cache_requests_total{{method="{_escape_label(name)}",result="miss"}} {m.cache_misses}'
+                )
+        lines.extend(
+            [
+                '# HELP jsonrpc_batch_size Number of JSON-RPC request objects per batch request.',
+                '# TYPE jsonrpc_batch_size histogram',
+            ]
+        )
+        lines.extend(_format_histogram('jsonrpc_batch_size', '', snapshot.batch_size))
+        return '\n'.join(lines) + '\n'
+
+    def summary(self: Self) -> dict[str, t.Any]:
+        """Summarize the metrics per method, for dashboards.
+
+        Returns:
+            dict[str, typing.Any]: The number of calls and errors, the error rate, the p50, p95 and p99
+                latency estimates, in seconds, and the cache hits, misses and hit ratio of each method,
+                and the number of batch requests.
+        """
+        snapshot = self.collect()
+        methods = {}
+        for name, m in sorted(snapshot.methods.items()):
+            errors = sum(m.errors.values())
+            cache_lookups = m.cache_hits + m.cache_misses
+            methods[name] = {
+                'calls': m.calls,
+                'errors': errors,
+                'error_rate': errors / m.calls if m.calls else None,
+                'p50': m.latency.quantile(0.5),
+                'p95': m.latency.quantile(0.95),
+                'p99': m.latency.quantile(0.99),
+                'cache_hits': m.cache_hits,
+                'cache_misses': m.cache_misses,
+                'cache_hit_ratio': m.cache_hits / cache_lookups if cache_lookups else None,
+            }
+        return {'methods': methods, 'batches': snapshot.batch_size.count}
+
+
+class JSONRPCMetrics:
+    """JSON-RPC metrics extension for Flask applications.
+
+    Records, per method, the number of calls, the number of errors by JSON-RPC
+    error code and a latency histogram, plus a histogram of the batch request
+    sizes, and exposes them in the Prometheus text format, and summarized in JSON
+    at the same path with the ``.json`` suffix, which is polled by the performance
+    dashboard of the web browsable API.
+
+    Args:
+        app (flask.Flask | None): The Flask application to initialize the extension with.
+        path (str): The URL path of the metrics endpoint.
+        registry (MetricsRegistry | None): The metrics registry. Defaults to a new registry.
+
+    Attributes:
+        path (str): The URL path of the metrics endpoint.
+        json_path (str): The URL path of the JSON metrics summary endpoint.
+        registry (MetricsRegistry): The metrics registry.
+        jsonrpc_sites (set[flask_jsonrpc.site.JSONRPCSite]): The set of registered JSON-RPC sites.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api', enable_metrics=True)
+        >>> assert jsonrpc.jsonrpc_metrics.path == '/metrics'
+        >>> assert jsonrpc.jsonrpc_metrics.json_path == '/metrics.json'
+    """
+
+    def __init__(
+        self: Self, app: Flask | None = None, path: str = '/metrics', registry: MetricsRegistry | None = None
+    ) -> None:
+        self.path = path
+        self.json_path = f'{path.rstrip("/")}.json'
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.jsonrpc_sites: set[JSONRPCSite] = set()
+        if app:
+            self.init_app(app)
+
+    def init_app(self: Self, app: Flask) -> None:
+        """Initialize the JSON-RPC metrics extension with a Flask application.
+
+        Args:
+            app (flask.Flask): The Flask application.
+        """
+        app.add_url_rule(self.path, urn('metrics', app.name, self.path), view_func=self.vf_metrics)
+        app.add_url_rule(self.json_path, urn('metrics', app.name, self.json_path), view_func=self.vf_json_metrics)
+
+    def register_jsonrpc_site(self: Self, jsonrpc_site: JSONRPCSite) -> None:
+        """Record the metrics of a JSON-RPC site.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+        """
+        if jsonrpc_site in self.jsonrpc_sites:
+            return
+        self.jsonrpc_sites.add(jsonrpc_site)
+        call_finished.connect(self.on_call_finished, sender=jsonrpc_site)
+        cache_checked.connect(self.on_cache_checked, sender=jsonrpc_site)
+        jsonrpc_site.register_before_request(self.on_request)
+
+    def on_request(self: Self, req_json: t.Any) -> None:  # noqa: ANN401
+        """Record the size of batch requests, it is registered as a before request function.
+
+        Args:
+            req_json (typing.Any): The decoded JSON-RPC request data.
+        """
+        if isinstance(req_json, list):
+            self.registry.record_batch(len(req_json))
+
+    def on_call_finished(
+        self: Self,
+        jsonrpc_site: JSONRPCSite,
+        *,
+        req_json: t.Any,  # noqa: ANN401
+        response: t.Any,  # noqa: ANN401
+        duration: float,
+        **kwargs: t.Any,  # noqa: ANN401
+    ) -> None:
+        """Record a JSON-RPC call, it is connected to the :data:`~flask_jsonrpc.signals.call_finished` signal.
+
+        Methods that are not registered on the site are recorded as ``__unknown__``, to
+        keep the number of metrics bounded.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the call.
+            req_json (typing.Any): The JSON-RPC request object.
+            response (typing.Any): The JSON-RPC response object, None for notifications.
+            duration (float): The call duration, in seconds.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        method_name = req_json.get('method') if isinstance(req_json, dict) else None
+        if not isinstance(method_name, str) or method_name not in jsonrpc_site.view_funcs:
+            method_name = METRICS_UNKNOWN_METHOD
+        error = response.get('error') if isinstance(response, dict) else None
+        error_code = error.get('code') if isinstance(error, dict) else None
+        self.registry.record_call(method_name, error_code, duration)
+
+    def on_cache_checked(
+        self: Self,
+        jsonrpc_site: JSONRPCSite,
+        *,
+        method_name: str,
+        hit: bool,
+        **kwargs: t.Any,  # noqa: ANN401
+    ) -> None:
+        """Record a cache lookup, it is connected to the :data:`~flask_jsonrpc.signals.cache_checked` signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the call.
+            method_name (str): The method name.
+            hit (bool): Whether the call was answered with a ``304 Not Modified``.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        self.registry.record_cache(method_name, hit=hit)
+
+    def vf_metrics(self: Self) -> Response:
+        """Render the metrics in the Prometheus text format.
+
+        Returns:
+            flask.Response: The metrics response.
+        """
+        return Response(self.registry.render_prometheus(), content_type=METRICS_CONTENT_TYPE)
+
+    def vf_json_metrics(self: Self) -> ft.ResponseReturnValue:
+        """Render the metrics summary in JSON.
+
+        Returns:
+            flask.typing.ResponseReturnValue: The metrics summary response.
+        """
+        return jsonify(self.registry.summary())
@@ -0,0 +1,329 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import os
+import re
+import hmac
+import time
+import typing as t
+import cProfile
+import datetime
+import contextlib
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask import Blueprint, g, abort, request, current_app, render_template, after_this_request, send_from_directory
+
+from flask_jsonrpc.helpers import urn
+from flask_jsonrpc.signals import request_started
+from flask_jsonrpc.encoders import jsonify
+
+if t.TYPE_CHECKING:
+    from flask import Flask, typing as ft
+    from flask.wrappers import Response
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+    from flask_jsonrpc.contrib.browse import JSONRPCBrowse
+
+PROFILER_HEADER: str = 'X-JSONRPC-Profile'
+PROFILER_CAPTURE_HEADER: str = 'X-JSONRPC-Profile-Capture'
+PROFILER_CAPTURE_SUFFIX: str = '.prof'
+PROFILER_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+class JSONRPCProfiler:
+    """Flask-JSONRPC on-demand profiler contrib extension.
+
+    Runs the dispatch of the requests that have the ``X-JSONRPC-Profile`` header
+    under :mod:`cProfile` and keeps the last ``max_captures`` captures on disk, in
+    the :mod:`pstats` format. The name of the capture is returned in the
+    ``X-JSONRPC-Profile-Capture`` response header, except for the responses of the
+    :class:`~flask_jsonrpc.wsgi.JSONRPCWSGIApp` and :class:`~flask_jsonrpc.asgi.JSONRPCASGIApp`
+    applications, that do not run the after request functions of Flask, the capture
+    is saved anyway.
+
+    Profiling is only allowed in debug mode, with the header value ``1``, or with
+    one of the allowlisted ``tokens`` as the header value. The captures can be
+    listed and downloaded, with the same rules, from a page of the web browsable
+    API, if it is enabled, or from ``<url_prefix>/captures.json`` and
+    ``<url_prefix>/<capture>``, where the token can also be passed in the
+    ``token`` query argument. The menu of the web browsable API only links the
+    captures page when no tokens are allowlisted, with the debug mode value
+    ``1``, otherwise open ``<url_prefix>/?token=<token>``.
+
+    Args:
+        app (flask.Flask | None): The Flask application instance. Defaults to None.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC | None): The JSON-RPC application instance. Defaults to None.
+        directory (str | None): The directory of the captures. Defaults to ``jsonrpc-profiles`` in the
+            instance folder of the Flask application.
+        max_captures (int): The number of captures kept on disk. Defaults to 20.
+        tokens (typing.Iterable[str]): The allowlisted tokens. Defaults to none.
+        url_prefix (str | None): The URL prefix of the capture pages. Defaults to ``<browse url>/profiles``
+            if the web browsable API is enabled, otherwise to ``<path>/profiles``.
+
+    Attributes:
+        directory (str | None): The directory of the captures.
+        max_captures (int): The number of captures kept on disk.
+        tokens (tuple[str, ...]): The allowlisted tokens.
+        url_prefix (str | None): The URL prefix of the capture pages.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.contrib.profiler import JSONRPCProfiler
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>> profiler = JSONRPCProfiler(app, jsonrpc, tokens=['s3cr3t'], max_captures=10)
+        >>> profiler.url_prefix
+        '/api/profiles'
+    """
+
+    def __init__(
+        self: Self,
+        app: Flask | None = None,
+        jsonrpc_app: JSONRPC | None = None,
+        *,
+        directory: str | None = None,
+        max_captures: int = 20,
+        tokens: t.Iterable[str] = (),
+        url_prefix: str | None = None,
+    ) -> None:
+        self.directory = directory
+        self.max_captures = max_captures
+        self.tokens = tuple(tokens)
+        self.url_prefix = url_prefix
+        self.jsonrpc_browse: JSONRPCBrowse | None = None
+        if app and jsonrpc_app:
+            self.init_app(app, jsonrpc_app)
+
+    def init_app(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        """Initialize the profiler with the Flask and JSON-RPC application instances.
+
+        Profiles the JSON-RPC site and the sites of the registered blueprints, and
+        registers the capture pages. The extension is kept in ``app.extensions['jsonrpc_profiler']``.
+
+        Args:
+            app (flask.Flask): The Flask application instance.
+            jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+        """
+        self.jsonrpc_browse = jsonrpc_app.jsonrpc_browse
+        if self.directory is None:
+            self.directory = os.path.join(app.instance_path, 'jsonrpc-profiles')
+        if self.url_prefix is None:
+            base_url = self.jsonrpc_browse.url_prefix if self.jsonrpc_browse else jsonrpc_app.path
+            self.url_prefix = f'{base_url.rstrip("/")}/profiles'
+
+        jsonrpc_sites = [jsonrpc_app.get_jsonrpc_site()] + [
+            japp.get_jsonrpc_site() for japp in jsonrpc_app.jsonrpc_apps
+        ]
+        app.extensions['jsonrpc_profiler'] = self
+        for jsonrpc_site in jsonrpc_sites:
+            request_started.connect(self.start_profile, sender=jsonrpc_site)
+            jsonrpc_site.register_before_request(self.annotate_profile)
+            jsonrpc_site.register_teardown_request(self.end_profile)
+
+        profiler = Blueprint(urn('profiler', app.name, self.url_prefix), __name__, template_folder='templates')
+        profiler.add_url_rule('/', view_func=self.vf_index)
+        profiler.add_url_rule('/captures.json', view_func=self.vf_json_captures)
+        profiler.add_url_rule('/<capture>', view_func=self.vf_capture)
+        app.register_blueprint(profiler, url_prefix=self.url_prefix)
+        # The menu can not pass the allowlisted tokens, it links the page only for the debug mode value
+        if self.jsonrpc_browse and not self.tokens:
+            self.jsonrpc_browse.register_menu_link('Profiles', f'{self.url_prefix}/?token=1')
+
+    def is_allowed(self: Self, value: str | None) -> bool:
+        """Check if profiling is allowed.
+
+        Args:
+            value (str | None): The value of the profile header, or the token.
+
+        Returns:
+            bool: True if the value is one of the allowlisted tokens, or is ``1`` in debug mode.
+        """
+        if not value:
+            return False
+        if current_app.debug and value == '1':
+            return True
+        return any(hmac.compare_digest(value.encode('utf-8'), token.encode('utf-8')) for token in self.tokens)
+
+    def start_profile(self: Self, jsonrpc_site: JSONRPCSite, **kwargs: t.Any) -> None:  # noqa: ANN401
+        """Start profiling the request if it has an allowed profile header, it is connected to the
+        :data:`~flask_jsonrpc.signals.request_started` signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the request.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        if not self.is_allowed(request.headers.get(PROFILER_HEADER)):
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:  # Another profiler is active, e.g. a debugger or a coverage tool
+            jsonrpc_site.logger.warning('unable to profile the request: %s', e)
+            return
+        g._jsonrpc_profile = profile
+        g._jsonrpc_profile_capture = self.capture_name('unknown')
+
+        # The header is set before a streamed response is sent, the capture is saved when it ends
+        @after_this_request
+        def add_capture_header(response: Response) -> Response:
+            response.headers[PROFILER_CAPTURE_HEADER] = g._jsonrpc_profile_capture
+            return response
+
+    def annotate_profile(self: Self, req_json: t.Any) -> None:  # noqa: ANN401
+        """Name the capture of the profiled request after its method, it is registered as a before
+        request function.
+
+        Args:
+            req_json (typing.Any): The decoded JSON-RPC request data.
+        """
+        if '_jsonrpc_profile' not in g:
+            return
+        method_name = req_json.get('method') if isinstance(req_json, dict) else None
+        g._jsonrpc_profile_capture = self.capture_name('batch' if isinstance(req_json, list) else str(method_name))
+
+    def end_profile(self: Self, exc: BaseException | None) -> None:
+        """Stop profiling the request and save the capture, it is registered as a teardown request function.
+
+        Args:
+            exc (BaseException | None): The exception raised while dispatching the request, if any.
+        """
+        profile: cProfile.Profile | None = g.pop('_jsonrpc_profile', None)
+        if profile is None:
+            return
+        profile.disable()
+        self.save(profile, g._jsonrpc_profile_capture)
+
+    def capture_name(self: Self, method_name: str) -> str:
+        """Build the name of a capture.
+
+        Args:
+            method_name (str): The profiled method name.
+
+        Returns:
+            str: The capture name.
+        """
+        return f'{time.time_ns()}-{PROFILER_UNSAFE_CHARS.sub("_", method_name)}{PROFILER_CAPTURE_SUFFIX}'
+
+    def save(self: Self, profile: cProfile.Profile, capture: str) -> None:
+        """Save a capture and remove the oldest ones above ``max_captures``.
+
+        Args:
+            profile (cProfile.Profile): The profile.
+            capture (str): The capture name.
+        """
+        directory = t.cast(str, self.directory)
+        os.makedirs(directory, exist_ok=True)
+        profile.dump_stats(os.path.join(directory, capture))
+        for old_capture in self.list_captures()[self.max_captures :]:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(directory, old_capture['name']))
+
+    def list_captures(self: Self) -> list[dict[str, t.Any]]:
+        """List the captures, newest first.
+
+        Returns:
+            list[dict[str, typing.Any]]: The name, method, creation date and size of the captures.
+        """
+        directory = t.cast(str, self.directory)
+        if not os.path.isdir(directory):
+            return []
+        captures = []
+        for name in os.listdir(directory):
+            timestamp, sep, rest = name.partition('-')
+            if not sep or not timestamp.isdigit() or not rest.endswith(PROFILER_CAPTURE_SUFFIX):
+                continue
+            captures.append(
+                {
+                    'name': name,
+                    'method': rest[: -len(PROFILER_CAPTURE_SUFFIX)],
+                    'created_at': datetime.datetime.fromtimestamp(int(timestamp) / 1e9, tz=datetime.timezone.utc),
+                    'size': os.path.getsize(os.path.join(directory, name)),
+                }
+            )
+        return sorted(captures, key=lambda capture: capture['name'], reverse=True)
+
+    def check_access(self: Self) -> None:
+        """Abort the request of a capture page if profiling is not allowed.
+
+        Raises:
+            werkzeug.exceptions.Forbidden: If profiling is not allowed.
+        """
+        if not self.is_allowed(request.headers.get(PROFILER_HEADER) or request.args.get('token')):
+            abort(403)
+
+    def vf_index(self: Self) -> ft.ResponseReturnValue:
+        """Render the captures page of the web browsable API.
+
+        Returns:
+            flask.typing.ResponseReturnValue: The rendered page, or a 404 error if the web browsable
+                API is not enabled.
+        """
+        self.check_access()
+        if self.jsonrpc_browse is None:
+            return jsonify({'message': 'Not found'}), 404
+        return render_template(
+            'browse/profiles.html',
+            url_prefix=self.url_prefix,
+            server_urls={},
+            browse_url=self.jsonrpc_browse.url_prefix,
+            browse_title=self.jsonrpc_browse.get_browse_title(),
+            browse_title_url=self.jsonrpc_browse.get_browse_title_url(),
+            browse_description=self.jsonrpc_browse.get_browse_description(),
+            token=request.args.get('token'),
+            captures=self.list_captures(),
+        )
+
+    def vf_json_captures(self: Self) -> ft.ResponseReturnValue:
+        """List the captures.
+
+        Returns:
+            flask.typing.ResponseReturnValue: The JSON list of captures.
+        """
+        self.check_access()
+        return jsonify(
+            [{**capture, 'created_at': capture['created_at'].isoformat()} for capture in self.list_captures()]
+        )
+
+    def vf_capture(self: Self, capture: str) -> ft.ResponseReturnValue:
+        """Download a capture.
+
+        Args:
+            capture (str): The capture name.
+
+        Returns:
+            flask.typing.ResponseReturnValue: The capture file, or a 404 error if it is not found.
+        """
+        self.check_access()
+        return send_from_directory(
+            t.cast(str, self.directory), capture, as_attachment=True, mimetype='application/octet-stream'
+        )
@@ -0,0 +1,325 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import re
+import time
+import typing as t
+import functools
+import threading
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask import request
+
+from flask_jsonrpc.exceptions import RateLimitExceededError
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+
+RATE_LIMIT_SITE_KEY: str = '*'
+RATE_LIMIT_PERIODS: dict[str, float] = {
+    's': 1.0,
+    'sec': 1.0,
+    'second': 1.0,
+    'm': 60.0,
+    'min': 60.0,
+    'minute': 60.0,
+    'h': 3600.0,
+    'hour': 3600.0,
+    'd': 86400.0,
+    'day': 86400.0,
+}
+
+_RATE_RE = re.compile(r'^\s*(\d+)\s*/\s*(\d*)\s*(?:(s|sec|m|min|h|d)|(second|minute|hour|day)s?)\s*$')
+
+
+@functools.lru_cache(maxsize=256)
+def parse_rate(rate: str) -> tuple[float, float]:
+    """Parse a rate limit expression.
+
+    The expression has the form ``<count>/<period>``, where period is one of
+    ``s``, ``m``, ``h``, ``d`` (or ``second``, ``minute``, ``hour``, ``day``),
+    optionally prefixed by a multiplier. Only the full words take a plural ``s``,
+    e.g. ``minutes``, but not ``ms``. The count is also used as the bucket
+    capacity, that is, the maximum burst size.
+
+    Args:
+        rate (str): The rate limit expression.
+
+    Returns:
+        tuple[float, float]: The refill rate, in tokens per second, and the bucket capacity.
+
+    Raises:
+        ValueError: If the expression is invalid.
+
+    Examples:
+        >>> parse_rate('100/s')
+        (100.0, 100.0)
+        >>> parse_rate('60/minute')
+        (1.0, 60.0)
+        >>> parse_rate('10/5s')
+        (2.0, 10.0)
+        >>> parse_rate('100 per second')
+        Traceback (most recent call last):
+            ...
+        ValueError: invalid rate limit: '100 per second'
+    """
+    match = _RATE_RE.match(rate.lower())
+    if match is None or int(match.group(1)) <= 0:
+        raise ValueError(f'invalid rate limit: {rate!r}') from None
+    count, multiplier, short_period, period = match.groups()
+    period = short_period or period
+    seconds = RATE_LIMIT_PERIODS[period] * int(multiplier or 1)
+    return int(count) / seconds, float(count)
+
+
+def remote_addr_key() -> str:
+    """Get the rate limit key from the client remote address.
+
+    Returns:
+        str: The client remote address.
+    """
+    return request.remote_addr or ''
+
+
+def header_key(name: str) -> t.Callable[[], str]:
+    """Create a key function that gets the rate limit key from a request header.
+
+    Falls back to the client remote address if the header is missing.
+
+    Args:
+        name (str): The header name, e.g. ``X-API-Key``.
+
+    Returns:
+        typing.Callable[[], str]: The key function.
+    """
+
+    def key_func() -> str:
+        return request.headers.get(name) or remote_addr_key()
+
+    return key_func
+
+
+class RateLimitBackend(t.Protocol):  # pragma: no cover
+    """A protocol for token bucket storages, implement it to share the buckets between processes."""
+
+    def consume(self: Self, key: str, rate: float, capacity: float, cost: float = 1.0) -> float:
+        """Take tokens from a bucket.
+
+        Args:
+            key (str): The bucket key.
+            rate (float): The refill rate, in tokens per second.
+            capacity (float): The bucket capacity.
+            cost (float): The number of tokens to take.
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise the number of seconds to wait before retrying.
+        """
+        ...
+
+
+class MemoryRateLimitBackend:
+    """In-process token bucket storage.
+
+    Each check is O(1). Buckets are guarded by a small set of striped locks, so
+    concurrent checks for different keys rarely contend. When the number of
+    buckets exceeds ``max_keys``, the least recently used bucket is evicted.
+
+    Args:
+        max_keys (int): Maximum number of buckets kept in memory. Defaults to 100000.
+        clock (typing.Callable[[], float]): Monotonic clock, in seconds. Defaults to :func:`time.monotonic`.
+
+    Examples:
+        >>> backend = MemoryRateLimitBackend()
+        >>> backend.consume('127.0.0.1', rate=1.0, capacity=1.0)
+        0.0
+        >>> backend.consume('127.0.0.1', rate=1.0, capacity=1.0) > 0
+        True
+    """
+
+    _LOCK_STRIPES = 16
+
+    def __init__(self: Self, max_keys: int = 100_000, clock: t.Callable[[], float] = time.monotonic) -> None:
+        self.max_keys = max_keys
+        self.clock = clock
+        self.buckets: dict[str, tuple[float, float]] = {}
+        self._locks = [threading.Lock() for _ in range(self._LOCK_STRIPES)]
+
+    def consume(self: Self, key: str, rate: float, capacity: float, cost: float = 1.0) -> float:
+        """Take tokens from a bucket.
+
+        Args:
+            key (str): The bucket key.
+            rate (float): The refill rate, in tokens per second.
+            capacity (float): The bucket capacity.
+            cost (float): The number of tokens to take.
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise the number of seconds to wait before retrying.
+        """
+        with self._locks[hash(key) % self._LOCK_STRIPES]:
+            now = self.clock()
+            # Re-inserted below, the buckets are kept from the least to the most recently used
+            bucket = self.buckets.pop(key, None)
+            if bucket is None:
+                tokens = capacity
+                if len(self.buckets) >= self.max_keys:
+                    self.buckets.pop(next(iter(self.buckets)), None)
+            else:
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            if tokens >= cost:
+                self.buckets[key] = (tokens - cost, now)
+                return 0.0
+            self.buckets[key] = (tokens, now)
+            return (cost - tokens) / rate
+
+
+class RateLimiter:
+    """Flask-JSONRPC rate limiter contrib extension.
+
+    Applies token bucket rate limits per client key, to the whole site and to
+    each method registered with a ``rate_limit`` option. Each element of a batch
+    request is counted separately, and each rejected element gets a
+    :class:`~flask_jsonrpc.exceptions.RateLimitExceededError` response.
+
+    Args:
+        app (flask.Flask | None): The Flask application instance. Defaults to None.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC | None): The JSON-RPC application instance. Defaults to None.
+        rate_limit (str | None): The site rate limit, e.g. ``'1000/s'``. Defaults to None (unlimited).
+        key_func (typing.Callable[[], str]): Function that returns the client key of the current request.
+            Defaults to :func:`remote_addr_key`.
+        backend (RateLimitBackend | None): The token bucket storage. Defaults to
+            :class:`MemoryRateLimitBackend`.
+
+    Attributes:
+        rate_limit (str | None): The site rate limit.
+        key_func (typing.Callable[[], str]): Function that returns the client key of the current request.
+        backend (RateLimitBackend): The token bucket storage.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.contrib.ratelimit import RateLimiter, header_key
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>>
+        >>> # Disable automatic validation for typechecking limitations with doctests
+        >>> # We always recommend to use validation in real applications
+        >>> @jsonrpc.method('app.search', rate_limit='10/s', validate=False)
+        ... def search(query: str) -> list[str]:
+        ...     return [query]
+        >>>
+        >>> limiter = RateLimiter(
+        ...     app, jsonrpc, rate_limit='1000/s', key_func=header_key('X-API-Key')
+        ... )
+    """
+
+    def __init__(
+        self: Self,
+        app: Flask | None = None,
+        jsonrpc_app: JSONRPC | None = None,
+        *,
+        rate_limit: str | None = None,
+        key_func: t.Callable[[], str] = remote_addr_key,
+        backend: RateLimitBackend | None = None,
+    ) -> None:
+        if rate_limit is not None:
+            parse_rate(rate_limit)
+        self.rate_limit = rate_limit
+        self.key_func = key_func
+        self.backend: RateLimitBackend = backend if backend is not None else MemoryRateLimitBackend()
+        if app and jsonrpc_app:
+            self.init_app(app, jsonrpc_app)
+
+    def init_app(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        """Initialize the rate limiter with the Flask and JSON-RPC application instances.
+
+        Registers the rate limit check to the JSON-RPC site and to the sites of the
+        registered blueprints, and validates the ``rate_limit`` option of the methods
+        registered so far.
+
+        Args:
+            app (flask.Flask): The Flask application instance.
+            jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+
+        Raises:
+            ValueError: If the rate limit of a method is not valid.
+        """
+        jsonrpc_sites = [jsonrpc_app.get_jsonrpc_site()] + [
+            japp.get_jsonrpc_site() for japp in jsonrpc_app.jsonrpc_apps
+        ]
+        for jsonrpc_site in jsonrpc_sites:
+            for method_name, view_func in jsonrpc_site.view_funcs.items():
+                method_rate_limit = getattr(view_func, 'jsonrpc_options', {}).get('rate_limit')
+                if method_rate_limit is not None:
+                    try:
+                        parse_rate(method_rate_limit)
+                    except ValueError as e:
+                        raise ValueError(f'{e} of the method {method_name!r}') from None
+            jsonrpc_site.register_before_dispatch(functools.partial(self.check, jsonrpc_site))
+
+    def _consume(self: Self, key: str, rate_limit: str) -> None:
+        """Take a token from a bucket.
+
+        Args:
+            key (str): The bucket key.
+            rate_limit (str): The rate limit expression.
+
+        Raises:
+            flask_jsonrpc.exceptions.RateLimitExceededError: If the bucket is empty.
+        """
+        rate, capacity = parse_rate(rate_limit)
+        retry_after = self.backend.consume(key, rate, capacity)
+        if retry_after > 0:
+            raise RateLimitExceededError(
+                data={'message': f'Rate limit exceeded: {rate_limit}', 'retry_after': round(retry_after, 3)}
+            ) from None
+
+    def check(self: Self, jsonrpc_site: JSONRPCSite, req_json: dict[str, t.Any]) -> None:
+        """Check the rate limits of a JSON-RPC request object, it is registered as a before dispatch function.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the request.
+            req_json (dict[str, typing.Any]): The JSON-RPC request object.
+
+        Raises:
+            flask_jsonrpc.exceptions.RateLimitExceededError: If a rate limit is exceeded.
+        """
+        client_key = self.key_func()
+        if self.rate_limit is not None:
+            self._consume(f'{RATE_LIMIT_SITE_KEY}:{client_key}', self.rate_limit)
+        method_name = req_json['method']
+        view_func = jsonrpc_site.view_funcs.get(method_name) if isinstance(method_name, str) else None
+        method_rate_limit = getattr(view_func, 'jsonrpc_options', {}).get('rate_limit')
+        if method_rate_limit is not None:
+            self._consume(f'{method_name}:{client_key}', method_rate_limit)
@@ -0,0 +1,304 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import sys
+import time
+import typing as t
+import itertools
+import threading
+import traceback
+import collections
+import contextvars
+from dataclasses import field, dataclass
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask_jsonrpc.helpers import json_size
+from flask_jsonrpc.signals import call_started, call_finished, request_started
+from flask_jsonrpc.timings import get_timings, start_timings
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+
+
+@dataclass
+class ActiveCall:
+    """A JSON-RPC call being handled by a worker thread.
+
+    Args:
+        method (str | None): The method name, None if the request object is invalid.
+        started_at (float): The :func:`time.perf_counter` value when the call started.
+        threshold (float): The slow call threshold of the method, in seconds.
+        timings (dict[str, float]): The phase timings of the request when the call started.
+        stack_samples (list[str]): The stacks of the worker thread sampled while the call was running.
+        thread_id (int): The identifier of the thread that started the call. Defaults to the current thread.
+    """
+
+    method: str | None
+    started_at: float
+    threshold: float
+    timings: dict[str, float] = field(default_factory=dict)
+    stack_samples: list[str] = field(default_factory=list)
+    thread_id: int = field(default_factory=threading.get_ident)
+
+
+class SlowCallLog:
+    """Flask-JSONRPC slow call log contrib extension.
+
+    Logs a warning, with a structured record in the ``jsonrpc_slow_call`` attribute of
+    the log record, for each JSON-RPC call that takes longer than the threshold. The
+    record has the method, request id, duration, params size and phase timings of the
+    call (see :mod:`flask_jsonrpc.timings`).
+
+    With a ``sample_interval``, a background thread samples the stack of the worker
+    threads running calls that already exceeded their threshold, using
+    :func:`sys._current_frames`, and the samples are added to the record. Sampling is
+    disabled by default.
+
+    The threshold can be overridden per method with the ``slow_call_threshold`` option.
+
+    Args:
+        app (flask.Flask | None): The Flask application instance. Defaults to None.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC | None): The JSON-RPC application instance. Defaults to None.
+        threshold (float): Duration from which a call is slow, in seconds. Defaults to 1.0.
+        sample_interval (float | None): Interval between stack samples, in seconds. Defaults to None (disabled).
+        max_stack_samples (int): Maximum number of stack samples per call. Defaults to 10.
+        max_records (int): Number of recent slow call records kept in memory. Defaults to 100.
+
+    Attributes:
+        threshold (float): Duration from which a call is slow, in seconds.
+        sample_interval (float | None): Interval between stack samples, in seconds.
+        max_stack_samples (int): Maximum number of stack samples per call.
+        records (collections.deque[dict[str, typing.Any]]): The most recent slow call records.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.contrib.slowlog import SlowCallLog
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>> slowlog = SlowCallLog(app, jsonrpc, threshold=0.5)
+        >>>
+        >>> # Disable automatic validation for typechecking limitations with doctests
+        >>> # We always recommend to use validation in real applications
+        >>> @jsonrpc.method('app.report', slow_call_threshold=5.0, validate=False)
+        ... def report() -> str:
+        ...     return 'OK'
+    """
+
+    def __init__(
+        self: Self,
+        app: Flask | None = None,
+        jsonrpc_app: JSONRPC | None = None,
+        *,
+        threshold: float = 1.0,
+        sample_interval: float | None = None,
+        max_stack_samples: int = 10,
+        max_records: int = 100,
+    ) -> None:
+        self.threshold = threshold
+        self.sample_interval = sample_interval
+        self.max_stack_samples = max_stack_samples
+        self.records: collections.deque[dict[str, t.Any]] = collections.deque(maxlen=max_records)
+        self._active_calls: dict[int, ActiveCall] = {}
+        # The calls are tracked by context, as the calls of an ASGI application share the event loop thread
+        self._current_call: contextvars.ContextVar[int | None] = contextvars.ContextVar(
+            'jsonrpc_slowlog_call', default=None
+        )
+        self._call_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._sampler: threading.Thread | None = None
+        self._stopped = threading.Event()
+        if app and jsonrpc_app:
+            self.init_app(app, jsonrpc_app)
+
+    def init_app(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        """Initialize the slow call log with the Flask and JSON-RPC application instances.
+
+        Logs the calls of the JSON-RPC site and of the sites of the registered blueprints.
+        The extension is kept in ``app.extensions['jsonrpc_slowlog']``.
+
+        Args:
+            app (flask.Flask): The Flask application instance.
+            jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+        """
+        jsonrpc_sites = [jsonrpc_app.get_jsonrpc_site()] + [
+            japp.get_jsonrpc_site() for japp in jsonrpc_app.jsonrpc_apps
+        ]
+        app.extensions['jsonrpc_slowlog'] = self
+        for jsonrpc_site in jsonrpc_sites:
+            request_started.connect(self.start_request, sender=jsonrpc_site)
+            call_started.connect(self.start_call, sender=jsonrpc_site)
+            call_finished.connect(self.end_call, sender=jsonrpc_site)
+
+    def get_threshold(self: Self, jsonrpc_site: JSONRPCSite, method_name: str | None) -> float:
+        """Get the slow call threshold of a method.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+            method_name (str | None): The method name.
+
+        Returns:
+            float: The ``slow_call_threshold`` option of the method, otherwise the threshold of the extension.
+        """
+        view_func = jsonrpc_site.view_funcs.get(method_name) if method_name is not None else None
+        threshold: float = getattr(view_func, 'jsonrpc_options', {}).get('slow_call_threshold', self.threshold)
+        return threshold
+
+    def start_request(self: Self, jsonrpc_site: JSONRPCSite, **kwargs: t.Any) -> None:  # noqa: ANN401
+        """Record the phase timings of the request, it is connected to the
+        :data:`~flask_jsonrpc.signals.request_started` signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the request.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        if get_timings() is None:
+            start_timings()
+
+    def start_call(self: Self, jsonrpc_site: JSONRPCSite, *, req_json: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        """Track a JSON-RPC call, it is connected to the :data:`~flask_jsonrpc.signals.call_started` signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the call.
+            req_json (typing.Any): The JSON-RPC request object.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        method_name = req_json.get('method') if isinstance(req_json, dict) else None
+        if not isinstance(method_name, str):
+            method_name = None
+        active_call = ActiveCall(
+            method=method_name,
+            started_at=time.perf_counter(),
+            threshold=self.get_threshold(jsonrpc_site, method_name),
+            timings=dict(get_timings() or {}),
+        )
+        call_id = next(self._call_ids)
+        with self._lock:
+            self._active_calls[call_id] = active_call
+        self._current_call.set(call_id)
+        if self.sample_interval is not None and (self._sampler is None or not self._sampler.is_alive()):
+            self.start_sampler()
+
+    def end_call(
+        self: Self,
+        jsonrpc_site: JSONRPCSite,
+        *,
+        req_json: t.Any,  # noqa: ANN401
+        response: t.Any,  # noqa: ANN401
+        duration: float,
+        **kwargs: t.Any,  # noqa: ANN401
+    ) -> None:
+        """Log the JSON-RPC call if it is slow, it is connected to the :data:`~flask_jsonrpc.signals.call_finished`
+        signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the call.
+            req_json (typing.Any): The JSON-RPC request object.
+            response (typing.Any): The JSON-RPC response object, None for notifications.
+            duration (float): The call duration, in seconds.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        call_id = self._current_call.get()
+        if call_id is None:
+            return
+        self._current_call.set(None)
+        with self._lock:
+            active_call = self._active_calls.pop(call_id, None)
+        if active_call is None or duration < active_call.threshold:
+            return
+
+        timings = get_timings() or {}
+        error = response.get('error') if isinstance(response, dict) else None
+        params = req_json.get('params') if isinstance(req_json, dict) else None
+        record = {
+            'method': active_call.method,
+            'id': req_json.get('id') if isinstance(req_json, dict) else None,
+            'duration': duration,
+            'threshold': active_call.threshold,
+            'params_size': json_size(params) if params is not None else 0,
+            'error_code': error.get('code') if isinstance(error, dict) else None,
+            'timings': {
+                phase: value - active_call.timings.get(phase, 0.0)
+                for phase, value in timings.items()
+                if value > active_call.timings.get(phase, 0.0)
+            },
+            'stack_samples': active_call.stack_samples,
+        }
+        self.records.append(record)
+        jsonrpc_site.logger.warning(
+            'slow call: %s took %.3fs (threshold %.3fs)',
+            active_call.method,
+            duration,
+            active_call.threshold,
+            extra={'jsonrpc_slow_call': record},
+        )
+
+    def sample(self: Self) -> None:
+        """Sample the stack of the worker threads running calls that exceeded their threshold."""
+        now = time.perf_counter()
+        with self._lock:
+            active_calls = [
+                active_call
+                for active_call in self._active_calls.values()
+                if now - active_call.started_at >= active_call.threshold
+                and len(active_call.stack_samples) < self.max_stack_samples
+            ]
+        if not active_calls:
+            return
+        frames = sys._current_frames()
+        for active_call in active_calls:
+            frame = frames.get(active_call.thread_id)
+            if frame is not None:
+                active_call.stack_samples.append(''.join(traceback.format_stack(frame)))
+
+    def start_sampler(self: Self) -> None:
+        """Start the background thread that samples the stacks, it is started by the first call."""
+        with self._lock:
+            if self._sampler is not None and self._sampler.is_alive():
+                return
+            self._stopped.clear()
+            self._sampler = threading.Thread(target=self._run_sampler, name='jsonrpc-slowlog-sampler', daemon=True)
+            self._sampler.start()
+
+    def stop_sampler(self: Self) -> None:
+        """Stop the background thread that samples the stacks."""
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _run_sampler(self: Self) -> None:
+        """Sample the stacks until the sampler is stopped."""
+        while not self._stopped.wait(self.sample_interval):
+            self.sample()
@@ -0,0 +1,446 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import time
+import typing as t
+import contextvars
+from dataclasses import field, dataclass
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask import g, request
+
+from flask_jsonrpc.helpers import json_size
+from flask_jsonrpc.signals import call_started, call_finished, request_started
+
+try:
+    from opentelemetry import trace, context as otel_context
+    from opentelemetry.trace import Status, SpanKind, StatusCode
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+
+AttributeValue = str | bool | int | float
+
+TRACING_REQUEST_SPAN_NAME: str = 'jsonrpc.request'
+TRACING_CALL_SPAN_NAME: str = 'jsonrpc.call'
+
+
+class Span(t.Protocol):  # pragma: no cover
+    """A tracing span, opened by :meth:`Tracer.start_span`."""
+
+    def set_attribute(self: Self, key: str, value: AttributeValue) -> None:
+        """Set an attribute of the span.
+
+        Args:
+            key (str): The attribute name.
+            value (str | bool | int | float): The attribute value.
+        """
+        ...
+
+    def set_error(self: Self, description: str | None) -> None:
+        """Mark the span as failed.
+
+        Args:
+            description (str | None): The error description.
+        """
+        ...
+
+    def record_exception(self: Self, exc: BaseException) -> None:
+        """Record an exception and mark the span as failed.
+
+        Args:
+            exc (BaseException): The exception.
+        """
+        ...
+
+    def end(self: Self) -> None:
+        """End the span."""
+        ...
+
+
+class Tracer(t.Protocol):  # pragma: no cover
+    """A tracing backend."""
+
+    def start_span(
+        self: Self, name: str, parent: Span | None = None, attributes: dict[str, AttributeValue] | None = None
+    ) -> Span:
+        """Open a span, it is the current span until it ends.
+
+        Args:
+            name (str): The span name.
+            parent (Span | None): The parent span, None for the span of the HTTP request.
+            attributes (dict[str, str | bool | int | float] | None): The initial attributes.
+
+        Returns:
+            Span: The span.
+        """
+        ...
+
+
+class NoopSpan:
+    """A span that records nothing."""
+
+    def set_attribute(self: Self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def set_error(self: Self, description: str | None) -> None:
+        pass
+
+    def record_exception(self: Self, exc: BaseException) -> None:
+        pass
+
+    def end(self: Self) -> None:
+        pass
+
+
+class NoopTracer:
+    """A tracer that records nothing, used when the OpenTelemetry API is not installed.
+
+    Examples:
+        >>> tracer = NoopTracer()
+        >>> span = tracer.start_span('jsonrpc.request')
+        >>> span.set_attribute('rpc.system', 'jsonrpc')
+        >>> span.end()
+    """
+
+    def start_span(
+        self: Self, name: str, parent: Span | None = None, attributes: dict[str, AttributeValue] | None = None
+    ) -> NoopSpan:
+        return NoopSpan()
+
+
+@dataclass
+class InMemorySpan:
+    """A span recorded in memory by :class:`InMemoryTracer`.
+
+    Args:
+        name (str): The span name.
+        tracer (InMemoryTracer): The tracer that opened the span.
+        parent (InMemorySpan | None): The parent span.
+        attributes (dict[str, str | bool | int | float]): The span attributes.
+        start_time (float): The :func:`time.perf_counter` value when the span started.
+        end_time (float | None): The :func:`time.perf_counter` value when the span ended.
+        error (str | None): The error description, if the span failed.
+        exceptions (list[BaseException]): The recorded exceptions.
+    """
+
+    name: str
+    tracer: InMemoryTracer
+    parent: InMemorySpan | None = None
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.perf_counter)
+    end_time: float | None = None
+    error: str | None = None
+    exceptions: list[BaseException] = field(default_factory=list)
+
+    def set_attribute(self: Self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def set_error(self: Self, description: str | None) -> None:
+        self.error = description or ''
+
+    def record_exception(self: Self, exc: BaseException) -> None:
+        self.exceptions.append(exc)
+        self.set_error(str(exc))
+
+    def end(self: Self) -> None:
+        self.end_time = time.perf_counter()
+        self.tracer.finished_spans.append(self)
+
+
+class InMemoryTracer:
+    """A tracer that keeps the finished spans in memory, intended for tests.
+
+    Attributes:
+        finished_spans (list[InMemorySpan]): The finished spans, in the order they ended.
+
+    Examples:
+        >>> tracer = InMemoryTracer()
+        >>> parent = tracer.start_span('parent')
+        >>> child = tracer.start_span('child', parent, {'key': 'value'})
+        >>> child.end()
+        >>> parent.end()
+        >>> [
+        ...     (span.name, span.parent and span.parent.name)
+        ...     for span in tracer.get_finished_spans()
+        ... ]
+        [('child', 'parent'), ('parent', None)]
+        >>> tracer.clear()
+        >>> tracer.get_finished_spans()
+        []
+    """
+
+    def __init__(self: Self) -> None:
+        self.finished_spans: list[InMemorySpan] = []
+
+    def start_span(
+        self: Self, name: str, parent: Span | None = None, attributes: dict[str, AttributeValue] | None = None
+    ) -> InMemorySpan:
+        return InMemorySpan(
+            name=name,
+            tracer=self,
+            parent=parent if isinstance(parent, InMemorySpan) else None,
+            attributes=dict(attributes or {}),
+        )
+
+    def get_finished_spans(self: Self) -> list[InMemorySpan]:
+        """Get the finished spans.
+
+        Returns:
+            list[InMemorySpan]: The finished spans, in the order they ended.
+        """
+        return list(self.finished_spans)
+
+    def clear(self: Self) -> None:
+        """Forget the finished spans."""
+        self.finished_spans.clear()
+
+
+class OpenTelemetrySpan:
+    """An OpenTelemetry span, attached to the current context until it ends.
+
+    Args:
+        span (opentelemetry.trace.Span): The OpenTelemetry span.
+        token (object): The token to detach the span from the current context.
+    """
+
+    def __init__(self: Self, span: trace.Span, token: object) -> None:
+        self.span = span
+        self.token = token
+
+    def set_attribute(self: Self, key: str, value: AttributeValue) -> None:
+        self.span.set_attribute(key, value)
+
+    def set_error(self: Self, description: str | None) -> None:
+        self.span.set_status(Status(StatusCode.ERROR, description))
+
+    def record_exception(self: Self, exc: BaseException) -> None:
+        self.span.record_exception(exc)
+        self.set_error(str(exc))
+
+    def end(self: Self) -> None:
+        otel_context.detach(self.token)  # type: ignore[arg-type]
+        self.span.end()
+
+
+class OpenTelemetryTracer:
+    """A tracer on top of the OpenTelemetry API.
+
+    The span of the HTTP request is a ``SERVER`` span, child of the current span
+    if any (e.g. opened by the Flask instrumentation), and the spans of the JSON-RPC
+    calls are its children. Spans opened by the view functions are children of the
+    span of their JSON-RPC call.
+
+    Args:
+        tracer_provider (opentelemetry.trace.TracerProvider | None): The tracer provider.
+            Defaults to the global tracer provider.
+
+    Raises:
+        RuntimeError: If the OpenTelemetry API is not installed.
+    """
+
+    def __init__(self: Self, tracer_provider: trace.TracerProvider | None = None) -> None:
+        if trace is None:  # pragma: no cover
+            raise RuntimeError('the OpenTelemetry API is not installed, see opentelemetry-api') from None
+        self.tracer = trace.get_tracer('flask_jsonrpc', tracer_provider=tracer_provider)
+
+    def start_span(
+        self: Self, name: str, parent: Span | None = None, attributes: dict[str, AttributeValue] | None = None
+    ) -> OpenTelemetrySpan:
+        ctx = trace.set_span_in_context(parent.span) if isinstance(parent, OpenTelemetrySpan) else None
+        kind = SpanKind.SERVER if parent is None else SpanKind.INTERNAL
+        span = self.tracer.start_span(name, context=ctx, kind=kind, attributes=attributes)
+        token = otel_context.attach(trace.set_span_in_context(span))
+        return OpenTelemetrySpan(span, token)
+
+
+class JSONRPCTracing:
+    """Flask-JSONRPC tracing contrib extension.
+
+    Opens a span for each HTTP request handled by the JSON-RPC sites and a child
+    span for each JSON-RPC call, i.e. each element of a batch request, with the
+    method name, request id, params size and error code as attributes.
+
+    By default the spans are sent to the OpenTelemetry API, if it is installed,
+    otherwise to a :class:`NoopTracer` and the extension does nothing.
+
+    Args:
+        app (flask.Flask | None): The Flask application instance. Defaults to None.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC | None): The JSON-RPC application instance. Defaults to None.
+        tracer (Tracer | None): The tracing backend. Defaults to :class:`OpenTelemetryTracer` if the
+            OpenTelemetry API is installed, otherwise to :class:`NoopTracer`.
+
+    Attributes:
+        tracer (Tracer): The tracing backend.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.contrib.tracing import JSONRPCTracing, InMemoryTracer
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>> tracing = JSONRPCTracing(app, jsonrpc, tracer=InMemoryTracer())
+    """
+
+    def __init__(
+        self: Self, app: Flask | None = None, jsonrpc_app: JSONRPC | None = None, *, tracer: Tracer | None = None
+    ) -> None:
+        if tracer is None:
+            tracer = OpenTelemetryTracer() if trace is not None else NoopTracer()
+        self.tracer: Tracer = tracer
+        # The call spans are tracked by context, as the calls of an ASGI batch run concurrently in one request
+        self._call_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+            'jsonrpc_trace_call_span', default=None
+        )
+        if app and jsonrpc_app:
+            self.init_app(app, jsonrpc_app)
+
+    def init_app(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        """Initialize the tracing with the Flask and JSON-RPC application instances.
+
+        Traces the JSON-RPC site and the sites of the registered blueprints, unless
+        the tracer is a :class:`NoopTracer`.
+
+        Args:
+            app (flask.Flask): The Flask application instance.
+            jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+        """
+        if isinstance(self.tracer, NoopTracer):
+            return
+        jsonrpc_sites = [jsonrpc_app.get_jsonrpc_site()] + [
+            japp.get_jsonrpc_site() for japp in jsonrpc_app.jsonrpc_apps
+        ]
+        for jsonrpc_site in jsonrpc_sites:
+            request_started.connect(self.start_request, sender=jsonrpc_site)
+            call_started.connect(self.start_call, sender=jsonrpc_site)
+            call_finished.connect(self.end_call, sender=jsonrpc_site)
+            jsonrpc_site.register_before_request(self.annotate_request)
+            jsonrpc_site.register_teardown_request(self.end_request)
+
+    def start_request(self: Self, jsonrpc_site: JSONRPCSite, **kwargs: t.Any) -> None:  # noqa: ANN401
+        """Open the span of the HTTP request, it is connected to the
+        :data:`~flask_jsonrpc.signals.request_started` signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the request.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        g._jsonrpc_trace_request_span = self.tracer.start_span(
+            TRACING_REQUEST_SPAN_NAME,
+            attributes={
+                'rpc.system': 'jsonrpc',
+                'url.path': request.path,
+                'http.request.body.size': request.content_length or 0,
+            },
+        )
+
+    def annotate_request(self: Self, req_json: t.Any) -> None:  # noqa: ANN401
+        """Add the batch size to the span of the HTTP request, it is registered as a before request function.
+
+        Args:
+            req_json (typing.Any): The decoded JSON-RPC request data.
+        """
+        span: Span | None = g.get('_jsonrpc_trace_request_span')
+        if span is not None and isinstance(req_json, list):
+            span.set_attribute('rpc.jsonrpc.batch_size', len(req_json))
+
+    def end_request(self: Self, exc: BaseException | None) -> None:
+        """End the span of the HTTP request, it is registered as a teardown request function.
+
+        Args:
+            exc (BaseException | None): The exception raised while dispatching the request, if any.
+        """
+        call_span = self._call_span.get()
+        if call_span is not None:
+            self._call_span.set(None)
+            call_span.end()
+        span: Span | None = g.pop('_jsonrpc_trace_request_span', None)
+        if span is None:
+            return
+        if exc is not None:
+            span.record_exception(exc)
+        span.end()
+
+    def start_call(self: Self, jsonrpc_site: JSONRPCSite, *, req_json: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        """Open the span of a JSON-RPC call, it is connected to the :data:`~flask_jsonrpc.signals.call_started`
+        signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site handling the call.
+            req_json (typing.Any): The JSON-RPC request object.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        attributes: dict[str, AttributeValue] = {'rpc.system': 'jsonrpc'}
+        name = TRACING_CALL_SPAN_NAME
+        if isinstance(req_json, dict):
+            method_name = req_json.get('method')
+            if isinstance(method_name, str):
+                name = method_name
+                attributes['rpc.method'] = method_name
+            if req_json.get('id') is not None:
+                attributes['rpc.jsonrpc.request_id'] = str(req_json['id'])
+            if isinstance(req_json.get('jsonrpc'), str):
+                attributes['rpc.jsonrpc.version'] = req_json['jsonrpc']
+            if 'params' in req_json:
+                attributes['rpc.jsonrpc.params.size'] = json_size(req_json['params'])
+        parent: Span | None = g.get('_jsonrpc_trace_request_span')
+        self._call_span.set(self.tracer.start_span(name, parent, attributes))
+
+    def end_call(
+        self: Self,
+        jsonrpc_site: JSONRPCSite,
+        *,
+        response: t.Any,  # noqa: ANN401
+        **kwargs: t.Any,  # noqa: ANN401
+    ) -> None:
+        """End the span of a JSON-RPC call, it is connected to the :data:`~flask_jsonrpc.signals.call_finished`
+        signal.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the call.
+            response (typing.Any): The JSON-RPC response object, None for notifications.
+            **kwargs (typing.Any): Other signal arguments.
+        """
+        span = self._call_span.get()
+        if span is None:
+            return
+        self._call_span.set(None)
+        error = response.get('error') if isinstance(response, dict) else None
+        if isinstance(error, dict):
+            span.set_attribute('rpc.jsonrpc.error_code', error.get('code', 0))
+            span.set_attribute('rpc.jsonrpc.error_message', str(error.get('message')))
+            span.set_error(error.get('message'))
+        span.end()
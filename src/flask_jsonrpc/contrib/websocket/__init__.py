@@ -0,0 +1,302 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import typing as t
+import threading
+import contextlib
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask import Response, request, current_app, copy_current_request_context
+
+from flask_jsonrpc.site import JSONRPC_VERSION_DEFAULT
+from flask_jsonrpc.helpers import urn
+from flask_jsonrpc.encoders import dumps
+from flask_jsonrpc.exceptions import ServerError, JSONRPCError
+
+try:
+    import simple_websocket
+except ImportError:  # pragma: no cover
+    simple_websocket = None
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+
+_current_session: ContextVar[WebSocketSession | None] = ContextVar('jsonrpc_websocket_session', default=None)
+
+
+def current_session() -> WebSocketSession | None:
+    """Get the WebSocket session of the JSON-RPC call being handled.
+
+    Returns:
+        WebSocketSession | None: The session, None if the call was not received through a WebSocket.
+    """
+    return _current_session.get()
+
+
+class WebSocketSession:
+    """A JSON-RPC session over a WebSocket connection.
+
+    Each message is a JSON-RPC request object or batch, dispatched in a thread pool, so
+    that several requests can be in flight, and each response is sent as soon as it is
+    ready, the client matching them by id. When ``max_in_flight`` requests are being
+    handled, the next message is not read until one of them finishes, which pushes back
+    on the client through the TCP flow control.
+
+    The session is created in the context of the handshake request, whose JSON provider
+    encodes the messages.
+
+    Args:
+        ws (simple_websocket.Server): The WebSocket connection.
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handles the requests.
+        max_in_flight (int): Maximum number of requests handled at the same time. Defaults to 16.
+
+    Attributes:
+        ws (simple_websocket.Server): The WebSocket connection.
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handles the requests.
+        max_in_flight (int): Maximum number of requests handled at the same time.
+    """
+
+    def __init__(self: Self, ws: simple_websocket.Server, jsonrpc_site: JSONRPCSite, max_in_flight: int = 16) -> None:
+        self.ws = ws
+        self.jsonrpc_site = jsonrpc_site
+        self.max_in_flight = max_in_flight
+        self._json = current_app.json
+        self._send_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+
+    def send(self: Self, data: t.Any) -> None:  # noqa: ANN401
+        """Send a JSON-RPC message to the client.
+
+        Args:
+            data (typing.Any): The JSON-RPC message, or a pre-encoded JSON message.
+        """
+        message = bytes(data).decode('utf-8') if isinstance(data, bytes | bytearray) else dumps(data, self._json)
+        with self._send_lock:
+            self.ws.send(message)
+
+    def notify(self: Self, method: str, params: t.Any = None) -> None:  # noqa: ANN401
+        """Send a JSON-RPC notification to the client.
+
+        Args:
+            method (str): The method name.
+            params (typing.Any): The params of the notification. Defaults to None (no params).
+        """
+        notification: dict[str, t.Any] = {'jsonrpc': JSONRPC_VERSION_DEFAULT, 'method': method}
+        if params is not None:
+            notification['params'] = params
+        self.send(notification)
+
+    def handle_message(self: Self, message: str | bytes) -> None:
+        """Dispatch a message and send its response, it runs in the thread pool of the session.
+
+        An unexpected error, e.g. raised by a before request function, is logged and sent
+        back as a JSON-RPC server error response, with the id of the request if the
+        message is a request object.
+
+        Args:
+            message (str | bytes): The message.
+        """
+        token = _current_session.set(self)
+        data = message.encode('utf-8') if isinstance(message, str) else message
+        try:
+            response = self.jsonrpc_site.dispatch_message(data)
+            if response is not None:
+                self.send(response)
+        except simple_websocket.ConnectionClosed:
+            pass
+        except Exception as e:
+            self.jsonrpc_site.logger.exception('unexpected error on the websocket message')
+            error = ServerError(data={'message': str(e)}, original_exception=e)
+            response = {'id': self._request_id(data), 'jsonrpc': JSONRPC_VERSION_DEFAULT, 'error': error.jsonrpc_format}
+            with contextlib.suppress(simple_websocket.ConnectionClosed):
+                self.send(response)
+        finally:
+            _current_session.reset(token)
+            self._in_flight.release()
+
+    def _request_id(self: Self, data: bytes) -> t.Any:  # noqa: ANN401
+        try:
+            json_data = self.jsonrpc_site.to_json(data)
+        except JSONRPCError:
+            return None
+        return json_data.get('id') if isinstance(json_data, dict) else None
+
+    def serve(self: Self) -> None:
+        """Receive and dispatch the messages until the connection is closed.
+
+        Each message is handled as a request of its own, see
+        :meth:`~flask_jsonrpc.site.JSONRPCSite.dispatch_message`.
+        """
+        with ThreadPoolExecutor(self.max_in_flight, thread_name_prefix='jsonrpc-websocket') as executor:
+            while True:
+                self._in_flight.acquire()
+                try:
+                    message = self.ws.receive()
+                except simple_websocket.ConnectionClosed:
+                    self._in_flight.release()
+                    break
+                executor.submit(copy_current_request_context(self.handle_message), message)
+
+
+class WebSocketResponse(Response):
+    """The response of a WebSocket view, once the connection is closed.
+
+    The WebSocket connection took over the socket, so no HTTP response must be written:
+    the WSGI server is told to drop the connection instead.
+
+    Args:
+        ws (simple_websocket.Server): The closed WebSocket connection.
+    """
+
+    def __init__(self: Self, ws: simple_websocket.Server) -> None:
+        super().__init__()
+        self.ws = ws
+
+    def __call__(self: Self, *args: t.Any, **kwargs: t.Any) -> t.Iterable[bytes]:  # noqa: ANN401
+        if self.ws.mode == 'werkzeug':
+            raise ConnectionError()
+        if self.ws.mode == 'gunicorn':  # pragma: no cover
+            raise StopIteration()
+        return []  # pragma: no cover
+
+
+class JSONRPCWebSocket:
+    """Flask-JSONRPC WebSocket transport contrib extension, it requires the
+    ``simple-websocket`` package.
+
+    Serves the methods of a JSON-RPC site over persistent WebSocket connections (see
+    :class:`WebSocketSession`), on the WSGI servers supported by ``simple-websocket``:
+    the Werkzeug development server, gunicorn with threads, eventlet and gevent. The
+    server can send notifications to the clients, to the client of the call being
+    handled with :func:`current_session`, or to all of them with :meth:`broadcast`.
+
+    Args:
+        app (flask.Flask | None): The Flask application instance. Defaults to None.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC | None): The JSON-RPC application instance. Defaults to None.
+        path (str | None): The URL path of the WebSocket endpoint. Defaults to the path of the
+            JSON-RPC application with the ``/ws`` suffix.
+        max_in_flight (int): Maximum number of requests handled at the same time per connection. Defaults to 16.
+        ping_interval (float | None): Interval between the keepalive pings, in seconds. Defaults to 25.0.
+        max_message_size (int | None): Maximum size of a message, in bytes. Defaults to None (unlimited).
+
+    Attributes:
+        path (str | None): The URL path of the WebSocket endpoint.
+        max_in_flight (int): Maximum number of requests handled at the same time per connection.
+        ping_interval (float | None): Interval between the keepalive pings, in seconds.
+        max_message_size (int | None): Maximum size of a message, in bytes.
+        sessions (set[WebSocketSession]): The open sessions.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.contrib.websocket import JSONRPCWebSocket
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>> websocket = JSONRPCWebSocket(app, jsonrpc, max_in_flight=4)
+        >>> websocket.path
+        '/api/ws'
+    """
+
+    def __init__(
+        self: Self,
+        app: Flask | None = None,
+        jsonrpc_app: JSONRPC | None = None,
+        *,
+        path: str | None = None,
+        max_in_flight: int = 16,
+        ping_interval: float | None = 25.0,
+        max_message_size: int | None = None,
+    ) -> None:
+        if simple_websocket is None:  # pragma: no cover
+            raise RuntimeError('the websocket transport requires the simple-websocket package')
+        self.path = path
+        self.max_in_flight = max_in_flight
+        self.ping_interval = ping_interval
+        self.max_message_size = max_message_size
+        self.sessions: set[WebSocketSession] = set()
+        self._lock = threading.Lock()
+        if app and jsonrpc_app:
+            self.init_app(app, jsonrpc_app)
+
+    def init_app(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        """Register the WebSocket endpoint of the JSON-RPC application.
+
+        The extension is kept in ``app.extensions['jsonrpc_websocket']``.
+
+        Args:
+            app (flask.Flask): The Flask application instance.
+            jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+        """
+        if self.path is None:
+            self.path = f'{(jsonrpc_app.path or "").rstrip("/")}/ws'
+        self.jsonrpc_site = jsonrpc_app.get_jsonrpc_site()
+        app.extensions['jsonrpc_websocket'] = self
+        app.add_url_rule(self.path, urn('websocket', app.name, self.path), view_func=self.vf_websocket, websocket=True)
+
+    def broadcast(self: Self, method: str, params: t.Any = None) -> None:  # noqa: ANN401
+        """Send a JSON-RPC notification to the clients of all the open sessions.
+
+        Args:
+            method (str): The method name.
+            params (typing.Any): The params of the notification. Defaults to None (no params).
+        """
+        with self._lock:
+            sessions = list(self.sessions)
+        for session in sessions:
+            try:
+                session.notify(method, params)
+            except simple_websocket.ConnectionClosed:
+                continue
+
+    def vf_websocket(self: Self) -> Response:
+        """Accept a WebSocket connection and serve it until it is closed, the requests that are
+        not a WebSocket handshake get a 400 response from the URL rule.
+
+        Returns:
+            flask.Response: The response, none is sent once the connection was upgraded.
+        """
+        ws = simple_websocket.Server.accept(
+            request.environ, ping_interval=self.ping_interval, max_message_size=self.max_message_size
+        )
+        session = WebSocketSession(ws, self.jsonrpc_site, max_in_flight=self.max_in_flight)
+        with self._lock:
+            self.sessions.add(session)
+        try:
+            session.serve()
+        finally:
+            with self._lock:
+                self.sessions.discard(session)
+        return WebSocketResponse(ws)
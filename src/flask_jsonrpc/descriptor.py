@@ -35,14 +35,12 @@ from typing_extensions import Self
 
 from flask_jsonrpc import typing as fjt
 from flask_jsonrpc.conf import settings
+from flask_jsonrpc.site import JSONRPC_DESCRIBE_METHOD_NAME, JSONRPCSite
 from flask_jsonrpc.types import params as types_params, methods as types_methods
 from flask_jsonrpc.helpers import from_python_type
+from flask_jsonrpc.encoders import RawJSON
 from flask_jsonrpc.types.types import Object, propertify
 
-if t.TYPE_CHECKING:
-    from flask_jsonrpc.site import JSONRPCSite
-
-JSONRPC_DESCRIBE_METHOD_NAME: str = 'rpc.describe'
 JSONRPC_DESCRIBE_SERVICE_METHOD_TYPE: str = 'method'
 
 
@@ -179,6 +177,9 @@ class JSONRPCServiceDescriptor:
         """
         annotations = getattr(obj, '__metadata__', ())
         obj_type = getattr(obj, '__origin__', obj) if t.get_origin(obj) is t.Annotated else obj
+        if obj_type is RawJSON:
+            # A pre-encoded JSON value can be any JSON value
+            obj_type = t.Any
         field_type = self._python_type_name(obj_type)
         field = fjt.Field(name=name, type=field_type)
         if (
@@ -326,8 +327,6 @@ class JSONRPCServiceDescriptor:
         Returns:
             flask_jsonrpc.typing.ServiceDescribe: Service description.
         """
-        from flask_jsonrpc.site import JSONRPCSite
-
         serv_desc = fjt.ServiceDescribe(
             id=f'urn:uuid:{self.jsonrpc_site.uuid}',
             version=self.jsonrpc_site.version,
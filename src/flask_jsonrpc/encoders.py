@@ -26,20 +26,109 @@
 # POSSIBILITY OF SUCH DAMAGE.
 from __future__ import annotations
 
+import re
 from enum import Enum
-from types import GeneratorType
+import json
+from types import GeneratorType, AsyncGeneratorType
 import typing as t
+import asyncio
 import inspect
 from pathlib import PurePath
+import secrets
 from collections import deque
 import dataclasses
 
-from typing_extensions import Buffer
+# Added in version 3.11.
+from typing_extensions import Self, Buffer
 
-from flask import typing as ft, jsonify as _jsonify
+from flask import typing as ft, current_app
 
 from pydantic.main import BaseModel
 
+if t.TYPE_CHECKING:
+    from flask import Flask
+    from flask.json.provider import JSONProvider
+
+
+class RawJSON:
+    """A pre-encoded JSON value, spliced verbatim into the JSON responses.
+
+    Methods whose result already exists as JSON text, such as a cached upstream response
+    or a stored document, can return it wrapped in a ``RawJSON``, instead of decoding it
+    to have it encoded again. The text is not checked, unless ``validate`` is True, so
+    an invalid fragment gives an invalid response. The binary codecs, such as MessagePack,
+    decode it.
+
+    Args:
+        data (str | bytes | bytearray): The JSON text, bytes are decoded as UTF-8.
+        validate (bool): Whether to check that the text is valid JSON. Defaults to False.
+
+    Attributes:
+        data (str): The JSON text.
+
+    Raises:
+        ValueError: If ``validate`` is True and the text is not valid JSON.
+
+    Examples:
+        >>> RawJSON(b'{"id": 1, "tags": ["a", "b"]}').loads()
+        {'id': 1, 'tags': ['a', 'b']}
+        >>> RawJSON('{"id": 1', validate=True)
+        Traceback (most recent call last):
+            ...
+        json.decoder.JSONDecodeError: Expecting ',' delimiter: line 1 column 9 (char 8)
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self: Self, data: str | bytes | bytearray, *, validate: bool = False) -> None:
+        if isinstance(data, bytes | bytearray):
+            data = data.decode('utf-8')
+        if validate:
+            json.loads(data)
+        self.data: str = data
+
+    def __repr__(self: Self) -> str:
+        return f'RawJSON({self.data!r})'
+
+    def loads(self: Self) -> t.Any:  # noqa: ANN401
+        """Decode the JSON text.
+
+        Returns:
+            typing.Any: The decoded value.
+        """
+        return json.loads(self.data)
+
+
+def iterate_async(aiterator: t.AsyncIterator[t.Any]) -> t.Iterator[t.Any]:
+    """Iterate an async iterator from synchronous code.
+
+    The items are awaited on an event loop of its own, kept until the iteration ends, as
+    an async generator is closed with the event loop that started it.
+
+    Args:
+        aiterator (typing.AsyncIterator[typing.Any]): The async iterator, e.g. an async generator.
+
+    Returns:
+        typing.Iterator[typing.Any]: The items of the async iterator.
+
+    Examples:
+        >>> async def numbers():
+        ...     for i in range(3):
+        ...         yield i
+        >>> list(iterate_async(numbers()))
+        [0, 1, 2]
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(aiterator.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
 
 def serializable(obj: t.Any) -> t.Any:  # noqa: ANN401, C901
     """Serialize an object to a JSON-serializable format.
@@ -107,6 +196,10 @@ def serializable(obj: t.Any) -> t.Any:  # noqa: ANN401, C901
         for item in obj:
             encoded_list.append(serializable(item))
         return encoded_list
+    if isinstance(obj, AsyncGeneratorType):
+        return serializable(iterate_async(obj))
+    if isinstance(obj, RawJSON):
+        return obj
     if dataclasses.is_dataclass(obj):
         obj_dict = dataclasses.asdict(obj)  # type: ignore
         return serializable(obj_dict)
@@ -117,8 +210,87 @@ def serializable(obj: t.Any) -> t.Any:  # noqa: ANN401, C901
     return obj
 
 
+def dumps(obj: t.Any, json_provider: JSONProvider | None = None, **kwargs: t.Any) -> str:  # noqa: ANN401
+    """Encode an object in JSON, splicing the :class:`RawJSON` values verbatim.
+
+    Each :class:`RawJSON` value is encoded as a random marker string by the ``default``
+    function of the JSON provider, and the markers are then replaced by the JSON texts in
+    a single pass over the encoded text, so the JSON provider must honor the ``default``
+    argument, as the Flask default one does.
+
+    Args:
+        obj (typing.Any): The object to encode.
+        json_provider (flask.json.provider.JSONProvider | None): The JSON provider. Defaults to
+            the JSON provider of the current application.
+        **kwargs (typing.Any): Arguments passed to the ``dumps`` method of the JSON provider.
+
+    Returns:
+        str: The JSON text.
+
+    Examples:
+        >>> from flask.json.provider import DefaultJSONProvider
+        >>> from flask import Flask
+        >>> json_provider = DefaultJSONProvider(Flask(__name__))
+        >>> dumps({'result': RawJSON(b'[1, 2]')}, json_provider)
+        '{"result": [1, 2]}'
+
+    See Also:
+        :func:`flask_jsonrpc.encoders.serializable`
+    """
+    if json_provider is None:
+        json_provider = current_app.json
+    provider_default = getattr(json_provider, 'default', None)
+    fragments: list[str] = []
+    marker = ''
+
+    def default(o: t.Any) -> t.Any:  # noqa: ANN401
+        nonlocal marker
+        if isinstance(o, RawJSON):
+            if not marker:
+                marker = f'rawjson:{secrets.token_hex(16)}:'
+            fragments.append(o.data)
+            return f'{marker}{len(fragments) - 1}'
+        if provider_default is None:
+            raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+        return provider_default(o)
+
+    rv = json_provider.dumps(serializable(obj), default=default, **kwargs)
+    if not fragments:
+        return rv
+    return re.sub(f'"{re.escape(marker)}(\\d+)"', lambda match: fragments[int(match.group(1))], rv)
+
+
+def dumps_response(obj: t.Any, app: Flask | None = None) -> str:  # noqa: ANN401
+    """Encode a response body in JSON, as :func:`flask.jsonify` does.
+
+    The body is indented in debug mode, or if the ``compact`` attribute of the JSON
+    provider is False, and compact otherwise, and it ends with a newline.
+
+    Args:
+        obj (typing.Any): The object to encode.
+        app (flask.Flask | None): The Flask application. Defaults to the current application.
+
+    Returns:
+        str: The JSON body.
+
+    Examples:
+        >>> from flask import Flask
+        >>> dumps_response({'result': [1, 2]}, Flask(__name__))
+        '{"result":[1,2]}\\n'
+    """
+    if app is None:
+        app = current_app
+    json_provider = app.json
+    compact = getattr(json_provider, 'compact', None)
+    if (compact is None and app.debug) or compact is False:
+        rv = dumps(obj, json_provider, indent=2)
+    else:
+        rv = dumps(obj, json_provider, separators=(',', ':'))
+    return f'{rv}\n'
+
+
 def jsonify(obj: t.Any) -> ft.ResponseValue:  # noqa: ANN401
-    """Convert an object to a JSON response.
+    """Convert an object to a JSON response, as :func:`flask.jsonify` does.
 
     Args:
         obj (typing.Any): The object to convert.
@@ -127,6 +299,8 @@ def jsonify(obj: t.Any) -> ft.ResponseValue:  # noqa: ANN401
         flask.typing.ResponseValue: The JSON response.
 
     See Also:
-        :func:`flask_jsonrpc.encoders.serializable`
+        :func:`flask_jsonrpc.encoders.dumps_response`
     """
-    return _jsonify(serializable(obj))
+    return current_app.response_class(
+        dumps_response(obj), mimetype=getattr(current_app.json, 'mimetype', 'application/json')
+    )
@@ -235,3 +235,37 @@ class ServerError(JSONRPCError):
         # unexpected errors.
         self.original_exception = original_exception
         super().__init__(message, code, data, status_code)
+
+
+class ServerOverloadedError(JSONRPCError):
+    """The server is overloaded and rejected the request before processing it.
+
+    Notes:
+        code: -32000 to -32099 Server error.
+    """
+
+    def __init__(
+        self: Self,
+        message: str | None = _('Server overloaded'),
+        code: int | None = -32001,
+        data: t.Any | None = None,  # noqa: ANN401
+        status_code: int | None = 503,
+    ) -> None:
+        super().__init__(message, code, data, status_code)
+
+
+class RateLimitExceededError(JSONRPCError):
+    """The client exceeded the rate limit of the method or of the site.
+
+    Notes:
+        code: -32000 to -32099 Server error.
+    """
+
+    def __init__(
+        self: Self,
+        message: str | None = _('Rate limit exceeded'),
+        code: int | None = -32002,
+        data: t.Any | None = None,  # noqa: ANN401
+        status_code: int | None = 429,
+    ) -> None:
+        super().__init__(message, code, data, status_code)
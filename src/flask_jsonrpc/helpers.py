@@ -26,6 +26,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 from __future__ import annotations
 
+import json
 import typing as t
 from operator import getitem
 import itertools
@@ -267,3 +268,25 @@ def get(obj: t.Any, path: str, default: t.Any = None) -> t.Any:  # noqa: ANN401
     except (TypeError, KeyError):
         return default
     return obj_val
+
+
+def json_size(obj: t.Any) -> int:  # noqa: ANN401
+    """Return the size of an object encoded in JSON, e.g. the params of a JSON-RPC request.
+
+    Args:
+        obj (typing.Any): The object.
+
+    Returns:
+        int: The number of characters of the JSON text, 0 if the object can not be encoded,
+            e.g. the bytes of a MessagePack request.
+
+    Examples:
+        >>> json_size([':)'])
+        6
+        >>> json_size([b'\\x00'])
+        0
+    """
+    try:
+        return len(json.dumps(obj))
+    except (TypeError, ValueError):
+        return 0
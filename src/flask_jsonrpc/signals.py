@@ -0,0 +1,58 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+from blinker import Namespace
+
+# This namespace is only for signals provided by Flask-JSONRPC itself.
+_signals = Namespace()
+
+request_started = _signals.signal('jsonrpc-request-started')
+"""blinker.NamedSignal: Sent by the JSON-RPC site when it starts dispatching a request, before the
+request data is decoded."""
+
+call_started = _signals.signal('jsonrpc-call-started')
+"""blinker.NamedSignal: Sent by the JSON-RPC site before each JSON-RPC request object (each element
+of a batch) is handled, with the keyword argument ``req_json``."""
+
+call_finished = _signals.signal('jsonrpc-call-finished')
+"""blinker.NamedSignal: Sent by the JSON-RPC site after each JSON-RPC request object (each element of a batch)
+is handled, with the keyword arguments ``req_json``, ``response``, ``status_code`` and ``duration`` (seconds)."""
+
+request_timed = _signals.signal('jsonrpc-request-timed')
+"""blinker.NamedSignal: Sent by the JSON-RPC view after the response is encoded, with the keyword argument
+``timings``, the duration in seconds of each phase of the request (see :mod:`flask_jsonrpc.timings`).
+The phase timings are only recorded while the signal has receivers or the Server-Timing header is enabled."""
+
+request_finished = _signals.signal('jsonrpc-request-finished')
+"""blinker.NamedSignal: Sent by the JSON-RPC view after the response is made, with the keyword arguments
+``response``, the :class:`flask.Response`, and ``duration``, the duration of the request in seconds."""
+
+cache_checked = _signals.signal('jsonrpc-cache-checked')
+"""blinker.NamedSignal: Sent by the JSON-RPC view after a GET request of a cacheable or idempotent method
+is answered, with the keyword arguments ``method_name`` and ``hit``, True when the response is a
+``304 Not Modified`` to a conditional request."""
@@ -26,15 +26,18 @@
 # POSSIBILITY OF SUCH DAMAGE.
 from __future__ import annotations
 
+import time
 from uuid import UUID, uuid4
+from types import GeneratorType, AsyncGeneratorType
 import typing as t
 import logging
+import functools
 from collections import OrderedDict
 
 # Added in version 3.11.
 from typing_extensions import Self
 
-from flask import json, request, current_app
+from flask import g, json, request, current_app
 from flask.logging import has_level_handler
 
 from typeguard import TypeCheckError
@@ -44,8 +47,9 @@ from werkzeug.datastructures import Headers
 
 from flask_jsonrpc.conf import settings
 from flask_jsonrpc.helpers import get
+from flask_jsonrpc.signals import call_started, call_finished, request_started
+from flask_jsonrpc.timings import get_timings, record_timing
 from flask_jsonrpc.funcutils import bindfy
-from flask_jsonrpc.descriptor import JSONRPCServiceDescriptor
 from flask_jsonrpc.exceptions import (
     ParseError,
     ServerError,
@@ -56,6 +60,12 @@ from flask_jsonrpc.exceptions import (
 )
 from flask_jsonrpc.types.types import AnnotatedMetadataTypeError, type_checker
 
+if t.TYPE_CHECKING:
+    from flask_jsonrpc import typing as fjt
+    from flask_jsonrpc.codecs import Codec
+    from flask_jsonrpc.descriptor import JSONRPCServiceDescriptor
+
+JSONRPC_DESCRIBE_METHOD_NAME: str = 'rpc.describe'
 JSONRPC_VERSION_DEFAULT: str = '2.0'
 JSONRPC_DEFAULT_HTTP_HEADERS: dict[str, str] = {}
 JSONRPC_DEFAULT_HTTP_STATUS_CODE: int = 200
@@ -74,12 +84,19 @@ class JSONRPCSite:
         base_url (str | None): The base URL for the JSON-RPC site.
         error_handlers (dict[type[Exception], typing.Callable[[typing.Any], typing.Any]]): A mapping of exception
             types to their handlers.
+        before_request_funcs (list[typing.Callable[[typing.Any], typing.Any]]): Functions called with the decoded
+            request data before it is dispatched.
+        teardown_request_funcs (list[typing.Callable[[BaseException | None], None]]): Functions called after
+            every request, even if an exception occurred.
+        before_dispatch_funcs (list[typing.Callable[[dict[str, typing.Any]], None]]): Functions called with each
+            JSON-RPC request object (each element of a batch) before it is dispatched.
         view_funcs (collections.OrderedDict[str, typing.Callable[..., typing.Any]]): A mapping of method names to
             their view functions.
+        codecs (dict[str, flask_jsonrpc.codecs.Codec]): A mapping of mimetypes to the codecs of the request and
+            response bodies, other than JSON.
         uuid (uuid.UUID): A unique identifier for the JSON-RPC site.
         name (str): The name of the JSON-RPC site.
         version (str): The version of the JSON-RPC API.
-        describe (typing.Callable[[], dict[str, typing.Any]]): A callable that returns the service description.
 
     Examples:
         >>> jsonrpc_site = JSONRPCSite(
@@ -91,11 +108,15 @@ class JSONRPCSite:
         self.path = path
         self.base_url = base_url
         self.error_handlers: dict[type[Exception], t.Callable[[t.Any], t.Any]] = {}
+        self.before_request_funcs: list[t.Callable[[t.Any], t.Any]] = []
+        self.teardown_request_funcs: list[t.Callable[[BaseException | None], None]] = []
+        self.before_dispatch_funcs: list[t.Callable[[dict[str, t.Any]], None]] = []
         self.view_funcs: t.OrderedDict[str, t.Callable[..., t.Any]] = OrderedDict()
+        self.codecs: dict[str, Codec] = {}
         self.uuid: UUID = uuid4()
         self.name: str = 'Flask-JSONRPC'
         self.version: str = version
-        self.describe = JSONRPCServiceDescriptor(self).describe
+        self.register(JSONRPC_DESCRIBE_METHOD_NAME, self._make_describe_view_func())
 
     def _is_notification_request(self: Self, req_json: dict[str, t.Any]) -> bool:
         """Check if the request is a notification request (without an 'id' member).
@@ -152,9 +173,19 @@ class JSONRPCSite:
         Returns:
             bool: True if the mimetype indicates JSON data, False otherwise.
         """
-        mt = request.mimetype
-        return mt in ('application/json', 'application/json-rpc', 'application/jsonrequest') or (
-            mt.startswith('application/') and mt.endswith('+json')
+        return self.is_json_mimetype(request.mimetype)
+
+    def is_json_mimetype(self: Self, mimetype: str) -> bool:
+        """Check if a mimetype indicates JSON data, see :attr:`is_json`.
+
+        Args:
+            mimetype (str): The mimetype, without parameters.
+
+        Returns:
+            bool: True if the mimetype indicates JSON data, False otherwise.
+        """
+        return mimetype in ('application/json', 'application/json-rpc', 'application/jsonrequest') or (
+            mimetype.startswith('application/') and mimetype.endswith('+json')
         )
 
     @cached_property
@@ -171,6 +202,59 @@ class JSONRPCSite:
             logger.addHandler(logging.NullHandler())
         return logger
 
+    @cached_property
+    def service_descriptor(self: Self) -> JSONRPCServiceDescriptor:
+        """Get the service descriptor of the JSON-RPC site.
+
+        The descriptor, and the pydantic models of :mod:`flask_jsonrpc.typing`, are only
+        imported on first use, so that importing Flask-JSONRPC and serving requests do
+        not pay for them. It replaces the placeholder of the ``rpc.describe`` method,
+        unless the method has been overridden.
+
+        Returns:
+            flask_jsonrpc.descriptor.JSONRPCServiceDescriptor: The service descriptor.
+        """
+        from flask_jsonrpc.descriptor import JSONRPCServiceDescriptor
+
+        view_func = self.view_funcs.get(JSONRPC_DESCRIBE_METHOD_NAME)
+        service_descriptor = JSONRPCServiceDescriptor(self)
+        if view_func is not None and not getattr(view_func, 'jsonrpc_describe_placeholder', False):
+            self.view_funcs[JSONRPC_DESCRIBE_METHOD_NAME] = view_func
+        return service_descriptor
+
+    def _make_describe_view_func(self: Self) -> t.Callable[[], fjt.ServiceDescribe]:
+        """Make the placeholder of the ``rpc.describe`` method, registered until
+        the service descriptor is loaded.
+
+        Returns:
+            typing.Callable[[], flask_jsonrpc.typing.ServiceDescribe]: The placeholder view function.
+        """
+
+        def describe() -> fjt.ServiceDescribe:
+            return self.describe()
+
+        describe.__doc__ = 'Service description for JSON-RPC 2.0'
+        setattr(describe, 'jsonrpc_method_name', JSONRPC_DESCRIBE_METHOD_NAME)  # noqa: B010
+        setattr(describe, 'jsonrpc_method_params', {})  # noqa: B010
+        setattr(describe, 'jsonrpc_validate', False)  # noqa: B010
+        setattr(describe, 'jsonrpc_notification', False)  # noqa: B010
+        setattr(describe, 'jsonrpc_options', {'notification': False, 'validate': False})  # noqa: B010
+        setattr(describe, 'jsonrpc_describe_placeholder', True)  # noqa: B010
+        return describe
+
+    def describe(self: Self) -> fjt.ServiceDescribe:
+        """Describe the JSON-RPC service.
+
+        Returns:
+            flask_jsonrpc.typing.ServiceDescribe: The service description.
+
+        Examples:
+            >>> jsonrpc_site = JSONRPCSite(version='2.0', path='/api')
+            >>> jsonrpc_site.describe().name
+            'Flask-JSONRPC'
+        """
+        return self.service_descriptor.service_describe()
+
     def set_path(self: Self, path: str) -> None:
         """Set the URL path for the JSON-RPC site.
 
@@ -207,6 +291,67 @@ class JSONRPCSite:
         """
         self.error_handlers[exception] = fn
 
+    def register_before_request(self: Self, fn: t.Callable[[t.Any], t.Any]) -> None:
+        """Register a function to run before each request is dispatched.
+
+        The function is called with the decoded request data (a dict or, for batch
+        requests, a list). If it returns a non-None value, that value is used as the
+        response and the request is not dispatched. The value may be a tuple in any
+        of the forms accepted by :meth:`unpack_tuple_returns`; a :class:`bytes` body
+        is sent as-is as pre-encoded JSON.
+
+        Args:
+            fn (typing.Callable[[typing.Any], typing.Any]): The function to register.
+
+        Examples:
+            >>> def reject_batches(req_json: Any) -> Any:
+            ...     if isinstance(req_json, list):
+            ...         return b'{"message": "batches are not allowed"}', 400
+            ...     return None
+            >>>
+            >>> jsonrpc_site = JSONRPCSite(version='2.0', path='/api')
+            >>> jsonrpc_site.register_before_request(reject_batches)
+        """
+        self.before_request_funcs.append(fn)
+
+    def register_teardown_request(self: Self, fn: t.Callable[[BaseException | None], None]) -> None:
+        """Register a function to run at the end of each request, even if an exception occurred.
+
+        Args:
+            fn (typing.Callable[[BaseException | None], None]): The function to register, it receives
+                the exception raised by the request, if any.
+
+        Examples:
+            >>> def log_teardown(exc: BaseException | None) -> None:
+            ...     pass
+            >>>
+            >>> jsonrpc_site = JSONRPCSite(version='2.0', path='/api')
+            >>> jsonrpc_site.register_teardown_request(log_teardown)
+        """
+        self.teardown_request_funcs.append(fn)
+
+    def register_before_dispatch(self: Self, fn: t.Callable[[dict[str, t.Any]], None]) -> None:
+        """Register a function to run before each JSON-RPC request object is dispatched.
+
+        The function is called once per request object, so once per element of a batch
+        request. It may raise a :class:`~flask_jsonrpc.exceptions.JSONRPCError` to reject
+        the request object, the error is then returned as its response.
+
+        Args:
+            fn (typing.Callable[[dict[str, typing.Any]], None]): The function to register.
+
+        Examples:
+            >>> from flask_jsonrpc.exceptions import InvalidRequestError
+            >>>
+            >>> def require_id(req_json: dict[str, Any]) -> None:
+            ...     if 'id' not in req_json:
+            ...         raise InvalidRequestError(data={'message': 'id is required'})
+            >>>
+            >>> jsonrpc_site = JSONRPCSite(version='2.0', path='/api')
+            >>> jsonrpc_site.register_before_dispatch(require_id)
+        """
+        self.before_dispatch_funcs.append(fn)
+
     def register(self: Self, name: str, view_func: t.Callable[..., t.Any]) -> None:
         """Register a view function with the JSON-RPC site.
 
@@ -222,9 +367,54 @@ class JSONRPCSite:
         """
         self.view_funcs[name] = view_func
 
+    def register_codec(self: Self, codec: Codec) -> None:
+        """Register a codec for the request and response bodies, see :mod:`flask_jsonrpc.codecs`.
+
+        The requests with one of the mimetypes of the codec are decoded with it, and
+        the responses are encoded with the codec that best matches the ``Accept``
+        header, or else with the codec of the request.
+
+        Args:
+            codec (flask_jsonrpc.codecs.Codec): The codec to register.
+
+        Examples:
+            >>> from flask_jsonrpc.codecs import MessagePackCodec
+            >>> jsonrpc_site = JSONRPCSite(version='2.0', path='/api')
+            >>> jsonrpc_site.register_codec(MessagePackCodec())
+            >>> sorted(jsonrpc_site.codecs)
+            ['application/msgpack', 'application/vnd.msgpack', 'application/x-msgpack']
+        """
+        for mimetype in codec.mimetypes:
+            self.codecs[mimetype] = codec
+
+    def get_response_codec(self: Self) -> Codec | None:
+        """Get the codec of the response body from the ``Accept`` header of the request.
+
+        Returns:
+            flask_jsonrpc.codecs.Codec | None: The codec that best matches the ``Accept`` header,
+                or else the codec of the request, None for JSON.
+        """
+        if not self.codecs:
+            return None
+        request_codec = self.codecs.get(request.mimetype)
+        mimetypes = ([request.mimetype] if request_codec is not None else []) + ['application/json', *self.codecs]
+        mimetype = request.accept_mimetypes.best_match(mimetypes)
+        if mimetype is None:
+            return request_codec
+        return self.codecs.get(mimetype)
+
     def dispatch_request(self: Self) -> tuple[t.Any, int, Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
         """Dispatch the JSON-RPC request.
 
+        The :data:`~flask_jsonrpc.signals.request_started` signal is sent first, the
+        registered before request functions run once the request data is decoded,
+        and the teardown request functions run when the request ends, or when the
+        result is streamed, see :func:`~flask_jsonrpc.streaming.defer_until_streamed`.
+        The ``mime`` and ``parse`` phases are timed, see :mod:`flask_jsonrpc.timings`.
+
+        The JSON-RPC request object of a GET request is read from the query string,
+        see :meth:`from_query_string`.
+
         Returns:
             tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
                 The response data, status code, and headers.
@@ -232,18 +422,127 @@ class JSONRPCSite:
         Raises:
             flask_jsonrpc.exceptions.ParseError: If the request is not valid JSON.
         """
-        if not self.validate_request():
-            raise ParseError(
-                data={
-                    'message': f'Invalid mime type for JSON: {request.mimetype}, '
-                    'use header Content-Type: application/json'
-                }
-            ) from None
+        exc: BaseException | None = None
+        streamed = False
+        if request_started.receivers:
+            request_started.send(self)
+        # Read after the signal, its receivers may start recording the timings
+        timings = get_timings()
+        try:
+            started_at = time.perf_counter()
+            json_data: t.Any
+            if request.method == 'GET':
+                json_data = self.from_query_string()
+            else:
+                if not self.validate_request():
+                    raise ParseError(
+                        data={
+                            'message': f'Invalid mime type for JSON: {request.mimetype}, '
+                            'use header Content-Type: application/json'
+                        }
+                    ) from None
+
+                started_at = record_timing(timings, 'mime', started_at)
+                json_data = self.to_json(self.get_request_data())
+            record_timing(timings, 'parse', started_at)
+            rv = self.preprocess_request(json_data)
+            if rv is not None:
+                return rv
+            if self._is_batch_request(json_data):
+                return self.batch_dispatch(json_data)
+            rv = self.handle_dispatch_except(json_data, stream=True)
+            streamed = self._defer_until_streamed(rv, functools.partial(self.do_teardown_request, None))
+            return rv
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            if not streamed:
+                self.do_teardown_request(exc)
+
+    def dispatch_message(self: Self, data: bytes) -> t.Any:  # noqa: ANN401
+        """Dispatch a JSON-RPC request object or batch received as one message of a stream,
+        e.g. a line of a pipelined request or a WebSocket message.
+
+        Each message is handled as a request of its own: the :data:`~flask_jsonrpc.signals.request_started`
+        signal is sent, the before request functions run, and the teardown request functions
+        run once the message is handled. The invalid messages get a JSON-RPC error response,
+        and the notifications no response.
 
-        json_data = self.to_json(request.data)
-        if self._is_batch_request(json_data):
-            return self.batch_dispatch(json_data)
-        return self.handle_dispatch_except(json_data)
+        Args:
+            data (bytes): The message.
+
+        Returns:
+            typing.Any: The response data, None if there is no response.
+        """
+        exc: BaseException | None = None
+        if request_started.receivers:
+            request_started.send(self)
+        try:
+            try:
+                json_data = self.to_json(data)
+                rv = self.preprocess_request(json_data)
+                if rv is None:
+                    if self._is_batch_request(json_data):
+                        rv = self.batch_dispatch(json_data)
+                    else:
+                        rv = self.handle_dispatch_except(json_data)
+            except JSONRPCError as e:
+                self.logger.info('jsonrpc error', exc_info=e)
+                return {'id': None, 'jsonrpc': JSONRPC_VERSION_DEFAULT, 'error': e.jsonrpc_format}
+            response, status_code, _ = rv
+            return response if status_code != 204 else None
+        except BaseException as e:
+            exc = e
+            raise
+        finally:
+            self.do_teardown_request(exc)
+
+    def dispatch_pipeline(self: Self, lines: t.Iterable[bytes]) -> t.Iterator[t.Any]:
+        """Dispatch a stream of JSON-RPC requests, one request object or batch per line (NDJSON).
+
+        Each line is dispatched as it is read, as a request of its own, see :meth:`dispatch_message`.
+
+        Args:
+            lines (typing.Iterable[bytes]): The lines of the request body.
+
+        Returns:
+            typing.Iterator[typing.Any]: The response data of each line, in the order the lines were handled.
+        """
+        for line in lines:
+            if not line.strip():
+                continue
+            response = self.dispatch_message(line)
+            if response is not None:
+                yield response
+
+    def preprocess_request(
+        self: Self,
+        req_json: t.Any,  # noqa: ANN401
+    ) -> tuple[t.Any, int, Headers | dict[str, str] | tuple[str] | list[tuple[str]]] | None:
+        """Call the registered before request functions.
+
+        Args:
+            req_json (typing.Any): The decoded JSON-RPC request data.
+
+        Returns:
+            tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]
+                | None: The response returned by the first function that returned a non-None value, otherwise None.
+        """
+        for fn in self.before_request_funcs:
+            rv = current_app.ensure_sync(fn)(req_json)
+            if rv is not None:
+                return self.unpack_tuple_returns(rv)
+        return None
+
+    def do_teardown_request(self: Self, exc: BaseException | None = None) -> None:
+        """Call the registered teardown request functions in the reverse order of registration.
+
+        Args:
+            exc (BaseException | None): The exception raised while dispatching the request, if any.
+        """
+        for fn in reversed(self.teardown_request_funcs):
+            current_app.ensure_sync(fn)(exc)
 
     def validate_request(self: Self) -> bool:
         """Validate the JSON-RPC request.
@@ -251,16 +550,137 @@ class JSONRPCSite:
         Returns:
             bool: True if the request is valid, False otherwise.
         """
-        if not self.is_json:
+        if not self.is_json and request.mimetype not in self.codecs:
             self.logger.info('invalid mimetype')
             return False
         return True
 
-    def to_json(self: Self, request_data: bytes) -> t.Any:  # noqa: ANN401
+    def is_get_allowed(self: Self, view_func: t.Callable[..., t.Any]) -> bool:
+        """Check if a JSON-RPC method can be called with a GET request.
+
+        Only the methods registered with the ``idempotent=True`` or ``cacheable=<ttl>``
+        options can be called with GET, as the GET requests may be repeated and cached.
+
+        Args:
+            view_func (typing.Callable[..., typing.Any]): The view function of the method.
+
+        Returns:
+            bool: True if the method can be called with GET, False otherwise.
+        """
+        options = getattr(view_func, 'jsonrpc_options', {})
+        return bool(options.get('idempotent', False)) or options.get('cacheable') is not None
+
+    def from_query_string(self: Self) -> dict[str, t.Any]:
+        """Build the JSON-RPC request object of a GET request from the query string.
+
+        The query string has the ``method``, the ``params`` encoded in JSON and the ``id``,
+        e.g. ``?method=app.sum&params=[1,2]&id=1``. The ``id`` is decoded as JSON if it
+        can be, otherwise it is kept as a string, and defaults to null.
+
+        Returns:
+            dict[str, typing.Any]: The JSON-RPC request object.
+
+        Raises:
+            flask_jsonrpc.exceptions.ParseError: If the params are not valid JSON.
+            flask_jsonrpc.exceptions.InvalidRequestError: If the method can not be called with GET.
+        """
+        args = request.args
+        method_name = args.get('method')
+        view_func = self.view_funcs.get(method_name) if method_name is not None else None
+        if view_func is not None and not self.is_get_allowed(view_func):
+            raise InvalidRequestError(
+                data={
+                    'message': f'Method {method_name!r} can not be called with GET, '
+                    'register it with the idempotent or cacheable options'
+                }
+            ) from None
+
+        req_json: dict[str, t.Any] = {'jsonrpc': args.get('jsonrpc', JSONRPC_VERSION_DEFAULT), 'method': method_name}
+        if 'params' in args:
+            try:
+                req_json['params'] = json.loads(args['params'])
+            except ValueError as e:
+                self.logger.info('invalid json: %s', args['params'], exc_info=e)
+                raise ParseError(data={'message': f'Invalid JSON: {args["params"]!r}'}) from e
+        req_id = args.get('id')
+        try:
+            req_json['id'] = json.loads(req_id) if req_id is not None else None
+        except ValueError:
+            req_json['id'] = req_id
+        return req_json
+
+    def get_request_data(self: Self) -> bytes:
+        """Get the request data, decompressed if the request has a ``Content-Encoding`` header.
+
+        The compressed body is read from the request stream and decompressed chunk by chunk,
+        up to the ``DECOMPRESSION_MAX_SIZE`` setting, with the content codings of the
+        ``DECOMPRESSION_ENCODINGS`` setting. As the stream is consumed, the decompressed
+        data is kept in :data:`~flask.g` (``_jsonrpc_request_data``) for the rest of the
+        request, e.g. for the traffic capture contrib.
+
+        Returns:
+            bytes: The request data.
+
+        Raises:
+            flask_jsonrpc.exceptions.ParseError: If the content coding is not supported (415),
+                the decompressed body is too large (413), or the compressed body is invalid.
+        """
+        content_encoding = request.headers.get('Content-Encoding')
+        if not content_encoding or content_encoding.strip().lower() == 'identity':
+            return request.data
+
+        data = self.decompress_request_data(
+            iter(functools.partial(request.stream.read, 64 * 1024), b''), content_encoding
+        )
+        g._jsonrpc_request_data = data
+        return data
+
+    def decompress_request_data(self: Self, chunks: t.Iterable[bytes], content_encoding: str) -> bytes:
+        """Decompress a request body with the ``DECOMPRESSION_*`` settings.
+
+        Args:
+            chunks (typing.Iterable[bytes]): The chunks of the compressed body.
+            content_encoding (str): The ``Content-Encoding`` header of the request.
+
+        Returns:
+            bytes: The decompressed body.
+
+        Raises:
+            flask_jsonrpc.exceptions.ParseError: If the content coding is not supported (415),
+                the decompressed body is too large (413), or the compressed body is invalid.
+        """
+        from flask_jsonrpc.compression import DecompressionLimitError, decompress_request_data
+
+        try:
+            return decompress_request_data(
+                chunks,
+                content_encoding,
+                encodings=settings.DECOMPRESSION_ENCODINGS,
+                max_size=settings.DECOMPRESSION_MAX_SIZE,
+            )
+        except LookupError as e:
+            self.logger.info('unsupported content encoding: %s', content_encoding)
+            raise ParseError(
+                data={'message': f'Unsupported Content-Encoding: {content_encoding}'}, status_code=415
+            ) from e
+        except DecompressionLimitError as e:
+            self.logger.info('decompressed request data too large', exc_info=e)
+            raise ParseError(
+                data={'message': f'Decompressed request data exceeds {settings.DECOMPRESSION_MAX_SIZE} bytes'},
+                status_code=413,
+            ) from e
+        except ValueError as e:
+            self.logger.info('invalid %s request data', content_encoding, exc_info=e)
+            raise ParseError(data={'message': f'Invalid {content_encoding} request data: {e}'}) from e
+
+    def to_json(self: Self, request_data: bytes, mimetype: str | None = None) -> t.Any:  # noqa: ANN401
         """Convert the request data to JSON.
 
+        The request data is decoded with the registered codec of the request mimetype, if any.
+
         Args:
             request_data (bytes): The request data.
+            mimetype (str | None): The mimetype of the request data. Defaults to None (the mimetype of the request).
 
         Returns:
             typing.Any: The JSON-decoded data.
@@ -268,15 +688,117 @@ class JSONRPCSite:
         Raises:
             flask_jsonrpc.exceptions.ParseError: If the request data is not valid JSON.
         """
+        codec = self.codecs.get(mimetype or request.mimetype) if self.codecs else None
+        if codec is not None:
+            mimetype = mimetype or request.mimetype
+            try:
+                return codec.loads(request_data)
+            except ValueError as e:
+                self.logger.info('invalid %s: %s', mimetype, request_data, exc_info=e)
+                raise ParseError(data={'message': f'Invalid {mimetype}: {request_data!r}'}) from e
         try:
             return json.loads(request_data)
         except ValueError as e:
             self.logger.info('invalid json: %s', request_data, exc_info=e)
             raise ParseError(data={'message': f'Invalid JSON: {request_data!r}'}) from e
 
+    def bind_params(self: Self, view_func: t.Callable[..., t.Any], params: t.Any) -> dict[str, t.Any]:  # noqa: ANN401
+        """Bind the parameters of a call to the view function, and check their types if the method is validated.
+
+        The ``bind`` and ``check`` phases are timed, see :mod:`flask_jsonrpc.timings`.
+
+        Args:
+            view_func (typing.Callable[..., typing.Any]): The view function.
+            params (typing.Any): The parameters of the call, by-position (list) or by-name (dict).
+
+        Returns:
+            dict[str, typing.Any]: The keyword arguments of the view function.
+
+        Raises:
+            flask_jsonrpc.exceptions.InvalidParamsError: If the parameters are not a list or a dict.
+            flask_jsonrpc.types.types.AnnotatedMetadataTypeError: If there is an annotated metadata type error.
+            typeguard.TypeCheckError: If there is a type checking error.
+        """
+        view_func_params = getattr(view_func, 'jsonrpc_method_params', {})
+        timings = get_timings()
+        started_at = time.perf_counter()
+        if isinstance(params, list):
+            kw_params = {}
+            for i, (param_name, _param_type) in enumerate(view_func_params.items()):
+                kw_params[param_name] = (params[i : i + 1] or [None])[0]
+            binded_params = bindfy(view_func, kw_params)
+        elif isinstance(params, dict):
+            binded_params = bindfy(view_func, params)
+        else:
+            raise InvalidParamsError(
+                data={'message': f'Parameter structures are by-position (list) or by-name (dict): {params}'}
+            ) from None
+
+        started_at = record_timing(timings, 'bind', started_at)
+        if getattr(view_func, 'jsonrpc_validate', settings.DEFAULT_JSONRPC_METHOD_VALIDATE):
+            binded_params = type_checker(view_func, binded_params)
+            record_timing(timings, 'check', started_at)
+        return binded_params
+
+    def check_return(self: Self, view_func: t.Callable[..., t.Any], resp_view: t.Any) -> t.Any:  # noqa: ANN401
+        """Check the value returned by the view function if the method is validated.
+
+        The ``return`` phase is timed, see :mod:`flask_jsonrpc.timings`.
+
+        Args:
+            view_func (typing.Callable[..., typing.Any]): The view function.
+            resp_view (typing.Any): The value returned by the view function.
+
+        Returns:
+            typing.Any: The value returned by the view function.
+
+        Raises:
+            TypeError: If the method returns a value but has no return annotation.
+
+        TODO:
+            - Enhance the checker to return the type.
+        """
+        started_at = time.perf_counter()
+        validate = getattr(view_func, 'jsonrpc_validate', settings.DEFAULT_JSONRPC_METHOD_VALIDATE)
+        # TODO: Enhance the checker to return the type
+        view_fun_annotations = t.get_type_hints(view_func) if validate else {}
+        view_fun_return: t.Any | None = view_fun_annotations.pop('return', type(None))
+        if validate and resp_view is not None and view_fun_return is type(None):
+            resp_view_qn = qualified_name(resp_view)
+            view_fun_return_qn = qualified_name(view_fun_return)
+            raise TypeError(f'return type of {resp_view_qn} must be a type; got {view_fun_return_qn} instead') from None
+        record_timing(get_timings(), 'return', started_at)
+        return resp_view
+
+    def make_invalid_params_error(self: Self, view_func: t.Callable[..., t.Any], exc: Exception) -> InvalidParamsError:
+        """Make the error of a call whose parameters or return value did not type check.
+
+        Args:
+            view_func (typing.Callable[..., typing.Any]): The view function.
+            exc (Exception): The type error, :class:`~flask_jsonrpc.types.types.AnnotatedMetadataTypeError`,
+                :class:`typeguard.TypeCheckError` or :class:`TypeError`.
+
+        Returns:
+            flask_jsonrpc.exceptions.InvalidParamsError: The JSON-RPC error.
+        """
+        if isinstance(exc, AnnotatedMetadataTypeError):
+            self.logger.info('invalid annotated type checked for: %s', view_func.__name__, exc_info=exc)
+            return InvalidParamsError(
+                data={
+                    'constraint': exc.annotated.__class__.__name__,
+                    'param': exc.name,
+                    'value': exc.value,
+                    'message': exc.message,
+                }
+            )
+        self.logger.info('invalid type checked for: %s', getattr(view_func, '__name__', view_func), exc_info=exc)
+        return InvalidParamsError(data={'message': str(exc)})
+
     def handle_view_func(self: Self, view_func: t.Callable[..., t.Any], params: t.Any) -> t.Any:  # noqa: ANN401
         """Handle the view function with the given parameters.
 
+        The ``bind``, ``check``, ``view`` and ``return`` phases are timed, see :mod:`flask_jsonrpc.timings`.
+
         Args:
             view_func (typing.Callable[..., typing.Any]): The view function to handle.
             params (typing.Any): The parameters to pass to the view function.
@@ -288,74 +810,32 @@ class JSONRPCSite:
             flask_jsonrpc.exceptions.InvalidParamsError: If the parameters are invalid.
             flask_jsonrpc.exceptions.InvalidParamsError: If there is an annotated metadata type error.
             flask_jsonrpc.exceptions.InvalidParamsError: If there is a type checking error.
-            TypeError: If there is a type mismatch.
-
-        TODO:
-            - Enhance the checker to return the type.
+            flask_jsonrpc.exceptions.InvalidParamsError: If there is a type mismatch.
         """
-        view_func_params = getattr(view_func, 'jsonrpc_method_params', {})
-        validate = getattr(view_func, 'jsonrpc_validate', settings.DEFAULT_JSONRPC_METHOD_VALIDATE)
         try:
-            if isinstance(params, list):
-                kw_params = {}
-                for i, (param_name, _param_type) in enumerate(view_func_params.items()):
-                    kw_params[param_name] = (params[i : i + 1] or [None])[0]
-                binded_params = bindfy(view_func, kw_params)
-            elif isinstance(params, dict):
-                binded_params = bindfy(view_func, params)
-            else:
-                raise InvalidParamsError(
-                    data={'message': f'Parameter structures are by-position (list) or by-name (dict): {params}'}
-                ) from None
-
-            if validate:
-                binded_params = type_checker(view_func, binded_params)
-
+            binded_params = self.bind_params(view_func, params)
+            started_at = time.perf_counter()
             resp_view = current_app.ensure_sync(view_func)(**binded_params)
-
-            # TODO: Enhance the checker to return the type
-            view_fun_annotations = t.get_type_hints(view_func) if validate else {}
-            view_fun_return: t.Any | None = view_fun_annotations.pop('return', type(None))
-            if validate and resp_view is not None and view_fun_return is type(None):
-                resp_view_qn = qualified_name(resp_view)
-                view_fun_return_qn = qualified_name(view_fun_return)
-                raise TypeError(
-                    f'return type of {resp_view_qn} must be a type; got {view_fun_return_qn} instead'
-                ) from None
-
-            return resp_view
-        except AnnotatedMetadataTypeError as e:
-            self.logger.info('invalid annotated type checked for: %s', view_func.__name__, exc_info=e)
-            raise InvalidParamsError(
-                data={
-                    'constraint': e.annotated.__class__.__name__,
-                    'param': e.name,
-                    'value': e.value,
-                    'message': e.message,
-                }
-            ) from e
+            record_timing(get_timings(), 'view', started_at)
+            return self.check_return(view_func, resp_view)
         except (TypeError, TypeCheckError) as e:
-            self.logger.info('invalid type checked for: %s', getattr(view_func, '__name__', view_func), exc_info=e)
-            raise InvalidParamsError(data={'message': str(e)}) from e
+            raise self.make_invalid_params_error(view_func, e) from e
 
-    def dispatch(
-        self: Self, req_json: dict[str, t.Any]
-    ) -> tuple[t.Any, int, Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
-        """Dispatch the JSON-RPC request.
+    def get_view_func(self: Self, req_json: dict[str, t.Any]) -> t.Callable[..., t.Any]:
+        """Get the view function of the method of a JSON-RPC request.
 
         Args:
             req_json (dict[str, typing.Any]): The JSON-RPC request data.
 
         Returns:
-            tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
-                The response data, status code, and headers.
+            typing.Callable[..., typing.Any]: The view function.
 
         Raises:
             flask_jsonrpc.exceptions.MethodNotFoundError: If the requested method is not found.
-            flask_jsonrpc.exceptions.InvalidRequestError: If the request is invalid.
+            flask_jsonrpc.exceptions.InvalidRequestError: If the method does not allow notifications
+                and the request is a notification.
         """
         method_name = req_json['method']
-        params = req_json.get('params', {})
         view_func = self.view_funcs.get(method_name)
         notification = getattr(view_func, 'jsonrpc_notification', settings.DEFAULT_JSONRPC_METHOD_NOTIFICATION)
         if not view_func:
@@ -368,8 +848,26 @@ class JSONRPCSite:
                     "Request object (without an 'id' member)"
                 }
             ) from None
+        return view_func
 
-        resp_view = self.handle_view_func(view_func, params)
+    def dispatch(
+        self: Self, req_json: dict[str, t.Any]
+    ) -> tuple[t.Any, int, Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
+        """Dispatch the JSON-RPC request.
+
+        Args:
+            req_json (dict[str, typing.Any]): The JSON-RPC request data.
+
+        Returns:
+            tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
+                The response data, status code, and headers.
+
+        Raises:
+            flask_jsonrpc.exceptions.MethodNotFoundError: If the requested method is not found.
+            flask_jsonrpc.exceptions.InvalidRequestError: If the request is invalid.
+        """
+        view_func = self.get_view_func(req_json)
+        resp_view = self.handle_view_func(view_func, req_json.get('params', {}))
         return self.make_response(req_json, resp_view)
 
     def handle_exception(
@@ -413,11 +911,68 @@ class JSONRPCSite:
         return response, jsonrpc_error.status_code, jsonrpc_error_headers
 
     def handle_dispatch_except(
-        self: Self, req_json: dict[str, t.Any]
+        self: Self, req_json: dict[str, t.Any], stream: bool = False
     ) -> tuple[t.Any, int, Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
         """Handle the dispatch of the request and catch exceptions.
 
-        If an exception occurs during dispatch, it is handled appropriately.
+        If an exception occurs during dispatch, it is handled appropriately. The
+        :data:`~flask_jsonrpc.signals.call_started` and :data:`~flask_jsonrpc.signals.call_finished`
+        signals are sent before and after the request is handled, or after the result is
+        streamed, see :func:`~flask_jsonrpc.streaming.defer_until_streamed`.
+
+        Args:
+            req_json (dict[str, typing.Any]): The JSON-RPC request data.
+            stream (bool): Whether the result may be streamed, only the result of a single
+                request, not an element of a batch, is. Defaults to False.
+
+        Returns:
+            tuple[typing.Any, int, werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
+                The response data, status code, and headers.
+        """
+        if call_started.receivers:
+            call_started.send(self, req_json=req_json)
+        started_at = time.perf_counter()
+        rv = self._handle_dispatch_except(req_json)
+        if call_finished.receivers:
+
+            def finish_call() -> None:
+                call_finished.send(
+                    self,
+                    req_json=req_json,
+                    response=rv[0],
+                    status_code=rv[1],
+                    duration=time.perf_counter() - started_at,
+                )
+
+            if not (stream and self._defer_until_streamed(rv, finish_call)):
+                finish_call()
+        return rv
+
+    def _defer_until_streamed(
+        self: Self,
+        rv: tuple[t.Any, int, Headers | dict[str, str] | tuple[str] | list[tuple[str]]],
+        fn: t.Callable[[], t.Any],
+    ) -> bool:
+        """Defer a function until the result of a response is streamed, see
+        :func:`~flask_jsonrpc.streaming.defer_until_streamed`.
+
+        Args:
+            rv (tuple[typing.Any, int, typing.Any]): The response data, status code, and headers.
+            fn (typing.Callable[[], typing.Any]): The function.
+
+        Returns:
+            bool: True if the function was deferred, False if the result is not streamed.
+        """
+        if not (isinstance(rv[0], dict) and isinstance(rv[0].get('result'), GeneratorType | AsyncGeneratorType)):
+            return False
+        from flask_jsonrpc.streaming import defer_until_streamed
+
+        return defer_until_streamed(fn)
+
+    def _handle_dispatch_except(
+        self: Self, req_json: dict[str, t.Any]
+    ) -> tuple[t.Any, int, Headers | dict[str, str] | tuple[str] | list[tuple[str]]]:
+        """Dispatch the request, converting the exceptions to JSON-RPC error responses.
 
         Args:
             req_json (dict[str, typing.Any]): The JSON-RPC request data.
@@ -427,8 +982,12 @@ class JSONRPCSite:
                 The response data, status code, and headers.
         """
         try:
+            started_at = time.perf_counter()
             if not self.validate(req_json):
                 raise InvalidRequestError(data={'message': f'Invalid JSON: {req_json!r}'}) from None
+            record_timing(get_timings(), 'validate', started_at)
+            for fn in self.before_dispatch_funcs:
+                current_app.ensure_sync(fn)(req_json)
             return self.dispatch(req_json)
         except Exception as e:
             if isinstance(e, JSONRPCError):  # mypyc: https://docs.python.org/3/glossary.html#term-EAFP
@@ -0,0 +1,320 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+from types import GeneratorType, AsyncGeneratorType
+import typing as t
+
+from flask import g, current_app, make_response, stream_with_context
+
+from flask_jsonrpc.site import JSONRPC_VERSION_DEFAULT
+from flask_jsonrpc.encoders import dumps, iterate_async
+from flask_jsonrpc.exceptions import ParseError, JSONRPCError
+
+if t.TYPE_CHECKING:
+    from flask import Response
+
+    from werkzeug.datastructures import Headers
+
+    from flask_jsonrpc.site import JSONRPCSite
+
+STREAM_MIMETYPE_JSON = 'application/json'
+STREAM_MIMETYPE_NDJSON = 'application/x-ndjson'
+STREAM_MIMETYPE_SSE = 'text/event-stream'
+STREAM_MIMETYPES: tuple[str, ...] = (STREAM_MIMETYPE_JSON, STREAM_MIMETYPE_NDJSON, STREAM_MIMETYPE_SSE)
+"""tuple[str, ...]: The mimetypes of the streamed results, by preference, negotiated with the
+``Accept`` header."""
+
+
+def is_stream(obj: t.Any) -> bool:  # noqa: ANN401
+    """Check if a method result is streamed, i.e. a generator or an async generator.
+
+    Args:
+        obj (typing.Any): The method result.
+
+    Returns:
+        bool: True if the result is streamed, False otherwise.
+
+    Examples:
+        >>> is_stream(i for i in range(3))
+        True
+        >>> is_stream([0, 1, 2])
+        False
+    """
+    return isinstance(obj, GeneratorType | AsyncGeneratorType)
+
+
+def start_stream_callbacks() -> None:
+    """Start collecting the functions that run when the streamed response of the current request
+    is closed, see :func:`defer_until_streamed`.
+
+    Examples:
+        >>> from flask import Flask
+        >>>
+        >>> app = Flask(__name__)
+        >>> with app.app_context():
+        ...     start_stream_callbacks()
+        ...     defer_until_streamed(lambda: print('closed'))
+        ...     run_stream_callbacks()
+        True
+        closed
+    """
+    g._jsonrpc_stream_callbacks = []
+
+
+def defer_until_streamed(fn: t.Callable[[], t.Any]) -> bool:
+    """Defer a function until the streamed response of the current request is closed.
+
+    The end of a call whose result is streamed, e.g. the :data:`~flask_jsonrpc.signals.call_finished`
+    signal and the teardown request functions, is deferred until the result is sent.
+
+    Args:
+        fn (typing.Callable[[], typing.Any]): The function.
+
+    Returns:
+        bool: True if the function is deferred, False if the response of the current request
+            is not streamed and the function must run now.
+
+    Examples:
+        >>> from flask import Flask
+        >>>
+        >>> app = Flask(__name__)
+        >>> with app.app_context():
+        ...     defer_until_streamed(lambda: print('closed'))
+        False
+    """
+    callbacks: list[t.Callable[[], t.Any]] | None = g.get('_jsonrpc_stream_callbacks')
+    if callbacks is None:
+        return False
+    callbacks.append(fn)
+    return True
+
+
+def run_stream_callbacks() -> None:
+    """Run the deferred functions of the current request, in the order they were deferred."""
+    for fn in g.pop('_jsonrpc_stream_callbacks', None) or ():
+        fn()
+
+
+def close_stream(chunks: t.Iterator[str]) -> t.Iterator[str]:
+    """Run the deferred functions of the current request once its streamed response is closed.
+
+    Args:
+        chunks (typing.Iterator[str]): The chunks of the streamed response.
+
+    Returns:
+        typing.Iterator[str]: The chunks.
+    """
+    try:
+        yield from chunks
+    finally:
+        run_stream_callbacks()
+
+
+def iterate_result(result: t.Iterator[t.Any] | t.AsyncIterator[t.Any]) -> t.Iterator[t.Any]:
+    """Iterate the items of a streamed result.
+
+    Args:
+        result (typing.Iterator[typing.Any] | typing.AsyncIterator[typing.Any]): The streamed result.
+
+    Returns:
+        typing.Iterator[typing.Any]: The items of the result.
+    """
+    if isinstance(result, AsyncGeneratorType):
+        return iterate_async(result)
+    return t.cast(t.Iterator[t.Any], result)
+
+
+def format_error(jsonrpc_site: JSONRPCSite, response: dict[str, t.Any], exc: Exception) -> dict[str, t.Any]:
+    """Make the JSON-RPC error response of an exception raised while a result is streamed.
+
+    Args:
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the call.
+        response (dict[str, typing.Any]): The JSON-RPC response of the call.
+        exc (Exception): The exception raised by the result.
+
+    Returns:
+        dict[str, typing.Any]: The JSON-RPC error response.
+    """
+    if isinstance(exc, JSONRPCError):
+        jsonrpc_site.logger.info('jsonrpc error', exc_info=exc)
+        return {'id': response.get('id'), 'jsonrpc': response.get('jsonrpc'), 'error': exc.jsonrpc_format}
+    error_response, _, _ = jsonrpc_site.handle_exception(response, exc)
+    return t.cast(dict[str, t.Any], error_response)
+
+
+def stream_json(jsonrpc_site: JSONRPCSite, response: dict[str, t.Any]) -> t.Iterator[str]:
+    """Stream a JSON-RPC response whose result is a JSON array, item by item.
+
+    If the result raises an exception, the array is closed and the response gets an
+    ``error`` member, so that the client can tell a failed stream from a complete one.
+
+    Args:
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the call.
+        response (dict[str, typing.Any]): The JSON-RPC response, with the streamed result.
+
+    Returns:
+        typing.Iterator[str]: The chunks of the JSON-RPC response.
+    """
+    json_provider = current_app.json
+    envelope = dumps({**response, 'result': []}, json_provider)
+    index = envelope.rindex('[]') + 1
+    yield envelope[:index]
+    try:
+        for i, item in enumerate(iterate_result(response['result'])):
+            yield (', ' if i else '') + dumps(item, json_provider)
+    except Exception as e:
+        error = format_error(jsonrpc_site, response, e)
+        yield f'], "error": {dumps(error["error"], json_provider)}}}'
+        return
+    yield envelope[index:]
+
+
+def stream_messages(jsonrpc_site: JSONRPCSite, response: dict[str, t.Any], mimetype: str) -> t.Iterator[str]:
+    """Stream a JSON-RPC response as a sequence of partial JSON-RPC responses, one per item of the result.
+
+    With NDJSON each partial response is a line, with SSE each partial response is the data
+    of a ``result`` event. If the result raises an exception, the last message is the
+    JSON-RPC error response, in an ``error`` event with SSE.
+
+    Args:
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the call.
+        response (dict[str, typing.Any]): The JSON-RPC response, with the streamed result.
+        mimetype (str): The mimetype of the stream, NDJSON or SSE.
+
+    Returns:
+        typing.Iterator[str]: The messages.
+    """
+    json_provider = current_app.json
+    sse = mimetype == STREAM_MIMETYPE_SSE
+    try:
+        for item in iterate_result(response['result']):
+            message = dumps({**response, 'result': item}, json_provider)
+            yield f'event: result\ndata: {message}\n\n' if sse else f'{message}\n'
+    except Exception as e:
+        message = dumps(format_error(jsonrpc_site, response, e), json_provider)
+        yield f'event: error\ndata: {message}\n\n' if sse else f'{message}\n'
+
+
+def make_stream_response(
+    jsonrpc_site: JSONRPCSite,
+    response: dict[str, t.Any],
+    status_code: int,
+    headers: Headers | dict[str, str] | tuple[str] | list[tuple[str]],
+    mimetype: str,
+) -> Response:
+    """Make the streamed response of a JSON-RPC call whose result is a generator or an async generator.
+
+    The items of the result are encoded and sent as they are produced, so that the memory
+    does not grow with the size of the result. The request context is kept while the
+    response is streamed, and the functions deferred until the response is streamed run
+    once it is closed, see :func:`defer_until_streamed`.
+
+    Args:
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handled the call.
+        response (dict[str, typing.Any]): The JSON-RPC response, with the streamed result.
+        status_code (int): The HTTP status code.
+        headers (werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]):
+            The HTTP headers.
+        mimetype (str): The mimetype of the stream, one of :data:`STREAM_MIMETYPES`.
+
+    Returns:
+        flask.Response: The streamed response.
+    """
+    if mimetype == STREAM_MIMETYPE_JSON:
+        chunks = stream_json(jsonrpc_site, response)
+    else:
+        chunks = stream_messages(jsonrpc_site, response, mimetype)
+    rv = make_response(stream_with_context(close_stream(chunks)), status_code, headers)
+    rv.mimetype = mimetype
+    if mimetype == STREAM_MIMETYPE_SSE:
+        rv.headers['Cache-Control'] = 'no-cache'
+    return rv
+
+
+def read_lines(readline: t.Callable[[int], bytes], max_size: int) -> t.Iterator[bytes]:
+    """Read the lines of a pipelined request body as they arrive.
+
+    Args:
+        readline (typing.Callable[[int], bytes]): The ``readline`` method of the request stream.
+        max_size (int): The maximum size of a line, with the newline, in bytes.
+
+    Returns:
+        typing.Iterator[bytes]: The lines.
+
+    Raises:
+        flask_jsonrpc.exceptions.ParseError: If a line exceeds ``max_size`` (413).
+
+    Examples:
+        >>> import io
+        >>> list(read_lines(io.BytesIO(b'[1]\\n[2]').readline, 8))
+        [b'[1]\\n', b'[2]']
+        >>> list(read_lines(io.BytesIO(b'[1, 2, 3, 4]\\n').readline, 8))
+        Traceback (most recent call last):
+          ...
+        flask_jsonrpc.exceptions.ParseError: Parse error
+    """
+    while line := readline(max_size + 1):
+        if len(line) > max_size:
+            raise ParseError(data={'message': f'Line exceeds {max_size} bytes'}, status_code=413)
+        yield line
+
+
+def make_pipeline_response(jsonrpc_site: JSONRPCSite, lines: t.Iterable[bytes]) -> Response:
+    """Make the streamed NDJSON response of a pipelined request, see
+    :meth:`~flask_jsonrpc.site.JSONRPCSite.dispatch_pipeline`.
+
+    The response of each line is encoded and sent as soon as the line is handled, while
+    the next lines are still being read. If the lines can not be read, e.g. a line is too
+    large, the last line of the response is the JSON-RPC error response.
+
+    Args:
+        jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site that handles the requests.
+        lines (typing.Iterable[bytes]): The lines of the request body.
+
+    Returns:
+        flask.Response: The streamed response.
+    """
+    json_provider = current_app.json
+
+    def chunks() -> t.Iterator[str | bytes]:
+        try:
+            for response in jsonrpc_site.dispatch_pipeline(lines):
+                if isinstance(response, bytes | bytearray):
+                    # Pre-encoded JSON body, e.g. returned by a before request function
+                    yield bytes(response).rstrip(b'\n') + b'\n'
+                else:
+                    yield dumps(response, json_provider) + '\n'
+        except JSONRPCError as e:
+            jsonrpc_site.logger.info('jsonrpc error', exc_info=e)
+            yield (
+                dumps({'id': None, 'jsonrpc': JSONRPC_VERSION_DEFAULT, 'error': e.jsonrpc_format}, json_provider) + '\n'
+            )
+
+    rv = make_response(stream_with_context(chunks()))
+    rv.mimetype = STREAM_MIMETYPE_NDJSON
+    return rv
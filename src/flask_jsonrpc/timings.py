@@ -0,0 +1,138 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import time
+import typing as t
+
+from flask import g
+
+SERVER_TIMING_PHASES: tuple[str, ...] = (
+    'mime',
+    'parse',
+    'validate',
+    'bind',
+    'check',
+    'view',
+    'return',
+    'serialize',
+    'compress',
+    'total',
+)
+"""tuple[str, ...]: The timed phases of a JSON-RPC request, in the order they run.
+
+* ``mime``: Content type check.
+* ``parse``: Request body decoding.
+* ``validate``: JSON-RPC request object validation.
+* ``bind``: Binding of the params to the view function arguments.
+* ``check``: Type and constraint checks of the arguments.
+* ``view``: View function execution.
+* ``return``: Return value validation.
+* ``serialize``: Response encoding.
+* ``compress``: Response compression, if enabled.
+* ``total``: The whole request, as seen by the JSON-RPC view.
+"""
+
+
+def start_timings() -> dict[str, float]:
+    """Start recording the phase timings of the current request.
+
+    Returns:
+        dict[str, float]: The phase timings of the current request, in seconds.
+
+    Examples:
+        >>> from flask import Flask
+        >>>
+        >>> app = Flask(__name__)
+        >>> with app.app_context():
+        ...     timings = start_timings()
+        ...     assert get_timings() is timings
+    """
+    timings: dict[str, float] = {}
+    g._jsonrpc_timings = timings
+    return timings
+
+
+def get_timings() -> dict[str, float] | None:
+    """Get the phase timings of the current request.
+
+    Returns:
+        dict[str, float] | None: The phase timings, in seconds, or None if they are not being recorded.
+
+    Examples:
+        >>> from flask import Flask
+        >>>
+        >>> app = Flask(__name__)
+        >>> with app.app_context():
+        ...     assert get_timings() is None
+    """
+    timings: dict[str, float] | None = g.get('_jsonrpc_timings')
+    return timings
+
+
+def record_timing(timings: dict[str, float] | None, phase: str, started_at: float) -> float:
+    """Add the time elapsed since ``started_at`` to a phase.
+
+    The timings of the same phase are added up, e.g. for the elements of a batch request.
+
+    Args:
+        timings (dict[str, float] | None): The phase timings, nothing is recorded if None.
+        phase (str): The phase name.
+        started_at (float): The :func:`time.perf_counter` value when the phase started.
+
+    Returns:
+        float: The current :func:`time.perf_counter` value, to be used as the start of the next phase.
+
+    Examples:
+        >>> import time
+        >>> timings = {}
+        >>> started_at = record_timing(timings, 'bind', time.perf_counter())
+        >>> _ = record_timing(timings, 'bind', started_at)
+        >>> list(timings)
+        ['bind']
+        >>> _ = record_timing(None, 'bind', started_at)
+    """
+    now = time.perf_counter()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + now - started_at
+    return now
+
+
+def format_server_timing(timings: t.Mapping[str, float]) -> str:
+    """Format the phase timings as a ``Server-Timing`` header value.
+
+    Args:
+        timings (typing.Mapping[str, float]): The phase timings, in seconds.
+
+    Returns:
+        str: The header value, with the durations in milliseconds.
+
+    Examples:
+        >>> format_server_timing({'parse': 0.0001, 'view': 0.0025})
+        'parse;dur=0.100, view;dur=2.500'
+    """
+    return ', '.join(f'{phase};dur={duration * 1000:.3f}' for phase, duration in timings.items())
@@ -26,20 +26,31 @@
 # POSSIBILITY OF SUCH DAMAGE.
 from __future__ import annotations
 
+import time
+from types import GeneratorType, AsyncGeneratorType
 import typing as t
+import functools
 
 # Added in version 3.11.
 from typing_extensions import Self
 
-from flask import typing as ft, make_response
+from flask import typing as ft, request, make_response
 from flask.views import MethodView
 
+from flask_jsonrpc.conf import settings
 from flask_jsonrpc.site import JSONRPC_VERSION_DEFAULT, JSONRPC_DEFAULT_HTTP_HEADERS
+from flask_jsonrpc.signals import cache_checked, request_timed, request_finished
+from flask_jsonrpc.timings import record_timing, start_timings, format_server_timing
 from flask_jsonrpc.encoders import jsonify
-from flask_jsonrpc.exceptions import JSONRPCError
+from flask_jsonrpc.exceptions import ParseError, JSONRPCError
 
 if t.TYPE_CHECKING:
+    from flask import Response
+
+    from werkzeug.datastructures import Headers
+
     from flask_jsonrpc.site import JSONRPCSite
+    from flask_jsonrpc.codecs import Codec
 
 
 class JSONRPCView(MethodView):
@@ -61,15 +72,259 @@ class JSONRPCView(MethodView):
         If the request is successful, returns a JSON response with the result.
         If there is a JSON-RPC error, returns a JSON response with the error details.
 
+        While the :data:`~flask_jsonrpc.signals.request_timed` signal has receivers or the
+        ``SERVER_TIMING_HEADER`` setting is enabled, the phases of the request are timed, the
+        timings are sent with the signal and, if enabled, in the ``Server-Timing`` header.
+        While the :data:`~flask_jsonrpc.signals.request_finished` signal has receivers, it is
+        sent with the response and the duration of the request. The signals of a streamed
+        result are sent once it is streamed, and its ``Server-Timing`` header only has the
+        phases before the stream.
+
+        While the ``COMPRESSION_ENABLED`` setting is enabled, the response is compressed with the
+        content coding negotiated with the ``Accept-Encoding`` header, see :mod:`flask_jsonrpc.compression`.
+
+        Returns:
+            flask.typing.ResponseReturnValue: The Flask response object.
+        """
+        if not (settings.SERVER_TIMING_HEADER or request_timed.receivers or request_finished.receivers):
+            if settings.COMPRESSION_ENABLED:
+                return self.compress_response(make_response(self.make_jsonrpc_response(None)))
+            return self.make_jsonrpc_response(None)
+
+        started_at = time.perf_counter()
+        timings = start_timings()
+        rv = make_response(self.make_jsonrpc_response(timings))
+        if settings.COMPRESSION_ENABLED:
+            compress_started_at = time.perf_counter()
+            rv = self.compress_response(rv)
+            record_timing(timings, 'compress', compress_started_at)
+        record_timing(timings, 'total', started_at)
+        if settings.SERVER_TIMING_HEADER:
+            rv.headers.add('Server-Timing', format_server_timing(timings))
+        if rv.is_streamed:
+            from flask_jsonrpc.streaming import defer_until_streamed
+
+            if defer_until_streamed(functools.partial(self.finish_request, rv, timings, started_at)):
+                return rv
+        self.finish_request(rv, timings)
+        return rv
+
+    def finish_request(self: Self, rv: Response, timings: dict[str, float], started_at: float | None = None) -> None:
+        """Send the :data:`~flask_jsonrpc.signals.request_timed` and :data:`~flask_jsonrpc.signals.request_finished`
+        signals of a request.
+
+        Args:
+            rv (flask.Response): The response.
+            timings (dict[str, float]): The phase timings of the request.
+            started_at (float | None): The start of a streamed request, to time the ``total`` phase
+                once the response is streamed. Defaults to None.
+        """
+        if started_at is not None:
+            timings['total'] = time.perf_counter() - started_at
+        if request_timed.receivers:
+            request_timed.send(self.jsonrpc_site, timings=timings)
+        if request_finished.receivers:
+            request_finished.send(self.jsonrpc_site, response=rv, duration=timings['total'])
+
+    def get(self: Self) -> ft.ResponseReturnValue:
+        """Handle GET requests for the JSON-RPC methods registered with the ``idempotent=True``
+        or ``cacheable=<ttl>`` options.
+
+        The JSON-RPC request object is read from the query string (see
+        :meth:`~flask_jsonrpc.site.JSONRPCSite.from_query_string`) and the successful
+        responses carry the caching headers, see :meth:`make_cacheable_response`.
+
+        Returns:
+            flask.typing.ResponseReturnValue: The Flask response object.
+        """
+        return self.post()
+
+    def make_cacheable_response(self: Self, rv: Response, response: t.Any) -> Response:  # noqa: ANN401
+        """Add the caching headers to the response of a GET request.
+
+        The response of a method registered with ``cacheable=<ttl>`` can be stored by shared
+        caches for ``ttl`` seconds (``Cache-Control: public, max-age=<ttl>``), the other
+        responses must be revalidated on each use (``Cache-Control: no-cache``). The response
+        has an ``ETag`` header, and the conditional requests that match it are answered with a
+        ``304 Not Modified``. If the site has codecs, the response varies with the ``Accept``
+        header. The :data:`~flask_jsonrpc.signals.cache_checked` signal is sent with the outcome.
+
+        Args:
+            rv (flask.Response): The Flask response object.
+            response (typing.Any): The JSON-RPC response data.
+
+        Returns:
+            flask.Response: The Flask response object, with the caching headers.
+        """
+        if rv.status_code != 200 or not isinstance(response, dict) or 'error' in response:
+            return rv
+
+        method_name = request.args.get('method', '')
+        ttl = getattr(self.jsonrpc_site.view_funcs.get(method_name), 'jsonrpc_options', {}).get('cacheable')
+        if ttl is None:
+            rv.cache_control.no_cache = True
+        else:
+            rv.cache_control.public = True
+            rv.cache_control.max_age = int(ttl)
+        if self.jsonrpc_site.codecs:
+            rv.vary.add('Accept')
+        rv.add_etag()
+        rv.make_conditional(request)
+        if cache_checked.receivers:
+            cache_checked.send(self.jsonrpc_site, method_name=method_name, hit=rv.status_code == 304)
+        return rv
+
+    def compress_response(self: Self, response: Response) -> Response:
+        """Compress the response with the ``COMPRESSION_*`` settings.
+
+        Args:
+            response (flask.Response): The response to compress.
+
+        Returns:
+            flask.Response: The compressed response.
+        """
+        from flask_jsonrpc.compression import compress_response
+
+        return compress_response(
+            response,
+            request.accept_encodings,
+            encodings=settings.COMPRESSION_ENCODINGS,
+            min_size=settings.COMPRESSION_MIN_SIZE,
+            levels=settings.COMPRESSION_LEVELS,
+        )
+
+    def make_jsonrpc_response(self: Self, timings: dict[str, float] | None) -> ft.ResponseReturnValue:
+        """Dispatch the request to the JSON-RPC site and encode the response.
+
+        The response is encoded in JSON, or with the codec of the site that matches the
+        request (see :meth:`~flask_jsonrpc.site.JSONRPCSite.get_response_codec`). The
+        responses of the GET requests get the caching headers, and the generator results
+        are streamed, see :meth:`make_stream_response`. The NDJSON requests are pipelined
+        while the ``NDJSON_PIPELINE_ENABLED`` setting is enabled, see :meth:`make_pipeline_response`.
+
+        Args:
+            timings (dict[str, float] | None): The phase timings of the request, the
+                ``serialize`` phase is recorded into it.
+
         Returns:
             flask.typing.ResponseReturnValue: The Flask response object.
         """
+        if settings.NDJSON_PIPELINE_ENABLED and request.mimetype == 'application/x-ndjson':
+            return self.make_pipeline_response()
+        from flask_jsonrpc.streaming import run_stream_callbacks, start_stream_callbacks
+
+        codec = self.jsonrpc_site.get_response_codec()
+        streamed = False
+        start_stream_callbacks()
         try:
             response, status_code, headers = self.jsonrpc_site.dispatch_request()
             if status_code == 204:
                 return make_response('', status_code, headers)
-            return make_response(jsonify(response), status_code, headers)
+            if isinstance(response, bytes | bytearray):
+                # Pre-encoded JSON body, e.g. returned by a before request function
+                rv = make_response(response, status_code, headers)
+                rv.mimetype = 'application/json'
+                return rv
+            if (
+                codec is None
+                and isinstance(response, dict)
+                and isinstance(response.get('result'), GeneratorType | AsyncGeneratorType)
+            ):
+                rv = self.make_stream_response(response, status_code, headers)
+                streamed = True
+                return rv
+            started_at = time.perf_counter()
+            if codec is not None:
+                rv = self.make_codec_response(codec, response, status_code, headers)
+            else:
+                rv = make_response(jsonify(response), status_code, headers)
+            record_timing(timings, 'serialize', started_at)
+            if request.method == 'GET':
+                return self.make_cacheable_response(rv, response)
+            return rv
         except JSONRPCError as e:
             self.jsonrpc_site.logger.info('jsonrpc error', exc_info=e)
             response = {'id': None, 'jsonrpc': JSONRPC_VERSION_DEFAULT, 'error': e.jsonrpc_format}
+            if codec is not None:
+                return self.make_codec_response(codec, response, e.status_code, JSONRPC_DEFAULT_HTTP_HEADERS)
             return make_response(jsonify(response), e.status_code, JSONRPC_DEFAULT_HTTP_HEADERS)
+        finally:
+            if not streamed:
+                run_stream_callbacks()
+
+    def make_stream_response(
+        self: Self,
+        response: dict[str, t.Any],
+        status_code: int,
+        headers: Headers | dict[str, str] | tuple[str] | list[tuple[str]],
+    ) -> Response:
+        """Stream the response of a method that returned a generator or an async generator.
+
+        The result is streamed as a JSON array inside the ``result`` member, or as a sequence
+        of partial JSON-RPC responses when the ``Accept`` header prefers NDJSON
+        (``application/x-ndjson``) or Server-Sent Events (``text/event-stream``), see
+        :mod:`flask_jsonrpc.streaming`.
+
+        Args:
+            response (dict[str, typing.Any]): The JSON-RPC response data, with the streamed result.
+            status_code (int): The HTTP status code.
+            headers (werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]):
+                The HTTP headers.
+
+        Returns:
+            flask.Response: The streamed response.
+        """
+        from flask_jsonrpc.streaming import STREAM_MIMETYPES, STREAM_MIMETYPE_JSON, make_stream_response
+
+        mimetype = request.accept_mimetypes.best_match(STREAM_MIMETYPES, STREAM_MIMETYPE_JSON)
+        return make_stream_response(self.jsonrpc_site, response, status_code, headers, mimetype)
+
+    def make_pipeline_response(self: Self) -> Response:
+        """Dispatch a pipelined request, whose body has one JSON-RPC request per line (NDJSON).
+
+        The lines are read from the request stream and dispatched as they arrive, and the
+        responses are streamed back as NDJSON, one line each, see
+        :meth:`~flask_jsonrpc.site.JSONRPCSite.dispatch_pipeline`. The lines are limited
+        to the ``NDJSON_PIPELINE_MAX_LINE_SIZE`` setting, and the compressed requests are
+        rejected, as the lines are read as they arrive.
+
+        Returns:
+            flask.Response: The streamed NDJSON response, or a JSON-RPC error response (415)
+                if the request has a ``Content-Encoding`` header.
+        """
+        from flask_jsonrpc.streaming import read_lines, make_pipeline_response
+
+        content_encoding = request.headers.get('Content-Encoding')
+        if content_encoding and content_encoding.strip().lower() != 'identity':
+            self.jsonrpc_site.logger.info('unsupported content encoding: %s', content_encoding)
+            error = ParseError(
+                data={'message': f'Unsupported Content-Encoding for a pipelined request: {content_encoding}'},
+                status_code=415,
+            )
+            response = {'id': None, 'jsonrpc': JSONRPC_VERSION_DEFAULT, 'error': error.jsonrpc_format}
+            return make_response(jsonify(response), error.status_code, JSONRPC_DEFAULT_HTTP_HEADERS)
+        lines = read_lines(request.stream.readline, settings.NDJSON_PIPELINE_MAX_LINE_SIZE)
+        return make_pipeline_response(self.jsonrpc_site, lines)
+
+    def make_codec_response(
+        self: Self,
+        codec: Codec,
+        response: t.Any,  # noqa: ANN401
+        status_code: int,
+        headers: Headers | dict[str, str] | tuple[str] | list[tuple[str]],
+    ) -> Response:
+        """Encode the response with a codec.
+
+        Args:
+            codec (flask_jsonrpc.codecs.Codec): The codec of the response body.
+            response (typing.Any): The JSON-RPC response data.
+            status_code (int): The HTTP status code.
+            headers (werkzeug.datastructures.Headers | dict[str, str] | tuple[str] | list[tuple[str]]):
+                The HTTP headers.
+
+        Returns:
+            flask.Response: The Flask response object.
+        """
+        rv = make_response(codec.dumps(response), status_code, headers)
+        rv.mimetype = codec.mimetypes[0]
+        return rv
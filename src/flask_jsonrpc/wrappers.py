@@ -41,11 +41,12 @@ from typeguard import typechecked
 from werkzeug.utils import cached_property
 
 from flask_jsonrpc.conf import settings
-from flask_jsonrpc.types.methods import MethodAnnotatedType
 
 if t.TYPE_CHECKING:
     from flask_jsonrpc.site import JSONRPCSite
     from flask_jsonrpc.views import JSONRPCView
+    from flask_jsonrpc.codecs import Codec
+    from flask_jsonrpc.types.methods import MethodAnnotatedType
 
 
 class JSONRPCDecoratorMixin:
@@ -400,3 +401,154 @@ class JSONRPCDecoratorMixin:
             return fn
 
         return decorator
+
+    def register_before_request(self: Self, fn: t.Callable[[t.Any], t.Any]) -> None:
+        """Register a function to run before each request is dispatched.
+
+        Args:
+            fn (typing.Callable[[typing.Any], typing.Any]): The function to register, it receives the
+                decoded request data and may return a response to skip the dispatch.
+
+        Examples:
+            >>> from flask import Flask
+            >>> from flask_jsonrpc import JSONRPC
+            >>>
+            >>> app = Flask(__name__)
+            >>> jsonrpc = JSONRPC(app, path='/api', version='1.0.0')
+            >>>
+            >>> def check_request(req_json: Any) -> None:
+            ...     pass
+            >>>
+            >>> jsonrpc.register_before_request(check_request)
+        """
+        self.get_jsonrpc_site().register_before_request(fn)
+
+    def before_request(self: Self, fn: t.Callable[[t.Any], t.Any]) -> t.Callable[[t.Any], t.Any]:
+        """Decorator to register a function to run before each request is dispatched.
+
+        Args:
+            fn (typing.Callable[[typing.Any], typing.Any]): The function to register.
+
+        Returns:
+            typing.Callable[[typing.Any], typing.Any]: The registered function.
+
+        Examples:
+            >>> from flask import Flask
+            >>> from flask_jsonrpc import JSONRPC
+            >>>
+            >>> app = Flask(__name__)
+            >>> jsonrpc = JSONRPC(app, path='/api', version='1.0.0')
+            >>>
+            >>> @jsonrpc.before_request
+            ... def check_request(req_json: Any) -> None:
+            ...     pass
+        """
+        self.register_before_request(fn)
+        return fn
+
+    def register_teardown_request(self: Self, fn: t.Callable[[BaseException | None], None]) -> None:
+        """Register a function to run at the end of each request, even if an exception occurred.
+
+        Args:
+            fn (typing.Callable[[BaseException | None], None]): The function to register.
+
+        Examples:
+            >>> from flask import Flask
+            >>> from flask_jsonrpc import JSONRPC
+            >>>
+            >>> app = Flask(__name__)
+            >>> jsonrpc = JSONRPC(app, path='/api', version='1.0.0')
+            >>>
+            >>> def release_resources(exc: BaseException | None) -> None:
+            ...     pass
+            >>>
+            >>> jsonrpc.register_teardown_request(release_resources)
+        """
+        self.get_jsonrpc_site().register_teardown_request(fn)
+
+    def teardown_request(
+        self: Self, fn: t.Callable[[BaseException | None], None]
+    ) -> t.Callable[[BaseException | None], None]:
+        """Decorator to register a function to run at the end of each request.
+
+        Args:
+            fn (typing.Callable[[BaseException | None], None]): The function to register.
+
+        Returns:
+            typing.Callable[[BaseException | None], None]: The registered function.
+
+        Examples:
+            >>> from flask import Flask
+            >>> from flask_jsonrpc import JSONRPC
+            >>>
+            >>> app = Flask(__name__)
+            >>> jsonrpc = JSONRPC(app, path='/api', version='1.0.0')
+            >>>
+            >>> @jsonrpc.teardown_request
+            ... def release_resources(exc: BaseException | None) -> None:
+            ...     pass
+        """
+        self.register_teardown_request(fn)
+        return fn
+
+    def register_before_dispatch(self: Self, fn: t.Callable[[dict[str, t.Any]], None]) -> None:
+        """Register a function to run before each JSON-RPC request object is dispatched.
+
+        Args:
+            fn (typing.Callable[[dict[str, typing.Any]], None]): The function to register, it receives
+                each request object, including each element of a batch, and may raise a JSON-RPC error
+                to reject it.
+
+        Examples:
+            >>> from flask import Flask
+            >>> from flask_jsonrpc import JSONRPC
+            >>>
+            >>> app = Flask(__name__)
+            >>> jsonrpc = JSONRPC(app, path='/api', version='1.0.0')
+            >>>
+            >>> def check_call(req_json: dict[str, Any]) -> None:
+            ...     pass
+            >>>
+            >>> jsonrpc.register_before_dispatch(check_call)
+        """
+        self.get_jsonrpc_site().register_before_dispatch(fn)
+
+    def before_dispatch(self: Self, fn: t.Callable[[dict[str, t.Any]], None]) -> t.Callable[[dict[str, t.Any]], None]:
+        """Decorator to register a function to run before each JSON-RPC request object is dispatched.
+
+        Args:
+            fn (typing.Callable[[dict[str, typing.Any]], None]): The function to register.
+
+        Returns:
+            typing.Callable[[dict[str, typing.Any]], None]: The registered function.
+
+        Examples:
+            >>> from flask import Flask
+            >>> from flask_jsonrpc import JSONRPC
+            >>>
+            >>> app = Flask(__name__)
+            >>> jsonrpc = JSONRPC(app, path='/api', version='1.0.0')
+            >>>
+            >>> @jsonrpc.before_dispatch
+            ... def check_call(req_json: dict[str, Any]) -> None:
+            ...     pass
+        """
+        self.register_before_dispatch(fn)
+        return fn
+
+    def register_codec(self: Self, codec: Codec) -> None:
+        """Register a codec for the request and response bodies, other than JSON.
+
+        Args:
+            codec (flask_jsonrpc.codecs.Codec): The codec to register.
+
+        Examples:
+            >>> from flask import Flask
+            >>> from flask_jsonrpc import JSONRPC
+            >>> from flask_jsonrpc.codecs import MessagePackCodec
+            >>>
+            >>> app = Flask(__name__)
+            >>> jsonrpc = JSONRPC(app, path='/api', version='1.0.0')
+            >>> jsonrpc.register_codec(MessagePackCodec())
+        """
+        self.get_jsonrpc_site().register_codec(codec)
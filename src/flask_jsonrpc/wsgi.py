@@ -0,0 +1,252 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+from types import GeneratorType, AsyncGeneratorType
+import typing as t
+
+# Added in version 3.11.
+from typing_extensions import Self
+
+from flask import request
+
+from werkzeug.http import HTTP_STATUS_CODES
+from werkzeug.datastructures import Headers
+
+from flask_jsonrpc.conf import settings
+from flask_jsonrpc.site import JSONRPC_VERSION_DEFAULT, JSONRPC_DEFAULT_HTTP_HEADERS
+from flask_jsonrpc.views import JSONRPCView
+from flask_jsonrpc.signals import request_timed, request_finished
+from flask_jsonrpc.encoders import dumps_response
+from flask_jsonrpc.streaming import (
+    STREAM_MIMETYPES,
+    STREAM_MIMETYPE_JSON,
+    make_stream_response,
+    run_stream_callbacks,
+    start_stream_callbacks,
+)
+from flask_jsonrpc.exceptions import JSONRPCError
+
+if t.TYPE_CHECKING:
+    from flask import Flask, Response
+
+    from _typeshed.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
+
+    from flask_jsonrpc.app import JSONRPC
+    from flask_jsonrpc.site import JSONRPCSite
+
+JSONRPC_LEAN_HTTP_HEADERS: list[tuple[str, str]] = [('Content-Type', 'application/json')]
+
+
+class JSONRPCWSGIApp:
+    """WSGI middleware that serves the JSON-RPC requests without the Flask view machinery.
+
+    The ``POST`` requests to the path of a JSON-RPC site are dispatched directly with
+    :meth:`~flask_jsonrpc.site.JSONRPCSite.dispatch_request`, inside a Flask request
+    context, so :data:`~flask.current_app`, :data:`~flask.request` and :data:`~flask.g`
+    can still be used by the methods, but without the URL dispatch, the
+    :class:`~flask.views.MethodView` instance, :func:`~flask.make_response` and
+    :func:`~flask.jsonify`: the response body is written as bytes, with a pre-built
+    header list. The teardown request functions of the Flask application still run.
+
+    The other requests are passed to the wrapped WSGI application, as well as the JSON-RPC
+    requests that need the full path: while the ``COMPRESSION_ENABLED`` or
+    ``SERVER_TIMING_HEADER`` settings are enabled, the
+    :data:`~flask_jsonrpc.signals.request_timed` or
+    :data:`~flask_jsonrpc.signals.request_finished` signals have receivers, or the Flask
+    application has before or after request functions. A response is still built, to save
+    the session, if the methods used it. The Flask ``request_started`` and
+    ``request_finished`` signals are not sent for the requests served by the middleware.
+    The sites served with a custom view class, or with the view ``decorators``, e.g. for
+    the authentication, are always passed to the wrapped application.
+
+    Args:
+        app (flask.Flask): The Flask application instance.
+        jsonrpc_app (flask_jsonrpc.app.JSONRPC): The JSON-RPC application instance.
+
+    Attributes:
+        app (flask.Flask): The Flask application instance.
+        wsgi_app (WSGIApplication): The wrapped WSGI application.
+        jsonrpc_sites (dict[str, flask_jsonrpc.site.JSONRPCSite]): The JSON-RPC sites served by the
+            middleware, by URL path.
+
+    Examples:
+        >>> from flask import Flask
+        >>> from flask_jsonrpc import JSONRPC
+        >>> from flask_jsonrpc.wsgi import JSONRPCWSGIApp
+        >>>
+        >>> app = Flask(__name__)
+        >>> jsonrpc = JSONRPC(app, '/api')
+        >>>
+        >>> # Disable automatic validation for typechecking limitations with doctests
+        >>> # We always recommend to use validation in real applications
+        >>> @jsonrpc.method('app.index', validate=False)
+        ... def index() -> str:
+        ...     return 'Welcome to Flask JSON-RPC'
+        >>>
+        >>> app.wsgi_app = JSONRPCWSGIApp(app, jsonrpc)  # type: ignore[method-assign]
+        >>> rv = app.test_client().post(
+        ...     '/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.index'}
+        ... )
+        >>> rv.data
+        b'{"id":1,"jsonrpc":"2.0","result":"Welcome to Flask JSON-RPC"}\\n'
+    """
+
+    def __init__(self: Self, app: Flask, jsonrpc_app: JSONRPC) -> None:
+        self.app = app
+        self.wsgi_app: WSGIApplication = app.wsgi_app
+        self.jsonrpc_sites: dict[str, JSONRPCSite] = {
+            jsonrpc_site.path: jsonrpc_site
+            for jsonrpc_site, jsonrpc_site_api in [(jsonrpc_app.get_jsonrpc_site(), jsonrpc_app.get_jsonrpc_site_api())]
+            + [(japp.get_jsonrpc_site(), japp.get_jsonrpc_site_api()) for japp in jsonrpc_app.jsonrpc_apps]
+            if jsonrpc_site.path is not None and jsonrpc_site_api is JSONRPCView and not jsonrpc_site_api.decorators
+        }
+
+    def __call__(self: Self, environ: WSGIEnvironment, start_response: StartResponse) -> t.Iterable[bytes]:
+        """Handle a WSGI request, see :meth:`flask.Flask.wsgi_app`.
+
+        Args:
+            environ (WSGIEnvironment): The WSGI environment.
+            start_response (StartResponse): The WSGI ``start_response`` callable.
+
+        Returns:
+            typing.Iterable[bytes]: The response body.
+        """
+        jsonrpc_site = self.jsonrpc_sites.get(environ.get('PATH_INFO', ''))
+        if jsonrpc_site is None or not self.is_lean_request(jsonrpc_site, environ):
+            return self.wsgi_app(environ, start_response)
+
+        ctx = self.app.request_context(environ)
+        error: BaseException | None = None
+        try:
+            try:
+                ctx.push()
+                rv = self.dispatch_request(jsonrpc_site)
+                # The request context property of Flask >= 3.1 marks the session as accessed
+                session = vars(ctx).get('_session', vars(ctx).get('session'))
+                if isinstance(rv, tuple) and getattr(session, 'accessed', False):
+                    status, headers, body = rv
+                    rv = self.app.process_response(self.app.response_class(body, status, headers))
+            except Exception as e:
+                try:
+                    rv = self.app.make_response(self.app.handle_user_exception(e))
+                except Exception as ex:
+                    error = ex
+                    rv = self.app.handle_exception(ex)
+            except BaseException as e:
+                error = e
+                raise
+            if isinstance(rv, tuple):
+                status, headers, body = rv
+                start_response(status, headers)
+                return [body]
+            return rv(environ, start_response)
+        finally:
+            if error is not None and self.app.should_ignore_error(error):
+                error = None
+            ctx.pop(error)
+
+    def is_lean_request(self: Self, jsonrpc_site: JSONRPCSite, environ: WSGIEnvironment) -> bool:
+        """Check if a request to a JSON-RPC site can be served by the middleware.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+            environ (WSGIEnvironment): The WSGI environment.
+
+        Returns:
+            bool: True if the request is served by the middleware, False if it is passed to the wrapped application.
+        """
+        if environ.get('REQUEST_METHOD') != 'POST':
+            return False
+        if (
+            settings.COMPRESSION_ENABLED
+            or settings.SERVER_TIMING_HEADER
+            or request_timed.receivers
+            or request_finished.receivers
+            or self.app.before_request_funcs.get(None)
+            or self.app.after_request_funcs.get(None)
+        ):
+            return False
+        mimetype = environ.get('CONTENT_TYPE', '').partition(';')[0].strip().lower()
+        return jsonrpc_site.is_json_mimetype(mimetype) or mimetype in jsonrpc_site.codecs
+
+    def dispatch_request(self: Self, jsonrpc_site: JSONRPCSite) -> tuple[str, list[tuple[str, str]], bytes] | Response:
+        """Dispatch the request to the JSON-RPC site and encode the response, see
+        :meth:`~flask_jsonrpc.views.JSONRPCView.make_jsonrpc_response`.
+
+        Args:
+            jsonrpc_site (flask_jsonrpc.site.JSONRPCSite): The JSON-RPC site.
+
+        Returns:
+            tuple[str, list[tuple[str, str]], bytes] | flask.Response: The status, headers and body of the
+                response, or a Flask response for the streamed results.
+        """
+        codec = jsonrpc_site.get_response_codec() if jsonrpc_site.codecs else None
+        start_stream_callbacks()
+        try:
+            try:
+                response, status_code, headers = jsonrpc_site.dispatch_request()
+            except JSONRPCError as e:
+                jsonrpc_site.logger.info('jsonrpc error', exc_info=e)
+                response = {'id': None, 'jsonrpc': JSONRPC_VERSION_DEFAULT, 'error': e.jsonrpc_format}
+                status_code, headers = e.status_code, JSONRPC_DEFAULT_HTTP_HEADERS
+
+            wsgi_headers = JSONRPC_LEAN_HTTP_HEADERS
+            if status_code == 204:
+                body, wsgi_headers = b'', []
+            elif isinstance(response, bytes | bytearray):
+                # Pre-encoded JSON body, e.g. returned by a before request function
+                body = bytes(response)
+            elif codec is not None:
+                body, wsgi_headers = codec.dumps(response), [('Content-Type', codec.mimetypes[0])]
+            elif isinstance(response, dict) and isinstance(response.get('result'), GeneratorType | AsyncGeneratorType):
+                mimetype = request.accept_mimetypes.best_match(STREAM_MIMETYPES, STREAM_MIMETYPE_JSON)
+                return make_stream_response(jsonrpc_site, response, status_code, headers, mimetype)
+            else:
+                body = self.dumps(response)
+        except BaseException:
+            run_stream_callbacks()
+            raise
+        run_stream_callbacks()
+
+        wsgi_headers = [*wsgi_headers, ('Content-Length', str(len(body)))]
+        if headers:
+            hdrs = Headers(wsgi_headers)
+            hdrs.update([headers] if isinstance(headers, tuple) else headers)  # type: ignore
+            wsgi_headers = hdrs.to_wsgi_list()
+        return f'{status_code} {HTTP_STATUS_CODES.get(status_code, "UNKNOWN").upper()}', wsgi_headers, body
+
+    def dumps(self: Self, obj: t.Any) -> bytes:  # noqa: ANN401
+        """Encode the response data in JSON, see :func:`~flask_jsonrpc.encoders.dumps_response`.
+
+        Args:
+            obj (typing.Any): The response data.
+
+        Returns:
+            bytes: The JSON body.
+        """
+        return dumps_response(obj, self.app).encode()
@@ -0,0 +1,237 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import time
+import threading
+import concurrent.futures
+
+from flask import Flask
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.contrib.admission import AdmissionControl
+
+
+def test_admission_create() -> None:
+    app = Flask('test_admission', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    admission = AdmissionControl(app, jsonrpc, max_in_flight=2, max_latency=0.5)
+
+    @jsonrpc.method('app.fn1')
+    def fn1(s: str) -> str:
+        assert admission.in_flight == 1
+        return f'Foo {s}'
+
+    assert admission.max_in_flight == 2
+    assert admission.max_latency == 0.5
+    assert admission.min_in_flight == 1
+    assert admission.retry_after == 1
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Foo :)'}
+        assert rv.status_code == 200
+
+        rv = client.post('/api', json=[{'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':P']}])
+        assert rv.json == [{'id': 1, 'jsonrpc': '2.0', 'result': 'Foo :P'}]
+        assert rv.status_code == 200
+
+        rv = client.post('/api', data='{"id": 1, "jsonrpc": "2.0",', content_type='application/json')
+        assert rv.json['error']['name'] == 'ParseError'
+        assert rv.status_code == 400
+
+    assert admission.in_flight == 0
+    assert admission.rejected == 0
+    assert 0 < admission.latency < 0.5
+
+
+def test_admission_max_in_flight() -> None:
+    app = Flask('test_admission', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    admission = AdmissionControl(app, jsonrpc, max_in_flight=1, retry_after=5)
+
+    @jsonrpc.method('app.fn1')
+    def fn1(s: str) -> str:
+        return f'Foo {s}'
+
+    @jsonrpc.method('app.health', critical=True)
+    def health() -> str:
+        return 'OK'
+
+    admission.in_flight = 1
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']})
+        assert rv.json == {
+            'id': None,
+            'jsonrpc': '2.0',
+            'error': {'code': -32001, 'data': None, 'message': 'Server overloaded', 'name': 'ServerOverloadedError'},
+        }
+        assert rv.status_code == 503
+        assert rv.headers['Retry-After'] == '5'
+        assert rv.mimetype == 'application/json'
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.health'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'OK'}
+        assert rv.status_code == 200
+
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.health'},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']},
+            ],
+        )
+        assert rv.json['error']['code'] == -32001
+        assert rv.status_code == 503
+
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.health'},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.health'},
+            ],
+        )
+        assert rv.json == [{'id': 1, 'jsonrpc': '2.0', 'result': 'OK'}, {'id': 2, 'jsonrpc': '2.0', 'result': 'OK'}]
+        assert rv.status_code == 200
+
+        rv = client.post('/api', json=[])
+        assert rv.json['error']['code'] == -32001
+        assert rv.status_code == 503
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': ['app.health']})
+        assert rv.json['error']['code'] == -32001
+        assert rv.status_code == 503
+
+    assert admission.in_flight == 1
+    assert admission.rejected == 4
+
+
+def test_admission_max_in_flight_concurrent() -> None:
+    app = Flask('test_admission', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    admission = AdmissionControl(app, jsonrpc, max_in_flight=2)
+    barrier = threading.Barrier(8)
+    release = threading.Event()
+    peak: list[int] = []
+
+    @jsonrpc.method('app.wait')
+    def wait() -> str:
+        peak.append(admission.in_flight)
+        release.wait(5)
+        return 'OK'
+
+    def call() -> int:
+        barrier.wait()
+        with app.test_client() as client:
+            return client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.wait'}).status_code
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(call) for _ in range(8)]
+        deadline = time.monotonic() + 5
+        while admission.rejected + len(peak) < 8 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        status_codes = sorted(future.result() for future in futures)
+
+    assert status_codes == [200, 200, 503, 503, 503, 503, 503, 503]
+    assert max(peak) <= 2
+    assert admission.in_flight == 0
+    assert admission.rejected == 6
+
+
+def test_admission_max_latency() -> None:
+    app = Flask('test_admission', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    admission = AdmissionControl(app, jsonrpc, max_latency=0.5, min_in_flight=1)
+
+    @jsonrpc.method('app.fn1')
+    def fn1(s: str) -> str:
+        return f'Foo {s}'
+
+    admission.latency = 10.0
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Foo :)'}
+        assert rv.status_code == 200
+        assert admission.latency < 10.0
+
+        admission.latency = 10.0
+        admission.in_flight = 1
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']})
+        assert rv.json['error']['code'] == -32001
+        assert rv.status_code == 503
+
+    assert admission.rejected == 1
+
+
+def test_admission_without_thresholds() -> None:
+    app = Flask('test_admission', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    admission = AdmissionControl(app, jsonrpc)
+
+    @jsonrpc.method('app.fn1')
+    def fn1(s: str) -> str:
+        return f'Foo {s}'
+
+    admission.in_flight = 1000
+    admission.latency = 1000.0
+    assert admission.is_overloaded() is False
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Foo :)'}
+        assert rv.status_code == 200
+
+
+def test_admission_create_with_blueprint() -> None:
+    app = Flask('test_admission', instance_relative_config=True)
+    user = JSONRPCBlueprint('user', __name__)
+
+    @user.method('user.index')
+    def user_index() -> str:
+        return 'Welcome to user'
+
+    @user.method('user.health', critical=True)
+    def user_health() -> str:
+        return 'OK'
+
+    jsonrpc = JSONRPC(app, '/api')
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    admission = AdmissionControl()
+    admission.init_app(app, jsonrpc)
+    admission.max_in_flight = 1
+
+    with app.test_client() as client:
+        rv = client.post('/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Welcome to user'}
+        assert rv.status_code == 200
+
+        admission.in_flight = 1
+        rv = client.post('/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'})
+        assert rv.json['error']['code'] == -32001
+        assert rv.status_code == 503
+
+        rv = client.post('/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.health'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'OK'}
+        assert rv.status_code == 200
@@ -0,0 +1,257 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+import tracemalloc
+
+from flask import Flask
+
+import pytest
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.site import JSONRPCSite
+from flask_jsonrpc.contrib.bench import (
+    Scenario,
+    WSGIRequest,
+    BenchmarkResults,
+    summarize,
+    machine_info,
+    method_params,
+    measure_memory,
+    run_benchmarks,
+    compare_results,
+    discover_scenarios,
+)
+import flask_jsonrpc.types.methods as tm
+
+
+def create_app() -> Flask:
+    app = Flask('test_bench', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    user = JSONRPCBlueprint('user', __name__)
+
+    @jsonrpc.method('app.index')
+    def index(name: str = 'Flask') -> str:
+        return f'Welcome to {name}'
+
+    @jsonrpc.method(
+        'app.greeting',
+        tm.MethodAnnotated[
+            tm.Example(name='first', params=[tm.ExampleField(name='name', value='First')]),
+            tm.Example(name='default', params=[tm.ExampleField(name='name', value='Default')]),
+        ],
+    )
+    def greeting(name: str) -> str:
+        return f'Hello {name}'
+
+    @jsonrpc.method('app.echo', tm.MethodAnnotated[tm.Example(name='echo', params=[])])
+    def echo(s: str) -> str:
+        return s
+
+    @jsonrpc.method('app.sum')
+    def sum_(a: int, b: int) -> int:
+        return a + b
+
+    @user.method('user.index')
+    def user_index() -> str:
+        return 'Welcome to user'
+
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    jsonrpc_v2 = JSONRPC(app, '/v2')
+
+    @jsonrpc_v2.method('v2.index')
+    def v2_index() -> str:
+        return 'Welcome to v2'
+
+    return app
+
+
+def test_wsgi_request() -> None:
+    app = create_app()
+
+    request = WSGIRequest(app, Scenario('index', {'jsonrpc': '2.0', 'method': 'app.index', 'id': 1}))
+    assert request() == b'{"id":1,"jsonrpc":"2.0","result":"Welcome to Flask"}\n'
+    assert request.status_code == 200
+    request.check()
+
+    request = WSGIRequest(app, Scenario('missing', {'jsonrpc': '2.0', 'method': 'app.missing', 'id': 1}))
+    with pytest.raises(ValueError, match='unexpected HTTP 400 response'):
+        request.check()
+
+    request = WSGIRequest(
+        app, Scenario('missing', {'jsonrpc': '2.0', 'method': 'app.missing', 'id': 1}, status_code=400)
+    )
+    request.check()
+
+
+def test_summarize_and_machine_info() -> None:
+    assert summarize([0.5]) == {
+        'rounds': 1,
+        'min': 0.5,
+        'max': 0.5,
+        'mean': 0.5,
+        'median': 0.5,
+        'stddev': 0.0,
+        'p95': 0.5,
+        'p99': 0.5,
+        'ops': 2.0,
+    }
+    assert summarize([0.0])['ops'] == 0.0
+
+    info = machine_info(['Flask', 'not-a-package-flask-jsonrpc'])
+    assert info['python_version']
+    assert info['Flask']
+    assert info['not-a-package-flask-jsonrpc'] == 'not installed'
+
+
+def test_discover_scenarios(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = create_app()
+    describe = JSONRPCSite.describe
+    described: list[JSONRPCSite] = []
+
+    def count_describe(self: JSONRPCSite) -> t.Any:  # noqa: ANN401
+        described.append(self)
+        return describe(self)
+
+    monkeypatch.setattr(JSONRPCSite, 'describe', count_describe)
+
+    scenarios, skipped = discover_scenarios(app)
+    assert len(described) == 3
+    assert scenarios == [
+        Scenario('app.index', {'jsonrpc': '2.0', 'method': 'app.index', 'id': 1}, path='/api', group='/api'),
+        Scenario(
+            'app.greeting',
+            {'jsonrpc': '2.0', 'method': 'app.greeting', 'id': 1, 'params': {'name': 'Default'}},
+            path='/api',
+            group='/api',
+        ),
+        Scenario('app.echo', {'jsonrpc': '2.0', 'method': 'app.echo', 'id': 1}, path='/api', group='/api'),
+        Scenario(
+            'user.index', {'jsonrpc': '2.0', 'method': 'user.index', 'id': 1}, path='/api/user', group='/api/user'
+        ),
+        Scenario('v2.index', {'jsonrpc': '2.0', 'method': 'v2.index', 'id': 1}, path='/v2', group='/v2'),
+    ]
+    assert skipped == [{'name': 'app.sum', 'reason': 'no example for the required params'}]
+
+    scenarios, _ = discover_scenarios(app, include_rpc=True)
+    assert [scenario.name for scenario in scenarios if scenario.name.startswith('rpc.')] == [
+        'rpc.describe',
+        'rpc.describe',
+        'rpc.describe',
+    ]
+
+    assert discover_scenarios(Flask('test_bench')) == ([], [])
+
+    jsonrpc_site = app.extensions['jsonrpc'][0].get_jsonrpc_site()
+    assert method_params(jsonrpc_site, 'app.greeting') == {'name': 'Default'}
+
+
+def test_run_benchmarks(tmp_path: Path) -> None:
+    app = create_app()
+    scenarios, _ = discover_scenarios(app)
+
+    results = run_benchmarks(app, scenarios, rounds=3, warmup=1, keyword='index')
+    assert [benchmark['name'] for benchmark in results.benchmarks] == ['app.index', 'user.index', 'v2.index']
+    assert results.benchmarks[0]['group'] == '/api'
+    assert results.benchmarks[0]['stats']['rounds'] == 3
+    assert results.machine_info['Flask-JSONRPC']
+    assert results.datetime
+
+    results = run_benchmarks(app, scenarios, rounds=2, warmup=0, keyword='/api')
+    assert [benchmark['name'] for benchmark in results.benchmarks] == ['app.index', 'app.greeting', 'user.index']
+    assert results.skipped[0]['name'] == 'app.echo'
+    assert results.skipped[0]['reason'].startswith('unexpected HTTP 400 response')
+
+    path = tmp_path / 'results.json'
+    results.save(str(path))
+    assert BenchmarkResults.load(str(path)) == results
+
+
+def test_measure_memory() -> None:
+    app = create_app()
+    scenarios, _ = discover_scenarios(app)
+
+    results = run_benchmarks(app, scenarios, rounds=3, warmup=1, keyword='app.index', memory=True)
+    stats = results.benchmarks[0]['stats']
+    assert set(stats) == {'rounds', 'peak', 'retained'}
+    assert stats['rounds'] == 3
+    assert stats['peak'] > 0
+
+    leaks: list[bytearray] = []
+    tracemalloc.start()
+    try:
+        stats = measure_memory(lambda: leaks.append(bytearray(100_000)), rounds=4, warmup=1)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert stats['peak'] >= 100_000
+    assert stats['retained'] >= 100_000
+    assert len(leaks) == 5
+
+    stats = measure_memory(lambda: bytearray(100_000), rounds=4)
+    assert stats['peak'] >= 100_000
+    assert stats['retained'] < 1024
+    assert not tracemalloc.is_tracing()
+
+
+def test_compare_results() -> None:
+    def results(**medians: float) -> BenchmarkResults:
+        return BenchmarkResults(
+            benchmarks=[{'name': name, 'stats': {'median': m, 'p99': m}} for name, m in medians.items()]
+        )
+
+    comparisons = compare_results(
+        results(fast=0.8, slow=1.2, same=1.05, zero=0.1, new=1.0),
+        results(fast=1.0, slow=1.0, same=1.0, zero=0.0, gone=1.0),
+        tolerance=0.1,
+    )
+    assert [(comparison.name, comparison.status) for comparison in comparisons] == [
+        ('fast', 'improved'),
+        ('slow', 'regressed'),
+        ('same', 'unchanged'),
+        ('zero', 'unchanged'),
+        ('new', 'new'),
+        ('gone', 'missing'),
+    ]
+    assert comparisons[1].baseline == 1.0
+    assert comparisons[1].current == 1.2
+    assert comparisons[1].change == pytest.approx(0.2)
+    assert comparisons[5].baseline == 1.0
+    assert comparisons[5].current is None
+
+    comparisons = compare_results(results(slow=1.2), results(slow=1.0), tolerance=0.5, stat='p99')
+    assert comparisons[0].status == 'unchanged'
+
+    memory = BenchmarkResults(benchmarks=[{'name': 'slow', 'stats': {'peak': 2048, 'retained': 0.0}}])
+    assert [comparison.status for comparison in compare_results(memory, results(slow=1.0), stat='peak')] == ['new']
+    assert [comparison.status for comparison in compare_results(results(slow=1.0), memory, stat='peak')] == ['missing']
+    assert compare_results(memory, memory, stat='retained')[0].status == 'unchanged'
+
+    with pytest.raises(ValueError, match="unknown statistic 'p42'"):
+        compare_results(results(), results(), stat='p42')
@@ -0,0 +1,143 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import socket
+
+from flask import Flask, request
+
+import pytest
+
+from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.contrib.bench import Scenario
+from flask_jsonrpc.contrib.bench.load import LoadClient, LoadTestResults, start_server, run_load_test, build_workload
+
+
+def call(method: str, path: str = '/api') -> Scenario:
+    return Scenario(method, {'jsonrpc': '2.0', 'method': method, 'id': 1}, path=path, group=path)
+
+
+def test_build_workload() -> None:
+    scenarios = [call('app.a'), call('app.b'), call('v2.a', '/v2'), Scenario('batch', [call('app.a').payload])]
+
+    assert build_workload(scenarios) == scenarios[:3]
+    batches = build_workload(scenarios, 'batch', batch_size=3)
+    assert batches == [
+        Scenario(
+            'batch[/api]',
+            [
+                {'jsonrpc': '2.0', 'method': 'app.a', 'id': 1},
+                {'jsonrpc': '2.0', 'method': 'app.b', 'id': 2},
+                {'jsonrpc': '2.0', 'method': 'app.a', 'id': 3},
+            ],
+            path='/api',
+            group='batch',
+        ),
+        Scenario(
+            'batch[/v2]', [{'jsonrpc': '2.0', 'method': 'v2.a', 'id': i} for i in (1, 2, 3)], path='/v2', group='batch'
+        ),
+    ]
+    assert build_workload(scenarios, 'mixed', batch_size=3) == scenarios[:3] + batches
+
+    with pytest.raises(ValueError, match="unknown workload 'random'"):
+        build_workload(scenarios, 'random')
+
+
+def test_load_test_results() -> None:
+    results = LoadTestResults(workload='single', clients=1)
+    assert results.throughput == 0.0
+    assert results.calls_throughput == 0.0
+    assert results.percentiles() == {}
+
+    results = LoadTestResults(
+        workload='single', clients=1, requests=4, calls=8, duration=2.0, latencies=[0.1, 0.2, 0.3, 0.4]
+    )
+    assert results.to_dict() == {
+        'machine_info': {},
+        'workload': 'single',
+        'clients': 1,
+        'requests': 4,
+        'calls': 8,
+        'errors': 0,
+        'duration': 2.0,
+        'throughput': 2.0,
+        'calls_throughput': 4.0,
+        'latency': {'p50': 0.2, 'p90': 0.4, 'p99': 0.4, 'p99.9': 0.4},
+    }
+
+
+def test_run_load_test() -> None:
+    app = Flask('test_load', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    client_ports: set[str] = set()
+
+    @jsonrpc.method('app.index')
+    def index() -> str:
+        client_ports.add(request.environ['REMOTE_PORT'])
+        return 'Welcome to Flask JSON-RPC'
+
+    results = run_load_test(app, [call('app.index')], clients=3, requests=5, warmup=0)
+    assert results.workload == 'single'
+    assert results.clients == 3
+    assert results.requests == 15
+    assert results.calls == 15
+    assert results.errors == 0
+    assert len(results.latencies) == 15
+    assert results.latencies == sorted(results.latencies)
+    assert results.duration > 0
+    assert results.machine_info['Flask-JSONRPC']
+    assert len(client_ports) == 3
+
+    results = run_load_test(app, [call('app.index'), call('app.missing')], workload='mixed', clients=2, requests=6)
+    assert results.requests == 12
+    assert results.calls == 4 * 1 + 4 * 1 + 4 * 10
+    assert results.errors == 4
+
+    with pytest.raises(ValueError, match='no requests to send'):
+        run_load_test(app, [], clients=1, requests=1)
+
+
+def test_server_and_client_errors() -> None:
+    server = start_server(Flask('test_load'))
+    host, port = server.server_address[:2]
+    try:
+        with socket.create_connection((host, port)) as sock:
+            sock.sendall(b'x' * 65537 + b'\r\n')
+            assert sock.recv(1024) == b''
+
+        with socket.create_connection((host, port)) as sock:
+            sock.sendall(b'NOT A REQUEST\r\n\r\n')
+            assert b'Error code: 400' in sock.makefile('rb').read()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    client = LoadClient(str(host), port, [call('app.index')], requests=2, timeout=1.0)
+    client.run()
+    assert client.sent == 2
+    assert client.errors == 2
+    assert client.latencies == []
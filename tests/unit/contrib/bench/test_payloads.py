@@ -0,0 +1,341 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import re
+import enum
+import typing as t
+import collections
+from dataclasses import dataclass
+
+import annotated_types
+
+from flask import Flask
+
+from pydantic import Field, BaseModel
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.typing import Field as DescribeField
+import flask_jsonrpc.types.params as tp
+from flask_jsonrpc.contrib.bench import WSGIRequest
+import flask_jsonrpc.types.methods as tm
+from flask_jsonrpc.contrib.bench.payloads import (
+    Constraints,
+    PayloadGenerator,
+    is_optional,
+    get_object_fields,
+    generate_scenarios,
+)
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class PetModel(BaseModel):
+    name: str = Field(min_length=1, max_length=8, pattern=r'^[a-z]+$')
+    age: int = Field(ge=0, lt=20)
+    tag: str | None = None
+
+
+@dataclass
+class Car:
+    name: str
+    year: int
+
+
+class UserDict(t.TypedDict):
+    name: str
+    tags: list[str]
+
+
+class Point(t.NamedTuple):
+    x: int
+    y: int
+
+
+class Engine:
+    def __init__(self, power: int, fuel: str) -> None:
+        self.power = power
+        self.fuel = fuel
+
+
+class Opaque:
+    pass
+
+
+def create_app() -> Flask:
+    app = Flask('test_payloads', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    user = JSONRPCBlueprint('user', __name__)
+
+    @jsonrpc.method('app.numbers')
+    def numbers(
+        n: t.Annotated[int, tp.Minimum(3), tp.Maximum(9)],
+        f: t.Annotated[float, tp.Minimum(0), tp.Maximum(1), tp.DecimalPlaces(2)],
+        m: t.Annotated[int, tp.MultipleOf(5)] = 10,
+    ) -> float:
+        return n + f + m
+
+    @jsonrpc.method('app.strings')
+    def strings(
+        code: t.Annotated[str, tp.Pattern(r'^[A-Z]{2}-\d{3}$')],
+        name: t.Annotated[str, tp.MinLength(2), tp.MaxLength(5)],
+        note: t.Annotated[str, tp.Required(True)],
+    ) -> str:
+        return f'{code} {name} {note}'
+
+    @jsonrpc.method('app.choices')
+    def choices(size: t.Literal['s', 'm', 'l'], flag: bool, count: int | None) -> str:
+        return f'{size} {flag} {count}'
+
+    @jsonrpc.method('app.collections')
+    def collections_(
+        items: t.Annotated[list[int], tp.Required(True), tp.MaxLength(4)],
+        scores: tuple[float, ...],
+        labels: t.Annotated[list[str] | None, tp.Nullable(False)] = None,
+    ) -> int:
+        return len(items) + len(scores) + len(labels or [])
+
+    @jsonrpc.method('app.pet')
+    def pet(pet: PetModel) -> str:
+        return pet.name
+
+    @jsonrpc.method(
+        'app.greeting',
+        tm.MethodAnnotated[tm.Example(name='default', params=[tm.ExampleField(name='name', value='Flask')])],
+    )
+    def greeting(name: str) -> str:
+        return f'Hello {name}'
+
+    @jsonrpc.method('app.now')
+    def now() -> str:
+        return 'now'
+
+    @jsonrpc.method('app.unchecked', validate=False)
+    def unchecked(value: t.Any) -> t.Any:  # noqa: ANN401
+        return value
+
+    @user.method('user.index')
+    def user_index(name: t.Annotated[str, tp.MaxLength(3)]) -> str:
+        return f'Welcome {name}'
+
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    return app
+
+
+def test_constraints() -> None:
+    assert Constraints.from_field(None) == Constraints()
+
+    field = DescribeField(
+        name='code', type='String', pattern=re.compile(r'^\d+$'), max_length=5, required=True, nullable=False
+    )
+    assert Constraints.from_field(field) == Constraints(max_length=5, pattern=r'^\d+$', required=True, nullable=False)
+
+    constraints = Constraints(minimum=1).update([annotated_types.Gt(0), annotated_types.Le(5), tp.Pattern('^a$')])
+    assert constraints == Constraints(minimum=0, maximum=5, exclusive_minimum=True, pattern='^a$')
+
+    constraints = Constraints().update(PetModel.model_fields['name'].metadata)
+    assert constraints == Constraints(min_length=1, max_length=8, pattern='^[a-z]+$')
+
+
+def test_is_optional() -> None:
+    assert is_optional(t.Any)
+    assert is_optional(None)
+    assert is_optional(int | None)
+    assert is_optional(t.Annotated[t.Optional[str], tp.MaxLength(2)])  # noqa: UP045
+    assert not is_optional(int)
+    assert not is_optional(int | str)
+
+
+def test_get_object_fields() -> None:
+    assert get_object_fields(Car) == {'name': str, 'year': int}
+    assert get_object_fields(UserDict) == {'name': str, 'tags': list[str]}
+    assert get_object_fields(Point) == {'x': int, 'y': int}
+    assert get_object_fields(Engine) == {'power': int, 'fuel': str}
+    assert get_object_fields(Opaque) is None
+
+
+def test_generate_from_pattern() -> None:
+    generator = PayloadGenerator(create_app().extensions['jsonrpc'][0].get_jsonrpc_site(), seed=1)
+    for pattern in (
+        r'^[A-Z]{2}-\d{3}$',
+        r'[^a]b.c',
+        r'\w+\s\W\D\S',
+        r'(cat|dog)s?',
+        r'(?>ab)+x*?y*+',
+        r'[^\d\s]{2,}',
+        r'[a-c0-2_]{4}',
+    ):
+        for _ in range(20):
+            assert re.fullmatch(pattern, generator.generate_from_pattern(pattern)), pattern
+
+    assert generator.generate_from_pattern(r'[^\w\W]') == ''
+    assert generator.generate_string(Constraints(pattern='a{8}', max_length=4)) == 'aaaaaaaa'
+
+
+def test_generate_number() -> None:
+    generator = PayloadGenerator(create_app().extensions['jsonrpc'][0].get_jsonrpc_site(), seed=1)
+    for _ in range(50):
+        assert 0 <= generator.generate_number(Constraints(), integer=True) <= 1000
+        assert -1010 <= generator.generate_number(Constraints(maximum=-10), integer=True) <= -10
+        assert generator.generate_number(Constraints(minimum=3, exclusive_minimum=True), integer=True) > 3
+        assert generator.generate_number(Constraints(maximum=5, exclusive_maximum=True), integer=True) < 5
+        assert generator.generate_number(Constraints(multiple_of=7), integer=True) % 7 == 0
+        assert generator.generate_number(Constraints(max_digits=2), integer=True) <= 99
+        value = generator.generate_number(Constraints(minimum=0, maximum=1, decimal_places=2), integer=False)
+        assert 0 <= value <= 1
+        assert value == round(value, 2)
+        assert isinstance(generator.generate_number(Constraints(), integer=False), float)
+
+
+def test_generate_value() -> None:
+    generator = PayloadGenerator(create_app().extensions['jsonrpc'][0].get_jsonrpc_site(), seed=1, max_depth=2)
+    for _ in range(20):
+        assert generator.generate_value(None) is None
+        assert isinstance(generator.generate_value(t.Any), str)
+        assert generator.generate_value(t.Literal[1, 2]) in (1, 2)
+        assert generator.generate_value(Color) in ('red', 'blue')
+        assert isinstance(generator.generate_value(bool), bool)
+        assert isinstance(generator.generate_value(int | str), int | str)
+        assert generator.generate_value(t.Optional[int], Constraints(nullable=False)) is not None  # noqa: UP045
+        assert len(generator.generate_value(list[int], Constraints(required=True, max_length=1))) == 1
+        assert len(generator.generate_value(set[str])) <= 3
+        assert len(generator.generate_value(tuple[int, str])) == 2
+        assert all(isinstance(item, int) for item in generator.generate_value(tuple[int, ...]))
+        assert all(key.isdigit() for key in generator.generate_value(dict[int, str], Constraints(required=True)))
+        assert isinstance(generator.generate_value(collections.abc.Mapping), dict)
+        assert isinstance(generator.generate_value(t.Annotated[str, tp.MaxLength(2)]), str)
+        assert isinstance(generator.generate_value(bytes), str)
+        assert isinstance(generator.generate_value(Opaque), str)
+        assert isinstance(generator.generate_value(t.Callable[[], int]), str)
+        assert all(not items for item in generator.generate_value(list[list[list[int]]]) for items in item)
+        assert generator.generate_value(dict[str, dict[str, dict[str, int]]]).get('x', {}) == {}
+
+        pet = PetModel.model_validate(generator.generate_value(PetModel))
+        assert 0 <= pet.age < 20
+        assert Car(**generator.generate_value(Car))
+        assert Point(**generator.generate_value(Point))
+        assert Engine(**generator.generate_value(Engine))
+        assert set(generator.generate_value(UserDict)) == {'name', 'tags'}
+
+
+def test_generate_invalid_values() -> None:
+    generator = PayloadGenerator(create_app().extensions['jsonrpc'][0].get_jsonrpc_site(), seed=1)
+    assert generator.generate_invalid_values(t.Annotated[int, tp.Minimum(3), tp.Maximum(9)]) == ['not a number', 2, 10]
+    assert generator.generate_invalid_values(
+        float, Constraints(minimum=0, maximum=1, exclusive_minimum=True, exclusive_maximum=True)
+    ) == ['not a number', 0, 1]
+    assert generator.generate_invalid_values(t.Annotated[str, tp.Required(True), tp.MinLength(2), tp.MaxLength(3)]) == [
+        12345,
+        '',
+        'xxxx',
+        'x',
+    ]
+    assert generator.generate_invalid_values(bool) == ['not a boolean']
+    assert generator.generate_invalid_values(Color) == ['__invalid__']
+    assert generator.generate_invalid_values(t.Literal['a'], Constraints(nullable=False)) == [None, '__invalid__']
+    assert generator.generate_invalid_values(t.Optional[bool]) == ['not a boolean']  # noqa: UP045
+    assert generator.generate_invalid_values(int | str) == []
+    values = generator.generate_invalid_values(list[int], Constraints(required=True, max_length=1))
+    assert values[:2] == [12345, []]
+    assert len(values[2]) == 2
+    assert generator.generate_invalid_values(dict[str, int]) == [12345]
+    assert generator.generate_invalid_values(dict[str, int], Constraints(required=True)) == [12345, {}]
+    assert generator.generate_invalid_values(PetModel) == ['not an object']
+    assert generator.generate_invalid_values(Car) == ['not an object']
+    assert generator.generate_invalid_values(Opaque) == []
+    assert generator.generate_invalid_values(t.Any) == []
+    assert generator.generate_invalid_values(t.Callable[[], int]) == []
+
+
+def test_generate_params() -> None:
+    app = create_app()
+    generator = PayloadGenerator(app.extensions['jsonrpc'][0].get_jsonrpc_site(), seed=1, example_ratio=1.0)
+    assert generator.generate_params('app.greeting') == {'name': 'Flask'}
+    assert generator.generate_params('app.now') == {}
+    assert generator.generate_params('app.now', valid=False) is None
+    assert generator.generate_params('app.unchecked', valid=False) is None
+
+    for _ in range(20):
+        params = generator.generate_params('app.numbers')
+        assert params is not None
+        assert 3 <= params['n'] <= 9
+        assert params.get('m', 5) % 5 == 0
+
+        params = generator.generate_params('app.strings')
+        assert params is not None
+        assert re.fullmatch(r'[A-Z]{2}-\d{3}', params['code'])
+        assert 2 <= len(params['name']) <= 5
+        assert params['note']
+
+    missing = 0
+    for _ in range(50):
+        params = generator.generate_params('app.choices', valid=False)
+        assert params is not None
+        missing += len(params) < 3
+    assert missing > 0
+
+
+def test_generate_scenarios() -> None:
+    app = create_app()
+    scenarios = generate_scenarios(app, count=20, invalid_ratio=0.5, seed=42)
+    assert scenarios == generate_scenarios(app, count=20, invalid_ratio=0.5, seed=42)
+    assert scenarios != generate_scenarios(app, count=20, invalid_ratio=0.5, seed=43)
+
+    names = {scenario.name.split('[')[0] for scenario in scenarios}
+    assert names == {
+        'app.numbers',
+        'app.strings',
+        'app.choices',
+        'app.collections',
+        'app.pet',
+        'app.greeting',
+        'app.now',
+        'app.unchecked',
+        'user.index',
+    }
+    assert {scenario.group for scenario in scenarios} == {'valid', 'invalid'}
+    assert all(scenario.group == 'valid' for scenario in scenarios if scenario.name.startswith('app.now'))
+    assert all(scenario.group == 'valid' for scenario in scenarios if scenario.name.startswith('app.unchecked'))
+    assert {scenario.path for scenario in scenarios} == {'/api', '/api/user'}
+
+    for scenario in scenarios:
+        request = WSGIRequest(app, scenario)
+        request()
+        if scenario.group == 'valid':
+            assert scenario.status_code is None
+            assert request.status_code == 200, scenario
+        else:
+            assert scenario.status_code == 400
+            assert request.status_code == 400, scenario
+
+    scenarios = generate_scenarios(app, seed=42, include_rpc=True)
+    assert 'rpc.describe[0]' in {scenario.name for scenario in scenarios}
+    now = next(scenario for scenario in scenarios if scenario.name == 'app.now[0]')
+    assert now.payload == {'jsonrpc': '2.0', 'method': 'app.now', 'id': 1}
@@ -863,6 +863,45 @@ def test_get_browse_login_template_by_env(monkeypatch: MonkeyPatch, tmp_path: Pa
             assert b'Login Page' in rv.data
 
 
+def test_browse_performance_dashboard(monkeypatch: MonkeyPatch) -> None:
+    with monkeypatch.context() as m:
+        m.setattr(
+            'flask_jsonrpc.conf.settings.BROWSE_DASHBOARD_PARTIAL_TEMPLATE',
+            'browse/partials/performance_dashboard.html',
+        )
+        app = Flask('test_browse', instance_relative_config=True)
+        jsonrpc = JSONRPC(app, '/api', enable_web_browsable_api=True, enable_metrics=True)
+
+        @jsonrpc.method('app.fn1')
+        def fn1(s: str) -> str:
+            return f'Foo {s}'
+
+        assert jsonrpc.jsonrpc_browse is not None
+        assert jsonrpc.jsonrpc_browse.jsonrpc_metrics is jsonrpc.jsonrpc_metrics
+
+        with app.test_client() as client:
+            rv = client.get('/api/browse/partials/dashboard.html')
+            assert rv.status_code == 200
+            assert b'ng-controller="PerformanceDashboardCtrl" data-metrics-url="/metrics.json"' in rv.data
+
+        app = Flask('test_browse', instance_relative_config=True)
+        jsonrpc = JSONRPC(app, '/api', enable_metrics=True)
+        jsonrpc.init_browse_app(app)
+        assert jsonrpc.jsonrpc_browse is not None
+        assert jsonrpc.jsonrpc_browse.jsonrpc_metrics is jsonrpc.jsonrpc_metrics
+
+        app = Flask('test_browse', instance_relative_config=True)
+        jsonrpc = JSONRPC(app, '/api', enable_web_browsable_api=True)
+        assert jsonrpc.jsonrpc_browse is not None
+        assert jsonrpc.jsonrpc_browse.jsonrpc_metrics is None
+
+        with app.test_client() as client:
+            rv = client.get('/api/browse/partials/dashboard.html')
+            assert rv.status_code == 200
+            assert b'data-metrics-url=""' in rv.data
+            assert b'The metrics are not enabled' in rv.data
+
+
 def test_get_browse_logout_template_returns_none(monkeypatch: MonkeyPatch) -> None:
     with monkeypatch.context() as m:
         m.setattr('flask_jsonrpc.conf.settings.BROWSE_LOGOUT_TEMPLATE', None)
@@ -0,0 +1,214 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+from flask import Flask
+
+import msgpack
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.conf import settings
+from flask_jsonrpc.codecs import MessagePackCodec
+from flask_jsonrpc.contrib.capture import TrafficRecorder, RotatingFileWriter, redact
+
+
+def create_app(tmp_path: Path, **kwargs: object) -> tuple[Flask, TrafficRecorder]:
+    app = Flask('test_capture', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    user = JSONRPCBlueprint('user', __name__)
+
+    @jsonrpc.method('app.login')
+    def login(username: str, password: str) -> dict[str, str]:
+        return {'username': username, 'token': f'token-{password}'}
+
+    @jsonrpc.method('app.notify', notification=True)
+    def notify(message: str) -> None:
+        pass
+
+    @user.method('user.index')
+    def user_index() -> str:
+        return 'Welcome to user'
+
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    recorder = TrafficRecorder(app, jsonrpc, path=str(tmp_path / 'traffic.jsonl'), **kwargs)  # type: ignore[arg-type]
+    return app, recorder
+
+
+def read_records(path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_redact() -> None:
+    assert redact({'a': 1, 'Password': 'x', 'b': [{'token': 'y'}, 2]}, {'password', 'token'}) == {
+        'a': 1,
+        'Password': '[REDACTED]',
+        'b': [{'token': '[REDACTED]'}, 2],
+    }
+    assert redact('password', {'password'}) == 'password'
+
+
+def test_rotating_file_writer(tmp_path: Path) -> None:
+    path = tmp_path / 'logs' / 'traffic.jsonl'
+    writer = RotatingFileWriter(str(path), max_bytes=10, backup_count=2)
+    for line in ('first', 'second', 'third', 'fourth'):
+        writer.write(line)
+    assert path.read_text() == 'fourth\n'
+    assert (tmp_path / 'logs' / 'traffic.jsonl.1').read_text() == 'third\n'
+    assert (tmp_path / 'logs' / 'traffic.jsonl.2').read_text() == 'second\n'
+    assert not (tmp_path / 'logs' / 'traffic.jsonl.3').exists()
+
+    writer = RotatingFileWriter(str(tmp_path / 'single.jsonl'), max_bytes=10, backup_count=0)
+    writer.write('first')
+    writer.write('second')
+    assert (tmp_path / 'single.jsonl').read_text() == 'second\n'
+    assert list(tmp_path.glob('single.jsonl.*')) == []
+
+    writer = RotatingFileWriter(str(tmp_path / 'unbounded.jsonl'), max_bytes=0, backup_count=1)
+    writer.write('first')
+    writer.write('second')
+    assert (tmp_path / 'unbounded.jsonl').read_text() == 'first\nsecond\n'
+
+
+def test_capture_create(tmp_path: Path) -> None:
+    app, recorder = create_app(tmp_path)
+    assert app.extensions['jsonrpc_capture'] is recorder
+    path = tmp_path / 'traffic.jsonl'
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.login', 'params': ['alice', 's3cr3t']})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': {'username': 'alice', 'token': 'token-s3cr3t'}}
+
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.login', 'params': {'username': 'bob', 'password': 'pw'}},
+                {'id': 3, 'jsonrpc': '2.0', 'method': 'app.unknown', 'params': ['x']},
+            ],
+        )
+        assert rv.status_code == 200
+
+        rv = client.post('/api', json={'jsonrpc': '2.0', 'method': 'app.notify', 'params': ['hi']})
+        assert rv.status_code == 204
+
+        rv = client.post('/api/user', json={'id': 4, 'jsonrpc': '2.0', 'method': 'user.index'})
+        assert rv.json == {'id': 4, 'jsonrpc': '2.0', 'result': 'Welcome to user'}
+
+        rv = client.post('/api', data='{"id": 1', content_type='application/json')
+        assert rv.status_code == 400
+
+    assert recorder.recorded == 4
+    records = read_records(path)
+    assert [record['path'] for record in records] == ['/api', '/api', '/api', '/api/user']
+    assert records[0]['request'] == {
+        'id': 1,
+        'jsonrpc': '2.0',
+        'method': 'app.login',
+        'params': ['alice', '[REDACTED]'],
+    }
+    assert records[0]['response'] == {'id': 1, 'jsonrpc': '2.0', 'result': {'username': 'alice', 'token': '[REDACTED]'}}
+    assert records[0]['status_code'] == 200
+    assert records[0]['duration'] > 0
+    assert records[0]['time'] <= records[1]['time']
+    assert records[1]['request'][0]['params'] == {'username': 'bob', 'password': '[REDACTED]'}
+    assert records[1]['request'][1]['params'] == ['x']
+    assert records[2]['status_code'] == 204
+    assert records[2]['response'] is None
+    assert records[3]['request'] == {'id': 4, 'jsonrpc': '2.0', 'method': 'user.index'}
+
+
+def test_capture_sample_rate_and_redacted_params(tmp_path: Path) -> None:
+    app, recorder = create_app(tmp_path, sample_rate=0.0)
+    with app.test_client() as client:
+        client.post('/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'})
+    assert recorder.recorded == 0
+    assert not (tmp_path / 'traffic.jsonl').exists()
+
+    app, recorder = create_app(tmp_path, redacted_params=['Username'])
+    assert recorder.redacted_params == frozenset({'username'})
+    with app.test_client() as client:
+        client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.login', 'params': ['alice', 'pw']})
+    records = read_records(tmp_path / 'traffic.jsonl')
+    assert records[0]['request']['params'] == ['[REDACTED]', 'pw']
+    assert records[0]['response']['result'] == {'username': '[REDACTED]', 'token': 'token-pw'}
+
+
+def test_capture_compressed_and_codec_bodies(tmp_path: Path) -> None:
+    app, recorder = create_app(tmp_path)
+    app.extensions['jsonrpc'][0].get_jsonrpc_site().register_codec(MessagePackCodec())
+    req_json = {'id': 1, 'jsonrpc': '2.0', 'method': 'app.login', 'params': ['alice', 'pw']}
+    resp_json = {'id': 1, 'jsonrpc': '2.0', 'result': {'username': 'alice', 'token': '[REDACTED]'}}
+
+    settings.COMPRESSION_ENABLED = True
+    settings.COMPRESSION_MIN_SIZE = 10
+    try:
+        with app.test_client() as client:
+            rv = client.post('/api', json=req_json, headers={'Accept-Encoding': 'gzip'})
+            assert rv.headers['Content-Encoding'] == 'gzip'
+
+            rv = client.post('/api', json=req_json, headers={'Accept-Encoding': 'br'})
+            assert rv.headers['Content-Encoding'] == 'br'
+
+            rv = client.post(
+                '/api',
+                data=msgpack.packb(req_json),
+                content_type='application/msgpack',
+                headers={'Accept-Encoding': 'identity'},
+            )
+            assert rv.status_code == 200
+            assert rv.mimetype == 'application/msgpack'
+
+            rv = client.post('/api', data=b'\xc1', content_type='application/msgpack')
+            assert rv.status_code == 400
+
+            rv = client.post(
+                '/api',
+                data=gzip.compress(json.dumps(req_json).encode()),
+                content_type='application/json',
+                headers={'Content-Encoding': 'gzip', 'Accept-Encoding': 'identity'},
+            )
+            assert rv.status_code == 200
+    finally:
+        settings.COMPRESSION_ENABLED = False
+        settings.COMPRESSION_MIN_SIZE = 1024
+
+    assert recorder.recorded == 4
+    records = read_records(tmp_path / 'traffic.jsonl')
+    assert [record['response'] for record in records] == [resp_json, None, resp_json, resp_json]
+    assert all(record['request']['params'] == ['alice', '[REDACTED]'] for record in records)
+
+
+def test_capture_default_path() -> None:
+    app = Flask('test_capture', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    recorder = TrafficRecorder()
+    assert recorder.writer is None
+    recorder.init_app(app, jsonrpc)
+    assert recorder.path == f'{app.instance_path}/jsonrpc-traffic.jsonl'
@@ -0,0 +1,135 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+from pathlib import Path
+
+from flask import Flask
+
+from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.contrib.capture import TrafficRecorder
+from flask_jsonrpc.contrib.capture.replay import ReplayResults, replay, load_records, responses_match
+
+
+def create_app(*, offset: int = 0) -> Flask:
+    app = Flask('test_replay', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.sum')
+    def sum_(a: int, b: int) -> int:
+        return a + b + offset
+
+    @jsonrpc.method('app.login')
+    def login(password: str) -> dict[str, str]:
+        return {'token': f'token-{password}-{offset}'}
+
+    return app
+
+
+def record_traffic(path: Path) -> None:
+    app = create_app()
+    TrafficRecorder(app, app.extensions['jsonrpc'][0], path=str(path), max_bytes=200, backup_count=5)
+    with app.test_client() as client:
+        client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [1, 2]})
+        client.post('/api', json={'id': 2, 'jsonrpc': '2.0', 'method': 'app.login', 'params': ['pw']})
+        client.post(
+            '/api',
+            json=[
+                {'id': 3, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [3, 4]},
+                {'id': 4, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': {'a': 5, 'b': 6}},
+            ],
+        )
+        client.post('/api', json={'id': 5, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': ['x', 2]})
+
+
+def test_responses_match() -> None:
+    assert responses_match({'a': [1, {'token': '[REDACTED]'}]}, {'a': [1, {'token': 'abc'}]})
+    assert not responses_match({'a': 1}, {'a': 1, 'b': 2})
+    assert not responses_match({'a': 1}, [1])
+    assert not responses_match([1, 2], [1])
+    assert responses_match(None, None)
+    assert not responses_match(None, {'a': 1})
+
+
+def test_load_records(tmp_path: Path) -> None:
+    path = tmp_path / 'traffic.jsonl'
+    record_traffic(path)
+    assert (tmp_path / 'traffic.jsonl.1').exists()
+
+    records = load_records(str(path))
+    requests = [record['request'] for record in records]
+    assert [request[0]['id'] if isinstance(request, list) else request['id'] for request in requests] == [1, 2, 3, 5]
+    assert [record['time'] for record in records] == sorted(record['time'] for record in records)
+
+
+def test_replay(tmp_path: Path) -> None:
+    path = tmp_path / 'traffic.jsonl'
+    record_traffic(path)
+    records = load_records(str(path))
+
+    results = replay(create_app(), records, speed=None)
+    assert results.speed is None
+    assert results.mismatches == []
+    assert [result.method for result in results.results] == ['app.sum', 'app.login', 'batch', 'app.sum']
+    assert [result.status_code for result in results.results] == [200, 200, 200, 400]
+    assert all(result.equal for result in results.results)
+    assert results.results[1].status_code == results.results[1].recorded_status_code
+
+    # The token of app.login is redacted in the recording, so it matches any token
+    results = replay(create_app(offset=1), records, speed=1000.0)
+    assert [result.index for result in results.mismatches] == [0, 2]
+    assert results.results[3].equal is True
+
+    results = replay(create_app(offset=1), records, speed=None, compare=False)
+    assert results.mismatches == []
+    assert all(result.equal is None for result in results.results)
+
+    data = results.to_dict()
+    assert data['requests'] == 4
+    assert data['mismatches'] == 0
+    assert set(data['latency']) == {'p50', 'p90', 'p99'}
+    assert data['recorded_latency']['p99'] == max(record['duration'] for record in records)
+    assert data['results'][0]['method'] == 'app.sum'
+
+
+def test_replay_pace() -> None:
+    app = create_app()
+    record = {
+        'path': '/api',
+        'request': {'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [1, 2]},
+        'status_code': 200,
+        'response': {'id': 1, 'jsonrpc': '2.0', 'result': 3},
+        'duration': 0.001,
+    }
+    results = replay(app, [{**record, 'time': 100.0}, {**record, 'time': 100.2}], speed=2.0)
+    assert results.mismatches == []
+    assert results.duration >= 0.1
+
+    results = replay(app, [])
+    assert results.results == []
+    assert results.percentiles() == {'p50': 0.0, 'p90': 0.0, 'p99': 0.0}
+    assert isinstance(results, ReplayResults)
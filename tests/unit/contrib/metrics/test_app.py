@@ -0,0 +1,315 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import gc
+import threading
+
+from flask import Flask
+
+import pytest
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.contrib.metrics import (
+    METRICS_CONTENT_TYPE,
+    METRICS_UNKNOWN_METHOD,
+    Histogram,
+    JSONRPCMetrics,
+    MetricsRegistry,
+)
+
+
+def test_histogram() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0, 3.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 2]
+    assert histogram.cumulative_counts() == [2, 3, 5]
+    assert histogram.count == 5
+    assert histogram.sum == 5.65
+
+    other = Histogram(buckets=(0.1, 1.0))
+    other.observe(0.2)
+    histogram.merge(other)
+    assert histogram.counts == [2, 2, 2]
+
+    histogram = Histogram(buckets=(0.1, 1.0), counts=[1, 0, 3], sum=7.0)
+    assert histogram.count == 4
+
+
+def test_histogram_quantile() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+    assert histogram.quantile(0.5) is None
+
+    histogram = Histogram(buckets=(0.1, 1.0), counts=[2, 2, 2])
+    assert histogram.quantile(0.1) == pytest.approx(0.03)
+    assert histogram.quantile(0.5) == pytest.approx(0.55)
+    assert histogram.quantile(0.99) == 1.0
+
+    histogram = Histogram(buckets=(0.1, 1.0), counts=[0, 1, 0])
+    assert histogram.quantile(0.0) == 0.0
+    assert histogram.quantile(1.0) == 1.0
+
+
+def test_registry_merges_thread_shards() -> None:
+    registry = MetricsRegistry()
+
+    def worker() -> None:
+        for _ in range(100):
+            registry.record_call('app.fn', None, 0.01)
+        registry.record_call('app.fn', -32602, 0.01)
+        registry.record_batch(3)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = registry.collect()
+    assert snapshot.methods['app.fn'].calls == 404
+    assert snapshot.methods['app.fn'].errors == {-32602: 4}
+    assert snapshot.methods['app.fn'].latency.count == 404
+    assert snapshot.batch_size.count == 4
+
+    # Collecting does not reset the counters
+    assert registry.collect().methods['app.fn'].calls == 404
+
+
+def test_registry_folds_shards_of_ended_threads() -> None:
+    registry = MetricsRegistry()
+    registry.record_call('app.fn', None, 0.01)
+
+    def worker() -> None:
+        registry.record_call('app.fn', -32602, 0.01)
+        assert len(registry._shards) == 2
+
+    for _ in range(50):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert len(registry._shards) == 1
+    snapshot = registry.collect()
+    assert snapshot.methods['app.fn'].calls == 51
+    assert snapshot.methods['app.fn'].errors == {-32602: 50}
+
+
+def test_registry_collect_while_recording() -> None:
+    registry = MetricsRegistry()
+    stopped = threading.Event()
+
+    def worker() -> None:
+        i = 0
+        while not stopped.is_set():
+            registry.record_call(f'app.fn{i % 500}', -(i % 300), 0.01)
+            i += 1
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    try:
+        for _ in range(200):
+            registry.collect()
+    finally:
+        stopped.set()
+        thread.join()
+    assert sum(m.calls for m in registry.collect().methods.values()) > 0
+
+
+def test_registry_render_prometheus() -> None:
+    registry = MetricsRegistry()
+    registry.record_call('app.fn', None, 0.002)
+    registry.record_call('app.fn', -32602, 0.2)
+    registry.record_call('app."quoted"', None, 20)
+    registry.record_batch(2)
+    registry.record_cache('app.fn', hit=True)
+    registry.record_cache('app.fn', hit=False)
+    registry.record_cache('app.cached', hit=True)
+
+    text = registry.render_prometheus()
+    assert text.endswith('\n')
+    lines = text.splitlines()
+    assert '# TYPE jsonrpc_calls_total counter' in lines
+    assert 'jsonrpc_calls_total{method="app.fn"} 2' in lines
+    assert 'jsonrpc_calls_total{method="app.\\"quoted\\""} 1' in lines
+    assert 'jsonrpc_errors_total{method="app.fn",code="-32602"} 1' in lines
+    assert '# TYPE jsonrpc_call_duration_seconds histogram' in lines
+    assert 'jsonrpc_call_duration_seconds_bucket{method="app.fn",le="0.001"} 0' in lines
+    assert 'jsonrpc_call_duration_seconds_bucket{method="app.fn",le="0.005"} 1' in lines
+    assert 'jsonrpc_call_duration_seconds_bucket{method="app.fn",le="0.25"} 2' in lines
+    assert 'jsonrpc_call_duration_seconds_bucket{method="app.fn",le="+Inf"} 2' in lines
+    assert 'jsonrpc_call_duration_seconds_sum{method="app.fn"} 0.202' in lines
+    assert 'jsonrpc_call_duration_seconds_count{method="app.fn"} 2' in lines
+    assert 'jsonrpc_call_duration_seconds_bucket{method="app.\\"quoted\\"",le="10"} 0' in lines
+    assert 'jsonrpc_batch_size_bucket{le="1"} 0' in lines
+    assert 'jsonrpc_batch_size_bucket{le="2"} 1' in lines
+    assert 'jsonrpc_batch_size_sum 2.0' in lines
+    assert 'jsonrpc_batch_size_count 1' in lines
+    assert '# TYPE jsonrpc_cache_requests_total counter' in lines
+    assert 'jsonrpc_cache_requests_total{method="app.fn",result="hit"} 1' in lines
+    assert 'jsonrpc_cache_requests_total{method="app.fn",result="miss"} 1' in lines
+    assert 'jsonrpc_cache_requests_total{method="app.cached",result="miss"} 0' in lines
+    assert not any(line.startswith('jsonrpc_cache_requests_total{method="app.\\"quoted') for line in lines)
+
+
+def test_registry_summary() -> None:
+    registry = MetricsRegistry()
+    assert registry.summary() == {'methods': {}, 'batches': 0}
+
+    registry.record_call('app.fn', None, 0.002)
+    registry.record_call('app.fn', -32602, 0.2)
+    registry.record_call('app.fn', -32000, 0.3)
+    registry.record_call('app.fn', None, 0.004)
+    registry.record_cache('app.fn', hit=True)
+    registry.record_cache('app.fn', hit=True)
+    registry.record_cache('app.fn', hit=False)
+    registry.record_cache('app.fn', hit=True)
+    registry.record_cache('app.cached', hit=True)
+    registry.record_batch(4)
+
+    summary = registry.summary()
+    assert summary['batches'] == 1
+    assert list(summary['methods']) == ['app.cached', 'app.fn']
+    assert summary['methods']['app.cached'] == {
+        'calls': 0,
+        'errors': 0,
+        'error_rate': None,
+        'p50': None,
+        'p95': None,
+        'p99': None,
+        'cache_hits': 1,
+        'cache_misses': 0,
+        'cache_hit_ratio': 1.0,
+    }
+    app_fn = summary['methods']['app.fn']
+    assert app_fn['calls'] == 4
+    assert app_fn['errors'] == 2
+    assert app_fn['error_rate'] == 0.5
+    assert app_fn['p50'] == 0.005
+    assert 0.25 < app_fn['p95'] < app_fn['p99'] <= 0.5
+    assert app_fn['cache_hit_ratio'] == 0.75
+
+
+def test_metrics_create() -> None:
+    app = Flask('test_metrics', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api', enable_metrics=True)
+    jsonrpc_bp = JSONRPCBlueprint('bp', __name__)
+
+    @jsonrpc.method('app.fn1')
+    def fn1(s: str) -> str:
+        return f'Foo {s}'
+
+    @jsonrpc.method('app.fn3', cacheable=60)
+    def fn3(s: str) -> str:
+        return f'Baz {s}'
+
+    @jsonrpc_bp.method('bp.fn2')
+    def fn2(s: str) -> str:
+        return f'Bar {s}'
+
+    jsonrpc.register_blueprint(app, jsonrpc_bp, url_prefix='/bp')
+
+    assert jsonrpc.jsonrpc_metrics is not None
+    assert jsonrpc.jsonrpc_metrics.jsonrpc_sites == {jsonrpc.get_jsonrpc_site(), jsonrpc_bp.get_jsonrpc_site()}
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Foo :)'}
+
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [1]},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.not_found'},
+                {'id': 3, 'jsonrpc': '2.0', 'method': ['app.fn1']},
+                {'jsonrpc': '2.0', 'method': 'app.fn1', 'params': ['notify']},
+            ],
+        )
+        assert rv.status_code == 200
+
+        rv = client.post('/api/bp', json={'id': 1, 'jsonrpc': '2.0', 'method': 'bp.fn2', 'params': [':)']})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Bar :)'}
+
+        snapshot = jsonrpc.jsonrpc_metrics.registry.collect()
+        assert snapshot.methods['app.fn1'].calls == 3
+        assert snapshot.methods['app.fn1'].errors == {-32602: 1}
+        assert snapshot.methods[METRICS_UNKNOWN_METHOD].calls == 2
+        assert snapshot.methods[METRICS_UNKNOWN_METHOD].errors == {-32601: 1, -32000: 1}
+        assert snapshot.methods['bp.fn2'].calls == 1
+        assert snapshot.batch_size.count == 1
+        assert snapshot.batch_size.sum == 4
+
+        rv = client.get('/api', query_string={'method': 'app.fn3', 'params': '[":)"]', 'id': '1'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Baz :)'}
+        rv = client.get(
+            '/api',
+            query_string={'method': 'app.fn3', 'params': '[":)"]', 'id': '1'},
+            headers={'If-None-Match': rv.headers['ETag']},
+        )
+        assert rv.status_code == 304
+
+        snapshot = jsonrpc.jsonrpc_metrics.registry.collect()
+        assert snapshot.methods['app.fn3'].calls == 2
+        assert snapshot.methods['app.fn3'].cache_hits == 1
+        assert snapshot.methods['app.fn3'].cache_misses == 1
+
+        rv = client.get('/metrics')
+        assert rv.status_code == 200
+        assert rv.content_type == METRICS_CONTENT_TYPE
+        assert 'jsonrpc_calls_total{method="app.fn1"} 3' in rv.text.splitlines()
+
+        rv = client.get('/metrics.json')
+        assert rv.status_code == 200
+        assert rv.json['batches'] == 1
+        assert rv.json['methods']['app.fn1']['calls'] == 3
+        assert rv.json['methods']['app.fn1']['error_rate'] == 1 / 3
+
+
+def test_metrics_init_later() -> None:
+    app = Flask('test_metrics', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    jsonrpc_bp = JSONRPCBlueprint('bp', __name__)
+    jsonrpc.register_blueprint(app, jsonrpc_bp, url_prefix='/bp')
+    assert jsonrpc.jsonrpc_metrics is None
+
+    registry = MetricsRegistry()
+    jsonrpc.init_metrics_app(app, path='/api/metrics')
+    assert jsonrpc.jsonrpc_metrics is not None
+    assert jsonrpc.jsonrpc_metrics.path == '/api/metrics'
+    assert jsonrpc.jsonrpc_metrics.json_path == '/api/metrics.json'
+    assert jsonrpc.jsonrpc_metrics.jsonrpc_sites == {jsonrpc.get_jsonrpc_site(), jsonrpc_bp.get_jsonrpc_site()}
+
+    # Registering the same site twice is a no-op
+    jsonrpc.jsonrpc_metrics.register_jsonrpc_site(jsonrpc.get_jsonrpc_site())
+    assert len(jsonrpc.get_jsonrpc_site().before_request_funcs) == 1
+
+    metrics = JSONRPCMetrics(registry=registry)
+    assert metrics.registry is registry
+
+    with app.test_client() as client:
+        rv = client.get('/api/metrics')
+        assert rv.status_code == 200
+        assert 'jsonrpc_batch_size_count 0' in rv.text.splitlines()
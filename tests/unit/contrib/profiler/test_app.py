@@ -0,0 +1,235 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import os
+import pstats
+import typing as t
+import logging
+from pathlib import Path
+
+from flask import Flask
+
+import pytest
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.contrib.profiler import JSONRPCProfiler
+
+
+def test_profiler_create(tmp_path: Path) -> None:
+    app = Flask('test_profiler', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    profiler = JSONRPCProfiler(app, jsonrpc, directory=str(tmp_path), tokens=['s3cr3t'], max_captures=2)
+
+    @jsonrpc.method('app.fn1')
+    def fn1(s: str) -> str:
+        return f'Foo {s}'
+
+    assert app.extensions['jsonrpc_profiler'] is profiler
+    assert profiler.url_prefix == '/api/profiles'
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Foo :)'}
+        assert 'X-JSONRPC-Profile-Capture' not in rv.headers
+        assert os.listdir(tmp_path) == []
+
+        rv = client.post(
+            '/api',
+            json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']},
+            headers={'X-JSONRPC-Profile': '1'},
+        )
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Foo :)'}
+        assert 'X-JSONRPC-Profile-Capture' not in rv.headers
+
+        rv = client.post(
+            '/api',
+            json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']},
+            headers={'X-JSONRPC-Profile': 's3cr3t'},
+        )
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Foo :)'}
+        capture = rv.headers['X-JSONRPC-Profile-Capture']
+        assert capture.endswith('-app.fn1.prof')
+        stats = pstats.Stats(str(tmp_path / capture))
+        assert any(func_name == 'fn1' for _, _, func_name in stats.stats)  # type: ignore[attr-defined]
+
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':(']},
+            ],
+            headers={'X-JSONRPC-Profile': 's3cr3t'},
+        )
+        assert rv.headers['X-JSONRPC-Profile-Capture'].endswith('-batch.prof')
+
+        rv = client.post(
+            '/api', data='{"id": 1, "jsonrpc": "2.0", "method": "app.fn1",', headers={'X-JSONRPC-Profile': 's3cr3t'}
+        )
+        assert rv.json['error']['code'] == -32700
+        assert rv.headers['X-JSONRPC-Profile-Capture'].endswith('-unknown.prof')
+
+        rv = client.post(
+            '/api', json={'id': 1, 'jsonrpc': '2.0', 'method': '../../x y'}, headers={'X-JSONRPC-Profile': 's3cr3t'}
+        )
+        assert rv.headers['X-JSONRPC-Profile-Capture'].endswith('-.._.._x_y.prof')
+
+        captures = profiler.list_captures()
+        assert [c['name'] for c in captures] == sorted(os.listdir(tmp_path), reverse=True)
+        assert [c['method'] for c in captures] == ['.._.._x_y', 'unknown']
+
+        rv = client.get('/api/profiles/captures.json')
+        assert rv.status_code == 403
+
+        rv = client.get('/api/profiles/captures.json', headers={'X-JSONRPC-Profile': 's3cr3t'})
+        assert rv.status_code == 200
+        assert [c['name'] for c in rv.json] == [c['name'] for c in captures]
+        assert rv.json[0]['size'] > 0
+        assert rv.json[0]['created_at'] == captures[0]['created_at'].isoformat()
+
+        rv = client.get(f'/api/profiles/{captures[0]["name"]}?token=s3cr3t')
+        assert rv.status_code == 200
+        assert rv.mimetype == 'application/octet-stream'
+        assert rv.headers['Content-Disposition'] == f'attachment; filename={captures[0]["name"]}'
+        assert rv.data == (tmp_path / captures[0]['name']).read_bytes()
+
+        rv = client.get(f'/api/profiles/{captures[0]["name"]}?token=wrong')
+        assert rv.status_code == 403
+
+        rv = client.get('/api/profiles/missing.prof?token=s3cr3t')
+        assert rv.status_code == 404
+
+        rv = client.get('/api/profiles/?token=s3cr3t')
+        assert rv.status_code == 404
+
+
+def test_profiler_debug_with_browse_and_blueprint(tmp_path: Path) -> None:
+    app = Flask('test_profiler', instance_relative_config=True)
+    app.debug = True
+    user = JSONRPCBlueprint('user', __name__)
+
+    @user.method('user.index')
+    def user_index() -> str:
+        return 'Welcome to user'
+
+    jsonrpc = JSONRPC(app, '/api', enable_web_browsable_api=True)
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    profiler = JSONRPCProfiler()
+    profiler.init_app(app, jsonrpc)
+    assert profiler.directory == os.path.join(app.instance_path, 'jsonrpc-profiles')
+    assert profiler.url_prefix == '/api/browse/profiles'
+    profiler.directory = str(tmp_path / 'profiles')
+
+    other_app = Flask('test_profiler_other', instance_relative_config=True)
+    other_profiler = JSONRPCProfiler(other_app, JSONRPC(other_app, '/api'), url_prefix='/_profiles')
+    assert other_profiler.url_prefix == '/_profiles'
+
+    token_app = Flask('test_profiler_token', instance_relative_config=True)
+    token_jsonrpc = JSONRPC(token_app, '/api', enable_web_browsable_api=True)
+    JSONRPCProfiler(token_app, token_jsonrpc, tokens=['s3cr3t'])
+    assert token_jsonrpc.jsonrpc_browse is not None
+    assert 'Profiles' not in token_jsonrpc.jsonrpc_browse.menu_links
+
+    with app.test_client() as client:
+        rv = client.get('/api/profiles/?token=s3cr3t')
+        assert rv.status_code == 404
+
+        rv = client.get('/api/browse/profiles/', headers={'X-JSONRPC-Profile': '1'})
+        assert rv.status_code == 200
+        assert b'No captures yet.' in rv.data
+
+        rv = client.get('/api/browse/profiles/captures.json', headers={'X-JSONRPC-Profile': '1'})
+        assert rv.json == []
+
+        rv = client.post(
+            '/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'}, headers={'X-JSONRPC-Profile': '1'}
+        )
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Welcome to user'}
+        capture = rv.headers['X-JSONRPC-Profile-Capture']
+        (tmp_path / 'profiles' / 'notes.txt').write_text('not a capture')
+        (tmp_path / 'profiles' / 'x-y.prof').write_text('not a capture')
+
+        rv = client.get('/api/browse/profiles/', headers={'X-JSONRPC-Profile': '1'})
+        assert rv.status_code == 200
+        assert capture.encode() in rv.data
+        assert b'user.index' in rv.data
+
+        rv = client.get('/api/browse/')
+        assert b'href="/api/browse/profiles/?token=1" target="_self"' in rv.data
+
+        rv = client.get('/api/browse/profiles/?token=1')
+        assert rv.status_code == 200
+
+        rv = client.get('/api/browse/profiles/')
+        assert rv.status_code == 403
+
+
+def test_profiler_streamed_result(tmp_path: Path) -> None:
+    app = Flask('test_profiler', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    JSONRPCProfiler(app, jsonrpc, directory=str(tmp_path), tokens=['s3cr3t'])
+
+    @jsonrpc.method('app.rows')
+    def rows(n: int) -> t.Iterator[int]:
+        yield from range(n)
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api',
+            json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [3]},
+            headers={'X-JSONRPC-Profile': 's3cr3t'},
+            buffered=False,
+        )
+        capture = rv.headers['X-JSONRPC-Profile-Capture']
+        assert capture.endswith('-app.rows.prof')
+        assert os.listdir(tmp_path) == []
+        assert b''.join(rv.response) == b'{"id": 1, "jsonrpc": "2.0", "result": [0, 1, 2]}'
+        rv.close()
+        assert os.listdir(tmp_path) == [capture]
+
+
+def test_profiler_with_another_profiler_active(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    class ActiveProfile:
+        def enable(self) -> None:
+            raise ValueError('Another profiling tool is already active')
+
+    app = Flask('test_profiler', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    JSONRPCProfiler(app, jsonrpc, directory=str(tmp_path), tokens=['s3cr3t'])
+    monkeypatch.setattr('flask_jsonrpc.contrib.profiler.cProfile.Profile', ActiveProfile)
+
+    @jsonrpc.method('app.fn1')
+    def fn1() -> str:
+        return 'Foo'
+
+    with app.test_client() as client, caplog.at_level(logging.WARNING):
+        rv = client.post(
+            '/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1'}, headers={'X-JSONRPC-Profile': 's3cr3t'}
+        )
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Foo'}
+        assert 'X-JSONRPC-Profile-Capture' not in rv.headers
+        assert 'unable to profile the request' in caplog.text
@@ -0,0 +1,195 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from flask import Flask
+
+import pytest
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.contrib.ratelimit import RateLimiter, MemoryRateLimitBackend, header_key, parse_rate
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_parse_rate() -> None:
+    assert parse_rate('100/s') == (100.0, 100.0)
+    assert parse_rate('100/second') == (100.0, 100.0)
+    assert parse_rate('120/m') == (2.0, 120.0)
+    assert parse_rate('3600 / hours') == (1.0, 3600.0)
+    assert parse_rate('86400/day') == (1.0, 86400.0)
+    assert parse_rate('10/5s') == (2.0, 10.0)
+    assert parse_rate('10/2 minutes') == (10 / 120, 10.0)
+    assert parse_rate('10/sec') == (10.0, 10.0)
+
+    for rate in ('', '100', '0/s', '-1/s', '100/fortnight', 's/100', '10/ms', '10/hs', '10/secs', '10/ss'):
+        with pytest.raises(ValueError, match='invalid rate limit'):
+            parse_rate(rate)
+
+
+def test_memory_backend() -> None:
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(max_keys=2, clock=clock)
+
+    assert backend.consume('a', rate=1.0, capacity=2.0) == 0.0
+    assert backend.consume('a', rate=1.0, capacity=2.0) == 0.0
+    assert backend.consume('a', rate=1.0, capacity=2.0) == 1.0
+
+    clock.now = 0.5
+    assert backend.consume('a', rate=1.0, capacity=2.0) == 0.5
+
+    clock.now = 10.0
+    assert backend.consume('a', rate=1.0, capacity=2.0) == 0.0
+    assert backend.buckets['a'] == (1.0, 10.0)
+
+    assert backend.consume('b', rate=1.0, capacity=2.0) == 0.0
+    assert backend.consume('a', rate=1.0, capacity=2.0) == 0.0
+    assert backend.consume('c', rate=1.0, capacity=2.0) == 0.0
+    assert list(backend.buckets) == ['a', 'c']
+
+
+def test_ratelimit_create() -> None:
+    app = Flask('test_ratelimit', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    clock = FakeClock()
+    limiter = RateLimiter(app, jsonrpc, rate_limit='3/s', backend=MemoryRateLimitBackend(clock=clock))
+
+    @jsonrpc.method('app.fn1')
+    def fn1(s: str) -> str:
+        return f'Foo {s}'
+
+    @jsonrpc.method('app.fn2', rate_limit='1/s')
+    def fn2(s: str) -> str:
+        return f'Bar {s}'
+
+    assert limiter.rate_limit == '3/s'
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn2', 'params': [':)']})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Bar :)'}
+        assert rv.status_code == 200
+
+        rv = client.post('/api', json={'id': 2, 'jsonrpc': '2.0', 'method': 'app.fn2', 'params': [':)']})
+        assert rv.json == {
+            'id': 2,
+            'jsonrpc': '2.0',
+            'error': {
+                'code': -32002,
+                'data': {'message': 'Rate limit exceeded: 1/s', 'retry_after': 1.0},
+                'message': 'Rate limit exceeded',
+                'name': 'RateLimitExceededError',
+            },
+        }
+        assert rv.status_code == 429
+
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 3, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']},
+                {'id': 4, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']},
+                {'id': 5, 'jsonrpc': '2.0', 'method': 'app.unknown'},
+            ],
+        )
+        assert rv.json[0] == {'id': 3, 'jsonrpc': '2.0', 'result': 'Foo :)'}
+        assert rv.json[1]['error']['code'] == -32002
+        assert rv.json[1]['error']['data'] == {'message': 'Rate limit exceeded: 3/s', 'retry_after': 0.333}
+        assert rv.json[2]['error']['code'] == -32002
+        assert rv.status_code == 200
+
+        clock.now = 10.0
+        rv = client.post('/api', json={'id': 6, 'jsonrpc': '2.0', 'method': 'app.unknown'})
+        assert rv.json['error']['code'] == -32601
+        assert rv.status_code == 400
+
+        rv = client.post('/api', json={'id': 7, 'jsonrpc': '2.0', 'method': ['app.fn1']})
+        assert rv.json['error']['code'] == -32000
+        assert rv.status_code == 500
+
+        rv = client.post(
+            '/api',
+            json={'id': 8, 'jsonrpc': '2.0', 'method': 'app.fn2', 'params': [':)']},
+            environ_base={'REMOTE_ADDR': '10.0.0.1'},
+        )
+        assert rv.json == {'id': 8, 'jsonrpc': '2.0', 'result': 'Bar :)'}
+        assert rv.status_code == 200
+
+
+def test_ratelimit_with_header_key_and_blueprint() -> None:
+    app = Flask('test_ratelimit', instance_relative_config=True)
+    user = JSONRPCBlueprint('user', __name__)
+
+    @user.method('user.index', rate_limit='1/m')
+    def user_index() -> str:
+        return 'Welcome to user'
+
+    jsonrpc = JSONRPC(app, '/api')
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    limiter = RateLimiter(key_func=header_key('X-API-Key'))
+    limiter.init_app(app, jsonrpc)
+    assert limiter.rate_limit is None
+
+    with app.test_client() as client:
+        rv = client.post('/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Welcome to user'}
+
+        rv = client.post(
+            '/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'}, headers={'X-API-Key': 'k1'}
+        )
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Welcome to user'}
+
+        rv = client.post(
+            '/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'}, headers={'X-API-Key': 'k1'}
+        )
+        assert rv.json['error']['code'] == -32002
+        assert rv.json['error']['data']['retry_after'] > 0
+
+        rv = client.post('/api/user', json={'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'})
+        assert rv.json['error']['code'] == -32002
+
+
+def test_ratelimit_invalid_site_rate_limit() -> None:
+    with pytest.raises(ValueError, match='invalid rate limit'):
+        RateLimiter(rate_limit='fast')
+
+
+def test_ratelimit_invalid_method_rate_limit() -> None:
+    app = Flask('test_ratelimit', instance_relative_config=True)
+    user = JSONRPCBlueprint('user', __name__)
+
+    @user.method('user.index', rate_limit='10/fortnight')
+    def user_index() -> str:
+        return 'Welcome to user'
+
+    jsonrpc = JSONRPC(app, '/api')
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+
+    with pytest.raises(ValueError, match="invalid rate limit: '10/fortnight' of the method 'user.index'"):
+        RateLimiter(app, jsonrpc)
@@ -0,0 +1,239 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import time
+import typing as t
+import logging
+import threading
+import contextvars
+
+from flask import Flask, g
+
+import pytest
+import msgpack
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.codecs import MessagePackCodec
+from flask_jsonrpc.signals import request_timed
+from flask_jsonrpc.contrib.slowlog import ActiveCall, SlowCallLog
+
+
+def create_app(**options: float | None) -> tuple[Flask, JSONRPC, SlowCallLog, threading.Event]:
+    app = Flask('test_slowlog', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    jsonrpc_bp = JSONRPCBlueprint('bp', __name__)
+    proceed = threading.Event()
+
+    @jsonrpc.method('app.fast')
+    def fast(s: str) -> str:
+        return f'Foo {s}'
+
+    @jsonrpc.method('app.slow', slow_call_threshold=0.0)
+    def slow(s: str) -> str:
+        proceed.wait(5)
+        return f'Slow {s}'
+
+    @jsonrpc.method('app.fail', slow_call_threshold=0.0)
+    def fail() -> str:
+        raise ValueError('Boom')
+
+    @jsonrpc_bp.method('bp.slow', slow_call_threshold=0.0)
+    def bp_slow() -> str:
+        return 'Slow'
+
+    jsonrpc.register_blueprint(app, jsonrpc_bp, url_prefix='/bp')
+    slowlog = SlowCallLog(app, jsonrpc, **options)  # type: ignore[arg-type]
+    return app, jsonrpc, slowlog, proceed
+
+
+def test_slowlog_create(caplog: pytest.LogCaptureFixture) -> None:
+    app, jsonrpc, slowlog, proceed = create_app(threshold=10.0)
+    proceed.set()
+
+    assert app.extensions['jsonrpc_slowlog'] is slowlog
+    assert slowlog.get_threshold(jsonrpc.get_jsonrpc_site(), 'app.fast') == 10.0
+    assert slowlog.get_threshold(jsonrpc.get_jsonrpc_site(), 'app.slow') == 0.0
+    assert slowlog.get_threshold(jsonrpc.get_jsonrpc_site(), None) == 10.0
+
+    with caplog.at_level(logging.WARNING), app.test_client() as client:
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.fast', 'params': [':)']},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.slow', 'params': [':('], 'extra': 1},
+                {'id': 3, 'jsonrpc': '2.0', 'method': 'app.fail'},
+                {'id': 4, 'jsonrpc': '2.0', 'method': ['app.fast']},
+            ],
+        )
+        assert rv.status_code == 200
+        assert list(g._jsonrpc_timings)[:2] == ['mime', 'parse']
+
+        rv = client.post('/api/bp', json={'id': 1, 'jsonrpc': '2.0', 'method': 'bp.slow'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Slow'}
+
+    assert [record['method'] for record in slowlog.records] == ['app.slow', 'app.fail', 'bp.slow']
+    record = slowlog.records[0]
+    assert record['id'] == 2
+    assert record['threshold'] == 0.0
+    assert record['duration'] >= 0.0
+    assert record['params_size'] == 6
+    assert record['error_code'] is None
+    assert list(record['timings']) == ['validate', 'bind', 'check', 'view', 'return']
+    assert record['stack_samples'] == []
+    assert slowlog.records[1]['error_code'] == -32000
+    assert slowlog.records[1]['params_size'] == 0
+
+    slow_records = [r for r in caplog.records if hasattr(r, 'jsonrpc_slow_call')]
+    assert len(slow_records) == 3
+    assert slow_records[0].levelno == logging.WARNING
+    assert slow_records[0].getMessage().startswith('slow call: app.slow took ')
+    assert slow_records[0].jsonrpc_slow_call is record
+
+
+def test_slowlog_sample() -> None:
+    app, _, slowlog, proceed = create_app(threshold=10.0)
+    slowlog.sample()
+
+    def call() -> None:
+        with app.test_client() as client:
+            rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.slow', 'params': [':)']})
+            assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Slow :)'}
+
+    worker = threading.Thread(target=call)
+    worker.start()
+    while not slowlog._active_calls:
+        time.sleep(0.001)
+    slowlog.max_stack_samples = 2
+    for _ in range(3):
+        slowlog.sample()
+    proceed.set()
+    worker.join()
+
+    assert len(slowlog.records) == 1
+    stack_samples = slowlog.records[0]['stack_samples']
+    assert len(stack_samples) == 2
+    assert 'in slow' in stack_samples[0]
+    assert 'proceed.wait(5)' in stack_samples[0]
+
+
+def test_slowlog_sampler_thread() -> None:
+    app, _, slowlog, proceed = create_app(threshold=10.0, sample_interval=0.005)
+    assert slowlog._sampler is None
+
+    def call() -> None:
+        with app.test_client() as client:
+            rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.slow', 'params': [':)']})
+            assert rv.status_code == 200
+
+    worker = threading.Thread(target=call)
+    worker.start()
+    while slowlog._sampler is None or not slowlog._sampler.is_alive():
+        time.sleep(0.001)
+    sampler = slowlog._sampler
+    slowlog.start_sampler()
+    assert slowlog._sampler is sampler
+
+    active_call = next(iter(slowlog._active_calls.values()))
+    deadline = time.monotonic() + 5
+    while not active_call.stack_samples and time.monotonic() < deadline:
+        time.sleep(0.005)
+    proceed.set()
+    worker.join()
+    slowlog.stop_sampler()
+
+    assert slowlog._sampler is None
+    assert not sampler.is_alive()
+    assert slowlog.records[0]['stack_samples']
+    slowlog.stop_sampler()
+
+
+def test_slowlog_init_later_with_request_timings() -> None:
+    app, jsonrpc, _, proceed = create_app(threshold=10.0)
+    proceed.set()
+    slowlog = SlowCallLog(threshold=0.0)
+    slowlog.init_app(app, jsonrpc)
+    timings: list[dict[str, float]] = []
+
+    def on_request_timed(sender: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        timings.append(kwargs['timings'])
+
+    with app.test_client() as client, request_timed.connected_to(on_request_timed):
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fast', 'params': [':)']})
+        assert rv.status_code == 200
+
+    assert len(timings) == 1
+    assert 'total' in timings[0]
+    assert list(slowlog.records[0]['timings']) == ['validate', 'bind', 'check', 'view', 'return']
+
+    # Calls of threads that are gone are not sampled
+    slowlog._active_calls[-1] = ActiveCall(method='app.fast', started_at=0.0, threshold=0.0, thread_id=-1)
+    slowlog.sample()
+    assert slowlog._active_calls[-1].stack_samples == []
+
+
+def test_slowlog_calls_sharing_a_thread() -> None:
+    app, jsonrpc, slowlog, proceed = create_app(threshold=0.0)
+    proceed.set()
+    site = jsonrpc.get_jsonrpc_site()
+    req_slow = {'id': 1, 'jsonrpc': '2.0', 'method': 'app.slow', 'params': [':)']}
+    req_fast = {'id': 2, 'jsonrpc': '2.0', 'method': 'app.fast', 'params': [':)']}
+
+    # The calls of an ASGI application run interleaved on the event loop thread, each one in its own context
+    with app.app_context():
+        ctx_slow, ctx_fast = contextvars.copy_context(), contextvars.copy_context()
+        ctx_slow.run(slowlog.start_call, site, req_json=req_slow)
+        ctx_fast.run(slowlog.start_call, site, req_json=req_fast)
+        assert len(slowlog._active_calls) == 2
+        ctx_fast.run(slowlog.end_call, site, req_json=req_fast, response={'id': 2}, duration=0.1)
+        ctx_slow.run(slowlog.end_call, site, req_json=req_slow, response={'id': 1}, duration=0.2)
+        ctx_slow.run(slowlog.end_call, site, req_json=req_slow, response={'id': 1}, duration=0.2)
+
+    assert slowlog._active_calls == {}
+    assert [(r['method'], r['id'], r['duration']) for r in slowlog.records] == [
+        ('app.fast', 2, 0.1),
+        ('app.slow', 1, 0.2),
+    ]
+
+
+def test_slowlog_with_binary_params() -> None:
+    app, jsonrpc, slowlog, proceed = create_app(threshold=0.0)
+    jsonrpc.register_codec(MessagePackCodec())
+    proceed.set()
+
+    @jsonrpc.method('app.size')
+    def size(data: t.Any) -> int:  # noqa: ANN401
+        return len(data)
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api',
+            data=msgpack.packb({'id': 1, 'jsonrpc': '2.0', 'method': 'app.size', 'params': [b'\x00\xff']}),
+            content_type='application/msgpack',
+        )
+        assert msgpack.unpackb(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': 2}
+
+    assert [record['method'] for record in slowlog.records] == ['app.size']
+    assert slowlog.records[0]['params_size'] == 0
@@ -0,0 +1,277 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import json
+import typing as t
+
+from flask import Flask
+
+import msgpack
+from opentelemetry.trace import SpanKind, StatusCode
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.codecs import MessagePackCodec
+from flask_jsonrpc.contrib.tracing import NoopTracer, InMemoryTracer, JSONRPCTracing, OpenTelemetryTracer
+
+
+def create_app(tracer: InMemoryTracer | OpenTelemetryTracer) -> tuple[Flask, JSONRPC, JSONRPCBlueprint]:
+    app = Flask('test_tracing', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    jsonrpc_bp = JSONRPCBlueprint('bp', __name__)
+
+    @jsonrpc.method('app.fn1')
+    def fn1(s: str) -> str:
+        return f'Foo {s}'
+
+    @jsonrpc.method('app.fail')
+    def fail() -> str:
+        raise ValueError('Boom')
+
+    @jsonrpc_bp.method('bp.fn2')
+    def fn2(s: str) -> str:
+        return f'Bar {s}'
+
+    jsonrpc.register_blueprint(app, jsonrpc_bp, url_prefix='/bp')
+    JSONRPCTracing(app, jsonrpc, tracer=tracer)
+    return app, jsonrpc, jsonrpc_bp
+
+
+def test_tracing_default_tracer() -> None:
+    tracing = JSONRPCTracing()
+    assert isinstance(tracing.tracer, OpenTelemetryTracer)
+
+
+def test_tracing_noop_tracer() -> None:
+    app = Flask('test_tracing', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    JSONRPCTracing(app, jsonrpc, tracer=NoopTracer())
+    assert jsonrpc.get_jsonrpc_site().before_request_funcs == []
+    assert jsonrpc.get_jsonrpc_site().teardown_request_funcs == []
+
+    span = NoopTracer().start_span('jsonrpc.request')
+    span.set_attribute('rpc.system', 'jsonrpc')
+    span.set_error('Boom')
+    span.record_exception(ValueError('Boom'))
+    span.end()
+
+
+def test_tracing_in_memory_tracer() -> None:
+    tracer = InMemoryTracer()
+    app, _, _ = create_app(tracer)
+
+    body = json.dumps(
+        [
+            {'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']},
+            {'id': 'a', 'jsonrpc': '2.0', 'method': 'app.fail'},
+            {'id': 3, 'jsonrpc': '2.0', 'method': 'app.not_found', 'params': {'s': 1}},
+            1,
+            {'id': 5, 'method': ['app.fn1']},
+        ]
+    )
+    with app.test_client() as client:
+        rv = client.post('/api', data=body, content_type='application/json')
+        assert rv.status_code == 200
+
+        spans = tracer.get_finished_spans()
+        assert [span.name for span in spans] == [
+            'app.fn1',
+            'app.fail',
+            'app.not_found',
+            'jsonrpc.call',
+            'jsonrpc.call',
+            'jsonrpc.request',
+        ]
+        request_span = spans[-1]
+        assert request_span.parent is None
+        assert request_span.attributes == {
+            'rpc.system': 'jsonrpc',
+            'url.path': '/api',
+            'http.request.body.size': len(body),
+            'rpc.jsonrpc.batch_size': 5,
+        }
+        assert request_span.error is None
+        assert all(span.parent is request_span for span in spans[:-1])
+        assert all(span.end_time is not None and span.end_time >= span.start_time for span in spans)
+        assert spans[0].attributes == {
+            'rpc.system': 'jsonrpc',
+            'rpc.method': 'app.fn1',
+            'rpc.jsonrpc.request_id': '1',
+            'rpc.jsonrpc.version': '2.0',
+            'rpc.jsonrpc.params.size': 6,
+        }
+        assert spans[0].error is None
+        assert spans[1].attributes['rpc.jsonrpc.request_id'] == 'a'
+        assert spans[1].attributes['rpc.jsonrpc.error_code'] == -32000
+        assert spans[1].error == 'Server error'
+        assert spans[2].attributes['rpc.jsonrpc.error_code'] == -32601
+        assert spans[2].attributes['rpc.jsonrpc.params.size'] == 8
+        assert spans[3].attributes == {
+            'rpc.system': 'jsonrpc',
+            'rpc.jsonrpc.error_code': -32600,
+            'rpc.jsonrpc.error_message': 'Invalid Request',
+        }
+        assert spans[4].attributes == {
+            'rpc.system': 'jsonrpc',
+            'rpc.jsonrpc.request_id': '5',
+            'rpc.jsonrpc.error_code': -32000,
+            'rpc.jsonrpc.error_message': 'Server error',
+        }
+
+        tracer.clear()
+        rv = client.post('/api/bp', json={'jsonrpc': '2.0', 'method': 'bp.fn2', 'params': [':)']})
+        assert rv.status_code == 204
+        spans = tracer.get_finished_spans()
+        assert [span.name for span in spans] == ['bp.fn2', 'jsonrpc.request']
+        assert 'rpc.jsonrpc.request_id' not in spans[0].attributes
+        assert 'rpc.jsonrpc.batch_size' not in spans[1].attributes
+
+        tracer.clear()
+        rv = client.post('/api', data='{"id": 1', content_type='application/json')
+        assert rv.status_code == 400
+        spans = tracer.get_finished_spans()
+        assert [span.name for span in spans] == ['jsonrpc.request']
+        assert spans[0].error == 'Parse error'
+        assert len(spans[0].exceptions) == 1
+
+
+def test_tracing_ends_dangling_call_span() -> None:
+    tracer = InMemoryTracer()
+    app, jsonrpc, _ = create_app(tracer)
+
+    @jsonrpc.errorhandler(ValueError)
+    def handle_value_error(ex: ValueError) -> dict[str, str]:
+        raise RuntimeError('Error handler failed') from ex
+
+    app.config['PROPAGATE_EXCEPTIONS'] = False
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.fail'})
+        assert rv.status_code == 500
+
+    spans = tracer.get_finished_spans()
+    assert [span.name for span in spans] == ['app.fail', 'jsonrpc.request']
+    assert spans[0].error is None
+    assert spans[1].error == 'Error handler failed'
+
+
+def test_tracing_opentelemetry_tracer() -> None:
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = OpenTelemetryTracer(tracer_provider=tracer_provider)
+    app, _, _ = create_app(tracer)
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.fn1', 'params': [':)']},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.fail'},
+            ],
+        )
+        assert rv.status_code == 200
+
+        spans = exporter.get_finished_spans()
+        assert [span.name for span in spans] == ['app.fn1', 'app.fail', 'jsonrpc.request']
+        request_span = spans[-1]
+        assert request_span.kind == SpanKind.SERVER
+        assert request_span.parent is None
+        for span in spans[:-1]:
+            assert span.kind == SpanKind.INTERNAL
+            assert span.parent is not None
+            assert span.parent.span_id == request_span.context.span_id
+            assert span.context.trace_id == request_span.context.trace_id
+        assert spans[0].attributes['rpc.method'] == 'app.fn1'
+        assert spans[0].status.status_code == StatusCode.UNSET
+        assert spans[1].attributes['rpc.jsonrpc.error_code'] == -32000
+        assert spans[1].status.status_code == StatusCode.ERROR
+        assert spans[1].status.description == 'Server error'
+
+        exporter.clear()
+        rv = client.post('/api', data='{"id": 1', content_type='application/json')
+        assert rv.status_code == 400
+        spans = exporter.get_finished_spans()
+        assert [span.name for span in spans] == ['jsonrpc.request']
+        assert spans[0].status.status_code == StatusCode.ERROR
+        assert spans[0].events[0].name == 'exception'
+
+
+def test_tracing_view_spans_are_children_of_the_call_span() -> None:
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = OpenTelemetryTracer(tracer_provider=tracer_provider)
+    app, jsonrpc, _ = create_app(tracer)
+
+    @jsonrpc.method('app.nested')
+    def nested() -> str:
+        with tracer.tracer.start_as_current_span('db.query'):
+            return 'OK'
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.nested'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'OK'}
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ['db.query', 'app.nested', 'jsonrpc.request']
+    assert spans[0].parent is not None
+    assert spans[0].parent.span_id == spans[1].context.span_id
+
+
+def test_tracing_without_open_spans() -> None:
+    tracer = InMemoryTracer()
+    app, jsonrpc, _ = create_app(tracer)
+    tracing = JSONRPCTracing(tracer=tracer)
+
+    with app.test_request_context('/api', method='POST'):
+        tracing.annotate_request([])
+        tracing.end_call(jsonrpc.get_jsonrpc_site(), response=None)
+        tracing.end_request(None)
+
+    assert tracer.get_finished_spans() == []
+
+
+def test_tracing_with_binary_params() -> None:
+    tracer = InMemoryTracer()
+    app, jsonrpc, _ = create_app(tracer)
+    jsonrpc.register_codec(MessagePackCodec())
+
+    @jsonrpc.method('app.size')
+    def size(data: t.Any) -> int:  # noqa: ANN401
+        return len(data)
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api',
+            data=msgpack.packb({'id': 1, 'jsonrpc': '2.0', 'method': 'app.size', 'params': [b'\x00\xff']}),
+            content_type='application/msgpack',
+        )
+        assert msgpack.unpackb(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': 2}
+
+    spans = tracer.get_finished_spans()
+    assert spans[0].attributes['rpc.jsonrpc.params.size'] == 0
@@ -0,0 +1,275 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import json
+import time
+import typing as t
+import threading
+
+from flask import Flask
+
+import pytest
+from werkzeug.serving import make_server
+
+from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.signals import request_started
+from flask_jsonrpc.contrib.websocket import JSONRPCWebSocket, current_session
+
+simple_websocket = pytest.importorskip('simple_websocket')
+
+
+class WebSocketServer:
+    def __init__(self, app: Flask) -> None:
+        self.server = make_server('127.0.0.1', 0, app, threaded=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> 'WebSocketServer':
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:  # noqa: ANN401
+        self.server.shutdown()
+        self.thread.join()
+
+    def connect(self, path: str = '/api/ws') -> t.Any:  # noqa: ANN401
+        return simple_websocket.Client.connect(f'ws://127.0.0.1:{self.server.port}{path}')
+
+
+def receive(ws: t.Any) -> t.Any:  # noqa: ANN401
+    return json.loads(ws.receive(timeout=5))
+
+
+def test_websocket_create() -> None:
+    app = Flask('test_websocket', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    websocket = JSONRPCWebSocket(app, jsonrpc, ping_interval=None)
+    released = threading.Event()
+    started = []
+
+    @jsonrpc.method('app.echo')
+    def echo(s: str) -> str:
+        return s
+
+    @jsonrpc.method('app.slow')
+    def slow(s: str) -> str:
+        released.wait(5)
+        return s
+
+    @jsonrpc.method('app.release')
+    def release() -> bool:
+        released.set()
+        return True
+
+    @jsonrpc.method('app.subscribe')
+    def subscribe(topic: str) -> str:
+        session = current_session()
+        assert session is not None
+        session.notify('app.subscribed', {'topic': topic})
+        return topic
+
+    assert websocket.path == '/api/ws'
+    assert app.extensions['jsonrpc_websocket'] is websocket
+    assert current_session() is None
+
+    with app.test_client() as client:
+        rv = client.get('/api/ws')
+        assert rv.status_code == 400
+
+    with WebSocketServer(app) as server, request_started.connected_to(lambda sender, **kwargs: started.append(sender)):
+        ws = server.connect()
+        try:
+            ws.send(json.dumps({'id': 1, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': [':)']}))
+            assert receive(ws) == {'id': 1, 'jsonrpc': '2.0', 'result': ':)'}
+
+            ws.send(json.dumps({'id': 2, 'jsonrpc': '2.0', 'method': 'app.slow', 'params': ['slow']}))
+            ws.send(json.dumps({'id': 3, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['fast']}))
+            assert receive(ws) == {'id': 3, 'jsonrpc': '2.0', 'result': 'fast'}
+            ws.send(json.dumps({'id': 4, 'jsonrpc': '2.0', 'method': 'app.release'}))
+            assert {receive(ws)['id'], receive(ws)['id']} == {2, 4}
+
+            ws.send(json.dumps({'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['notification']}))
+            ws.send(b'{"id": 5, "jsonrpc": "2.0", "method": "app.echo", "params": ["bytes"]}')
+            assert receive(ws) == {'id': 5, 'jsonrpc': '2.0', 'result': 'bytes'}
+
+            ws.send('{"id": 6,')
+            assert receive(ws)['error']['code'] == -32700
+
+            ws.send(
+                json.dumps(
+                    [
+                        {'id': 7, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['a']},
+                        {'id': 8, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['b']},
+                    ]
+                )
+            )
+            assert receive(ws) == [
+                {'id': 7, 'jsonrpc': '2.0', 'result': 'a'},
+                {'id': 8, 'jsonrpc': '2.0', 'result': 'b'},
+            ]
+
+            ws.send(json.dumps({'id': 9, 'jsonrpc': '2.0', 'method': 'app.subscribe', 'params': ['news']}))
+            assert receive(ws) == {'jsonrpc': '2.0', 'method': 'app.subscribed', 'params': {'topic': 'news'}}
+            assert receive(ws) == {'id': 9, 'jsonrpc': '2.0', 'result': 'news'}
+
+            assert len(websocket.sessions) == 1
+            websocket.broadcast('app.ping')
+            assert receive(ws) == {'jsonrpc': '2.0', 'method': 'app.ping'}
+        finally:
+            ws.close()
+
+        for _ in range(50):
+            if not websocket.sessions:
+                break
+            time.sleep(0.1)
+        assert websocket.sessions == set()
+        assert len(started) == 9
+
+
+def test_websocket_backpressure() -> None:
+    app = Flask('test_websocket', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    websocket = JSONRPCWebSocket(max_in_flight=1, path='/ws')
+    websocket.init_app(app, jsonrpc)
+    released = threading.Event()
+    calls = []
+
+    @jsonrpc.method('app.slow')
+    def slow(n: int) -> int:
+        calls.append(n)
+        released.wait(5)
+        return n
+
+    @jsonrpc.before_request
+    def cached(req_json: t.Any) -> bytes | None:  # noqa: ANN401
+        if isinstance(req_json, dict) and req_json.get('method') == 'app.cached':
+            return b'{"id": 9, "jsonrpc": "2.0", "result": "cached"}'
+        return None
+
+    with WebSocketServer(app) as server:
+        ws = server.connect('/ws')
+        try:
+            ws.send(json.dumps({'id': 1, 'jsonrpc': '2.0', 'method': 'app.slow', 'params': [1]}))
+            ws.send(json.dumps({'id': 2, 'jsonrpc': '2.0', 'method': 'app.slow', 'params': [2]}))
+            time.sleep(0.2)
+            assert calls == [1]
+
+            released.set()
+            assert receive(ws) == {'id': 1, 'jsonrpc': '2.0', 'result': 1}
+            assert receive(ws) == {'id': 2, 'jsonrpc': '2.0', 'result': 2}
+            assert calls == [1, 2]
+
+            ws.send(json.dumps({'id': 9, 'jsonrpc': '2.0', 'method': 'app.cached'}))
+            assert receive(ws) == {'id': 9, 'jsonrpc': '2.0', 'result': 'cached'}
+
+            released.clear()
+            ws.send(json.dumps({'id': 3, 'jsonrpc': '2.0', 'method': 'app.slow', 'params': [3]}))
+            for _ in range(50):
+                if len(calls) == 3:
+                    break
+                time.sleep(0.1)
+            (session,) = websocket.sessions
+        finally:
+            ws.close()
+
+        for _ in range(50):
+            if not session.ws.connected:
+                break
+            time.sleep(0.1)
+        released.set()
+        for _ in range(50):
+            if not websocket.sessions:
+                break
+            time.sleep(0.1)
+        assert websocket.sessions == set()
+
+
+def test_websocket_unexpected_error() -> None:
+    app = Flask('test_websocket', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    websocket = JSONRPCWebSocket(app, jsonrpc, ping_interval=None)
+    site = jsonrpc.get_jsonrpc_site()
+
+    @jsonrpc.method('app.echo')
+    def echo(s: str) -> str:
+        return s
+
+    @jsonrpc.before_request
+    def crash(req_json: t.Any) -> None:  # noqa: ANN401
+        if isinstance(req_json, list) or req_json.get('method') == 'app.crash':
+            raise RuntimeError('crash')
+
+    def dispatch_message(data: bytes) -> t.Any:  # noqa: ANN401
+        if data.startswith(b'boom'):
+            raise RuntimeError('boom')
+        return original_dispatch_message(data)
+
+    original_dispatch_message = site.dispatch_message
+    site.dispatch_message = dispatch_message  # type: ignore[method-assign]
+
+    with WebSocketServer(app) as server:
+        ws = server.connect()
+        try:
+            ws.send(json.dumps({'id': 1, 'jsonrpc': '2.0', 'method': 'app.crash'}))
+            assert receive(ws) == {
+                'id': 1,
+                'jsonrpc': '2.0',
+                'error': {
+                    'code': -32000,
+                    'data': {'message': 'crash'},
+                    'message': 'Server error',
+                    'name': 'ServerError',
+                },
+            }
+
+            ws.send(json.dumps([{'id': 2, 'jsonrpc': '2.0', 'method': 'app.crash'}]))
+            assert receive(ws)['id'] is None
+
+            ws.send('boom')
+            assert receive(ws)['id'] is None
+
+            ws.send(json.dumps({'id': 3, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['ok']}))
+            assert receive(ws) == {'id': 3, 'jsonrpc': '2.0', 'result': 'ok'}
+        finally:
+            ws.close()
+
+        for _ in range(50):
+            if not websocket.sessions:
+                break
+            time.sleep(0.1)
+        assert websocket.sessions == set()
+
+
+def test_websocket_broadcast_closed_session() -> None:
+    app = Flask('test_websocket', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    websocket = JSONRPCWebSocket(app, jsonrpc)
+
+    class ClosedSession:
+        def notify(self, method: str, params: t.Any = None) -> None:  # noqa: ANN401
+            raise simple_websocket.ConnectionClosed()
+
+    websocket.sessions.add(ClosedSession())  # type: ignore[arg-type]
+    websocket.broadcast('app.ping', [1])
@@ -38,6 +38,7 @@ import pytest
 from werkzeug.datastructures import Headers
 
 from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.encoders import RawJSON
 
 # Added in version 3.11.
 try:
@@ -791,3 +792,154 @@ def test_app_create_with_register_browse_when_jsonrpc_browse_is_null_raises_exc(
 
     with pytest.raises(RuntimeError):
         jsonrpc.register_browse(mock_jsonrpc_blueprint)
+
+
+def test_app_before_and_teardown_request() -> None:
+    app = Flask('test_app', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    calls: list[str] = []
+
+    @jsonrpc.method('app.index')
+    def index() -> str:
+        calls.append('index')
+        return 'Welcome to Flask JSON-RPC'
+
+    @jsonrpc.before_request
+    def before_request(req_json: t.Any) -> t.Any:  # noqa: ANN401
+        calls.append('before')
+        if req_json.get('method') == 'app.blocked':
+            return {'id': req_json.get('id'), 'jsonrpc': '2.0', 'result': 'Blocked'}, 403, {'X-Blocked': '1'}
+        return None
+
+    @jsonrpc.teardown_request
+    def teardown_request(exc: BaseException | None) -> None:
+        calls.append('teardown')
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.index'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Welcome to Flask JSON-RPC'}
+        assert rv.status_code == 200
+
+        rv = client.post('/api', json={'id': 2, 'jsonrpc': '2.0', 'method': 'app.blocked'})
+        assert rv.json == {'id': 2, 'jsonrpc': '2.0', 'result': 'Blocked'}
+        assert rv.status_code == 403
+        assert rv.headers['X-Blocked'] == '1'
+
+    assert calls == ['before', 'index', 'teardown', 'before', 'teardown']
+
+
+def test_app_get_idempotent_and_cacheable_methods() -> None:
+    app = Flask('test_app', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.sum', cacheable=60)
+    def sum_(a: int, b: int) -> int:
+        return a + b
+
+    @jsonrpc.method('app.hello', idempotent=True)
+    def hello(name: str = 'Flask JSON-RPC') -> str:
+        return f'Hello {name}'
+
+    @jsonrpc.method('app.fail', idempotent=True)
+    def fail() -> str:
+        raise ValueError('fail')
+
+    @jsonrpc.method('app.update')
+    def update(n: int) -> int:
+        return n
+
+    with app.test_client() as client:
+        rv = client.get('/api', query_string={'method': 'app.sum', 'params': '[1, 2]', 'id': '1'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 3}
+        assert rv.status_code == 200
+        assert rv.headers['Cache-Control'] == 'public, max-age=60'
+        assert rv.headers['ETag']
+        assert 'Last-Modified' not in rv.headers
+        assert 'Vary' not in rv.headers
+
+        rv = client.get(
+            '/api',
+            query_string={'method': 'app.sum', 'params': '[1, 2]', 'id': '1'},
+            headers={'If-None-Match': rv.headers['ETag']},
+        )
+        assert rv.status_code == 304
+        assert rv.data == b''
+
+        rv = client.get('/api', query_string={'method': 'app.hello', 'id': 'abc'})
+        assert rv.json == {'id': 'abc', 'jsonrpc': '2.0', 'result': 'Hello Flask JSON-RPC'}
+        assert rv.headers['Cache-Control'] == 'no-cache'
+
+        rv = client.get('/api', query_string={'method': 'app.hello', 'params': '["Eve"]'})
+        assert rv.json == {'id': None, 'jsonrpc': '2.0', 'result': 'Hello Eve'}
+
+        rv = client.get('/api', query_string={'method': 'app.fail', 'id': '1'})
+        assert rv.json['error']['code'] == -32000
+        assert 'Cache-Control' not in rv.headers
+        assert 'ETag' not in rv.headers
+
+        rv = client.get('/api', query_string={'method': 'app.update', 'params': '[1]', 'id': '1'})
+        assert rv.json['error']['code'] == -32600
+        assert rv.json['error']['data'] == {
+            'message': "Method 'app.update' can not be called with GET, register it with the idempotent or "
+            'cacheable options'
+        }
+        assert rv.status_code == 400
+
+        rv = client.get('/api', query_string={'method': 'app.sum', 'params': '[1, 2', 'id': '1'})
+        assert rv.json['error']['code'] == -32700
+        assert rv.json['error']['data'] == {'message': "Invalid JSON: '[1, 2'"}
+
+        rv = client.get('/api', query_string={'method': 'app.unknown', 'id': '1'})
+        assert rv.json['error']['code'] == -32601
+        assert 'Cache-Control' not in rv.headers
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [1, 2]})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 3}
+        assert 'Cache-Control' not in rv.headers
+
+
+def test_app_raw_json_results() -> None:
+    app = Flask('test_app', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    documents = {1: b'{"id": 1, "tags": ["a", "b"]}', 2: b'{"id": 2, "tags": []'}
+
+    @jsonrpc.method('app.document')
+    def document(doc_id: int) -> RawJSON:
+        return RawJSON(documents[doc_id], validate=doc_id > 1)
+
+    @jsonrpc.method('app.documents')
+    def documents_(doc_ids: list[int]) -> list[RawJSON]:
+        return [RawJSON(documents[doc_id]) for doc_id in doc_ids]
+
+    @jsonrpc.method('app.document_dict')
+    def document_dict(doc_id: int) -> dict[str, t.Any]:
+        return RawJSON(documents[doc_id])  # type: ignore[return-value]
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.document', 'params': [1]})
+        assert rv.data == b'{"id":1,"jsonrpc":"2.0","result":{"id": 1, "tags": ["a", "b"]}}\n'
+        assert rv.status_code == 200
+
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.documents', 'params': [[1, 1]]},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.document', 'params': [1]},
+            ],
+        )
+        assert rv.json == [
+            {'id': 1, 'jsonrpc': '2.0', 'result': [{'id': 1, 'tags': ['a', 'b']}, {'id': 1, 'tags': ['a', 'b']}]},
+            {'id': 2, 'jsonrpc': '2.0', 'result': {'id': 1, 'tags': ['a', 'b']}},
+        ]
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.document', 'params': [2]})
+        assert rv.json['error']['code'] == -32000
+        assert rv.json['error']['data']['message'].startswith("Expecting ',' delimiter")
+        assert rv.status_code == 500
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.document_dict', 'params': [1]})
+        assert rv.json['error']['code'] == -32602
+        assert rv.status_code == 400
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'rpc.describe'})
+        assert rv.json['result']['methods']['app.document']['returns'] == {'name': 'default', 'type': 'Object'}
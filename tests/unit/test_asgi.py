@@ -0,0 +1,512 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import gzip
+import json
+import time
+import typing as t
+import asyncio
+
+from flask import Flask, g, request
+
+import pytest
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.asgi import JSONRPCASGIApp
+from flask_jsonrpc.signals import call_started, call_finished, request_started
+from flask_jsonrpc.exceptions import JSONRPCError
+from flask_jsonrpc.contrib.tracing import InMemoryTracer, JSONRPCTracing
+from flask_jsonrpc.contrib.ratelimit import RateLimiter, header_key
+
+pytest.importorskip('asgiref')
+
+
+class ASGIResponse(t.NamedTuple):
+    status_code: int
+    headers: dict[bytes, bytes]
+    body: bytes
+
+    @property
+    def json(self) -> t.Any:  # noqa: ANN401
+        return json.loads(self.body)
+
+
+async def asgi_request(
+    asgi_app: JSONRPCASGIApp,
+    data: t.Any = None,  # noqa: ANN401
+    *,
+    path: str = '/api',
+    method: str = 'POST',
+    body: bytes | None = None,
+    chunks: list[bytes] | None = None,
+    headers: list[tuple[bytes, bytes]] | None = None,
+    **extra_scope: t.Any,  # noqa: ANN401
+) -> ASGIResponse | None:
+    if chunks is None:
+        chunks = [json.dumps(data).encode('utf-8') if body is None else body]
+    messages = [
+        {'type': 'http.request', 'body': chunk, 'more_body': i < len(chunks) - 1} for i, chunk in enumerate(chunks)
+    ]
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode('latin-1'),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'content-type', b'application/json')] if headers is None else headers,
+        **extra_scope,
+    }
+    sent: list[t.MutableMapping[str, t.Any]] = []
+
+    async def receive() -> t.MutableMapping[str, t.Any]:
+        return messages.pop(0) if messages else {'type': 'http.disconnect'}
+
+    async def send(message: t.MutableMapping[str, t.Any]) -> None:
+        sent.append(message)
+
+    await asgi_app(scope, receive, send)
+    if not sent:
+        return None
+    start, body_message = sent
+    return ASGIResponse(start['status'], dict(start['headers']), body_message['body'])
+
+
+def test_asgi_app() -> None:  # noqa: C901
+    app = Flask('test_asgi', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    event = asyncio.Event()
+
+    @jsonrpc.method('app.sync')
+    def sync(s: str) -> str:
+        return f'Sync {s}'
+
+    @jsonrpc.method('app.async')
+    async def async_(s: str) -> str:
+        await asyncio.sleep(0)
+        return f'Async {s}'
+
+    @jsonrpc.method('app.sleep')
+    async def sleep(seconds: float) -> float:
+        await asyncio.sleep(seconds)
+        return seconds
+
+    @jsonrpc.method('app.wait')
+    async def wait() -> str:
+        await event.wait()
+        return 'waited'
+
+    @jsonrpc.method('app.set')
+    async def set_() -> str:
+        event.set()
+        return 'set'
+
+    @jsonrpc.method('app.stream')
+    async def stream(n: int) -> t.AsyncGenerator[int, None]:
+        for i in range(n):
+            yield i
+
+    @jsonrpc.method('app.headers')
+    async def headers() -> tuple[str, dict[str, str]]:
+        return 'headers', {'X-Foo': 'bar'}
+
+    @jsonrpc.method('app.untyped', validate=True)
+    async def untyped():  # type: ignore[no-untyped-def] # noqa: ANN202
+        return 'untyped'
+
+    @jsonrpc.method('app.notify', notification=True)
+    async def notify(s: str) -> None:
+        g.notified = s
+
+    @jsonrpc.method('app.no_notification', notification=False)
+    async def no_notification() -> str:
+        return 'no'
+
+    @jsonrpc.teardown_request
+    def teardown(exc: BaseException | None) -> None:
+        assert exc is None
+
+    asgi_app = JSONRPCASGIApp(app, jsonrpc)
+    assert list(asgi_app.jsonrpc_sites) == ['/api']
+
+    async def run() -> None:
+        rv = await asgi_request(asgi_app, {'id': 1, 'jsonrpc': '2.0', 'method': 'app.sync', 'params': [':)']})
+        assert rv is not None
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Sync :)'}
+        assert rv.status_code == 200
+        assert rv.headers == {b'content-type': b'application/json', b'content-length': str(len(rv.body)).encode()}
+
+        rv = await asgi_request(asgi_app, {'id': 2, 'jsonrpc': '2.0', 'method': 'app.async', 'params': {'s': ':)'}})
+        assert rv is not None
+        assert rv.json == {'id': 2, 'jsonrpc': '2.0', 'result': 'Async :)'}
+
+        rv = await asgi_request(asgi_app, {'id': 3, 'jsonrpc': '2.0', 'method': 'app.stream', 'params': [3]})
+        assert rv is not None
+        assert rv.json == {'id': 3, 'jsonrpc': '2.0', 'result': [0, 1, 2]}
+
+        rv = await asgi_request(asgi_app, {'id': 4, 'jsonrpc': '2.0', 'method': 'app.headers'})
+        assert rv is not None
+        assert rv.json == {'id': 4, 'jsonrpc': '2.0', 'result': 'headers'}
+        assert rv.headers[b'x-foo'] == b'bar'
+
+        rv = await asgi_request(
+            asgi_app,
+            [
+                {'id': 5, 'jsonrpc': '2.0', 'method': 'app.wait'},
+                {'id': 6, 'jsonrpc': '2.0', 'method': 'app.set'},
+                {'jsonrpc': '2.0', 'method': 'app.notify', 'params': [':)']},
+                {'id': 7, 'jsonrpc': '2.0', 'method': 'app.headers'},
+                1,
+            ],
+        )
+        assert rv is not None
+        assert rv.json == [
+            {'id': 5, 'jsonrpc': '2.0', 'result': 'waited'},
+            {'id': 6, 'jsonrpc': '2.0', 'result': 'set'},
+            {'id': 7, 'jsonrpc': '2.0', 'result': 'headers'},
+            {
+                'id': None,
+                'jsonrpc': '2.0',
+                'error': {
+                    'code': -32600,
+                    'data': {'message': 'Invalid JSON: 1'},
+                    'message': 'Invalid Request',
+                    'name': 'InvalidRequestError',
+                },
+            },
+        ]
+        assert rv.headers[b'x-foo'] == b'bar'
+        assert rv.status_code == 200
+
+        rv = await asgi_request(asgi_app, [{'jsonrpc': '2.0', 'method': 'app.notify', 'params': [':)']}])
+        assert rv is not None
+        assert rv.body == b''
+        assert rv.status_code == 204
+        assert rv.headers == {b'content-length': b'0'}
+
+        rv = await asgi_request(asgi_app, [])
+        assert rv is not None
+        assert rv.json['error']['code'] == -32600
+        assert rv.status_code == 400
+
+        rv = await asgi_request(asgi_app, {'id': 8, 'jsonrpc': '2.0', 'method': 'app.async', 'params': [1]})
+        assert rv is not None
+        assert rv.json['error']['code'] == -32602
+        assert rv.status_code == 400
+
+        rv = await asgi_request(asgi_app, {'id': 9, 'jsonrpc': '2.0', 'method': 'app.untyped'})
+        assert rv is not None
+        assert rv.json['error']['code'] == -32602
+
+        rv = await asgi_request(asgi_app, {'id': 10, 'jsonrpc': '2.0', 'method': 'app.sync', 'params': 1})
+        assert rv is not None
+        assert rv.json['error']['code'] == -32602
+
+        rv = await asgi_request(asgi_app, {'id': 11, 'jsonrpc': '2.0', 'method': 'app.unknown'})
+        assert rv is not None
+        assert rv.json['error']['code'] == -32601
+        assert rv.status_code == 400
+
+        rv = await asgi_request(asgi_app, {'jsonrpc': '2.0', 'method': 'app.no_notification'})
+        assert rv is not None
+        assert rv.json['error']['code'] == -32600
+
+        rv = await asgi_request(asgi_app, body=b'{"id": 12,')
+        assert rv is not None
+        assert rv.json == {
+            'id': None,
+            'jsonrpc': '2.0',
+            'error': {
+                'code': -32700,
+                'data': {'message': 'Invalid JSON: b\'{"id": 12,\''},
+                'message': 'Parse error',
+                'name': 'ParseError',
+            },
+        }
+        assert rv.status_code == 400
+
+        rv = await asgi_request(asgi_app, {'id': 13}, headers=[(b'content-type', b'text/plain')])
+        assert rv is not None
+        assert rv.json['error']['data'] == {
+            'message': 'Invalid mime type for JSON: text/plain, use header Content-Type: application/json'
+        }
+
+        rv = await asgi_request(asgi_app, {'id': 14}, path='/unknown')
+        assert rv == (404, {b'content-type': b'text/plain; charset=utf-8', b'content-length': b'9'}, b'Not Found')
+
+        rv = await asgi_request(asgi_app, {'id': 15}, method='GET')
+        assert rv is not None
+        assert rv.status_code == 405
+        assert rv.headers[b'allow'] == b'POST'
+
+        rv = await asgi_request(
+            asgi_app,
+            body=gzip.compress(b'{"id": 16, "jsonrpc": "2.0", "method": "app.sync", "params": ["gzip"]}'),
+            headers=[(b'content-type', b'application/json; charset=utf-8'), (b'content-encoding', b'gzip')],
+        )
+        assert rv is not None
+        assert rv.json == {'id': 16, 'jsonrpc': '2.0', 'result': 'Sync gzip'}
+
+        rv = await asgi_request(
+            asgi_app, {'id': 17}, headers=[(b'content-type', b'application/json'), (b'content-encoding', b'br2')]
+        )
+        assert rv is not None
+        assert rv.json['error']['code'] == -32700
+        assert rv.status_code == 415
+
+        rv = await asgi_request(
+            asgi_app,
+            chunks=[b'{"id": 18, "jsonrpc": "2.0", ', b'"method": "app.sync", "params": ["chunks"]}'],
+            headers=[(b'content-type', b'application/json'), (b'content-encoding', b'identity')],
+        )
+        assert rv is not None
+        assert rv.json == {'id': 18, 'jsonrpc': '2.0', 'result': 'Sync chunks'}
+
+        assert await asgi_request(asgi_app, chunks=[b'{"id": 19,', b'']) is not None
+        assert await asgi_request(asgi_app, chunks=[]) is None
+
+        started_at = time.perf_counter()
+        rvs = await asyncio.gather(
+            *[
+                asgi_request(asgi_app, {'id': i, 'jsonrpc': '2.0', 'method': 'app.sleep', 'params': [0.2]})
+                for i in range(100)
+            ]
+        )
+        assert time.perf_counter() - started_at < 2.0
+        assert [rv.json['id'] for rv in rvs if rv is not None] == list(range(100))
+
+    asyncio.run(run())
+
+
+def test_asgi_app_hooks_and_error_handlers() -> None:  # noqa: C901
+    app = Flask('test_asgi', instance_relative_config=True)
+    app.config['MAX_CONTENT_LENGTH'] = 64
+    jsonrpc = JSONRPC(app, '/api')
+    user = JSONRPCBlueprint('user', __name__)
+    teardowns: list[BaseException | None] = []
+    started: list[t.Any] = []
+
+    class MyError(Exception):
+        pass
+
+    class OtherError(Exception):
+        pass
+
+    @user.method('user.index')
+    async def user_index() -> str:
+        return 'Welcome to user'
+
+    @user.method('user.fail')
+    async def user_fail() -> str:
+        raise MyError('fail')
+
+    @user.method('user.other')
+    def user_other() -> str:
+        raise OtherError('other')
+
+    @user.errorhandler(MyError)
+    async def handle_my_error(exc: MyError) -> dict[str, t.Any]:
+        return {'message': f'handled: {exc}'}
+
+    @user.before_request
+    async def cached(req_json: t.Any) -> t.Any:  # noqa: ANN401
+        if isinstance(req_json, dict) and req_json.get('method') == 'user.cached':
+            return b'{"id": 1, "jsonrpc": "2.0", "result": "cached"}', 200, {'X-Cache': 'hit'}
+        if isinstance(req_json, dict) and req_json.get('method') == 'user.crash':
+            raise RuntimeError('crash')
+        return None
+
+    @user.before_dispatch
+    async def reject(req_json: dict[str, t.Any]) -> None:
+        if req_json.get('method') == 'user.rejected':
+            raise JSONRPCError(message='Rejected', code=-32001, status_code=403)
+
+    @user.teardown_request
+    async def teardown(exc: BaseException | None) -> None:
+        teardowns.append(exc)
+
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    asgi_app = JSONRPCASGIApp(app, jsonrpc)
+    assert list(asgi_app.jsonrpc_sites) == ['/api', '/api/user']
+
+    async def run() -> None:
+        with request_started.connected_to(lambda sender, **kwargs: started.append(sender)):
+            rv = await asgi_request(asgi_app, {'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'}, path='/api/user')
+        assert rv is not None
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Welcome to user'}
+        assert started == [user.get_jsonrpc_site()]
+
+        with (
+            call_started.connected_to(lambda sender, **kwargs: started.append(kwargs['req_json'])),
+            call_finished.connected_to(lambda sender, **kwargs: started.append(kwargs['status_code'])),
+        ):
+            rv = await asgi_request(asgi_app, {'id': 2, 'jsonrpc': '2.0', 'method': 'user.fail'}, path='/api/user')
+        assert rv is not None
+        assert rv.json['error']['data'] == {'message': 'handled: fail'}
+        assert rv.status_code == 500
+        assert started[1:] == [{'id': 2, 'jsonrpc': '2.0', 'method': 'user.fail'}, 500]
+
+        rv = await asgi_request(asgi_app, {'id': 3, 'jsonrpc': '2.0', 'method': 'user.other'}, path='/api/user')
+        assert rv is not None
+        assert rv.json['error']['data'] == {'message': 'other'}
+        assert rv.status_code == 500
+
+        rv = await asgi_request(asgi_app, {'id': 4, 'jsonrpc': '2.0', 'method': 'user.cached'}, path='/api/user')
+        assert rv is not None
+        assert rv.body == b'{"id": 1, "jsonrpc": "2.0", "result": "cached"}'
+        assert rv.headers[b'x-cache'] == b'hit'
+
+        rv = await asgi_request(asgi_app, {'id': 5, 'jsonrpc': '2.0', 'method': 'user.rejected'}, path='/api/user')
+        assert rv is not None
+        assert rv.json['error']['code'] == -32001
+        assert rv.status_code == 403
+
+        rv = await asgi_request(asgi_app, {'id': 6, 'jsonrpc': '2.0', 'method': 'user.index', 'params': ['x' * 64]})
+        assert rv is not None
+        assert rv.json['error']['data'] == {'message': 'Request data exceeds 64 bytes'}
+        assert rv.status_code == 413
+
+        with pytest.raises(RuntimeError, match='crash'):
+            await asgi_request(asgi_app, {'id': 7, 'jsonrpc': '2.0', 'method': 'user.crash'}, path='/api/user')
+        assert teardowns[:5] == [None] * 5
+        assert isinstance(teardowns[5], RuntimeError)
+
+    asyncio.run(run())
+
+
+def test_asgi_app_request_context() -> None:
+    app = Flask('test_asgi', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    tracer = InMemoryTracer()
+    JSONRPCTracing(app, jsonrpc, tracer=tracer)
+    RateLimiter(app, jsonrpc, key_func=header_key('X-API-Key'))
+
+    @jsonrpc.method('app.index', rate_limit='1/m')
+    async def index() -> str:
+        return request.headers['X-Forwarded-For']
+
+    @jsonrpc.method('app.remote_addr')
+    def remote_addr() -> str:
+        return f'{request.remote_addr} {request.script_root} {request.path}'
+
+    asgi_app = JSONRPCASGIApp(app, jsonrpc)
+    data = {'id': 1, 'jsonrpc': '2.0', 'method': 'app.index'}
+    body = json.dumps(data).encode('utf-8')
+    headers = [
+        (b'content-type', b'application/json'),
+        (b'content-length', str(len(body)).encode('latin-1')),
+        (b'x-api-key', b'key'),
+        (b'x-forwarded-for', b'10.0.0.1'),
+        (b'x-forwarded-for', b'10.0.0.2'),
+    ]
+
+    async def run() -> None:
+        rv = await asgi_request(asgi_app, body=body, headers=headers, client=('127.0.0.1', 5000))
+        assert rv is not None
+        assert rv.status_code == 200
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': '10.0.0.1,10.0.0.2'}
+
+        rv = await asgi_request(asgi_app, body=body, headers=headers, client=('127.0.0.1', 5000))
+        assert rv is not None
+        assert rv.status_code == 429
+        assert rv.json['error']['name'] == 'RateLimitExceededError'
+
+        other_headers = [(b'x-api-key', b'other') if name == b'x-api-key' else (name, value) for name, value in headers]
+        rv = await asgi_request(asgi_app, body=body, headers=other_headers)
+        assert rv is not None
+        assert rv.status_code == 200
+
+        asgi_app.jsonrpc_sites['/root/api'] = jsonrpc.get_jsonrpc_site()
+        rv = await asgi_request(
+            asgi_app,
+            {'id': 2, 'jsonrpc': '2.0', 'method': 'app.remote_addr'},
+            path='/root/api',
+            root_path='/root',
+            client=('127.0.0.1', 5000),
+            server=('127.0.0.1', 8000),
+        )
+        assert rv is not None
+        assert rv.json == {'id': 2, 'jsonrpc': '2.0', 'result': '127.0.0.1 /root /api'}
+
+    asyncio.run(run())
+    spans = [span for span in tracer.get_finished_spans() if span.name == 'jsonrpc.request']
+    assert len(spans) == 4
+    assert spans[0].attributes['url.path'] == '/api'
+    assert spans[0].attributes['http.request.body.size'] == len(body)
+    assert spans[-1].attributes['url.path'] == '/api'
+
+
+def test_asgi_app_batch_tracing() -> None:
+    app = Flask('test_asgi', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    tracer = InMemoryTracer()
+    JSONRPCTracing(app, jsonrpc, tracer=tracer)
+
+    @jsonrpc.method('app.sleep')
+    async def sleep(n: int) -> int:
+        await asyncio.sleep(0.01 * (3 - n))
+        return n
+
+    asgi_app = JSONRPCASGIApp(app, jsonrpc)
+
+    async def run() -> None:
+        rv = await asgi_request(
+            asgi_app, [{'id': i, 'jsonrpc': '2.0', 'method': 'app.sleep', 'params': [i]} for i in range(3)]
+        )
+        assert rv is not None
+        assert rv.json == [{'id': i, 'jsonrpc': '2.0', 'result': i} for i in range(3)]
+
+    asyncio.run(run())
+    spans = tracer.get_finished_spans()
+    assert [span.name for span in spans] == ['app.sleep', 'app.sleep', 'app.sleep', 'jsonrpc.request']
+    assert [span.attributes['rpc.jsonrpc.request_id'] for span in spans[:3]] == ['2', '1', '0']
+    assert all(span.parent is spans[-1] for span in spans[:3])
+    assert spans[-1].attributes['rpc.jsonrpc.batch_size'] == 3
+
+
+def test_asgi_app_lifespan() -> None:
+    app = Flask('test_asgi', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    asgi_app = JSONRPCASGIApp(app, jsonrpc)
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.other'}, {'type': 'lifespan.shutdown'}]
+    sent: list[t.MutableMapping[str, t.Any]] = []
+
+    async def receive() -> t.MutableMapping[str, t.Any]:
+        return messages.pop(0)
+
+    async def send(message: t.MutableMapping[str, t.Any]) -> None:
+        sent.append(message)
+
+    async def run() -> None:
+        await asgi_app({'type': 'lifespan'}, receive, send)
+        with pytest.raises(RuntimeError, match='unsupported ASGI scope type: websocket'):
+            await asgi_app({'type': 'websocket', 'path': '/api'}, receive, send)
+
+    asyncio.run(run())
+    assert sent == [{'type': 'lifespan.startup.complete'}, {'type': 'lifespan.shutdown.complete'}]
@@ -0,0 +1,255 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from flask import Flask
+
+from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.cli import jsonrpc_cli
+from flask_jsonrpc.contrib.bench import BenchmarkResults
+from flask_jsonrpc.contrib.capture import TrafficRecorder
+
+
+def create_app() -> Flask:
+    app = Flask('test_cli', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.index')
+    def index() -> str:
+        return 'Welcome to Flask JSON-RPC'
+
+    @jsonrpc.method('app.sum')
+    def sum_(a: int, b: int) -> int:
+        return a + b
+
+    return app
+
+
+def test_bench(tmp_path: Path) -> None:
+    app = create_app()
+    runner = app.test_cli_runner()
+    output = tmp_path / 'results.json'
+
+    result = runner.invoke(jsonrpc_cli, ['bench', '--rounds', '3', '--warmup', '1', '--output', str(output)])
+    assert result.exit_code == 0, result.output
+    assert 'app.index' in result.stdout
+    assert 'median' in result.stdout
+    assert 'app.sum                          skipped: no example for the required params' in result.stderr
+    results = BenchmarkResults.load(str(output))
+    assert [benchmark['name'] for benchmark in results.benchmarks] == ['app.index']
+    assert results.skipped == [{'name': 'app.sum', 'reason': 'no example for the required params'}]
+
+
+def test_bench_baseline(tmp_path: Path) -> None:
+    app = create_app()
+    runner = app.test_cli_runner()
+    baseline = tmp_path / 'baseline.json'
+    args = ['bench', '--rounds', '3', '--warmup', '0', '--baseline', str(baseline)]
+
+    result = runner.invoke(jsonrpc_cli, args)
+    assert result.exit_code == 2
+    assert 'not found, create it with --save-baseline' in result.output
+
+    result = runner.invoke(jsonrpc_cli, ['bench', '--save-baseline'])
+    assert result.exit_code == 2
+    assert '--save-baseline requires --baseline' in result.output
+
+    result = runner.invoke(jsonrpc_cli, [*args, '--save-baseline'])
+    assert result.exit_code == 0, result.output
+    assert f'Saved the baseline to {baseline}' in result.stdout
+
+    result = runner.invoke(jsonrpc_cli, [*args, '--tolerance', '1000000'])
+    assert result.exit_code == 0, result.output
+    assert 'Compared with' in result.stdout
+    assert 'app.index                        unchanged' in result.stdout
+
+    data = json.loads(baseline.read_text())
+    data['benchmarks'][0]['stats']['p99'] = 1e-12
+    data['benchmarks'].append({'name': 'app.gone', 'group': '/api', 'stats': {'p99': 1.0}})
+    baseline.write_text(json.dumps(data))
+    result = runner.invoke(jsonrpc_cli, [*args, '--stat', 'p99'])
+    assert result.exit_code == 1
+    assert 'app.index                        regressed' in result.stdout
+    assert 'app.gone                         missing' in result.stdout
+    assert 'Error: 1 scenario(s) regressed: app.index' in result.stderr
+
+
+def test_bench_memory(tmp_path: Path) -> None:
+    app = create_app()
+    runner = app.test_cli_runner()
+    baseline = tmp_path / 'baseline.json'
+    args = ['bench', '--memory', '--rounds', '2', '--warmup', '1', '--baseline', str(baseline)]
+
+    result = runner.invoke(jsonrpc_cli, [*args, '--save-baseline'])
+    assert result.exit_code == 0, result.output
+    assert 'app.index                        peak ' in result.stdout
+    assert 'retained' in result.stdout
+    assert BenchmarkResults.load(str(baseline)).benchmarks[0]['stats']['rounds'] == 2
+
+    result = runner.invoke(jsonrpc_cli, [*args, '--stat', 'retained', '--tolerance', '1000000'])
+    assert result.exit_code == 0, result.output
+    assert 'Compared with' in result.stdout
+    assert '(retained, tolerance' in result.stdout
+
+    result = runner.invoke(jsonrpc_cli, [*args, '--stat', 'median'])
+    assert result.exit_code == 2
+    assert '--stat median is not a memory statistic, check --memory' in result.output
+
+    result = runner.invoke(jsonrpc_cli, ['bench', '--stat', 'peak'])
+    assert result.exit_code == 2
+    assert '--stat peak is a memory statistic, check --memory' in result.output
+
+
+def test_bench_scenarios(tmp_path: Path) -> None:
+    app = create_app()
+    runner = app.test_cli_runner()
+    scenarios = tmp_path / 'scenarios.json'
+
+    scenarios.write_text(
+        json.dumps(
+            [
+                {'name': 'sum', 'payload': {'jsonrpc': '2.0', 'method': 'app.sum', 'params': [1, 2], 'id': 1}},
+                {
+                    'name': 'missing',
+                    'payload': {'jsonrpc': '2.0', 'method': 'app.missing', 'id': 1},
+                    'path': '/api',
+                    'group': 'error',
+                    'status_code': 400,
+                },
+            ]
+        )
+    )
+    result = runner.invoke(jsonrpc_cli, ['bench', '--rounds', '2', '--warmup', '0', '--scenarios', str(scenarios)])
+    assert result.exit_code == 0, result.output
+    assert 'sum' in result.stdout
+    assert 'missing' in result.stdout
+
+    scenarios.write_text(json.dumps({'name': 'sum'}))
+    result = runner.invoke(jsonrpc_cli, ['bench', '--scenarios', str(scenarios)])
+    assert result.exit_code == 2
+    assert 'expected a JSON list of scenarios' in result.output
+
+    scenarios.write_text(json.dumps([{'name': 'sum'}]))
+    result = runner.invoke(jsonrpc_cli, ['bench', '--scenarios', str(scenarios)])
+    assert result.exit_code == 2
+    assert 'invalid scenario' in result.output
+
+
+def test_load(tmp_path: Path) -> None:
+    app = create_app()
+    runner = app.test_cli_runner()
+    output = tmp_path / 'load.json'
+
+    result = runner.invoke(
+        jsonrpc_cli, ['load', '--clients', '2', '--requests', '5', '--workload', 'mixed', '--output', str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    assert '10 requests (55 calls) from 2 clients' in result.stdout
+    assert 'Throughput:' in result.stdout
+    assert 'p99.9' in result.stdout
+    data = json.loads(output.read_text())
+    assert data['workload'] == 'mixed'
+    assert data['errors'] == 0
+    assert set(data['latency']) == {'p50', 'p90', 'p99', 'p99.9'}
+
+    result = runner.invoke(jsonrpc_cli, ['load', '--clients', '1', '--requests', '1', '-k', 'app.sum'])
+    assert result.exit_code == 2
+    assert 'no requests to send' in result.output
+
+
+def test_load_errors(tmp_path: Path) -> None:
+    app = create_app()
+    runner = app.test_cli_runner()
+    scenarios = tmp_path / 'scenarios.json'
+    scenarios.write_text(json.dumps([{'name': 'sum', 'payload': {'jsonrpc': '2.0', 'method': 'app.sum', 'id': 1}}]))
+
+    result = runner.invoke(jsonrpc_cli, ['load', '-c', '1', '-n', '2', '--warmup', '0', '--scenarios', str(scenarios)])
+    assert result.exit_code == 1
+    assert 'Error: 2 request(s) failed' in result.stderr
+
+    scenarios.write_text('{')
+    result = runner.invoke(jsonrpc_cli, ['load', '--scenarios', str(scenarios)])
+    assert result.exit_code == 2
+    assert 'invalid JSON' in result.output
+
+
+def test_generate(tmp_path: Path) -> None:
+    app = create_app()
+    runner = app.test_cli_runner()
+    output = tmp_path / 'scenarios.json'
+
+    result = runner.invoke(jsonrpc_cli, ['generate', '--count', '2', '--seed', '1'])
+    assert result.exit_code == 0, result.output
+    scenarios = json.loads(result.stdout)
+    assert [scenario['name'] for scenario in scenarios] == ['app.index[0]', 'app.index[1]', 'app.sum[0]', 'app.sum[1]']
+    assert scenarios[2]['payload']['method'] == 'app.sum'
+    assert set(scenarios[2]['payload']['params']) == {'a', 'b'}
+
+    result = runner.invoke(
+        jsonrpc_cli, ['generate', '-n', '5', '--invalid-ratio', '1', '--seed', '1', '--output', str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    assert f'Generated 10 scenarios to {output}' in result.stdout
+    scenarios = json.loads(output.read_text())
+    assert {scenario['group'] for scenario in scenarios if scenario['name'].startswith('app.sum')} == {'invalid'}
+
+    result = runner.invoke(
+        jsonrpc_cli, ['bench', '--rounds', '2', '--warmup', '0', '-k', 'invalid', '--scenarios', str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    assert 'app.sum[4]' in result.stdout
+
+
+def test_replay(tmp_path: Path) -> None:
+    app = create_app()
+    traffic = tmp_path / 'traffic.jsonl'
+    output = tmp_path / 'replay.json'
+    TrafficRecorder(app, app.extensions['jsonrpc'][0], path=str(traffic))
+    with app.test_client() as client:
+        client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [1, 2]})
+        client.post('/api', json={'id': 2, 'jsonrpc': '2.0', 'method': 'app.index'})
+
+    runner = create_app().test_cli_runner()
+    result = runner.invoke(jsonrpc_cli, ['replay', str(traffic), '--speed', '10', '--output', str(output)])
+    assert result.exit_code == 0, result.output
+    assert '2 requests replayed in' in result.stdout
+    assert '0 mismatches' in result.stdout
+    assert 'p99' in result.stdout
+    assert json.loads(output.read_text())['requests'] == 2
+
+    records = traffic.read_text().splitlines()
+    traffic.write_text(records[0].replace('"result":3', '"result":4') + '\n' + records[1] + '\n')
+    result = runner.invoke(jsonrpc_cli, ['replay', str(traffic), '--fast'])
+    assert result.exit_code == 1
+    assert '#0 app.sum: HTTP 200 (recorded 200), different response' in result.stderr
+    assert 'Error: 1 request(s) differ from the recording' in result.stderr
+
+    result = runner.invoke(jsonrpc_cli, ['replay', str(traffic), '--fast', '--no-compare'])
+    assert result.exit_code == 0, result.output
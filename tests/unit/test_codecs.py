@@ -0,0 +1,236 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import uuid
+from decimal import Decimal
+import datetime
+
+from flask import Flask
+
+import cbor2
+import pytest
+import msgpack
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.codecs import CBORCodec, MessagePackCodec
+from flask_jsonrpc.encoders import RawJSON
+
+
+def test_msgpack_codec() -> None:
+    codec = MessagePackCodec()
+    assert codec.mimetypes == ('application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack')
+
+    data = codec.dumps(
+        {
+            'id': 1,
+            'result': {
+                'amount': Decimal('1.5'),
+                'uid': uuid.UUID('5e1b5b6c-1b7a-4b8a-9d0f-2f8d9a3c4b5e'),
+                'date': datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+                1: b'bytes',
+            },
+        }
+    )
+    assert codec.loads(data) == {
+        'id': 1,
+        'result': {
+            'amount': '1.5',
+            'uid': '5e1b5b6c-1b7a-4b8a-9d0f-2f8d9a3c4b5e',
+            'date': 'Fri, 02 Jan 2026 03:04:05 GMT',
+            1: 'bytes',
+        },
+    }
+
+    assert codec.loads(codec.dumps({'id': 1, 'result': RawJSON(b'{"key": [1, 2]}')})) == {
+        'id': 1,
+        'result': {'key': [1, 2]},
+    }
+
+    for data in (b'\xc1', b'\x92\x01', codec.dumps(1) + b'\x01'):
+        with pytest.raises(ValueError):
+            codec.loads(data)
+
+
+def test_cbor_codec() -> None:
+    codec = CBORCodec()
+    assert codec.mimetypes == ('application/cbor',)
+
+    date = datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    assert codec.loads(codec.dumps({'id': 1, 'result': {'amount': Decimal('1.5'), 'date': date}})) == {
+        'id': 1,
+        'result': {'amount': Decimal('1.5'), 'date': date},
+    }
+
+    assert codec.loads(codec.dumps({'id': 1, 'result': RawJSON(b'{"key": [1, 2]}')})) == {
+        'id': 1,
+        'result': {'key': [1, 2]},
+    }
+
+    with pytest.raises(cbor2.CBOREncodeTypeError, match='cannot serialize type object'):
+        codec.dumps({'id': 1, 'result': object()})
+
+    with pytest.raises(ValueError):
+        codec.loads(b'\xff')
+
+
+def test_app_with_codecs() -> None:
+    app = Flask('test_codecs')
+    jsonrpc = JSONRPC(app, '/api')
+    jsonrpc.register_codec(MessagePackCodec())
+    jsonrpc.register_codec(CBORCodec())
+
+    @jsonrpc.method('app.sum')
+    def sum_(numbers: list[float]) -> float:
+        return sum(numbers)
+
+    @jsonrpc.method('app.answer', cacheable=60)
+    def answer() -> int:
+        return 42
+
+    with app.test_client() as client:
+        rv = client.get(
+            '/api', query_string={'method': 'app.answer', 'id': '1'}, headers={'Accept': 'application/cbor'}
+        )
+        assert rv.mimetype == 'application/cbor'
+        assert cbor2.loads(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': 42}
+        assert rv.headers['Vary'] == 'Accept'
+
+        rv = client.get('/api', query_string={'method': 'app.answer', 'id': '1'})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 42}
+        assert rv.headers['Vary'] == 'Accept'
+
+        rv = client.post(
+            '/api',
+            data=msgpack.packb({'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [[1.5, 2, 3]]}),
+            content_type='application/msgpack',
+        )
+        assert rv.mimetype == 'application/msgpack'
+        assert msgpack.unpackb(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': 6.5}
+        assert rv.status_code == 200
+
+        rv = client.post(
+            '/api',
+            data=msgpack.packb([{'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [[1, 2]]}]),
+            content_type='application/x-msgpack',
+            headers={'Accept': '*/*'},
+        )
+        assert rv.mimetype == 'application/msgpack'
+        assert msgpack.unpackb(rv.data) == [{'id': 1, 'jsonrpc': '2.0', 'result': 3}]
+
+        rv = client.post(
+            '/api',
+            data=msgpack.packb({'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [[1, 2]]}),
+            content_type='application/msgpack',
+            headers={'Accept': 'application/json'},
+        )
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 3}
+
+        rv = client.post(
+            '/api',
+            json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [[1, 2]]},
+            headers={'Accept': 'application/cbor'},
+        )
+        assert rv.mimetype == 'application/cbor'
+        assert cbor2.loads(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': 3}
+
+        rv = client.post(
+            '/api',
+            json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [[1, 2]]},
+            headers={'Accept': 'text/html'},
+        )
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 3}
+
+        rv = client.post(
+            '/api',
+            data=cbor2.dumps({'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': ['x']}),
+            content_type='application/cbor',
+        )
+        assert rv.mimetype == 'application/cbor'
+        assert cbor2.loads(rv.data)['error']['code'] == -32602
+        assert rv.status_code == 400
+
+        rv = client.post('/api', data=b'\xc1', content_type='application/msgpack')
+        assert rv.mimetype == 'application/msgpack'
+        assert msgpack.unpackb(rv.data) == {
+            'id': None,
+            'jsonrpc': '2.0',
+            'error': {
+                'code': -32700,
+                'data': {'message': "Invalid application/msgpack: b'\\xc1'"},
+                'message': 'Parse error',
+                'name': 'ParseError',
+            },
+        }
+        assert rv.status_code == 400
+
+        rv = client.post('/api', data=b'\x00', content_type='application/octet-stream')
+        assert rv.json['error']['code'] == -32700
+        assert rv.status_code == 400
+
+
+def test_app_with_codecs_and_blueprint() -> None:
+    app = Flask('test_codecs')
+    user = JSONRPCBlueprint('user', __name__)
+    article = JSONRPCBlueprint('article', __name__)
+    article.register_codec(MessagePackCodec(mimetypes=('application/msgpack', 'application/x-article')))
+
+    @user.method('user.index')
+    def user_index() -> str:
+        return 'Welcome to user'
+
+    @article.method('article.index')
+    def article_index() -> str:
+        return 'Welcome to article'
+
+    jsonrpc = JSONRPC(app, '/api')
+    jsonrpc.register_codec(CBORCodec())
+    jsonrpc.register_codec(MessagePackCodec())
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    jsonrpc.register_blueprint(app, article, url_prefix='/article')
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api/user',
+            data=cbor2.dumps({'id': 1, 'jsonrpc': '2.0', 'method': 'user.index'}),
+            content_type='application/cbor',
+        )
+        assert cbor2.loads(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': 'Welcome to user'}
+
+        rv = client.post(
+            '/api/article',
+            data=msgpack.packb({'id': 1, 'jsonrpc': '2.0', 'method': 'article.index'}),
+            content_type='application/vnd.msgpack',
+        )
+        assert rv.mimetype == 'application/msgpack'
+        assert msgpack.unpackb(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': 'Welcome to article'}
+
+        rv = client.post(
+            '/api/article',
+            data=msgpack.packb({'id': 1, 'jsonrpc': '2.0', 'method': 'article.index'}),
+            content_type='application/msgpack',
+            headers={'Accept': 'application/x-article'},
+        )
+        assert rv.mimetype == 'application/msgpack'
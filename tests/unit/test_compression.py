@@ -0,0 +1,286 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import gzip
+import json
+import zlib
+
+from flask import Flask, Response
+
+import brotli
+import pytest
+import zstandard
+from werkzeug.http import parse_accept_header
+from werkzeug.datastructures import Accept
+
+from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.conf import settings
+from flask_jsonrpc.compression import (
+    COMPRESSORS,
+    ZlibCompressor,
+    DecompressionLimitError,
+    compress_response,
+    negotiate_encoding,
+    decompress_request_data,
+)
+
+DECOMPRESSORS = {
+    'gzip': gzip.decompress,
+    'deflate': zlib.decompress,
+    'br': brotli.decompress,
+    'zstd': lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+}
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'deflate', 'br', 'zstd'])
+def test_compressors(encoding: str) -> None:
+    compressor = COMPRESSORS[encoding]
+    data = json.dumps({'id': 1, 'jsonrpc': '2.0', 'result': list(range(1000))}).encode('utf-8')
+
+    compressed = compressor.compress(data, compressor.level)
+    assert compressor.encoding == encoding
+    assert len(compressed) < len(data)
+    assert DECOMPRESSORS[encoding](compressed) == data
+
+    chunks = list(compressor.compress_stream([data[:100], b'', data[100:]], compressor.level))
+    assert len(chunks) == 4
+    assert DECOMPRESSORS[encoding](b''.join(chunks)) == data
+
+
+def test_negotiate_encoding() -> None:
+    encodings = ['zstd', 'br', 'gzip', 'deflate', 'compress']
+    assert negotiate_encoding(parse_accept_header('gzip, deflate, br, zstd', Accept), encodings) == 'zstd'
+    assert negotiate_encoding(parse_accept_header('gzip;q=0.5, br', Accept), encodings) == 'br'
+    assert negotiate_encoding(parse_accept_header('deflate', Accept), encodings) == 'deflate'
+    assert negotiate_encoding(parse_accept_header('*', Accept), ['gzip']) == 'gzip'
+    assert negotiate_encoding(parse_accept_header('compress', Accept), encodings) is None
+    assert negotiate_encoding(parse_accept_header('', Accept), encodings) is None
+
+
+def test_compress_response() -> None:
+    accept_encodings = parse_accept_header('gzip', Accept)
+    data = b'x' * 2048
+
+    rv = compress_response(Response(data), accept_encodings, encodings=['gzip'], min_size=1024)
+    assert rv.headers['Content-Encoding'] == 'gzip'
+    assert rv.headers['Vary'] == 'Accept-Encoding'
+    assert rv.content_length == len(rv.data) < len(data)
+    assert gzip.decompress(rv.data) == data
+
+    rv = compress_response(Response(data), accept_encodings, encodings=['gzip'], levels={'gzip': 0})
+    assert len(rv.data) > len(data)
+    assert gzip.decompress(rv.data) == data
+
+    rv = Response(data)
+    rv.set_etag('abc')
+    rv = compress_response(rv, accept_encodings, encodings=['gzip'])
+    assert rv.get_etag() == ('abc', True)
+
+    rv = compress_response(Response(b'x' * 10), accept_encodings, encodings=['gzip'], min_size=1024)
+    assert 'Content-Encoding' not in rv.headers
+    assert rv.headers['Vary'] == 'Accept-Encoding'
+
+    rv = compress_response(Response(data), parse_accept_header('br', Accept), encodings=['gzip'])
+    assert 'Content-Encoding' not in rv.headers
+    assert rv.data == data
+
+    for rv in (Response(status=204), Response(data, headers={'Content-Encoding': 'br'})):
+        assert compress_response(rv, accept_encodings, encodings=['gzip']) is rv
+        assert 'Vary' not in rv.headers
+
+    rv = Response(data, status=304)
+    rv.set_etag('abc')
+    rv = compress_response(rv, accept_encodings, encodings=['gzip'], min_size=1024)
+    assert rv.headers['Vary'] == 'Accept-Encoding'
+    assert rv.get_etag() == ('abc', True)
+    assert 'Content-Encoding' not in rv.headers
+    assert rv.data == data
+
+    rv = compress_response(
+        Response(iter([b'x' * 10, b'y' * 10]), headers={'Content-Length': '20'}),
+        accept_encodings,
+        encodings=['gzip'],
+        min_size=1024,
+    )
+    assert rv.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in rv.headers
+    assert gzip.decompress(b''.join(rv.response)) == b'x' * 10 + b'y' * 10
+
+
+def test_app_with_compression() -> None:
+    app = Flask('test_compression')
+    app.config['FLASK_JSONRPC_COMPRESSION_ENABLED'] = True
+    app.config['FLASK_JSONRPC_COMPRESSION_MIN_SIZE'] = 100
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.items')
+    def items(n: int) -> list[int]:
+        return list(range(n))
+
+    try:
+        with app.test_client() as client:
+            rv = client.post(
+                '/api',
+                json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.items', 'params': [1000]},
+                headers={'Accept-Encoding': 'gzip, br'},
+            )
+            assert rv.status_code == 200
+            assert rv.headers['Content-Encoding'] == 'br'
+            assert rv.headers['Vary'] == 'Accept-Encoding'
+            assert json.loads(brotli.decompress(rv.data)) == {'id': 1, 'jsonrpc': '2.0', 'result': list(range(1000))}
+
+            rv = client.post(
+                '/api',
+                json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.items', 'params': [10]},
+                headers={'Accept-Encoding': 'gzip, br'},
+            )
+            assert 'Content-Encoding' not in rv.headers
+            assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': list(range(10))}
+
+            settings.SERVER_TIMING_HEADER = True
+            rv = client.post(
+                '/api',
+                json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.items', 'params': [1000]},
+                headers={'Accept-Encoding': 'gzip'},
+            )
+            assert rv.headers['Content-Encoding'] == 'gzip'
+            phases = [metric.split(';')[0] for metric in rv.headers['Server-Timing'].split(', ')]
+            assert phases[-3:] == ['serialize', 'compress', 'total']
+    finally:
+        settings.COMPRESSION_ENABLED = False
+        settings.COMPRESSION_MIN_SIZE = 1024
+        settings.SERVER_TIMING_HEADER = False
+
+
+@pytest.mark.parametrize('encoding', ['gzip', 'deflate'])
+def test_decompress_request_data(encoding: str) -> None:
+    compressor = COMPRESSORS[encoding]
+    data = json.dumps([{'id': i, 'jsonrpc': '2.0', 'method': 'app.fn'} for i in range(100)]).encode('utf-8')
+    compressed = compressor.compress(data, compressor.level)
+    chunks = [compressed[i : i + 100] for i in range(0, len(compressed), 100)]
+
+    assert decompress_request_data(chunks, encoding, encodings=['gzip', 'deflate'], max_size=len(data)) == data
+    assert decompress_request_data(chunks, f' {encoding.upper()} ', encodings=[encoding], max_size=len(data)) == data
+
+    with pytest.raises(DecompressionLimitError, match=f'decompressed body exceeds {len(data) - 1} bytes'):
+        decompress_request_data(chunks, encoding, encodings=[encoding], max_size=len(data) - 1)
+
+    with pytest.raises(ValueError, match=f'truncated {encoding} body'):
+        decompress_request_data(chunks[:-1], encoding, encodings=[encoding], max_size=len(data))
+
+    with pytest.raises(ValueError, match=f'invalid {encoding} body'):
+        decompress_request_data([b'not compressed'], encoding, encodings=[encoding], max_size=len(data))
+
+    with pytest.raises(LookupError, match=f'unsupported content coding: {encoding}'):
+        decompress_request_data(chunks, encoding, encodings=[], max_size=len(data))
+
+
+def test_decompress_bomb() -> None:
+    compressor = ZlibCompressor('gzip', zlib.MAX_WBITS | 16)
+    bomb = compressor.compress(b'\0' * (64 * 1024 * 1024), 9)
+    assert len(bomb) < 128 * 1024
+
+    with pytest.raises(DecompressionLimitError):
+        compressor.decompress_stream([bomb], 1024 * 1024)
+
+    compressor = ZlibCompressor('deflate', zlib.MAX_WBITS)
+    with pytest.raises(DecompressionLimitError):
+        compressor.decompress_stream([zlib.compress(b'\0' * 2048)[:-4]], 1024)
+
+
+def test_app_with_compressed_request() -> None:
+    app = Flask('test_compression')
+    app.config['FLASK_JSONRPC_DECOMPRESSION_MAX_SIZE'] = 64 * 1024
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.sum')
+    def sum_(numbers: list[int]) -> int:
+        return sum(numbers)
+
+    try:
+        with app.test_client() as client:
+            data = json.dumps({'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [list(range(1000))]})
+            rv = client.post(
+                '/api',
+                data=gzip.compress(data.encode('utf-8')),
+                headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'},
+            )
+            assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 499500}
+            assert rv.status_code == 200
+
+            data = json.dumps([{'id': i, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [[i, 1]]} for i in range(3)])
+            rv = client.post(
+                '/api',
+                data=zlib.compress(data.encode('utf-8')),
+                headers={'Content-Type': 'application/json', 'Content-Encoding': 'deflate'},
+            )
+            assert rv.json == [{'id': i, 'jsonrpc': '2.0', 'result': i + 1} for i in range(3)]
+            assert rv.status_code == 200
+
+            rv = client.post(
+                '/api',
+                json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.sum', 'params': [[1, 2]]},
+                headers={'Content-Encoding': 'identity'},
+            )
+            assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': 3}
+
+            rv = client.post(
+                '/api',
+                data=gzip.compress(b'\0' * (1024 * 1024)),
+                headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'},
+            )
+            assert rv.json['error']['code'] == -32700
+            assert rv.json['error']['data'] == {'message': 'Decompressed request data exceeds 65536 bytes'}
+            assert rv.status_code == 413
+
+            rv = client.post(
+                '/api',
+                data=brotli.compress(data.encode('utf-8')),
+                headers={'Content-Type': 'application/json', 'Content-Encoding': 'br'},
+            )
+            assert rv.json['error']['data'] == {'message': 'Unsupported Content-Encoding: br'}
+            assert rv.status_code == 415
+
+            rv = client.post(
+                '/api',
+                data=data.encode('utf-8'),
+                headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'},
+            )
+            assert rv.json['error']['code'] == -32700
+            assert rv.json['error']['data']['message'].startswith('Invalid gzip request data: invalid gzip body')
+            assert rv.status_code == 400
+
+            settings.DECOMPRESSION_ENCODINGS = []
+            rv = client.post(
+                '/api',
+                data=gzip.compress(data.encode('utf-8')),
+                headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'},
+            )
+            assert rv.json['error']['data'] == {'message': 'Unsupported Content-Encoding: gzip'}
+            assert rv.status_code == 415
+    finally:
+        settings.DECOMPRESSION_ENCODINGS = ['gzip', 'deflate']
+        settings.DECOMPRESSION_MAX_SIZE = 16 * 1024 * 1024
@@ -26,7 +26,10 @@
 # POSSIBILITY OF SUCH DAMAGE.
 import sys
 from enum import Enum
+import json
+import typing as t
 from pathlib import Path
+import datetime
 from collections import deque
 from dataclasses import dataclass
 
@@ -36,7 +39,7 @@ from pydantic.main import BaseModel
 
 import pytest
 
-from flask_jsonrpc.encoders import jsonify, serializable
+from flask_jsonrpc.encoders import RawJSON, dumps, jsonify, serializable
 
 # Added in version 3.11.
 try:
@@ -194,3 +197,68 @@ def test_jsonify_simple() -> None:
         assert jsonify(1).response == [b'1\n']
         assert jsonify({}).response == [b'{}\n']
         assert jsonify({'key': 1}).response == [b'{"key":1}\n']
+
+
+def test_raw_json() -> None:
+    raw = RawJSON(b'{"key": [1, 2]}')
+    assert raw.data == '{"key": [1, 2]}'
+    assert raw.loads() == {'key': [1, 2]}
+    assert repr(raw) == 'RawJSON(\'{"key": [1, 2]}\')'
+    assert RawJSON('[1, 2', validate=False).data == '[1, 2'
+    assert RawJSON(bytearray(b'null'), validate=True).data == 'null'
+
+    with pytest.raises(ValueError, match='Expecting'):
+        RawJSON('[1, 2', validate=True)
+
+
+def test_serializable_raw_json() -> None:
+    raw = RawJSON('[1, 2]')
+    assert serializable(raw) is raw
+    assert serializable({'key': [raw]}) == {'key': [raw]}
+
+
+def test_dumps_raw_json() -> None:
+    app = Flask('dumps')
+
+    with app.app_context():
+        assert dumps({'key': 1}) == '{"key": 1}'
+        assert dumps({'result': RawJSON('{"z": 1, "a": [true]}')}) == '{"result": {"z": 1, "a": [true]}}'
+        assert (
+            dumps(
+                [
+                    {'id': 1, 'result': RawJSON(b'"one"')},
+                    {'id': 2, 'result': [RawJSON('2'), 'rawjson:0', datetime.date(2026, 1, 2)]},
+                ],
+                separators=(',', ':'),
+            )
+            == '[{"id":1,"result":"one"},{"id":2,"result":[2,"rawjson:0","Fri, 02 Jan 2026 00:00:00 GMT"]}]'
+        )
+        assert dumps({'result': RawJSON('[1]')}, indent=2) == '{\n  "result": [1]\n}'
+
+        with pytest.raises(TypeError, match='Object of type object is not JSON serializable'):
+            dumps({'result': object()})
+
+    class JSONProvider:
+        def dumps(self: Self, obj: t.Any, **kwargs: t.Any) -> str:  # noqa: ANN401
+            return json.dumps(obj, **kwargs)
+
+    assert dumps([RawJSON('{}')], JSONProvider()) == '[{}]'  # type: ignore[arg-type]
+    results = [{'id': i, 'result': RawJSON(f'{{"n": {i}, "s": "\\\\1"}}')} for i in range(10_000)]
+    assert json.loads(dumps(results, JSONProvider())) == [  # type: ignore[arg-type]
+        {'id': i, 'result': {'n': i, 's': '\\1'}} for i in range(10_000)
+    ]
+    with pytest.raises(TypeError, match='Object of type date is not JSON serializable'):
+        dumps([datetime.date(2026, 1, 2)], JSONProvider())  # type: ignore[arg-type]
+
+
+def test_jsonify_raw_json() -> None:
+    app = Flask('jsonify')
+
+    with app.app_context():
+        rv = jsonify({'id': 1, 'result': RawJSON(b'{"key": [1, 2]}')})
+        assert rv.response == [b'{"id":1,"result":{"key": [1, 2]}}\n']
+        assert rv.mimetype == 'application/json'
+
+        app.debug = True
+        rv = jsonify({'id': 1, 'result': RawJSON(b'{"key": [1, 2]}')})
+        assert rv.response == [b'{\n  "id": 1,\n  "result": {"key": [1, 2]}\n}\n']
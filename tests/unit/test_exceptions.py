@@ -32,6 +32,8 @@ from flask_jsonrpc.exceptions import (
     InvalidParamsError,
     InvalidRequestError,
     MethodNotFoundError,
+    ServerOverloadedError,
+    RateLimitExceededError,
 )
 
 
@@ -125,3 +127,31 @@ def test_server_error() -> None:
     assert error.data is None
     assert error.status_code == 500
     assert error.jsonrpc_format == {'code': -32000, 'data': None, 'message': 'Server error', 'name': 'ServerError'}
+
+
+def test_server_overloaded_error() -> None:
+    error = ServerOverloadedError()
+    assert error.code == -32001
+    assert error.message == 'Server overloaded'
+    assert error.data is None
+    assert error.status_code == 503
+    assert error.jsonrpc_format == {
+        'code': -32001,
+        'data': None,
+        'message': 'Server overloaded',
+        'name': 'ServerOverloadedError',
+    }
+
+
+def test_rate_limit_exceeded_error() -> None:
+    error = RateLimitExceededError()
+    assert error.code == -32002
+    assert error.message == 'Rate limit exceeded'
+    assert error.data is None
+    assert error.status_code == 429
+    assert error.jsonrpc_format == {
+        'code': -32002,
+        'data': None,
+        'message': 'Rate limit exceeded',
+        'name': 'RateLimitExceededError',
+    }
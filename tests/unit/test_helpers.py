@@ -31,7 +31,7 @@ from pydantic.main import BaseModel
 
 import pytest
 
-from flask_jsonrpc.helpers import Node, get, urn, from_python_type
+from flask_jsonrpc.helpers import Node, get, urn, json_size, from_python_type
 
 
 def test_basic_tree() -> None:
@@ -296,3 +296,15 @@ def test_get_with_special_characters() -> None:
     obj = {'a.b': {'c.d': 1}}
     assert get(obj, 'a.b.c.d', 'default') == 'default'
     assert get(obj, 'a.b', 'default') == {'c.d': 1}
+
+
+def test_json_size() -> None:
+    assert json_size([':)']) == 6
+    assert json_size({'a': 1}) == 8
+    assert json_size(None) == 4
+    assert json_size([b'\x00']) == 0
+    assert json_size({('a',): 1}) == 0
+
+    circular: list[t.Any] = []
+    circular.append(circular)
+    assert json_size(circular) == 0
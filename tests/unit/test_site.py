@@ -36,6 +36,7 @@ import pytest
 from werkzeug.datastructures import Headers
 
 from flask_jsonrpc.site import JSONRPCSite
+from flask_jsonrpc.signals import call_started, call_finished, request_started
 from flask_jsonrpc.exceptions import ParseError, ServerError, InvalidRequestError
 from flask_jsonrpc.types.types import AnnotatedMetadataTypeError
 
@@ -884,3 +885,142 @@ def test_site_with_view_func_return_annotated_raises_exc() -> None:
             }
             assert status_code == 400
             assert headers == {}
+
+
+def test_site_register_before_and_teardown_request() -> None:
+    def view_func() -> str:
+        return 'Hello world!'
+
+    calls: list[t.Any] = []
+
+    def before_request(req_json: t.Any) -> None:  # noqa: ANN401
+        calls.append(('before', req_json))
+
+    def reject_batch(req_json: t.Any) -> t.Any:  # noqa: ANN401
+        if isinstance(req_json, list):
+            return b'{"message": "no batches"}', 400
+        return None
+
+    def teardown_request(exc: BaseException | None) -> None:
+        calls.append(('teardown', exc))
+
+    app = Flask('site')
+    jsonrpc_site = JSONRPCSite(version='1.0.0', path='/path', base_url='/base')
+    jsonrpc_site.register('app.view_func', view_func=view_func)
+    jsonrpc_site.register_before_request(before_request)
+    jsonrpc_site.register_before_request(reject_batch)
+    jsonrpc_site.register_teardown_request(teardown_request)
+
+    req_json = {'id': 1, 'jsonrpc': '2.0', 'method': 'app.view_func'}
+    with app.test_request_context('/base/path', method='POST', json=req_json):
+        rv, status_code, headers = jsonrpc_site.dispatch_request()
+        assert rv == {'id': 1, 'jsonrpc': '2.0', 'result': 'Hello world!'}
+        assert status_code == 200
+        assert headers == {}
+    assert calls == [('before', req_json), ('teardown', None)]
+
+    calls.clear()
+    with app.test_request_context('/base/path', method='POST', json=[req_json]):
+        rv, status_code, headers = jsonrpc_site.dispatch_request()
+        assert rv == b'{"message": "no batches"}'
+        assert status_code == 400
+        assert headers == {}
+    assert calls == [('before', [req_json]), ('teardown', None)]
+
+    calls.clear()
+    with (
+        app.test_request_context('/base/path', method='POST', data='{"id": 1', content_type='application/json'),
+        pytest.raises(ParseError) as excinfo,
+    ):
+        jsonrpc_site.dispatch_request()
+    assert calls == [('teardown', excinfo.value)]
+
+
+def test_site_call_finished_signal() -> None:
+    def view_func() -> str:
+        return 'Hello world!'
+
+    calls: list[t.Any] = []
+
+    def on_call_finished(sender: JSONRPCSite, **kwargs: t.Any) -> None:  # noqa: ANN401
+        calls.append((sender, kwargs))
+
+    app = Flask('site')
+    jsonrpc_site = JSONRPCSite(version='1.0.0', path='/path', base_url='/base')
+    jsonrpc_site.register('app.view_func', view_func=view_func)
+
+    req_json = [{'id': 1, 'jsonrpc': '2.0', 'method': 'app.view_func'}, {'id': 2, 'jsonrpc': '2.0', 'method': 'x'}]
+    with (
+        call_finished.connected_to(on_call_finished, sender=jsonrpc_site),
+        app.test_request_context('/base/path', method='POST', json=req_json),
+    ):
+        jsonrpc_site.dispatch_request()
+
+    assert len(calls) == 2
+    sender, kwargs = calls[0]
+    assert sender is jsonrpc_site
+    assert kwargs['req_json'] == req_json[0]
+    assert kwargs['response'] == {'id': 1, 'jsonrpc': '2.0', 'result': 'Hello world!'}
+    assert kwargs['status_code'] == 200
+    assert kwargs['duration'] >= 0
+    _, kwargs = calls[1]
+    assert kwargs['req_json'] == req_json[1]
+    assert kwargs['response']['error']['code'] == -32601
+    assert kwargs['status_code'] == 400
+
+
+def test_site_request_and_call_started_signals() -> None:
+    def view_func() -> str:
+        return 'Hello world!'
+
+    calls: list[t.Any] = []
+
+    def on_request_started(sender: JSONRPCSite, **kwargs: t.Any) -> None:  # noqa: ANN401
+        calls.append(('request_started', kwargs))
+
+    def on_call_started(sender: JSONRPCSite, **kwargs: t.Any) -> None:  # noqa: ANN401
+        calls.append(('call_started', kwargs))
+
+    app = Flask('site')
+    jsonrpc_site = JSONRPCSite(version='1.0.0', path='/path', base_url='/base')
+    jsonrpc_site.register('app.view_func', view_func=view_func)
+
+    req_json = {'id': 1, 'jsonrpc': '2.0', 'method': 'app.view_func'}
+    with (
+        request_started.connected_to(on_request_started, sender=jsonrpc_site),
+        call_started.connected_to(on_call_started, sender=jsonrpc_site),
+        app.test_request_context('/base/path', method='POST', json=[req_json, req_json]),
+    ):
+        jsonrpc_site.dispatch_request()
+
+    assert calls == [
+        ('request_started', {}),
+        ('call_started', {'req_json': req_json}),
+        ('call_started', {'req_json': req_json}),
+    ]
+
+
+def test_site_describe_loaded_on_first_use() -> None:
+    def describe() -> str:
+        return 'Custom describe'
+
+    app = Flask('site')
+    jsonrpc_site = JSONRPCSite(version='1.0.0', path='/api')
+    placeholder = jsonrpc_site.view_funcs['rpc.describe']
+    assert placeholder.jsonrpc_describe_placeholder is True
+    assert 'service_descriptor' not in jsonrpc_site.__dict__
+
+    with app.test_request_context('/api', method='POST', json={'id': 1, 'jsonrpc': '2.0', 'method': 'rpc.describe'}):
+        rv, status_code, _ = jsonrpc_site.dispatch_request()
+        assert rv['result'].name == 'Flask-JSONRPC'
+        assert list(rv['result'].methods) == ['rpc.describe']
+        assert status_code == 200
+
+    view_func = jsonrpc_site.view_funcs['rpc.describe']
+    assert view_func is not placeholder
+    assert view_func is jsonrpc_site.service_descriptor.describe
+
+    jsonrpc_site = JSONRPCSite(version='1.0.0', path='/api')
+    jsonrpc_site.register('rpc.describe', describe)
+    assert jsonrpc_site.describe().name == 'Flask-JSONRPC'
+    assert jsonrpc_site.view_funcs['rpc.describe'] is describe
@@ -0,0 +1,414 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import gzip
+import json
+import typing as t
+import asyncio
+
+from flask import Flask
+
+import pytest
+import msgpack
+
+from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.conf import settings
+from flask_jsonrpc.codecs import MessagePackCodec
+from flask_jsonrpc.signals import call_finished, request_started, request_finished
+from flask_jsonrpc.exceptions import InvalidParamsError
+from flask_jsonrpc.contrib.slowlog import SlowCallLog
+from flask_jsonrpc.contrib.tracing import InMemoryTracer, JSONRPCTracing
+from flask_jsonrpc.contrib.admission import AdmissionControl
+
+
+def create_app() -> tuple[Flask, list[int]]:
+    app = Flask('test_streaming', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    produced: list[int] = []
+
+    @jsonrpc.method('app.rows')
+    def rows(n: int, fail: int = -1) -> t.Iterator[dict[str, int]]:
+        for i in range(n):
+            if i == fail:
+                raise ValueError(f'failed at {i}')
+            produced.append(i)
+            yield {'row': i}
+
+    @jsonrpc.method('app.arows')
+    async def arows(n: int, fail: int = -1) -> t.AsyncIterator[int]:
+        for i in range(n):
+            await asyncio.sleep(0)
+            if i == fail:
+                raise InvalidParamsError(data={'message': f'failed at {i}'})
+            yield i
+
+    return app, produced
+
+
+def test_stream_json_array() -> None:
+    app, produced = create_app()
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [3]})
+        assert rv.status_code == 200
+        assert 'Content-Length' not in rv.headers
+        assert rv.mimetype == 'application/json'
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': [{'row': 0}, {'row': 1}, {'row': 2}]}
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [0]})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': []}
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.arows', 'params': [3]})
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': [0, 1, 2]}
+
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [3, 2]})
+        assert rv.status_code == 200
+        assert rv.json == {
+            'id': 1,
+            'jsonrpc': '2.0',
+            'result': [{'row': 0}, {'row': 1}],
+            'error': {
+                'code': -32000,
+                'data': {'message': 'failed at 2'},
+                'message': 'Server error',
+                'name': 'ServerError',
+            },
+        }
+
+        produced.clear()
+        rv = client.post(
+            '/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [1000]}, buffered=False
+        )
+        chunks = rv.response
+        assert next(chunks) == b'{"id": 1, "jsonrpc": "2.0", "result": ['
+        assert next(chunks) == b'{"row": 0}'
+        assert produced == [0]
+        rv.close()
+
+
+def test_stream_ends_once_streamed() -> None:
+    app, produced = create_app()
+    jsonrpc_site = app.extensions['jsonrpc'][0].get_jsonrpc_site()
+    events: list[str] = []
+    jsonrpc_site.register_teardown_request(lambda exc: events.append('teardown'))
+
+    def on_call_finished(sender: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        events.append(f'call_finished {kwargs["duration"] > 0}')
+
+    def on_request_finished(sender: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        events.append(f'request_finished {kwargs["response"].is_streamed}')
+
+    with (
+        app.test_client() as client,
+        call_finished.connected_to(on_call_finished, sender=jsonrpc_site),
+        request_finished.connected_to(on_request_finished, sender=jsonrpc_site),
+    ):
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [3]}, buffered=False)
+        chunks = rv.response
+        assert next(chunks) == b'{"id": 1, "jsonrpc": "2.0", "result": ['
+        assert next(chunks) == b'{"row": 0}'
+        assert events == []
+        assert b''.join(chunks) == b', {"row": 1}, {"row": 2}]}'
+        rv.close()
+        assert events == ['call_finished True', 'teardown', 'request_finished True']
+
+        events.clear()
+        produced.clear()
+        rv = client.post(
+            '/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [1000]}, buffered=False
+        )
+        next(rv.response)
+        assert events == []
+        rv.close()
+        assert produced == []
+        assert events == ['call_finished True', 'teardown', 'request_finished True']
+
+        events.clear()
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [3, 1]})
+        assert rv.json['error']['data'] == {'message': 'failed at 1'}
+        assert events == ['call_finished True', 'teardown', 'request_finished True']
+
+        events.clear()
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.unknown'})
+        assert rv.status_code == 400
+        assert events == ['call_finished True', 'teardown', 'request_finished False']
+
+
+def test_stream_messages() -> None:
+    app, _ = create_app()
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api',
+            json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [2]},
+            headers={'Accept': 'application/x-ndjson'},
+        )
+        assert rv.mimetype == 'application/x-ndjson'
+        assert [json.loads(line) for line in rv.text.splitlines()] == [
+            {'id': 1, 'jsonrpc': '2.0', 'result': {'row': 0}},
+            {'id': 1, 'jsonrpc': '2.0', 'result': {'row': 1}},
+        ]
+
+        rv = client.post(
+            '/api',
+            json={'id': 'a', 'jsonrpc': '2.0', 'method': 'app.arows', 'params': [3, 1]},
+            headers={'Accept': 'application/x-ndjson'},
+        )
+        assert [json.loads(line) for line in rv.text.splitlines()] == [
+            {'id': 'a', 'jsonrpc': '2.0', 'result': 0},
+            {
+                'id': 'a',
+                'jsonrpc': '2.0',
+                'error': {
+                    'code': -32602,
+                    'data': {'message': 'failed at 1'},
+                    'message': 'Invalid params',
+                    'name': 'InvalidParamsError',
+                },
+            },
+        ]
+
+        rv = client.post(
+            '/api',
+            json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [2, 1]},
+            headers={'Accept': 'text/event-stream'},
+        )
+        assert rv.mimetype == 'text/event-stream'
+        assert rv.headers['Cache-Control'] == 'no-cache'
+        events = [event.split('\n') for event in rv.text.split('\n\n') if event]
+        assert [event[0] for event in events] == ['event: result', 'event: error']
+        assert json.loads(events[0][1].removeprefix('data: ')) == {'id': 1, 'jsonrpc': '2.0', 'result': {'row': 0}}
+        assert json.loads(events[1][1].removeprefix('data: '))['error']['data'] == {'message': 'failed at 1'}
+
+
+def test_stream_drained_in_batch_and_codec() -> None:
+    app, _ = create_app()
+    jsonrpc = app.extensions['jsonrpc'][0]
+    jsonrpc.register_codec(MessagePackCodec())
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [2]},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.arows', 'params': [2]},
+            ],
+        )
+        assert 'Content-Length' in rv.headers
+        assert rv.json == [
+            {'id': 1, 'jsonrpc': '2.0', 'result': [{'row': 0}, {'row': 1}]},
+            {'id': 2, 'jsonrpc': '2.0', 'result': [0, 1]},
+        ]
+
+        rv = client.post(
+            '/api',
+            data=msgpack.packb({'id': 1, 'jsonrpc': '2.0', 'method': 'app.arows', 'params': [3]}),
+            content_type='application/msgpack',
+        )
+        assert 'Content-Length' in rv.headers
+        assert msgpack.unpackb(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': [0, 1, 2]}
+
+
+def test_stream_batch_elements_end_with_the_batch() -> None:
+    app = Flask('test_streaming', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api')
+    tracer = InMemoryTracer()
+    JSONRPCTracing(app, jsonrpc, tracer=tracer)
+    slowlog = SlowCallLog(app, jsonrpc, threshold=0.0)
+
+    @jsonrpc.method('app.rows')
+    def rows(n: int) -> t.Iterator[int]:
+        yield from range(n)
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [2]},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.rows', 'params': [3]},
+            ],
+        )
+        assert rv.json == [
+            {'id': 1, 'jsonrpc': '2.0', 'result': [0, 1]},
+            {'id': 2, 'jsonrpc': '2.0', 'result': [0, 1, 2]},
+        ]
+
+    assert slowlog._active_calls == {}
+    assert [record['id'] for record in slowlog.records] == [1, 2]
+    spans = tracer.get_finished_spans()
+    assert [span.name for span in spans] == ['app.rows', 'app.rows', 'jsonrpc.request']
+    assert [span.attributes['rpc.jsonrpc.request_id'] for span in spans[:2]] == ['1', '2']
+    assert all(span.parent is spans[-1] for span in spans[:2])
+
+
+def test_ndjson_pipeline_with_admission_control() -> None:
+    app = Flask('test_streaming', instance_relative_config=True)
+    app.config['FLASK_JSONRPC_NDJSON_PIPELINE_ENABLED'] = True
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.echo')
+    def echo(s: str) -> str:
+        return s
+
+    admission = AdmissionControl(app, jsonrpc, max_in_flight=1)
+    body = ''.join(
+        json.dumps({'id': i, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': [str(i)]}) + '\n' for i in range(3)
+    )
+
+    try:
+        with app.test_client() as client:
+            rv = client.post('/api', data=body, content_type='application/x-ndjson')
+            assert [json.loads(line) for line in rv.text.splitlines()] == [
+                {'id': i, 'jsonrpc': '2.0', 'result': str(i)} for i in range(3)
+            ]
+        assert admission.in_flight == 0
+        assert admission.rejected == 0
+    finally:
+        settings.NDJSON_PIPELINE_ENABLED = False
+
+
+def test_ndjson_pipeline_rejects_compressed_and_long_lines() -> None:
+    app = Flask('test_streaming', instance_relative_config=True)
+    app.config['FLASK_JSONRPC_NDJSON_PIPELINE_ENABLED'] = True
+    jsonrpc = JSONRPC(app, '/api', version='2.5.0')
+
+    @jsonrpc.method('app.echo')
+    def echo(s: str) -> str:
+        return s
+
+    short = json.dumps({'id': 1, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['a']}) + '\n'
+    long = json.dumps({'id': 2, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['b' * 128]}) + '\n'
+
+    try:
+        settings.NDJSON_PIPELINE_MAX_LINE_SIZE = 128
+        with app.test_client() as client:
+            rv = client.post(
+                '/api',
+                data=gzip.compress(short.encode()),
+                headers={'Content-Encoding': 'gzip'},
+                content_type='application/x-ndjson',
+            )
+            assert rv.status_code == 415
+            assert rv.json['jsonrpc'] == '2.0'
+            assert rv.json['error']['code'] == -32700
+            assert 'Content-Encoding' in rv.json['error']['data']['message']
+
+            rv = client.post(
+                '/api', data=short, headers={'Content-Encoding': 'identity'}, content_type='application/x-ndjson'
+            )
+            assert rv.status_code == 200
+            assert json.loads(rv.text) == {'id': 1, 'jsonrpc': '2.0', 'result': 'a'}
+
+            rv = client.post('/api', data=short + long + short, content_type='application/x-ndjson')
+            responses = [json.loads(line) for line in rv.text.splitlines()]
+            assert responses[0] == {'id': 1, 'jsonrpc': '2.0', 'result': 'a'}
+            assert len(responses) == 2
+            assert responses[1]['id'] is None
+            assert responses[1]['jsonrpc'] == '2.0'
+            assert responses[1]['error']['code'] == -32700
+            assert responses[1]['error']['data'] == {'message': 'Line exceeds 128 bytes'}
+    finally:
+        settings.NDJSON_PIPELINE_ENABLED = False
+        settings.NDJSON_PIPELINE_MAX_LINE_SIZE = 1024 * 1024
+
+
+def test_ndjson_pipeline() -> None:
+    app = Flask('test_streaming', instance_relative_config=True)
+    app.config['FLASK_JSONRPC_NDJSON_PIPELINE_ENABLED'] = True
+    jsonrpc = JSONRPC(app, '/api')
+    started: list[t.Any] = []
+    finished: list[bool] = []
+    teardowns: list[BaseException | None] = []
+
+    @jsonrpc.method('app.echo', notification=True)
+    def echo(s: str) -> str:
+        return s
+
+    @jsonrpc.before_request
+    def cached(req_json: t.Any) -> bytes | None:  # noqa: ANN401
+        if isinstance(req_json, dict) and req_json.get('method') == 'app.cached':
+            return b'{"id": 9, "jsonrpc": "2.0", "result": "cached"}\n'
+        if isinstance(req_json, dict) and req_json.get('method') == 'app.crash':
+            raise RuntimeError('crash')
+        return None
+
+    @jsonrpc.teardown_request
+    def teardown(exc: BaseException | None) -> None:
+        teardowns.append(exc)
+
+    lines = [
+        {'id': 1, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['a']},
+        {'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['notify']},
+        {'id': 9, 'jsonrpc': '2.0', 'method': 'app.cached'},
+        [{'id': 2, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['b']}],
+        [],
+        {'id': 3, 'jsonrpc': '2.0', 'method': 'app.unknown'},
+    ]
+    body = '\n'.join(json.dumps(line) for line in lines) + '\n\nnot json\n'
+
+    def on_request_started(sender: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        started.append(sender)
+
+    def on_request_finished(sender: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        finished.append(kwargs['response'].is_streamed)
+
+    try:
+        with app.test_client() as client:
+            with (
+                request_started.connected_to(on_request_started, sender=jsonrpc.get_jsonrpc_site()),
+                request_finished.connected_to(on_request_finished, sender=jsonrpc.get_jsonrpc_site()),
+            ):
+                rv = client.post('/api', data=body, content_type='application/x-ndjson')
+                responses = [json.loads(line) for line in rv.text.splitlines()]
+            assert finished == [True]
+            assert rv.status_code == 200
+            assert rv.mimetype == 'application/x-ndjson'
+            assert responses[:3] == [
+                {'id': 1, 'jsonrpc': '2.0', 'result': 'a'},
+                {'id': 9, 'jsonrpc': '2.0', 'result': 'cached'},
+                [{'id': 2, 'jsonrpc': '2.0', 'result': 'b'}],
+            ]
+            assert responses[3]['error']['data'] == {'message': 'Empty array'}
+            assert responses[4]['error']['code'] == -32601
+            assert responses[5]['error']['code'] == -32700
+            assert len(responses) == 6
+            assert started == [jsonrpc.get_jsonrpc_site()] * 7
+            assert teardowns == [None] * 7
+
+            with pytest.raises(RuntimeError, match='crash'):
+                client.post(
+                    '/api',
+                    data=json.dumps({'id': 1, 'jsonrpc': '2.0', 'method': 'app.crash'}),
+                    content_type='application/x-ndjson',
+                )
+            assert isinstance(teardowns[-1], RuntimeError)
+
+            settings.NDJSON_PIPELINE_ENABLED = False
+            rv = client.post('/api', data=body, content_type='application/x-ndjson')
+            assert rv.status_code == 400
+            assert rv.json['error']['code'] == -32700
+    finally:
+        settings.NDJSON_PIPELINE_ENABLED = False
@@ -31,7 +31,10 @@ from flask import Flask
 
 import pytest
 
+from flask_jsonrpc import JSONRPC
+from flask_jsonrpc.conf import settings
 from flask_jsonrpc.views import JSONRPCView
+from flask_jsonrpc.signals import request_timed, request_finished
 from flask_jsonrpc.exceptions import JSONRPCError
 
 # Python 3.11+
@@ -48,6 +51,9 @@ def test_jsonrpc_view_simple() -> None:
         def __init__(self: Self) -> None:
             self.logger = logging.getLogger('mock_jsonrpc_site')
 
+        def get_response_codec(self: Self) -> None:
+            return None
+
         def dispatch_request(self: Self) -> tuple[t.Any, int, dict[str, t.Any]]:
             return {'id': 1, 'jsonrpc': '2.0', 'result': 'Hello world!'}, 200, {}
 
@@ -65,6 +71,9 @@ def test_jsonrpc_view_with_response_status_code_204() -> None:
         def __init__(self: Self) -> None:
             self.logger = logging.getLogger('mock_jsonrpc_site')
 
+        def get_response_codec(self: Self) -> None:
+            return None
+
         def dispatch_request(self: Self) -> tuple[t.Any, int, dict[str, t.Any]]:
             return '', 204, {}
 
@@ -82,6 +91,9 @@ def test_jsonrpc_view_with_invalid_request() -> None:
         def __init__(self: Self) -> None:
             self.logger = logging.getLogger('mock_jsonrpc_site')
 
+        def get_response_codec(self: Self) -> None:
+            return None
+
         def dispatch_request(self: Self) -> tuple[t.Any, int, dict[str, t.Any]]:
             raise JSONRPCError(
                 message='Invalid request', code=1001, data={'message': 'Invalid request'}, status_code=500
@@ -103,3 +115,105 @@ def test_jsonrpc_view_with_invalid_request() -> None:
             'id': None,
             'jsonrpc': '2.0',
         }
+
+
+def test_jsonrpc_view_with_pre_encoded_response() -> None:
+    class MockJSONRPCSite:
+        def __init__(self: Self) -> None:
+            self.logger = logging.getLogger('mock_jsonrpc_site')
+
+        def get_response_codec(self: Self) -> None:
+            return None
+
+        def dispatch_request(self: Self) -> tuple[t.Any, int, dict[str, t.Any]]:
+            return b'{"id": 1, "jsonrpc": "2.0", "result": "Hello world!"}', 200, {'X-Custom': '1'}
+
+    app = Flask('mehod_view')
+    app.add_url_rule('/api', view_func=JSONRPCView.as_view('jsonrpc_view', jsonrpc_site=MockJSONRPCSite()))
+
+    with app.test_client() as client:
+        r = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.index'})
+        assert r.status_code == 200
+        assert r.mimetype == 'application/json'
+        assert r.headers['X-Custom'] == '1'
+        assert r.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Hello world!'}
+
+
+def test_jsonrpc_view_with_server_timing() -> None:
+    app = Flask('mehod_view')
+    app.config['FLASK_JSONRPC_SERVER_TIMING_HEADER'] = True
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.index')
+    def index(name: str) -> str:
+        return f'Hello {name}!'
+
+    try:
+        with app.test_client() as client:
+            r = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.index', 'params': ['Tequila']})
+            assert r.status_code == 200
+            assert r.json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Hello Tequila!'}
+            phases = [metric.split(';')[0] for metric in r.headers['Server-Timing'].split(', ')]
+            assert phases == ['mime', 'parse', 'validate', 'bind', 'check', 'view', 'return', 'serialize', 'total']
+
+            r = client.post('/api', data='{"id": 1', content_type='application/json')
+            assert r.status_code == 400
+            assert r.headers['Server-Timing'].startswith('mime;dur=')
+    finally:
+        settings.SERVER_TIMING_HEADER = False
+
+
+def test_jsonrpc_view_with_request_timed_signal() -> None:
+    app = Flask('mehod_view')
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.index', validate=False)
+    def index(name: str) -> str:
+        return f'Hello {name}!'
+
+    timings: list[dict[str, float]] = []
+
+    def on_request_timed(sender: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        timings.append(kwargs['timings'])
+
+    with app.test_client() as client, request_timed.connected_to(on_request_timed, sender=jsonrpc.get_jsonrpc_site()):
+        r = client.post(
+            '/api',
+            json=[
+                {'id': 1, 'jsonrpc': '2.0', 'method': 'app.index', 'params': ['Tequila']},
+                {'id': 2, 'jsonrpc': '2.0', 'method': 'app.index', 'params': ['Lou']},
+            ],
+        )
+        assert r.status_code == 200
+        assert 'Server-Timing' not in r.headers
+
+    assert len(timings) == 1
+    assert list(timings[0]) == ['mime', 'parse', 'validate', 'bind', 'view', 'return', 'serialize', 'total']
+    assert all(duration >= 0 for duration in timings[0].values())
+    assert timings[0]['total'] >= timings[0]['view']
+
+
+def test_jsonrpc_view_with_request_finished_signal() -> None:
+    app = Flask('mehod_view')
+    jsonrpc = JSONRPC(app, '/api')
+
+    @jsonrpc.method('app.index', validate=False)
+    def index(name: str) -> str:
+        return f'Hello {name}!'
+
+    finished: list[dict[str, t.Any]] = []
+
+    def on_request_finished(sender: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        finished.append(kwargs)
+
+    with (
+        app.test_client() as client,
+        request_finished.connected_to(on_request_finished, sender=jsonrpc.get_jsonrpc_site()),
+    ):
+        r = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.index', 'params': ['Tequila']})
+        assert r.status_code == 200
+        assert 'Server-Timing' not in r.headers
+
+    assert len(finished) == 1
+    assert finished[0]['response'].json == {'id': 1, 'jsonrpc': '2.0', 'result': 'Hello Tequila!'}
+    assert finished[0]['duration'] > 0
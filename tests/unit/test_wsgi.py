@@ -0,0 +1,277 @@
+# Copyright (c) 2026-2026, Cenobit Technologies, Inc. http://cenobit.es/
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# * Neither the name of the Cenobit Technologies nor the names of
+#    its contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import typing as t
+
+from flask import Flask, g, request, session, request_started
+
+import pytest
+
+from flask_jsonrpc import JSONRPC, JSONRPCBlueprint
+from flask_jsonrpc.conf import settings
+from flask_jsonrpc.wsgi import JSONRPCWSGIApp
+from flask_jsonrpc.views import JSONRPCView
+from flask_jsonrpc.codecs import MessagePackCodec
+from flask_jsonrpc.signals import request_timed
+from flask_jsonrpc.exceptions import JSONRPCError
+
+
+def create_app() -> tuple[Flask, JSONRPC]:  # noqa: C901
+    app = Flask('test_wsgi', instance_relative_config=True)
+    app.secret_key = 'secret'
+    jsonrpc = JSONRPC(app, '/api')
+    user = JSONRPCBlueprint('user', __name__)
+
+    @jsonrpc.method('app.echo')
+    def echo(s: str) -> str:
+        g.echoed = s
+        return s
+
+    @jsonrpc.method('app.headers')
+    def headers() -> tuple[str, int, dict[str, str]]:
+        return 'headers', 201, {'X-Foo': 'bar', 'Content-Type': 'application/json; charset=utf-8'}
+
+    @jsonrpc.method('app.remote')
+    def remote() -> str:
+        return request.remote_addr or ''
+
+    @jsonrpc.method('app.session')
+    def session_() -> int:
+        session['count'] = session.get('count', 0) + 1
+        return int(session['count'])
+
+    @jsonrpc.method('app.stream')
+    def stream(n: int) -> t.Iterator[int]:
+        yield from range(n)
+
+    @jsonrpc.method('app.notify', notification=True)
+    def notify(s: str) -> None:
+        return None
+
+    @jsonrpc.method('app.fail')
+    def fail() -> str:
+        raise ValueError('fail')
+
+    @jsonrpc.before_request
+    def cached(req_json: t.Any) -> t.Any:  # noqa: ANN401
+        if isinstance(req_json, dict) and req_json.get('method') == 'app.cached':
+            return b'{"id": 1, "jsonrpc": "2.0", "result": "cached"}'
+        if isinstance(req_json, dict) and req_json.get('method') == 'app.crash':
+            raise RuntimeError('crash')
+        if isinstance(req_json, dict) and req_json.get('method') == 'app.exit':
+            raise SystemExit(1)
+        if isinstance(req_json, dict) and req_json.get('method') == 'app.forbidden':
+            raise JSONRPCError(message='Forbidden', code=-32001, status_code=403)
+        return None
+
+    @user.method('user.index')
+    def user_index() -> str:
+        return 'Welcome to user'
+
+    jsonrpc.register_blueprint(app, user, url_prefix='/user')
+    return app, jsonrpc
+
+
+def test_wsgi_app_same_responses_as_view() -> None:
+    app, jsonrpc = create_app()
+    lean_app, lean_jsonrpc = create_app()
+    lean_app.wsgi_app = JSONRPCWSGIApp(lean_app, lean_jsonrpc)  # type: ignore[method-assign]
+    assert list(lean_app.wsgi_app.jsonrpc_sites) == ['/api', '/api/user']  # type: ignore[attr-defined]
+
+    payloads: list[tuple[str, t.Any]] = [
+        ('/api', {'id': 1, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': [':)']}),
+        ('/api', {'id': 2, 'jsonrpc': '2.0', 'method': 'app.headers'}),
+        ('/api', {'id': 3, 'jsonrpc': '2.0', 'method': 'app.remote'}),
+        ('/api', {'id': 4, 'jsonrpc': '2.0', 'method': 'app.stream', 'params': [3]}),
+        ('/api', {'id': 5, 'jsonrpc': '2.0', 'method': 'app.fail'}),
+        ('/api', {'id': 6, 'jsonrpc': '2.0', 'method': 'app.unknown'}),
+        ('/api', {'id': 7, 'jsonrpc': '2.0', 'method': 'app.cached'}),
+        ('/api', {'id': 8, 'jsonrpc': '2.0', 'method': 'app.forbidden'}),
+        ('/api', {'jsonrpc': '2.0', 'method': 'app.notify', 'params': [':)']}),
+        ('/api', [{'id': 9, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': ['a']}, {'id': 10}]),
+        ('/api', []),
+        ('/api/user', {'id': 11, 'jsonrpc': '2.0', 'method': 'user.index'}),
+    ]
+    dispatched: list[Flask] = []
+    with (
+        app.test_client() as client,
+        lean_app.test_client() as lean_client,
+        request_started.connected_to(dispatched.append, sender=lean_app),
+    ):
+        for path, payload in payloads:
+            rv = client.post(path, json=payload)
+            lean_rv = lean_client.post(path, json=payload)
+            assert lean_rv.data == rv.data
+            assert lean_rv.status_code == rv.status_code
+            if rv.status_code != 204:
+                assert lean_rv.headers == rv.headers
+        assert dispatched == []
+
+        rv = client.post('/api', data='{"id": 12,', content_type='application/json')
+        lean_rv = lean_client.post('/api', data='{"id": 12,', content_type='application/json')
+        assert lean_rv.data == rv.data
+        assert lean_rv.status_code == rv.status_code == 400
+
+        rv = client.post('/api', json={'id': 13, 'jsonrpc': '2.0', 'method': 'app.crash'})
+        lean_rv = lean_client.post('/api', json={'id': 13, 'jsonrpc': '2.0', 'method': 'app.crash'})
+        assert lean_rv.status_code == rv.status_code == 500
+
+        for _ in range(2):
+            rv = client.post('/api', json={'id': 14, 'jsonrpc': '2.0', 'method': 'app.session'})
+            lean_rv = lean_client.post('/api', json={'id': 14, 'jsonrpc': '2.0', 'method': 'app.session'})
+            assert lean_rv.json == rv.json
+        assert lean_rv.json['result'] == 2
+
+        rv = client.get('/api')
+        lean_rv = lean_client.get('/api')
+        assert lean_rv.status_code == rv.status_code
+
+        rv = lean_client.post('/unknown', json={'id': 15})
+        assert rv.status_code == 404
+        assert dispatched == [lean_app, lean_app]
+
+
+def test_wsgi_app_fallbacks() -> None:
+    app, jsonrpc = create_app()
+    wsgi_app = JSONRPCWSGIApp(app, jsonrpc)
+    jsonrpc_site = jsonrpc.get_jsonrpc_site()
+    environ = {'REQUEST_METHOD': 'POST', 'CONTENT_TYPE': 'application/json; charset=utf-8'}
+    assert wsgi_app.is_lean_request(jsonrpc_site, environ) is True
+    assert wsgi_app.is_lean_request(jsonrpc_site, {**environ, 'REQUEST_METHOD': 'GET'}) is False
+    assert wsgi_app.is_lean_request(jsonrpc_site, {**environ, 'CONTENT_TYPE': 'text/plain'}) is False
+    assert wsgi_app.is_lean_request(jsonrpc_site, {'REQUEST_METHOD': 'POST'}) is False
+
+    with request_timed.connected_to(lambda sender, **kwargs: None):
+        assert wsgi_app.is_lean_request(jsonrpc_site, environ) is False
+
+    try:
+        settings.COMPRESSION_ENABLED = True
+        assert wsgi_app.is_lean_request(jsonrpc_site, environ) is False
+    finally:
+        settings.COMPRESSION_ENABLED = False
+
+    @app.after_request
+    def after_request(response: t.Any) -> t.Any:  # noqa: ANN401
+        return response
+
+    assert wsgi_app.is_lean_request(jsonrpc_site, environ) is False
+
+
+def test_wsgi_app_view_decorators() -> None:
+    def require_token(view: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:  # noqa: ANN401
+            if request.headers.get('Authorization') != 'Bearer token':
+                return {'message': 'Unauthorized'}, 401
+            return view(*args, **kwargs)
+
+        return wrapper
+
+    class AuthJSONRPCView(JSONRPCView):
+        decorators = [require_token]
+
+    class CustomJSONRPCView(JSONRPCView):
+        pass
+
+    app = Flask('test_wsgi', instance_relative_config=True)
+    jsonrpc = JSONRPC(app, '/api', jsonrpc_site_api=AuthJSONRPCView)
+    custom = JSONRPC(app, '/custom', jsonrpc_site_api=CustomJSONRPCView)
+
+    @jsonrpc.method('app.echo')
+    def echo(s: str) -> str:
+        return s
+
+    assert JSONRPCWSGIApp(app, jsonrpc).jsonrpc_sites == {}
+    assert JSONRPCWSGIApp(app, custom).jsonrpc_sites == {}
+    app.wsgi_app = JSONRPCWSGIApp(app, jsonrpc)  # type: ignore[method-assign]
+
+    data = {'id': 1, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': [':)']}
+    with app.test_client() as client:
+        rv = client.post('/api', json=data)
+        assert rv.status_code == 401
+        assert rv.json == {'message': 'Unauthorized'}
+
+        rv = client.post('/api', json=data, headers={'Authorization': 'Bearer token'})
+        assert rv.status_code == 200
+        assert rv.json == {'id': 1, 'jsonrpc': '2.0', 'result': ':)'}
+
+
+def test_wsgi_app_codec() -> None:
+    msgpack = pytest.importorskip('msgpack')
+    app, jsonrpc = create_app()
+    jsonrpc.register_codec(MessagePackCodec())
+    app.wsgi_app = JSONRPCWSGIApp(app, jsonrpc)  # type: ignore[method-assign]
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api',
+            data=msgpack.packb({'id': 1, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': [':)']}),
+            content_type='application/msgpack',
+        )
+        assert msgpack.unpackb(rv.data) == {'id': 1, 'jsonrpc': '2.0', 'result': ':)'}
+        assert rv.mimetype == 'application/msgpack'
+
+
+def test_wsgi_app_debug() -> None:
+    app, jsonrpc = create_app()
+    app.debug = True
+    app.wsgi_app = JSONRPCWSGIApp(app, jsonrpc)  # type: ignore[method-assign]
+
+    with app.test_client() as client:
+        rv = client.post('/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': [':)']})
+        assert rv.data == b'{\n  "id": 1,\n  "jsonrpc": "2.0",\n  "result": ":)"\n}\n'
+
+        with pytest.raises(RuntimeError, match='crash'):
+            client.post('/api', json={'id': 2, 'jsonrpc': '2.0', 'method': 'app.crash'})
+
+        with pytest.raises(SystemExit):
+            client.post('/api', json={'id': 3, 'jsonrpc': '2.0', 'method': 'app.exit'})
+
+    teardowns: list[BaseException | None] = []
+    app.teardown_request(teardowns.append)
+    app.should_ignore_error = lambda error: isinstance(error, RuntimeError)  # type: ignore[method-assign]
+    with app.test_client() as client, pytest.raises(RuntimeError, match='crash'):
+        client.post('/api', json={'id': 4, 'jsonrpc': '2.0', 'method': 'app.crash'})
+    assert teardowns == [None]
+
+
+def test_wsgi_app_stream_ends_once_streamed() -> None:
+    app, jsonrpc = create_app()
+    app.wsgi_app = JSONRPCWSGIApp(app, jsonrpc)  # type: ignore[method-assign]
+    teardowns: list[BaseException | None] = []
+    jsonrpc.get_jsonrpc_site().register_teardown_request(teardowns.append)
+
+    with app.test_client() as client:
+        rv = client.post(
+            '/api', json={'id': 1, 'jsonrpc': '2.0', 'method': 'app.stream', 'params': [3]}, buffered=False
+        )
+        assert next(rv.response) == b'{"id": 1, "jsonrpc": "2.0", "result": ['
+        assert teardowns == []
+        rv.close()
+        assert teardowns == [None]
+
+        rv = client.post('/api', json={'id': 2, 'jsonrpc': '2.0', 'method': 'app.echo', 'params': [':)']})
+        assert rv.json == {'id': 2, 'jsonrpc': '2.0', 'result': ':)'}
+        assert teardowns == [None, None]